@@ -1,7 +1,23 @@
 import streamlit as st
-import plotly.express as px
+
+from elections_germany import data
+from elections_germany.correlations import point_estimates
 
 st.set_page_config(page_title="Home", layout="wide")
+
+
+@st.cache_data
+def load_gdp_correlations():
+    """
+    Correlation of each party with the 2-year average GDP growth (as on page
+    03), without the bootstrap intervals of the ``correlations`` table.
+    """
+    corr = point_estimates(data.national_votes(), data.gdp(), data.unemployment(), "gdp_lag2_avg", "pearson")
+    return {party: f"{r:.2f}".replace("-", "–") for party, r in corr.items()}
+
+
+corr = load_gdp_correlations()
+
 st.title("📉 Elections in Germany")
 st.write("Welcome to our app! Here we explore the election results in Germany and different socio-economic parameters over time! \n\nUse the sidebar to navigate to other pages.")
 
@@ -9,7 +25,7 @@ st.markdown("""
             ### Our Results    
             """) 
 
-st.markdown("""
+st.markdown(f"""
             ##### Interpretation of GDP, Unemployment and Party Vote-Share Trends
             **Overall pattern**  
             Taken together, the figure illustrates three key dynamics:  
@@ -17,7 +33,7 @@ st.markdown("""
             2. A **structural rise of issue and niche parties** such as the Greens and, for a time, Die Linke.  
             3. The **emergence of AfD as a major protest party**, with gains concentrated in or after periods of crisis rather than during “normal” growth years.
             
-            - CDU/CSU (0.74) show a moderate positive correlation, potentially meaning their vote share tends to increase in election years that follow stronger economic conditions. Greens (–0.72) show a moderate negative correlation, indicating their vote share tends to increase in periods following weaker economic performance. And, AfD (–0.34) has a weak-to-moderate negative correlation, meaning their vote gains slightly coincide with periods of weaker economic conditions.
+            - CDU/CSU ({corr["cdu_csu"]}) show a moderate positive correlation, potentially meaning their vote share tends to increase in election years that follow stronger economic conditions. Greens ({corr["gruene_total"]}) show a moderate negative correlation, indicating their vote share tends to increase in periods following weaker economic performance. And, AfD ({corr["afd_total"]}) has a weak-to-moderate negative correlation, meaning their vote gains slightly coincide with periods of weaker economic conditions.
 
             
             If you want to see the graphs:
@@ -0,0 +1 @@
+"""Shared data and figure helpers for the Elections in Germany Streamlit app."""
@@ -0,0 +1,297 @@
+"""
+Command line entry point.
+
+    python -m elections_germany build-store [--force] [TABLE ...]
+    python -m elections_germany run-pipeline [--force] [--workers N] [STAGE ...]
+    python -m elections_germany build-geometry [--force] [--source PATH]
+    python -m elections_germany build-tiles [--force] [--source PATH]
+    python -m elections_germany serve-tiles [--host HOST] [--port PORT]
+    python -m elections_germany serve-api [--host HOST] [--port PORT]
+    python -m elections_germany serve [--health-port PORT] [--workers N] [--year YEAR ...] [-- STREAMLIT OPTION ...]
+    python -m elections_germany render-figures [--force] [FIGURE ...]
+    python -m elections_germany render-year-figures [--force] [--workers N] [YEAR ...]
+    python -m elections_germany build-images [--force] [YEAR ...]
+    python -m elections_germany export-static [--out DIR] [--max-states N] [PAGE ...]
+    python -m elections_germany import-budget [--repeat N] [PAGE ...]
+    python -m elections_germany benchmark [--repeat N] [--no-sweep] [--max-regression F] [PAGE ...]
+"""
+
+import argparse
+from pathlib import Path
+
+from elections_germany import (
+    api, benchmark, figure_store, geometry, images, importtime, pipeline, prewarm, store, tile_server,
+    tiles, year_figures,
+)
+
+
+def cmd_build_store(args):
+    unknown = sorted(set(args.tables) - set(store.TABLES))
+    if unknown:
+        raise SystemExit(f"unknown table(s): {', '.join(unknown)}")
+
+    built = store.build_store(args.tables or None, force=args.force)
+    for name, entry in built.items():
+        print(f"{name:<22} {entry['rows']:>8} rows  <- {entry['source']}")
+
+    missing = [name for name in args.tables or store.TABLES if name not in built]
+    for name in missing:
+        print(f"{name:<22} skipped ({store.source_label(name)} not found)")
+
+
+def cmd_run_pipeline(args):
+    unknown = sorted(set(args.stages) - set(pipeline.STAGES))
+    if unknown:
+        raise SystemExit(f"unknown stage(s): {', '.join(unknown)}")
+
+    pipeline.run(args.stages or None, force=args.force, workers=args.workers)
+
+
+def cmd_build_geometry(args):
+    if not args.source.exists():
+        raise SystemExit(f"{args.source} not found")
+
+    manifest = geometry.build_geometry(args.source, force=args.force)
+    print(f"source                {manifest['source_bytes']:>10} bytes")
+    for tolerance, level in manifest["levels"].items():
+        print(
+            f"tolerance {tolerance:<11} {level['bytes']:>10} bytes"
+            f"  {level['vertices']:>8} vertices  -> data/geo/{level['file']}"
+        )
+
+
+def cmd_build_tiles(args):
+    if not args.source.exists():
+        raise SystemExit(f"{args.source} not found")
+
+    manifest = tiles.build_tiles(args.source, force=args.force)
+    for zoom, level in manifest["zooms"].items():
+        print(f"zoom {zoom:<4} {level['tiles']:>8} tiles {level['bytes']:>10} bytes  -> data/tiles/{level['file']}")
+
+
+def cmd_serve_tiles(args):
+    try:
+        tile_server.serve(args.host, args.port)
+    except FileNotFoundError as e:
+        raise SystemExit(str(e))
+
+
+def cmd_serve_api(args):
+    try:
+        api.serve(args.host, args.port)
+    except FileNotFoundError as e:
+        raise SystemExit(str(e))
+
+
+def cmd_serve(args):
+    streamlit_args = args.streamlit_args
+    if streamlit_args[:1] == ["--"]:
+        streamlit_args = streamlit_args[1:]
+    prewarm.serve(
+        streamlit_args, health_host=args.health_host, health_port=args.health_port,
+        workers=args.workers, years=args.year,
+    )
+
+
+def cmd_render_figures(args):
+    unknown = sorted(set(args.figures) - set(figure_store.FIGURES))
+    if unknown:
+        raise SystemExit(f"unknown figure(s): {', '.join(unknown)}")
+
+    manifest = figure_store.render_figures(args.figures or None, force=args.force)
+    for name in args.figures or figure_store.FIGURES:
+        rendered = manifest[name]["figures"]
+        size = sum(f["bytes"] for f in rendered.values())
+        print(f"{name:<22} {len(rendered):>4} figures {size:>10} bytes")
+
+
+def cmd_render_year_figures(args):
+    year_figures.render_years(args.years or None, force=args.force, workers=args.workers)
+
+
+def cmd_build_images(args):
+    missing = sorted(set(args.years) - set(images.figure_years()))
+    if missing:
+        raise SystemExit(f"no figure for year(s): {', '.join(map(str, missing))}")
+
+    manifest = images.build_images(args.years or None, force=args.force)
+    for year in args.years or images.figure_years():
+        entry = manifest[str(year)]
+        smallest = min(entry["variants"], key=lambda v: v["bytes"])
+        print(
+            f"{year}  {len(entry['variants']):>3} variants ({', '.join(entry['formats'])}, smallest"
+            f" {smallest['bytes']:>7} bytes)  {entry['pyramid']['tiles']:>4} zoom tiles"
+        )
+
+
+def cmd_export_static(args):
+    # imported here: its HTML template is only needed by this command
+    from elections_germany import export
+
+    unknown = sorted(set(args.pages) - set(benchmark.pages()))
+    if unknown:
+        raise SystemExit(f"unknown page(s): {', '.join(unknown)}")
+
+    export.export_static(
+        args.out or export.EXPORT_DIR, args.pages or None, max_states=args.max_states or export.MAX_STATES,
+    )
+
+
+def cmd_import_budget(args):
+    unknown = sorted(set(args.pages) - set(benchmark.pages()))
+    if unknown:
+        raise SystemExit(f"unknown page(s): {', '.join(unknown)}")
+
+    over = importtime.check(args.pages or benchmark.pages(), repeat=args.repeat)
+    if over:
+        raise SystemExit(f"import time over budget: {', '.join(over)}")
+
+
+def cmd_benchmark(args):
+    unknown = sorted(set(args.pages) - set(benchmark.pages()))
+    if unknown:
+        raise SystemExit(f"unknown page(s): {', '.join(unknown)}")
+
+    history = benchmark.read_history(args.history)
+    results = benchmark.run_benchmarks(args.pages or None, repeat=args.repeat, sweep=not args.no_sweep)
+    entry = benchmark.append_history(results, args.history)
+
+    for page, result in results.items():
+        sweep = result["sweep"]
+        slowest = max((s["seconds"] for s in sweep), default=0)
+        print(
+            f"{page:<46} cold {result['cold_seconds']:>7.2f}s  warm {result['warm_seconds']:>7.2f}s"
+            f"  {result['peak_rss_kb'] // 1024:>5} MB  {result['delta_bytes']:>9} delta bytes"
+            f"  sweep {len(sweep):>3} (max {slowest:.2f}s)"
+        )
+        errors = [result] * ("error" in result) + [s for s in sweep if "error" in s]
+        for failed in errors:
+            print(f"    error: {failed['error']}")
+
+    if history:
+        regressions = benchmark.compare(history[-1], entry, args.max_regression)
+        for page, metric, before, after in regressions:
+            print(f"REGRESSION {page} {metric}: {before:.2f}s -> {after:.2f}s")
+        if regressions:
+            raise SystemExit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m elections_germany")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser(
+        "build-store", help="convert the raw CSVs into the Parquet store"
+    )
+    p.add_argument("tables", nargs="*", metavar="TABLE")
+    p.add_argument("--force", action="store_true", help="rebuild even if unchanged")
+    p.set_defaults(func=cmd_build_store)
+
+    p = commands.add_parser(
+        "run-pipeline", help="derive sorted_elects / sorted_incomes from the raw data"
+    )
+    p.add_argument("stages", nargs="*", metavar="STAGE")
+    p.add_argument("--force", action="store_true", help="ignore cached stage results")
+    p.add_argument("--workers", type=int, default=None, help="size of the process pool")
+    p.set_defaults(func=cmd_run_pipeline)
+
+    p = commands.add_parser(
+        "build-geometry", help="write simplified county geometry for the maps"
+    )
+    p.add_argument("--source", type=Path, default=geometry.SOURCE_PATH)
+    p.add_argument("--force", action="store_true", help="rebuild even if unchanged")
+    p.set_defaults(func=cmd_build_geometry)
+
+    p = commands.add_parser(
+        "build-tiles", help="cut the municipal geometry into vector tiles"
+    )
+    p.add_argument("--source", type=Path, default=tiles.SOURCE_PATH)
+    p.add_argument("--force", action="store_true", help="rebuild even if unchanged")
+    p.set_defaults(func=cmd_build_tiles)
+
+    p = commands.add_parser(
+        "serve-tiles", help="serve the municipal winner map tiles over HTTP"
+    )
+    p.add_argument("--host", default=tile_server.DEFAULT_HOST)
+    p.add_argument("--port", type=int, default=tile_server.DEFAULT_PORT)
+    p.set_defaults(func=cmd_serve_tiles)
+
+    p = commands.add_parser(
+        "serve-api", help="serve the election and income tables as a JSON/Arrow HTTP API"
+    )
+    p.add_argument("--host", default=api.DEFAULT_HOST)
+    p.add_argument("--port", type=int, default=api.DEFAULT_PORT)
+    p.set_defaults(func=cmd_serve_api)
+
+    p = commands.add_parser(
+        "serve", help="run the app, warm its caches and report readiness on /health"
+    )
+    p.add_argument("--health-host", default="0.0.0.0")
+    p.add_argument("--health-port", type=int, default=prewarm.DEFAULT_HEALTH_PORT)
+    p.add_argument("--workers", type=int, default=prewarm.DEFAULT_WORKERS)
+    p.add_argument(
+        "--year", type=int, action="append",
+        help="warm the maps of this election year early (repeat, most visited first)",
+    )
+    p.add_argument("streamlit_args", nargs=argparse.REMAINDER, help="passed to `streamlit run`")
+    p.set_defaults(func=cmd_serve)
+
+    p = commands.add_parser(
+        "render-figures", help="pre-render the static figures to data/figures/"
+    )
+    p.add_argument("figures", nargs="*", metavar="FIGURE")
+    p.add_argument("--force", action="store_true", help="re-render even if unchanged")
+    p.set_defaults(func=cmd_render_figures)
+
+    p = commands.add_parser(
+        "render-year-figures", help="redraw figures/<year>.png from the data"
+    )
+    p.add_argument("years", nargs="*", type=int, metavar="YEAR")
+    p.add_argument("--force", action="store_true", help="re-render even if unchanged")
+    p.add_argument("--workers", type=int, default=None, help="size of the process pool")
+    p.set_defaults(func=cmd_render_year_figures)
+
+    p = commands.add_parser(
+        "build-images", help="write responsive variants and zoom tiles of figures/*.png"
+    )
+    p.add_argument("years", nargs="*", type=int, metavar="YEAR")
+    p.add_argument("--force", action="store_true", help="rebuild even if unchanged")
+    p.set_defaults(func=cmd_build_images)
+
+    p = commands.add_parser(
+        "export-static", help="render every page and widget state to static HTML"
+    )
+    p.add_argument("pages", nargs="*", metavar="PAGE", help="e.g. pages/04_Elections_and_Income.py")
+    p.add_argument("--out", type=Path, default=None, help="output directory (default: site/)")
+    p.add_argument(
+        "--max-states", type=int, default=None,
+        help="widget combinations per page before exporting one widget at a time (default: 256)",
+    )
+    p.set_defaults(func=cmd_export_static)
+
+    p = commands.add_parser(
+        "import-budget", help="check the import time of every page against its budget"
+    )
+    p.add_argument("pages", nargs="*", metavar="PAGE", help="e.g. pages/04_Elections_and_Income.py")
+    p.add_argument("--repeat", type=int, default=importtime.REPEAT, help="fresh interpreters per page")
+    p.set_defaults(func=cmd_import_budget)
+
+    p = commands.add_parser(
+        "benchmark", help="time every page cold and warm through AppTest"
+    )
+    p.add_argument("pages", nargs="*", metavar="PAGE", help="e.g. pages/04_Elections_and_Income.py")
+    p.add_argument("--repeat", type=int, default=3, help="number of warm runs")
+    p.add_argument("--no-sweep", action="store_true", help="skip the widget sweep")
+    p.add_argument("--history", type=Path, default=benchmark.HISTORY_PATH)
+    p.add_argument(
+        "--max-regression", type=float, default=0.2,
+        help="fail if a page got slower than this fraction since the last run",
+    )
+    p.set_defaults(func=cmd_benchmark)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Alignment of election years with income-tax years.
+
+Income statistics are not published for every election year, so every
+comparison of votes and income needs "the closest income year" for an
+election. ``align_years`` computes it for all election years at once with
+``pd.merge_asof`` and a tolerance in years; the direction policy decides
+which side is searched:
+
+- ``"backward_then_forward"`` (default): the latest income year at or before
+  the election, otherwise the earliest one after it
+- ``"backward"`` / ``"forward"`` / ``"nearest"``: as in ``pd.merge_asof``
+
+``join_income`` uses it to attach the income of every county to its
+election results, once, at build time (store table ``elections_income``).
+"""
+
+import numpy as np
+import pandas as pd
+
+POLICIES = ("backward_then_forward", "backward", "forward", "nearest")
+DEFAULT_POLICY = "backward_then_forward"
+DEFAULT_TOLERANCE = 3  # years
+
+
+def align_years(election_years, income_years, tolerance=DEFAULT_TOLERANCE, policy=DEFAULT_POLICY):
+    """
+    One row per election year with the matched ``income_year`` (nullable,
+    missing when no income year lies within ``tolerance``).
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {POLICIES}")
+
+    left = pd.DataFrame(
+        {"election_year": np.unique(np.asarray(election_years, dtype="int64"))}
+    )
+    right = pd.DataFrame(
+        {"income_year": np.unique(np.asarray(income_years, dtype="int64"))}
+    )
+
+    def asof(direction):
+        return pd.merge_asof(
+            left,
+            right,
+            left_on="election_year",
+            right_on="income_year",
+            direction=direction,
+            tolerance=tolerance,
+        )["income_year"]
+
+    if policy == "backward_then_forward":
+        income_year = asof("backward").fillna(asof("forward"))
+    else:
+        income_year = asof(policy)
+
+    left["income_year"] = income_year.astype("Int64")
+    return left
+
+
+def income_year_for(alignment, year):
+    """Matched income year for ``year`` from an ``align_years`` table, or None."""
+    match = alignment.loc[alignment["election_year"] == year, "income_year"]
+    if match.empty or pd.isna(match.iloc[0]):
+        return None
+    return int(match.iloc[0])
+
+
+def join_income(elections, incomes, tolerance=DEFAULT_TOLERANCE, policy=DEFAULT_POLICY):
+    """
+    Election results per county and year with the income columns of the
+    aligned income year (left join: counties without income data keep NaNs).
+    """
+    alignment = align_years(
+        elections["election_year"].unique(),
+        incomes["year"].unique(),
+        tolerance=tolerance,
+        policy=policy,
+    )
+
+    income = incomes.drop(columns=["state_code"], errors="ignore").rename(
+        columns={"year": "income_year", "code": "county"}
+    )
+    income["income_year"] = income["income_year"].astype("Int64")
+
+    joined = elections.merge(alignment, on="election_year", how="left")
+    return joined.merge(income, on=["income_year", "county"], how="left")
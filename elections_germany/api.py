@@ -0,0 +1,304 @@
+"""
+Read-only HTTP API over the tables behind the dashboard.
+
+    GET /counties?year=2021&party=afd&state=14
+    GET /municipalities?year=2021&county=14612
+    GET /states?year=2021
+    GET /federal
+    GET /taxation?year=2021&county=9162
+    GET /national?year=2021
+
+Every endpoint reads the same store tables as the pages, through ``data``
+(``vote_cube``, ``taxation``, ``gdp_votes``), and answers with
+JSON records, or with an Arrow IPC stream for ``?format=arrow`` or
+``Accept: application/vnd.apache.arrow.stream``. ``party`` keeps the regions
+won by that party; ``GET /`` lists the endpoints and their parameters.
+
+The ETag of a response is a hash of the source hashes of its tables in
+``data/store/manifest.json`` and the normalised query, so clients revalidate
+with ``If-None-Match`` and get a 304 until the store is rebuilt; each content
+encoding of a response has its own ETag (``"<hash>-gzip"``). Encoded and
+compressed (Brotli if the ``brotli`` package is installed, else gzip)
+responses are kept in an LRU cache keyed on the store version, so repeated
+queries never touch pandas.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from elections_germany import data, store
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+CACHE_SIZE = 2048  # encoded responses kept in memory
+MAX_AGE = 300  # seconds clients may use a response before revalidating
+
+JSON_TYPE = "application/json"
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+FORMATS = {"json": JSON_TYPE, "arrow": ARROW_TYPE}
+
+
+class QueryError(ValueError):
+    """A request the API cannot answer; the message is sent back with a 400."""
+
+
+# ----------------- QUERIES -----------------
+
+
+def _int(params, name):
+    try:
+        return int(params[name])
+    except ValueError:
+        raise QueryError(f"{name} must be an integer, got {params[name]!r}") from None
+
+
+def _party(params):
+    from elections_germany.cube import PARTIES
+
+    if params["party"] not in PARTIES:
+        raise QueryError(f"unknown party {params['party']!r}, expected one of {PARTIES}")
+    return params["party"]
+
+
+@lru_cache(maxsize=8)
+def _level(level, version):
+    """One level of the vote cube with its parent regions as columns."""
+    rows = data.elections(level).drop(columns="level")
+    if level == "municipality":
+        rows.insert(2, "county", rows["region"] // 1000)
+        rows.insert(2, "state", rows["region"] // 1_000_000)
+    elif level == "county":
+        rows.insert(2, "state", rows["region"] // 1000)
+    return rows
+
+
+@lru_cache(maxsize=4)
+def _counties(version):
+    """``taxation`` of the Kreise only, keyed like the vote cube."""
+    df = data.taxation()
+    # the states and the country have shorter codes
+    df = df[df["Region_Code"].str.len() == 5]
+    return df.assign(
+        county=df["Region_Code"].astype("int32"),
+        Region_Name=df["Region_Name"].str.strip(),
+    ).drop(columns="Region_Code").reset_index(drop=True)
+
+
+def _results(level):
+    def query(params, version):
+        rows = _level(level, version)
+        mask = True
+        if "year" in params:
+            mask = mask & (rows["election_year"] == _int(params, "year"))
+        if "party" in params:
+            mask = mask & (rows["winner"] == _party(params))
+        for parent in ("state", "county"):
+            if parent in params:
+                mask = mask & (rows[parent] == _int(params, parent))
+        return rows if mask is True else rows[mask]
+
+    return query
+
+
+def _taxation(params, version):
+    rows = _counties(version)
+    mask = True
+    if "year" in params:
+        mask = mask & (rows["Year"] == _int(params, "year"))
+    if "county" in params:
+        mask = mask & (rows["county"] == _int(params, "county"))
+    return rows if mask is True else rows[mask]
+
+
+def _national(params, version):
+    rows = data.national_votes()
+    if "year" in params:
+        rows = rows[rows["election_year"] == _int(params, "year")]
+    return rows
+
+
+# endpoint -> (store tables, accepted parameters, query)
+ENDPOINTS = {
+    "counties": (("vote_cube",), ("year", "party", "state"), _results("county")),
+    "municipalities": (("vote_cube",), ("year", "party", "state", "county"), _results("municipality")),
+    "states": (("vote_cube",), ("year", "party"), _results("state")),
+    "federal": (("vote_cube",), ("year", "party"), _results("federal")),
+    "taxation": (("taxation",), ("year", "county"), _taxation),
+    "national": (("gdp_votes",), ("year",), _national),
+}
+
+
+# ----------------- RESPONSES -----------------
+
+
+def parse_query(path, accept=""):
+    """``(endpoint, params, format)`` of a request, with ``params`` a sorted tuple."""
+    url = urlsplit(path)
+    endpoint = url.path.strip("/")
+    if endpoint not in ENDPOINTS:
+        raise QueryError(f"unknown endpoint /{endpoint}, see /")
+    params = dict(parse_qsl(url.query))
+    fmt = params.pop("format", "arrow" if ARROW_TYPE in accept else "json")
+    if fmt not in FORMATS:
+        raise QueryError(f"unknown format {fmt!r}, expected one of {list(FORMATS)}")
+    unknown = sorted(set(params) - set(ENDPOINTS[endpoint][1]))
+    if unknown:
+        raise QueryError(f"unknown parameter(s) {', '.join(unknown)} for /{endpoint}")
+    return endpoint, tuple(sorted(params.items())), fmt
+
+
+def _encode(df, fmt):
+    if fmt == "json":
+        return df.to_json(orient="records").encode()
+
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def response(endpoint, params, fmt, version):
+    """``(body, etag)`` of one normalised query."""
+    tables, _, query = ENDPOINTS[endpoint]
+    hashes = data.source_hashes()
+    missing = [t for t in tables if t not in hashes]
+    if missing:
+        raise FileNotFoundError(f"{', '.join(missing)} not built, run `python -m elections_germany build-store`")
+
+    digest = hashlib.sha256(repr((endpoint, params, fmt)).encode())
+    for name in tables:
+        digest.update(hashes[name].encode())
+    body = _encode(query(dict(params), version), fmt)
+    return body, f'"{digest.hexdigest()[:32]}"'
+
+
+@lru_cache(maxsize=1)
+def _brotli():
+    """The optional ``brotli`` module, None if it is not installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def content_encoding(accept_encoding):
+    """The best encoding the client accepts: br, gzip or None (identity)."""
+    accepted = {token.split(";")[0].strip() for token in accept_encoding.split(",")}
+    if "br" in accepted and _brotli() is not None:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def encoded_etag(etag, encoding):
+    """The ETag of ``etag``'s representation in ``encoding`` (None: identity)."""
+    return etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+
+
+def etag_matches(if_none_match, etag):
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compressed(endpoint, params, fmt, version, encoding):
+    body, _ = response(endpoint, params, fmt, version)
+    if encoding == "br":
+        return _brotli().compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+
+def index():
+    return json.dumps({
+        f"/{name}": {"parameters": list(accepted) + ["format"], "tables": list(tables)}
+        for name, (tables, accepted, _) in ENDPOINTS.items()
+    }, indent=2).encode()
+
+
+def clear_cache():
+    for cached in (_level, _counties, response, compressed):
+        cached.cache_clear()
+
+
+# ----------------- SERVER -----------------
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    # keep-alive: clients issuing many small queries reuse one connection
+    protocol_version = "HTTP/1.1"
+    # headers and body are two writes; with Nagle on, every keep-alive response waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        endpoint = urlsplit(self.path).path.strip("/")
+        if endpoint == "":
+            self._send(200, index(), JSON_TYPE)
+            return
+        if endpoint not in ENDPOINTS:
+            self._send(404, json.dumps({"error": f"unknown endpoint /{endpoint}, see /"}).encode(), JSON_TYPE)
+            return
+        try:
+            endpoint, params, fmt = parse_query(self.path, self.headers.get("Accept", ""))
+            version = data.store_version()
+            body, etag = response(endpoint, params, fmt, version)
+        except QueryError as e:
+            self._send(400, json.dumps({"error": str(e)}).encode(), JSON_TYPE)
+            return
+        except FileNotFoundError as e:
+            self._send(503, json.dumps({"error": str(e)}).encode(), JSON_TYPE)
+            return
+
+        encoding = content_encoding(self.headers.get("Accept-Encoding", ""))
+        headers = {
+            "ETag": encoded_etag(etag, encoding),
+            "Cache-Control": f"public, max-age={MAX_AGE}",
+            "Vary": "Accept, Accept-Encoding",
+        }
+        if etag_matches(self.headers.get("If-None-Match", ""), headers["ETag"]):
+            self._send(304, b"", None, headers)
+            return
+        if encoding is not None:
+            body = compressed(endpoint, params, fmt, version, encoding)
+            headers["Content-Encoding"] = encoding
+        self._send(200, body, FORMATS[fmt], headers)
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        if content_type is not None:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    if not store.MANIFEST_PATH.exists():
+        raise FileNotFoundError(f"{store.MANIFEST_PATH} not found, run `python -m elections_germany build-store`")
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    print(f"serving the data API on http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
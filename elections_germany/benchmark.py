@@ -0,0 +1,246 @@
+"""
+Page render benchmarks.
+
+Every page (``Home.py`` and ``pages/*.py``) is run headlessly through
+Streamlit's ``AppTest`` in a fresh process, so the first run is cold (no
+imports, no ``st.cache_*`` entries) and the following runs are warm. Per
+page we record:
+
+- ``cold_seconds`` / ``warm_seconds``: wall time of the first run and the
+  median of ``repeat`` further runs
+- ``peak_rss_kb``: peak resident memory of the page process
+- ``delta_bytes``: serialized size of the forward messages (deltas) a run
+  sends to the browser
+- ``sweep``: time and delta bytes after setting every option of every
+  selectbox, ticking every checkbox and moving every slider to its ends,
+  one at a time
+
+Runs and interactions that raise are recorded with an ``error`` instead of
+aborting the suite.
+
+Each run is appended to ``data/benchmark_history.json`` together with the
+git commit it was measured on. ``compare`` checks the new run against the
+previous one, so a slow page can be caught before deploying::
+
+    python -m elections_germany benchmark --max-regression 0.2
+"""
+
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+from elections_germany import store
+
+HISTORY_PATH = store.DATA_DIR / "benchmark_history.json"
+TIMEOUT = 300  # seconds per AppTest run
+
+
+def pages():
+    """Every page of the app, relative to the repository root."""
+    return ["Home.py"] + sorted(
+        str(p.relative_to(store.ROOT)) for p in (store.ROOT / "pages").glob("*.py")
+    )
+
+
+# ----------------- ONE PAGE -----------------
+# Runs in its own process (see ``run_benchmarks``).
+
+
+class _DeltaCounter:
+    """Counts the bytes of every ForwardMsg enqueued by a script run."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def install(self):
+        from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+        enqueue = ForwardMsgQueue.enqueue
+        counter = self
+
+        def counting_enqueue(queue, msg):
+            counter.bytes += msg.ByteSize()
+            return enqueue(queue, msg)
+
+        ForwardMsgQueue.enqueue = counting_enqueue
+
+
+def _timed(counter, action):
+    """``(app, result)`` of one run; the app is None if AppTest itself raised."""
+    counter.bytes = 0
+    start = time.perf_counter()
+    # a failing run is recorded, not raised, so one broken widget does not
+    # stop the suite
+    try:
+        at = action()
+    except Exception as e:
+        # raised before the script ran, e.g. a value that is not an option
+        at, error = None, f"{type(e).__name__}: {e}"
+    else:
+        error = str(at.exception[0].value) if at.exception else None
+    seconds = time.perf_counter() - start
+    result = {"seconds": round(seconds, 4), "delta_bytes": counter.bytes}
+    if error is not None:
+        result["error"] = error
+    return at, result
+
+
+def select_index(widget, index):
+    """
+    Select option ``index`` of a selectbox or radio. The browser sends the
+    label of the chosen option and AppTest only knows the labels, so the
+    identity is installed as the widget's format_func: ``select`` and
+    ``select_index`` fail on widgets whose format_func maps values to labels.
+    """
+    from streamlit.testing.v1.element_tree import TESTING_KEY
+
+    widget.root.session_state[TESTING_KEY][widget.id] = str
+    return widget.set_value(widget.options[index])
+
+
+def _slider_ends(slider):
+    """Values of a slider at both ends of its range, except its current one."""
+    if isinstance(slider.value, (list, tuple)):
+        ends = [[slider.min, slider.max]]
+    else:
+        ends = [slider.min, slider.max]
+    return [v for v in ends if v != slider.value]
+
+
+def _sweep(at, counter, fresh_run):
+    """
+    Every selectbox option, every checkbox and both ends of every slider, one
+    interaction each. After a failed interaction the sweep continues from a
+    fresh run, so the failed value is not carried into the next one.
+    """
+    results = []
+
+    def interact(widget, label, value, action):
+        nonlocal at
+        after, result = _timed(counter, action)
+        results.append({"widget": widget, "label": label, "value": str(value), **result})
+        at = after if "error" not in result else fresh_run()
+
+    for i in range(len(at.selectbox)):
+        box = at.selectbox[i]
+        for j, option in enumerate(list(box.options)):
+            interact("selectbox", box.label, option, lambda: select_index(at.selectbox[i], j).run(timeout=TIMEOUT))
+
+    for i in range(len(at.slider)):
+        slider = at.slider[i]
+        for value in _slider_ends(slider):
+            interact("slider", slider.label, value, lambda: at.slider[i].set_value(value).run(timeout=TIMEOUT))
+
+    for i in range(len(at.checkbox)):
+        label = at.checkbox[i].label
+        if at.checkbox[i].value:
+            continue
+        interact("checkbox", label, True, lambda: at.checkbox[i].check().run(timeout=TIMEOUT))
+        if i < len(at.checkbox) and at.checkbox[i].value:
+            at = at.checkbox[i].uncheck().run(timeout=TIMEOUT)
+    return results
+
+
+def benchmark_page(page, repeat=3, sweep=True):
+    """Cold run, ``repeat`` warm runs and the widget sweep of one page."""
+    from streamlit.testing.v1 import AppTest
+
+    # pages open images etc. relative to the app directory
+    os.chdir(store.ROOT)
+    counter = _DeltaCounter()
+    counter.install()
+    script = str(store.ROOT / page)
+
+    def fresh_run():
+        return AppTest.from_file(script, default_timeout=TIMEOUT).run()
+
+    at, cold = _timed(counter, fresh_run)
+    warm = [_timed(counter, fresh_run)[1] for _ in range(repeat)]
+
+    result = {
+        "cold_seconds": cold["seconds"],
+        "warm_seconds": round(statistics.median(w["seconds"] for w in warm), 4),
+        "delta_bytes": warm[-1]["delta_bytes"] if warm else cold["delta_bytes"],
+        "sweep": _sweep(at, counter, fresh_run) if sweep and "error" not in cold else [],
+    }
+    if "error" in cold:
+        result["error"] = cold["error"]
+    # Linux reports kilobytes, macOS bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["peak_rss_kb"] = peak // 1024 if platform.system() == "Darwin" else peak
+    return result
+
+
+# ----------------- SUITE -----------------
+
+
+def run_benchmarks(names=None, repeat=3, sweep=True):
+    """Benchmark every page in ``names`` (default: all), one process each."""
+    results = {}
+    for page in names or pages():
+        # a new interpreter per page: cold means cold, and RSS is per page
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            results[page] = pool.submit(benchmark_page, page, repeat, sweep).result()
+    return results
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=store.ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def read_history(path=HISTORY_PATH):
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def append_history(results, path=HISTORY_PATH):
+    """Append a run to the history file; returns the new entry."""
+    import streamlit
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "machine": platform.node(),
+        "pages": results,
+    }
+    history = read_history(path)
+    history.append(entry)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=2)
+    tmp.replace(path)
+    return entry
+
+
+def compare(previous, current, max_regression=0.2):
+    """
+    Pages whose cold or warm time grew by more than ``max_regression``
+    (a fraction) since ``previous``, as ``(page, metric, before, after)``.
+    """
+    regressions = []
+    for page, result in current["pages"].items():
+        before = previous["pages"].get(page)
+        if before is None:
+            continue
+        for metric in ("cold_seconds", "warm_seconds"):
+            if result[metric] > before[metric] * (1 + max_regression):
+                regressions.append((page, metric, before[metric], result[metric]))
+    return regressions
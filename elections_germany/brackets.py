@@ -0,0 +1,114 @@
+"""
+Vote shares by income bracket (page 01).
+
+``income_brackets`` splits the municipalities of one election year into
+``n_bins`` quantiles of the tax per taxpayer of their Kreis and returns the
+vote share of every party per bracket. The quantiles and the shares use the
+same weighting, computed from the cumulative weights of the rows sorted by
+tax:
+
+- ``"valid_votes"``: every bracket holds about the same number of voters and
+  its shares are the vote shares of all its voters together
+- ``"taxpayers"``: every bracket holds about the same number of taxpayers (the
+  taxpayers of a Kreis are spread over its municipalities by valid votes)
+- ``"none"``: every municipality counts once, as ``pd.qcut`` followed by
+  ``groupby().mean()``
+
+Results are memoized in a bounded LRU keyed on all parameters and the
+version of ``tax_votes``, so switching back and forth between years and bin
+counts does not recompute them, and a rebuilt table is picked up.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from elections_germany import data
+from elections_germany.regions import PANEL_PARTIES, panel_year
+
+WEIGHTINGS = ("valid_votes", "taxpayers", "none")
+DEFAULT_WEIGHTING = "valid_votes"
+CACHE_SIZE = 128  # parameter combinations kept by ``income_brackets``
+
+
+def row_weights(rows, weighting):
+    """Weight of every municipality of one election and tax year."""
+    if weighting == "none":
+        return np.ones(len(rows))
+    valid = rows["valid_votes"].to_numpy(dtype="float64")
+    if weighting == "valid_votes":
+        return valid
+    if weighting == "taxpayers":
+        kreis_valid = rows.groupby("county")["valid_votes"].transform("sum").to_numpy(dtype="float64")
+        return rows["Taxpayer_Count"].to_numpy(dtype="float64") * valid / kreis_valid
+    raise ValueError(f"unknown weighting {weighting!r}, expected one of {WEIGHTINGS}")
+
+
+def bracket_table(values, shares, weights, n_bins, weighted=True):
+    """
+    Bracket index, weighted median of ``values`` and weighted mean of every
+    column of ``shares`` for ``n_bins`` quantiles of ``values``.
+
+    Returns ``(bins, medians, means)`` for the non-empty brackets, lowest
+    first. Unweighted quantiles are interpolated like ``pd.qcut``.
+    """
+    order = np.argsort(values, kind="stable")
+    values, shares, weights = values[order], shares[order], weights[order]
+    cum = np.cumsum(weights)
+
+    q = np.arange(1, n_bins) / n_bins
+    if weighted:
+        inner = values[np.searchsorted(cum, q * cum[-1], side="left")]
+    else:
+        inner = np.quantile(values, q)
+    # right-closed brackets, as pd.qcut
+    bins = np.searchsorted(inner, values, side="left")
+
+    # sorted by value, every bracket is a contiguous run of rows
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    ends = np.r_[starts[1:], len(values)]
+    totals = np.add.reduceat(weights, starts)
+    means = np.add.reduceat(shares * weights[:, None], starts, axis=0) / totals[:, None]
+
+    # weighted median: where the cumulative weight passes half the bracket,
+    # between two rows if it lands exactly on one
+    half = cum[starts] - weights[starts] + totals / 2
+    at = np.minimum(np.searchsorted(cum, half, side="left"), ends - 1)
+    next_row = np.minimum(at + 1, ends - 1)
+    on_row = np.isclose(cum[at], half)
+    medians = np.where(on_row, (values[at] + values[next_row]) / 2, values[at])
+    return bins[starts], medians, means
+
+
+def income_brackets(election_year, tax_year=None, n_bins=5,
+                    weighting=DEFAULT_WEIGHTING, parties=tuple(PANEL_PARTIES)):
+    """
+    Median ``Tax_per_Taxpayer`` (int, €) and vote share (0-1) of every party
+    in ``parties`` per income bracket of one election year (tax year default:
+    the latest), both indexed by ``TaxBin`` (0 = lowest income).
+
+    The returned objects are shared by every caller; do not modify them.
+    """
+    return _income_brackets(
+        election_year, tax_year, n_bins, weighting, tuple(parties), data.table_version("tax_votes"),
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _income_brackets(election_year, tax_year, n_bins, weighting, parties, version):
+    rows = panel_year(data.tax_votes(), election_year, tax_year)
+    parties = list(parties)
+    weights = row_weights(rows, weighting)
+    values = rows["Tax_per_Taxpayer"].to_numpy(dtype="float64")
+    shares = rows[parties].to_numpy(dtype="float64")
+
+    keep = ~np.isnan(values) & ~np.isnan(shares).any(axis=1) & (weights > 0)
+    bins, medians, means = bracket_table(
+        values[keep], shares[keep], weights[keep], n_bins, weighted=weighting != "none"
+    )
+
+    index = pd.Index(bins, name="TaxBin")
+    bin_labels = pd.Series(np.round(medians).astype(int), index=index, name="Tax_per_Taxpayer")
+    mean_by_bin = pd.DataFrame(means, index=index, columns=parties)
+    return bin_labels, mean_by_bin
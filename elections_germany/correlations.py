@@ -0,0 +1,209 @@
+"""
+Correlations between national party vote shares and economic indicators.
+
+``correlation_table`` correlates every party of ``gdp_votes`` with every
+indicator built from the annual GDP growth and unemployment series -- the
+value in the election year, its lags and its rolling means -- with both
+Pearson and Spearman, in one broadcast NumPy pass over all pairs.
+
+Confidence intervals are percentile bootstraps over the elections. The
+resamples are evaluated in batches of the same vectorized function, spread
+over a process pool.
+
+The result is the derived store table ``correlations``, so it is recomputed
+whenever one of the source files changes. ``Home.py`` only shows point
+estimates and computes them with ``point_estimates`` (the same ``correlate``
+call, without the bootstrap), so a cold Home page never waits for the
+table to be built and still shows the numbers of page 03.
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+PARTY_COLS = ["cdu_csu", "spd_total", "gruene_total", "fdp_total", "linke_pds_total", "afd_total"]
+METHODS = ("pearson", "spearman")
+
+N_BOOT = 2000
+BATCH = 250  # resamples per pool task
+CONFIDENCE = 0.95
+SEED = 20250223
+
+SERIES_LABELS = {"gdp": "GDP Growth", "unemployment": "Unemployment"}
+
+
+# ----------------- INDICATORS -----------------
+
+
+def indicator_frame(election_years, series):
+    """
+    One row per election year and, for every annual series in ``series``
+    (name -> Series indexed by year), the columns
+
+    - ``<name>``: value in the election year
+    - ``<name>_lag1`` / ``<name>_lag2``: value one / two years before
+    - ``<name>_lag2_avg``: mean of the two years before the election
+    - ``<name>_roll3``: mean of the election year and the two years before
+
+    An election only enters an indicator once its own year is complete in
+    the series (e.g. 2025 has no GDP growth yet), so all indicators of a
+    series are compared over the same elections.
+    """
+    years = pd.Index(np.asarray(election_years, dtype="int64"), name="election_year")
+    out = pd.DataFrame(index=years)
+    for name, values in series.items():
+        values = values.astype("float64")
+        values.index = values.index.astype("int64")
+
+        def at(offset):
+            return values.reindex(years - offset).to_numpy()
+
+        published = ~np.isnan(at(0))
+        columns = {
+            name: at(0),
+            f"{name}_lag1": at(1),
+            f"{name}_lag2": at(2),
+            f"{name}_lag2_avg": (at(1) + at(2)) / 2,
+            f"{name}_roll3": (at(0) + at(1) + at(2)) / 3,
+        }
+        for col, col_values in columns.items():
+            out[col] = np.where(published, col_values, np.nan)
+    return out
+
+
+# ----------------- VECTORIZED CORRELATION -----------------
+
+
+def _ranks(a):
+    """
+    Average ranks (1-based, ties share their mean rank) along axis -3, the
+    observation axis; NaNs stay NaN and are not counted.
+    """
+    left = a[..., :, None, :, :]
+    right = a[..., None, :, :, :]
+    less = (right < left).sum(axis=-3)
+    equal = (right == left).sum(axis=-3)
+    ranks = less + (equal + 1) / 2
+    return np.where(np.isnan(a), np.nan, ranks)
+
+
+def correlate(x, y, method="pearson"):
+    """
+    Correlation of every column of ``x`` (..., n, p) with every column of
+    ``y`` (..., n, k), as an array (..., p, k). Leading axes are batches
+    (bootstrap resamples). Each pair uses the observations where both values
+    are present.
+    """
+    xx = x[..., :, :, None]
+    yy = y[..., :, None, :]
+    both = ~np.isnan(xx) & ~np.isnan(yy)
+    xx = np.where(both, xx, np.nan)
+    yy = np.where(both, yy, np.nan)
+    if method == "spearman":
+        xx, yy = _ranks(xx), _ranks(yy)
+    elif method != "pearson":
+        raise ValueError(f"unknown method {method!r}, expected one of {METHODS}")
+
+    # resamples can leave a pair without observations or with a constant column
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        dx = xx - np.nanmean(xx, axis=-3, keepdims=True)
+        dy = yy - np.nanmean(yy, axis=-3, keepdims=True)
+        cov = np.nansum(dx * dy, axis=-3)
+        r = cov / np.sqrt(np.nansum(dx * dx, axis=-3) * np.nansum(dy * dy, axis=-3))
+    # fewer than 3 pairs or a constant column: undefined
+    return np.where(both.sum(axis=-3) >= 3, r, np.nan)
+
+
+def _bootstrap_batch(x, y, method, seed, size):
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, x.shape[0], size=(size, x.shape[0]))
+    return correlate(x[rows], y[rows], method)
+
+
+def bootstrap(x, y, method="pearson", n_boot=N_BOOT, workers=None, seed=SEED):
+    """``n_boot`` resampled correlation matrices (n_boot, p, k)."""
+    sizes = [min(BATCH, n_boot - start) for start in range(0, n_boot, BATCH)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        batches = pool.map(
+            _bootstrap_batch,
+            [x] * len(sizes), [y] * len(sizes), [method] * len(sizes), seeds, sizes,
+        )
+        return np.concatenate(list(batches))
+
+
+# ----------------- TABLE -----------------
+
+
+def _inputs(gdp_votes, deu_gdp, unemployment):
+    """Party shares ``x`` (elections, parties), indicators ``y`` (elections, indicators) and their frame."""
+    votes = gdp_votes.sort_values("election_year")
+    indicators = indicator_frame(
+        votes["election_year"],
+        {
+            "gdp": deu_gdp["gdp_growth"],
+            "unemployment": unemployment.set_index("year")["unemployment_percentage"],
+        },
+    )
+    x = votes[PARTY_COLS].to_numpy(dtype="float64")
+    return x, indicators.to_numpy(dtype="float64"), indicators
+
+
+def correlation_table(gdp_votes, deu_gdp, unemployment, n_boot=N_BOOT, workers=None):
+    """
+    Long table with one row per party, indicator and method: ``r``, the
+    number of elections ``n`` and the bootstrap interval ``ci_low`` /
+    ``ci_high``.
+    """
+    x, y, indicators = _inputs(gdp_votes, deu_gdp, unemployment)
+    n = (~np.isnan(x[:, :, None]) & ~np.isnan(y[:, None, :])).sum(axis=0)
+
+    alpha = (1 - CONFIDENCE) / 2
+    frames = []
+    for method in METHODS:
+        r = correlate(x, y, method)
+        resampled = bootstrap(x, y, method, n_boot=n_boot, workers=workers)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN pairs
+            low, high = np.nanquantile(resampled, [alpha, 1 - alpha], axis=0)
+        frames.append(pd.DataFrame({
+            "party": np.repeat(PARTY_COLS, y.shape[1]),
+            "indicator": np.tile(indicators.columns, len(PARTY_COLS)),
+            "method": method,
+            "r": r.ravel(),
+            "n": n.ravel().astype("int16"),
+            "ci_low": low.ravel(),
+            "ci_high": high.ravel(),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def point_estimates(gdp_votes, deu_gdp, unemployment, indicator="gdp_lag2_avg", method="pearson"):
+    """``r`` of every party with one indicator, as ``lookup(table, ...)["r"]`` but without the bootstrap."""
+    x, y, indicators = _inputs(gdp_votes, deu_gdp, unemployment)
+    r = correlate(x, y[:, [indicators.columns.get_loc(indicator)]], method)[:, 0]
+    return pd.Series(r, index=pd.Index(PARTY_COLS, name="party"), name="r")
+
+
+def indicator_label(indicator):
+    """Readable name of an ``indicator_frame`` column, e.g. "2-Year Average GDP Growth"."""
+    name, _, suffix = indicator.partition("_")
+    if name not in SERIES_LABELS:
+        return indicator
+    label = SERIES_LABELS[name]
+    return {
+        "": label,
+        "lag1": f"{label} 1 Year Before",
+        "lag2": f"{label} 2 Years Before",
+        "lag2_avg": f"2-Year Average {label}",
+        "roll3": f"3-Year Average {label} (incl. Election Year)",
+    }.get(suffix, indicator)
+
+
+def lookup(table, indicator="gdp_lag2_avg", method="pearson"):
+    """Rows of one indicator and method, indexed by party in ``PARTY_COLS`` order."""
+    rows = table[(table["indicator"] == indicator) & (table["method"] == method)]
+    return rows.set_index("party").reindex(PARTY_COLS)
@@ -0,0 +1,137 @@
+"""
+County crosswalk across territorial reforms (changes of the Gebietsstand).
+
+The GERDA election results and the map geometry use today's Kreise, while
+the income statistics of year t use the layout of year t + 3: before the
+reforms in Saxony-Anhalt (2007), Saxony (2008), Mecklenburg-Vorpommern
+(2011) and a few single mergers they report counties that no longer exist,
+and joins on ``county`` silently drop them.
+
+``data/county_crosswalk.csv`` lists every reform as edges ``from_code`` ->
+``to_code``, one successor per old county. A county that only grew keeps an
+edge to itself (Wartburgkreis 2021). The few counties that were split
+(Anhalt-Zerbst, Aschersleben-Staßfurt, Demmin) are recoded as a whole to the
+successor that received most of them: the harmonised GERDA files only know
+today's municipalities, so the shares of the split-off parts cannot be
+derived from the data in the repo.
+
+``rebase`` chains the reforms into one recode from every old (year, county)
+row to the latest layout and sums the rows that end up in the same county,
+so a whole multi-year panel is re-based at once. The store table
+``county_incomes`` is ``sorted_incomes`` re-based this way.
+"""
+
+import numpy as np
+import pandas as pd
+
+# income statistics of year t use the layout of year t + 3 (data/README_data.md)
+INCOME_LAYOUT_LAG = 3
+
+
+def check_recode(crosswalk):
+    """Raises ValueError if a county has more than one successor in a reform."""
+    split = crosswalk[crosswalk.duplicated(["reform_year", "from_code"], keep=False)]
+    if not split.empty:
+        row = split.iloc[0]
+        raise ValueError(
+            f"county {row['from_code']} has several successors in the {row['reform_year']} reform"
+        )
+
+
+def layout_mapping(crosswalk, layout_year):
+    """
+    ``from_code`` -> ``to_code`` from the layout of ``layout_year`` to the
+    latest one, with the reforms after it chained, for every code that
+    changed after ``layout_year``.
+    """
+    later = crosswalk[crosswalk["reform_year"] > layout_year]
+    codes = later["from_code"].unique()
+    mapped = pd.Series(codes, index=codes)
+    for _, edges in later.groupby("reform_year", sort=True):
+        recode = pd.Series(edges["to_code"].to_numpy(), index=edges["from_code"].to_numpy())
+        mapped = mapped.map(recode).fillna(mapped).astype(mapped.dtype)
+    return pd.DataFrame({"from_code": mapped.index, "to_code": mapped.to_numpy()})
+
+
+def rebase(frame, crosswalk, code="code", period="year", sums=(), means=None, layout_lag=0):
+    """
+    ``frame`` (one row per ``period`` and ``code``) in the latest layout of
+    ``crosswalk``.
+
+    A row is in an old layout if its code changed in a reform after
+    ``period + layout_lag``. Such rows are recoded to the latest codes and
+    the rows of one new county are combined: ``sums`` (counts, amounts) are
+    added up, ``means`` (column -> mass column, e.g. a per-taxpayer value ->
+    the number of taxpayers) are averaged weighted by their mass. A new
+    county only gets a value if every county mapped into it has one. Rows in
+    the latest layout are kept, and a code that is also published in the
+    latest layout for the same period keeps the published row. The other
+    columns of a re-based row are taken from the latest row of its code.
+    """
+    means = dict(means or {})
+    sums = list(sums)
+    reform_years = np.sort(crosswalk["reform_year"].unique())
+    layout = frame[period].to_numpy(dtype="int64") + layout_lag
+    epoch = np.searchsorted(reform_years, layout, side="right")
+
+    old_epochs = np.unique(epoch[epoch < len(reform_years)])
+    if len(old_epochs) == 0:
+        return frame.sort_values([period, code], ignore_index=True)
+    mapping = pd.concat(
+        [layout_mapping(crosswalk, reform_years[e] - 1).assign(epoch=e) for e in old_epochs],
+        ignore_index=True,
+    )
+
+    rows = pd.DataFrame({
+        "row": np.arange(len(frame)),
+        "epoch": epoch,
+        "from_code": frame[code].to_numpy(),
+    })
+    edges = rows.merge(mapping, on=["epoch", "from_code"])
+    old = np.zeros(len(frame), dtype=bool)
+    old[edges["row"].to_numpy()] = True
+
+    # columns: sums, mass-weighted means, masses
+    moved = frame.iloc[edges["row"].to_numpy()]
+    keys = [period, "epoch", "to_code"]
+    values = pd.DataFrame({
+        period: moved[period].to_numpy(),
+        "epoch": edges["epoch"].to_numpy(),
+        "to_code": edges["to_code"].to_numpy(),
+    })
+    for col in sums:
+        values[col] = moved[col].to_numpy(dtype="float64")
+    for i, (col, mass) in enumerate(means.items()):
+        weights = moved[mass].to_numpy(dtype="float64")
+        values[f"_mean{i}"] = moved[col].to_numpy(dtype="float64") * weights
+        values[f"_mass{i}"] = weights
+    grouped = values.groupby(keys, sort=False)
+    totals = grouped.sum()
+    covered = grouped.count()
+
+    # counties every new county needs from the old layout
+    expected = mapping.groupby(["epoch", "to_code"]).size()
+    needed = expected.reindex(totals.index.droplevel(period)).to_numpy()
+    totals = totals.where(covered.ge(needed, axis=0))
+
+    totals = totals.reset_index()
+    rebased = totals[[period]].assign(**{code: totals["to_code"].to_numpy()})
+    for col in sums:
+        rebased[col] = totals[col].to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i, col in enumerate(means):
+            rebased[col] = (totals[f"_mean{i}"] / totals[f"_mass{i}"]).to_numpy()
+    rebased = rebased.dropna(subset=sums + list(means), how="all")
+
+    kept = frame[~old]
+    published = kept[sums + list(means)].notna().any(axis=1)
+
+    # labels (names, state codes) of a re-based row: latest row of its code
+    labels = [c for c in frame.columns if c not in rebased.columns]
+    latest = kept.sort_values(period).drop_duplicates(code, keep="last")[[code] + labels]
+    rebased = rebased.merge(latest, on=code, how="left")
+
+    # published values first, then re-based ones, then empty published rows
+    out = pd.concat([kept[published], rebased[frame.columns], kept[~published]], ignore_index=True)
+    out = out.drop_duplicates([period, code])
+    return out.sort_values([period, code], ignore_index=True)
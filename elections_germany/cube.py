@@ -0,0 +1,110 @@
+"""
+Vote-weighted election results at every level of the region hierarchy.
+
+The municipal GERDA shares are converted to vote counts once (share x
+valid votes) and summed up municipality -> county -> state -> federal in a
+single pass: the rows are sorted by (year, state, county, municipality) once
+and every level is an ``np.add.reduceat`` over the group starts of the level
+below it. Shares of a county, a state or the country are then votes / valid
+votes, not the unweighted mean of municipal shares.
+
+The result is the store table ``vote_cube``, one row per (election year,
+level, region) with the valid votes, the share of every party in
+``PARTIES`` and ``GROUPS``, and the winner, runner-up and margin among
+``PARTIES``. Pages read one level with ``data.elections``.
+"""
+
+import numpy as np
+import pandas as pd
+
+# parties competing for the winner of a region, in GERDA column order
+PARTIES = ["cdu", "csu", "spd", "gruene", "fdp", "linke_pds", "afd", "other_parties"]
+# aggregate columns of the GERDA files, summed like a party
+GROUPS = ["cdu_csu", "far_right", "far_left_w_linke"]
+
+# finest first; the sort keys that identify a region of the level
+LEVELS = {
+    "municipality": ["election_year", "state", "county", "ags"],
+    "county": ["election_year", "state", "county"],
+    "state": ["election_year", "state"],
+    "federal": ["election_year"],
+}
+
+
+def _group_starts(keys):
+    """First row of every run of equal keys in sorted ``keys`` (list of arrays)."""
+    change = np.zeros(len(keys[0]), dtype=bool)
+    change[0] = True
+    for key in keys:
+        change[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(change)
+
+
+def winners(shares, parties=PARTIES):
+    """
+    Winner, runner-up and margin (share points between them) of every row of
+    the share matrix ``shares`` (regions x ``parties``).
+    """
+    names = np.asarray(parties)
+    top2 = np.argpartition(-shares, 1, axis=1)[:, :2]
+    top2_shares = np.take_along_axis(shares, top2, axis=1)
+    # argpartition does not order the two
+    swap = top2_shares[:, 1] > top2_shares[:, 0]
+    top2[swap] = top2[swap][:, ::-1]
+    top2_shares[swap] = top2_shares[swap][:, ::-1]
+    return pd.DataFrame({
+        "winner": names[top2[:, 0]],
+        "runner_up": names[top2[:, 1]],
+        "margin": top2_shares[:, 0] - top2_shares[:, 1],
+    })
+
+
+def vote_cube(gerda):
+    """Every level of ``LEVELS`` from the municipal GERDA results, stacked."""
+    from elections_germany.pipeline import OTHER_PARTIES
+
+    gerda = gerda.sort_values(LEVELS["municipality"], ignore_index=True)
+    shares = gerda[PARTIES[:-1] + GROUPS].astype("float64").fillna(0)
+    shares.insert(
+        len(PARTIES) - 1,
+        "other_parties",
+        gerda.loc[:, OTHER_PARTIES[0]:OTHER_PARTIES[1]].astype("float64").sum(axis=1),
+    )
+    valid = gerda["valid_votes"].to_numpy(dtype="float64")
+    valid = np.where(np.isnan(valid), 0.0, valid)
+    # valid votes first, then the votes of every party and group
+    sums = np.column_stack([valid, shares.to_numpy() * valid[:, None]])
+    keys = gerda[LEVELS["municipality"]].to_numpy(dtype="int64")
+
+    frames = []
+    starts_below = np.arange(len(gerda))
+    for level, columns in LEVELS.items():
+        starts = _group_starts([keys[:, i] for i in range(len(columns))])
+        # the groups of a level are runs of groups of the level below it
+        sums = np.add.reduceat(sums, np.searchsorted(starts_below, starts), axis=0)
+        starts_below = starts
+
+        region = keys[starts, len(columns) - 1] if len(columns) > 1 else np.zeros(len(starts))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            level_shares = sums[:, 1:] / sums[:, :1]
+        frame = pd.DataFrame(level_shares, columns=shares.columns)
+        frame.insert(0, "election_year", keys[starts, 0])
+        frame.insert(1, "level", level)
+        frame.insert(2, "region", region)
+        frame.insert(3, "valid_votes", sums[:, 0])
+        frames.append(pd.concat(
+            [frame, winners(np.nan_to_num(level_shares[:, : len(PARTIES)]))], axis=1
+        ))
+
+    cube = pd.concat(frames, ignore_index=True)
+    cube["level"] = pd.Categorical(cube["level"], categories=list(LEVELS))
+    return cube
+
+
+def national_shares(federal):
+    """Federal rows in the layout of page 02: ``<party>_total`` and ``cdu_csu`` in percent."""
+    out = pd.DataFrame({"election_year": federal["election_year"].to_numpy()})
+    for party in PARTIES[:-1]:
+        out[f"{party}_total"] = federal[party].to_numpy(dtype="float64") * 100
+    out["cdu_csu"] = out["cdu_total"] + out["csu_total"]
+    return out.sort_values("election_year", ignore_index=True)
@@ -0,0 +1,179 @@
+"""
+The one way the pages, the API and the prewarm thread read the store.
+
+    elections(level, years, columns)    vote cube, one level of the region hierarchy
+    municipal_votes(year, columns)      GERDA results per municipality, one election
+    income(years, columns)              county incomes, re-based to today's Kreise
+    taxation(years) / tax_votes()       income tax per Kreis, joined with the votes
+    gdp() / unemployment()              German GDP growth and unemployment rate
+    national_votes()                    national shares with GDP growth (``gdp_votes``)
+    year_alignment() / correlations()
+
+Every page used to wrap ``store.load_table`` in its own loader
+(``load_data(name)`` on pages 02-04, ``load_income_tax_data`` on page 01,
+...), so a table was decoded and cached once per page and ``st.cache_data``
+handed every rerun an unpickled copy of it. The accessors read only the
+requested columns and years from the Parquet files and memoize the result in
+one process-wide cache, keyed on the normalised arguments and the source hash
+of the table in the store manifest: every caller shares one frame per query,
+and a rebuilt table is picked up without a restart. Caches built on top of
+the accessors key on ``table_version`` (or ``store_version``) as well.
+Inside a ``profiling.step`` an accessor records whether it was a cache hit
+and the size of its result.
+
+The frames are shared: copy them before modifying them in place.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from elections_germany import profiling, store
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+CACHE_SIZE = 128  # distinct queries kept in memory
+
+
+def store_version() -> int:
+    """Changes whenever a build changes the manifest (a ``stat``, no read)."""
+    try:
+        return store.MANIFEST_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=4)
+def _source_hashes(version):
+    return {name: entry["source_sha256"] for name, entry in store.read_manifest().items()}
+
+
+def source_hashes() -> dict:
+    """``{table: source hash}`` of every built table, read once per manifest version."""
+    return _source_hashes(store_version())
+
+
+def table_version(name: str) -> str | None:
+    """Source hash of one table, None if it has not been built yet; part of every cache key."""
+    return source_hashes().get(name)
+
+
+def _columns(columns: Iterable[str] | None) -> tuple | None:
+    """Hashable cache key of a column list; the order of the columns is kept."""
+    return None if columns is None else tuple(dict.fromkeys(columns))
+
+
+def _years(years: Iterable[int] | int | None) -> tuple | None:
+    """Hashable, order-independent cache key of one year or a list of years."""
+    if years is None:
+        return None
+    if not isinstance(years, Iterable):
+        years = [years]
+    return tuple(sorted({int(y) for y in years}))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+@profiling.computed
+def _read(name, columns, filters, version):
+    return store.load_table(
+        name,
+        columns=list(columns) if columns is not None else None,
+        filters=[(col, op, list(v) if isinstance(v, tuple) else v) for col, op, v in filters] or None,
+    )
+
+
+def read(name: str, columns: Iterable[str] | None = None, **equal) -> pd.DataFrame:
+    """
+    Any store table through the shared cache, with only ``columns`` decoded
+    and only the rows where every ``column=value`` of ``equal`` holds (a
+    list or tuple value matches any of its items).
+    """
+    filters = tuple(
+        (col, "in", tuple(value)) if isinstance(value, (list, tuple, set, range)) else (col, "==", value)
+        for col, value in sorted(equal.items())
+        if value is not None
+    )
+    return profiling.cached(_read(name, _columns(columns), filters, table_version(name)))
+
+
+def clear_cache():
+    _read.cache_clear()
+    _source_hashes.cache_clear()
+
+
+# ----------------- ELECTIONS -----------------
+
+
+def elections(
+    level: str, years: Iterable[int] | int | None = None, columns: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Vote-weighted results of one level of ``cube.LEVELS`` ("municipality",
+    "county", "state", "federal"), one row per election year and region.
+    """
+    from elections_germany.cube import LEVELS
+
+    if level not in LEVELS:
+        raise ValueError(f"unknown level {level!r}, expected one of {list(LEVELS)}")
+    return read("vote_cube", columns, level=level, election_year=_years(years))
+
+
+def municipal_votes(year: int, columns: Iterable[str] | None = None) -> pd.DataFrame:
+    """
+    GERDA results per municipality of one federal election, on the municipal
+    boundaries of the 2021 file up to its last election and of the 2025 file
+    after it.
+    """
+    from elections_germany.regions import LAST_2021_BOUNDARY_ELECTION
+
+    table = "federal_muni_harm_21" if year <= LAST_2021_BOUNDARY_ELECTION else "federal_muni_harm_25"
+    return read(table, columns, election_year=int(year))
+
+
+def year_alignment() -> pd.DataFrame:
+    """Income year used for every election year (see ``alignment``)."""
+    return read("year_alignment")
+
+
+# ----------------- INCOME AND TAXES -----------------
+
+
+def income(years: Iterable[int] | int | None = None, columns: Iterable[str] | None = None) -> pd.DataFrame:
+    """Income per county and year, old Kreise re-based to today's (``county_incomes``)."""
+    return read("county_incomes", columns, year=_years(years))
+
+
+def taxation(years: Iterable[int] | int | None = None) -> pd.DataFrame:
+    """Income tax per state and Kreis (GENESIS 73111-01-01-5)."""
+    return read("taxation", Year=_years(years))
+
+
+def tax_votes() -> pd.DataFrame:
+    """Kreis income tax x municipal election results, every tax and election year."""
+    return read("tax_votes")
+
+
+# ----------------- ECONOMY -----------------
+
+
+def gdp() -> pd.DataFrame:
+    """German GDP growth in %, indexed by year."""
+    return read("deu_gdp")
+
+
+def unemployment() -> pd.DataFrame:
+    """German unemployment rate in %, one row per year."""
+    return read("unemployment")
+
+
+def national_votes() -> pd.DataFrame:
+    """National party shares per election year with the GDP growth of that year."""
+    return read("gdp_votes")
+
+
+def correlations() -> pd.DataFrame:
+    """Party vote shares vs. economic indicators (see ``correlations``)."""
+    return read("correlations")
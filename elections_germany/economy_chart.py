@@ -0,0 +1,234 @@
+"""
+Economy indicator vs. party vote share chart (page 02).
+
+``indicator_chart`` composes the figure from an indicator series (bars on
+the left axis) and the national vote shares (lines on the right axis). The
+static overlay -- government periods coloured by coalition, coalition labels
+and historical events -- does not depend on the indicator. It is built once
+per vote-share range by ``overlay`` and cached as plain layout fragments
+(shapes, annotations, traces), which are merged into the figure in a single
+constructor call instead of ~30 ``add_vrect`` / ``add_annotation`` calls.
+
+New indicators (e.g. inflation) only need a series and an axis range.
+"""
+
+from functools import lru_cache
+
+import plotly.graph_objects as go
+
+PARTY_COLS_FOR_PLOT = [
+    "cdu_csu",
+    "spd_total",
+    "gruene_total",
+    "fdp_total",
+    "afd_total",
+    "linke_pds_total",
+]
+
+LEGEND_NAMES = {
+    "cdu_csu": "CDU/CSU",
+    "spd_total": "SPD",
+    "gruene_total": "Greens",
+    "fdp_total": "FDP",
+    "afd_total": "AfD",
+    "linke_pds_total": "Linke/PDS",
+}
+
+PARTY_COLORS = {
+    "cdu_csu": "black",
+    "spd_total": "red",
+    "gruene_total": "green",
+    "fdp_total": "gold",
+    "afd_total": "blue",
+    "linke_pds_total": "purple",
+}
+
+GOVERNMENTS = [
+    {"start": 1990, "end": 1994, "coalition": ["cdu_csu", "fdp_total"]},
+    {"start": 1994, "end": 1998, "coalition": ["cdu_csu", "fdp_total"]},
+    {"start": 1998, "end": 2002, "coalition": ["spd_total", "gruene_total"]},
+    {"start": 2002, "end": 2005, "coalition": ["spd_total", "gruene_total"]},
+    {"start": 2005, "end": 2009, "coalition": ["cdu_csu", "spd_total"]},
+    {"start": 2009, "end": 2013, "coalition": ["cdu_csu", "fdp_total"]},
+    {"start": 2013, "end": 2018, "coalition": ["cdu_csu", "spd_total"]},
+    {"start": 2018, "end": 2021, "coalition": ["cdu_csu", "spd_total"]},
+    {"start": 2021, "end": 2025, "coalition": ["spd_total", "gruene_total", "fdp_total"]},
+    {"start": 2025, "end": 2026, "coalition": ["cdu_csu", "spd_total"]},
+]
+
+GOV_LABEL_MAP = {
+    "cdu_csu": "CDU/CSU",
+    "spd_total": "SPD",
+    "gruene_total": "Greens",
+    "fdp_total": "FDP",
+}
+
+EVENTS = {
+    1990: "1990, Reunification of Germany",
+    1997: "1997, Asian financial crisis",
+    2001: "2001, 9/11",
+    2002: "2002, Introduction of Euro in Germany",
+    2004: "2004, Expansion of EU, 10 new countries",
+    2008: "2008, Global financial crisis",
+    2011: "2011, Eurozone economic crisis",
+    2015: "2015, Migration crisis",
+    2016: "2016, Brexit",
+    2020: "2020, COVID-19",
+    2022: "2022, Russian-Ukrainian war",
+}
+
+
+def _vrect(x0, x1, **style):
+    return dict(
+        type="rect", xref="x", yref="y domain", x0=x0, x1=x1, y0=0, y1=1,
+        layer="below", **style,
+    )
+
+
+@lru_cache(maxsize=8)
+def overlay(ymin, ymax):
+    """
+    Government periods and events as (shapes, annotations, traces).
+
+    ``ymin``/``ymax`` are the range of the vote shares; the event lines and
+    labels are placed relative to it. The result is shared between calls and
+    must not be modified.
+    """
+    shapes = []
+    annotations = []
+
+    for g in GOVERNMENTS:
+        start, end = g["start"], g["end"]
+        coalition = g["coalition"]
+        width = (end - start) / len(coalition)
+
+        # color slices
+        for i, party in enumerate(coalition):
+            shapes.append(_vrect(
+                start + i * width,
+                start + (i + 1) * width,
+                fillcolor=PARTY_COLORS.get(party, "lightgray"),
+                opacity=0.12,
+                line=dict(width=0),
+            ))
+
+        # outer box
+        shapes.append(_vrect(
+            start,
+            end,
+            fillcolor="rgba(0,0,0,0)",
+            line=dict(width=1.5, color="rgba(0,0,0,0.35)"),
+        ))
+
+        # coalition label
+        annotations.append(dict(
+            x=(start + end) / 2,
+            xref="x",
+            y=1.0,
+            yref="paper",
+            text="<br>".join(GOV_LABEL_MAP[p] for p in coalition),
+            showarrow=False,
+            font=dict(size=11),
+            align="center",
+            yanchor="bottom",
+        ))
+
+    traces = []
+    for year, text in EVENTS.items():
+        traces.append(dict(
+            type="scatter",
+            x=[year, year],
+            y=[ymin, ymax * 1.1],
+            mode="lines",
+            line=dict(color="gray", width=1),
+            showlegend=False,
+        ))
+        annotations.append(dict(
+            x=year,
+            y=ymin,
+            text=f"<b>{text}</b>",
+            textangle=-90,
+            font=dict(size=12, color="gray"),
+            showarrow=False,
+            xanchor="center",
+            yanchor="bottom",
+        ))
+
+    return tuple(shapes), tuple(annotations), tuple(traces)
+
+
+def indicator_chart(
+    years,
+    values,
+    votes,
+    *,
+    name,
+    color,
+    axis_title,
+    axis_range,
+    hover_label,
+):
+    """
+    Indicator bars (left axis) with the party vote shares (right axis) and
+    the cached government / event overlay.
+
+    ``votes`` has an ``election_year`` column and one column per party of
+    ``PARTY_COLS_FOR_PLOT`` with shares in percent.
+    """
+    data = [
+        go.Bar(
+            x=years,
+            y=values,
+            name=name,
+            marker_color=color,
+            opacity=0.65,
+            yaxis="y1",
+            hovertemplate=f"<b>{hover_label}</b><br>%{{y:.2f}}%<extra></extra>",
+        )
+    ]
+
+    for party in PARTY_COLS_FOR_PLOT:
+        data.append(
+            go.Scatter(
+                x=votes["election_year"],
+                y=votes[party],
+                mode="lines+markers",
+                name=LEGEND_NAMES.get(party, party),
+                line=dict(color=PARTY_COLORS.get(party, "gray")),
+                yaxis="y2",
+                hovertemplate="<b>%{fullData.name}</b><br>Year: %{x}<br>Vote Share: %{y:.2f}%<extra></extra>",
+            )
+        )
+
+    ymin = float(votes[PARTY_COLS_FOR_PLOT].min().min())
+    ymax = float(votes[PARTY_COLS_FOR_PLOT].max().max())
+    shapes, annotations, traces = overlay(ymin, ymax)
+
+    layout = dict(
+        xaxis=dict(title="Election Year"),
+        yaxis=dict(  # LEFT AXIS (indicator)
+            title=axis_title,
+            showgrid=False,
+            range=list(axis_range),
+        ),
+        yaxis2=dict(  # RIGHT AXIS
+            title="Vote Share (%)",
+            overlaying="y",
+            side="right",
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.12,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=11),
+        ),
+        shapes=list(shapes),
+        annotations=list(annotations),
+        template="plotly_white",
+        width=1200,
+        height=720,
+    )
+
+    return go.Figure(data=data + list(traces), layout=layout)
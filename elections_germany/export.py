@@ -0,0 +1,374 @@
+"""
+Static export of the dashboard.
+
+Most of the app is a read-only view of static data, so every page can be
+served from a plain file host instead of a Streamlit process per visitor.
+``export_static`` runs every page headlessly through ``AppTest`` (as the
+benchmark does) once per combination of its selectboxes, radios and
+checkboxes, and writes:
+
+- ``<page>.html``: the page at its default widget values, with the widgets
+  as plain form controls (``index.html`` is the Home page);
+- ``states/<page>/<n>.html``: the page body for every other combination,
+  swapped in by a small script when a control changes;
+- ``figures/<hash>.json``: every Plotly figure once, however many states
+  show it;
+- ``assets/plotly.min.js`` and ``app/static/``: one copy of plotly.js and of
+  the shared map geometry and images, at the URLs the figures reference.
+
+Pages with more than ``MAX_STATES`` combinations are exported one widget at
+a time from the defaults, like the benchmark sweep; the script then falls
+back to the state where only the changed control differs. Sliders keep
+their default value.
+"""
+
+import hashlib
+import html
+import itertools
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+from elections_germany import benchmark, store, transport
+
+EXPORT_DIR = store.ROOT / "site"
+MAX_STATES = 256  # widget combinations exported per page before falling back to a sweep
+MAX_ROWS = 200  # rows of a dataframe written to the page
+IFRAME_HEIGHT = 620  # px, embedded viewers (page 05 zoom)
+TIMEOUT = benchmark.TIMEOUT
+
+# Python-Markdown extensions closest to the Markdown Streamlit renders
+MARKDOWN_EXTENSIONS = ["tables", "fenced_code", "sane_lists"]
+
+# widget types that become client-side controls
+CONTROL_TYPES = ("selectbox", "radio", "checkbox")
+
+
+def page_slug(page):
+    """``Home.py`` -> ``index``, ``pages/04_Elections_and_Income.py`` -> ``04_Elections_and_Income``."""
+    return "index" if page == "Home.py" else Path(page).stem
+
+
+def _link_slugs():
+    """Exported page of every ``st.page_link`` target: Streamlit's URL name or the script path."""
+    slugs = {}
+    for page in benchmark.pages():
+        slugs[page] = page_slug(page)
+        slugs[re.sub(r"^\d+_", "", Path(page).stem)] = page_slug(page)
+    slugs[""] = "index"
+    return slugs
+
+
+# ----------------- WIDGET STATES -----------------
+
+
+def controls(at):
+    """Every control of a run: id, type, label, option labels and default index."""
+    dims = []
+    for kind in CONTROL_TYPES:
+        for i, widget in enumerate(getattr(at, kind)):
+            if kind == "checkbox":
+                options, default = ["False", "True"], int(bool(widget.value))
+            else:
+                options, default = [str(o) for o in widget.options], widget.index or 0
+            dims.append({
+                "id": f"{kind}:{i}", "type": kind, "label": widget.label,
+                "options": options, "default": default,
+            })
+    return dims
+
+
+def widget_states(dims, max_states=MAX_STATES):
+    """Every combination of option indices, or the defaults plus one change each."""
+    default = tuple(d["default"] for d in dims)
+    total = 1
+    for d in dims:
+        total *= len(d["options"])
+    if total <= max_states:
+        return list(itertools.product(*(range(len(d["options"])) for d in dims)))
+
+    states = [default]
+    for i, d in enumerate(dims):
+        for k in range(len(d["options"])):
+            if k != d["default"]:
+                states.append(default[:i] + (k,) + default[i + 1:])
+    return states
+
+
+def _apply(at, dims, state):
+    """Set every control of ``at`` to ``state``; False if a control is not on the page."""
+    for d, k in zip(dims, state):
+        kind, i = d["type"], int(d["id"].split(":")[1])
+        widgets = getattr(at, kind)
+        if i >= len(widgets):
+            return False
+        widget = widgets[i]
+        if kind == "checkbox":
+            widget.set_value(bool(k))
+        else:
+            benchmark.select_index(widget, k)
+    return True
+
+
+# ----------------- HTML -----------------
+
+
+class _Bundle:
+    """Output directory plus the figures written so far (by content hash)."""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.figures = set()
+
+    def figure(self, spec):
+        key = hashlib.sha256(spec.encode()).hexdigest()[:20]
+        if key not in self.figures:
+            path = self.out_dir / "figures" / f"{key}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(spec, encoding="utf-8")
+            self.figures.add(key)
+        return f"figures/{key}.json"
+
+
+def _markdown(text, css="md"):
+    # rendered at export time, so the site needs no markdown script; raw HTML
+    # is kept, as with unsafe_allow_html
+    import markdown
+
+    return f'<div class="{css}">{markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS)}</div>'
+
+
+def _control(node, dims):
+    kind = node.type
+    index = sum(1 for _ in itertools.takewhile(lambda w: w is not node, getattr(node.root, kind)))
+    dim = next((i for i, d in enumerate(dims) if d["id"] == f"{kind}:{index}"), None)
+    label = html.escape(node.label)
+    # a control that only appears in some states is shown, but not switchable
+    disabled = "" if dim is not None else " disabled"
+    if kind == "checkbox":
+        checked = " checked" if node.value else ""
+        return f'<label class="control"><input type="checkbox" data-dim="{dim}"{checked}{disabled}> {label}</label>'
+    options = "".join(
+        f'<option value="{k}"{" selected" if k == node.index else ""}>{html.escape(str(o))}</option>'
+        for k, o in enumerate(node.options)
+    )
+    return f'<label class="control">{label}<select data-dim="{dim}"{disabled}>{options}</select></label>'
+
+
+def render_node(node, dims, bundle):
+    """HTML of one element (or block) of an ``AppTest`` element tree."""
+    kind = node.type
+    children = getattr(node, "children", None)
+    if children is not None and kind not in CONTROL_TYPES:
+        inner = "".join(render_node(c, dims, bundle) for c in children.values())
+        if kind == "expander":
+            return f"<details><summary>{html.escape(node.label)}</summary>{inner}</details>"
+        if kind == "column":
+            return f'<div class="column">{inner}</div>'
+        if kind in ("flex_container", "horizontal"):
+            return f'<div class="row">{inner}</div>'
+        return f"<div>{inner}</div>"
+
+    if kind in CONTROL_TYPES:
+        return _control(node, dims)
+    if kind in ("title", "header", "subheader"):
+        level = {"title": 1, "header": 2, "subheader": 3}[kind]
+        return f"<h{level}>{html.escape(node.value)}</h{level}>"
+    if kind == "markdown":
+        return _markdown(node.value)
+    if kind == "caption":
+        return _markdown(node.value, "md caption")
+    if kind in ("info", "warning", "error", "success"):
+        return _markdown(node.value, f"md alert {kind}")
+    if kind in ("dataframe", "table"):
+        return node.value.to_html(max_rows=MAX_ROWS, classes="frame", border=0)
+    if kind == "slider":
+        return f'<p class="control">{html.escape(node.label)}: {html.escape(str(node.value))}</p>'
+
+    # elements without an AppTest class: ``proto`` is the element's own message
+    proto = node.proto
+    if kind == "plotly_chart":
+        return f'<div class="plotly" data-src="{bundle.figure(proto.spec)}"></div>'
+    if kind == "page_link":
+        slug = _link_slugs().get(proto.page, page_slug(proto.page))
+        return f'<p><a href="{slug}.html">{html.escape(proto.label)}</a></p>'
+    if kind == "iframe":
+        frame = proto
+        src = f'srcdoc="{html.escape(frame.srcdoc)}"' if frame.srcdoc else f'src="{html.escape(frame.src)}"'
+        return f'<iframe {src} style="width:100%;height:{IFRAME_HEIGHT}px;border:0"></iframe>'
+    # images, vega charts, ...: only in the app
+    return ""
+
+
+SCRIPT = """
+const page = JSON.parse(document.getElementById("page-data").textContent);
+const body = document.getElementById("body");
+const figures = new Map();
+let current = page.default.slice();
+
+function plot(div) {
+  const src = div.dataset.src;
+  if (!figures.has(src)) figures.set(src, fetch(src).then((r) => r.json()));
+  figures.get(src).then((fig) => Plotly.newPlot(div, fig.data, fig.layout, {responsive: true}));
+}
+
+function hydrate() {
+  body.querySelectorAll(".plotly").forEach(plot);
+  body.querySelectorAll("[data-dim]").forEach((el) => {
+    if (el.dataset.dim === "None") return;
+    el.addEventListener("change", () => {
+      const dim = Number(el.dataset.dim);
+      switchTo(dim, el.type === "checkbox" ? Number(el.checked) : Number(el.value));
+    });
+  });
+}
+
+async function switchTo(dim, value) {
+  let state = current.slice();
+  state[dim] = value;
+  if (!(state.join(",") in page.states)) {
+    // exported one control at a time: keep the others at their defaults
+    state = page.default.slice();
+    state[dim] = value;
+  }
+  let file = page.states[state.join(",")];
+  if (file === undefined) {
+    // not exported: put the controls back
+    state = current;
+    file = page.states[state.join(",")];
+  }
+  body.innerHTML = file === null ? page.defaultBody : await (await fetch(file)).text();
+  current = state;
+  hydrate();
+}
+
+page.defaultBody = body.innerHTML;
+hydrate();
+"""
+
+STYLE = """
+body { font-family: "Source Sans Pro", sans-serif; margin: 0; display: flex; }
+nav { width: 15rem; padding: 1rem; background: #f0f2f6; min-height: 100vh; }
+nav a { display: block; margin: .4rem 0; color: #31333f; }
+main { flex: 1; padding: 1rem 3rem; max-width: 100%; overflow-x: hidden; }
+.row { display: flex; gap: 1rem; }
+.column { flex: 1; min-width: 0; }
+.control { display: block; margin: .5rem 0; }
+.control select { display: block; margin-top: .25rem; }
+.caption { color: #808495; font-size: .9rem; }
+.alert { background: #e8f0fe; padding: .75rem 1rem; border-radius: .5rem; }
+.frame { font-size: .8rem; border-collapse: collapse; display: block; overflow-x: auto; }
+.frame td, .frame th { padding: .2rem .5rem; border-bottom: 1px solid #ddd; }
+details { border: 1px solid #ddd; border-radius: .5rem; padding: .5rem 1rem; margin: .5rem 0; }
+"""
+
+
+def page_html(title, nav, body, data):
+    # "</script>" inside the JSON would end the data block early
+    payload = json.dumps(data).replace("</", "<\\/")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<style>{STYLE}</style>
+<script src="assets/plotly.min.js"></script>
+</head>
+<body>
+<nav>{nav}</nav>
+<main id="body">{body}</main>
+<script type="application/json" id="page-data">{payload}</script>
+<script>{SCRIPT}</script>
+</body>
+</html>
+"""
+
+
+# ----------------- EXPORT -----------------
+
+
+def _page_title(page):
+    return "Home" if page == "Home.py" else page_slug(page).split("_", 1)[1].replace("_", " ")
+
+
+def export_page(page, bundle, nav, max_states=MAX_STATES, log=print):
+    """Every widget state of one page; returns the number of states written."""
+    from streamlit.testing.v1 import AppTest
+
+    def fresh_run():
+        return AppTest.from_file(str(store.ROOT / page), default_timeout=TIMEOUT).run()
+
+    slug = page_slug(page)
+    at = fresh_run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+    dims = controls(at)
+    default = tuple(d["default"] for d in dims)
+    default_body = "".join(render_node(c, dims, bundle) for c in at.main.children.values())
+
+    state_dir = bundle.out_dir / "states" / slug
+    shutil.rmtree(state_dir, ignore_errors=True)
+    states = {",".join(map(str, default)): None}
+    for n, state in enumerate(widget_states(dims, max_states)):
+        if state == default:
+            continue
+        # every state from a fresh default run: the options of some widgets
+        # depend on others, so a state is only valid relative to the defaults
+        at = fresh_run()
+        if not _apply(at, dims, state):
+            continue
+        try:
+            at.run()
+        except ValueError as e:
+            # a value that is not an option once the other widgets changed
+            log(f"    {page} state {state}: {e}")
+            continue
+        if at.exception:
+            log(f"    {page} state {state}: {at.exception[0].value}")
+            continue
+        path = state_dir / f"{n}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(render_node(c, dims, bundle) for c in at.main.children.values()), encoding="utf-8")
+        states[",".join(map(str, state))] = f"states/{slug}/{n}.html"
+
+    data = {"dims": [d["id"] for d in dims], "default": list(default), "states": states}
+    (bundle.out_dir / f"{slug}.html").write_text(
+        page_html(_page_title(page), nav, default_body, data), encoding="utf-8"
+    )
+    return len(states)
+
+
+def export_static(out_dir=EXPORT_DIR, pages=None, max_states=MAX_STATES, log=print):
+    """Export every page in ``pages`` (default: all) to ``out_dir``."""
+    import plotly.offline
+
+    from elections_germany import figure_store, images
+
+    # the pages read pre-rendered figures and images where they exist
+    figure_store.render_figures()
+    images.build_images()
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    assets = out_dir / "assets" / "plotly.min.js"
+    assets.parent.mkdir(parents=True, exist_ok=True)
+    assets.write_text(plotly.offline.get_plotlyjs(), encoding="utf-8")
+    # the figures reference the geometry and images by their app URL
+    if transport.STATIC_DIR.exists():
+        shutil.copytree(transport.STATIC_DIR, out_dir / transport.STATIC_URL, dirs_exist_ok=True)
+
+    all_pages = benchmark.pages()
+    nav = "".join(f'<a href="{page_slug(p)}.html">{html.escape(_page_title(p))}</a>' for p in all_pages)
+
+    # pages open files relative to the app directory
+    os.chdir(store.ROOT)
+    bundle = _Bundle(out_dir)
+    written = {}
+    for page in pages or all_pages:
+        written[page] = export_page(page, bundle, nav, max_states, log=log)
+        log(f"{page:<46} {written[page]:>4} states")
+    log(f"{len(bundle.figures)} figures -> {out_dir}")
+    return written
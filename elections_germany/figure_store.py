@@ -0,0 +1,265 @@
+"""
+Pre-rendered figure store.
+
+Most charts of the app are deterministic functions of the static data and
+of at most a couple of widget values (year, party, ...). ``render_figures``
+builds every figure in ``FIGURES`` for every combination of its parameters
+and writes the serialized Plotly JSON, gzip-compressed, to
+``data/figures/<name>/<params>.json.gz``. ``data/figures/manifest.json``
+records the content hash of each figure and the inputs it was rendered from
+(its code hash, the source hash of each of its tables and the geometry
+version); a figure set is only re-rendered when its inputs changed.
+
+Pages call ``figure(name, **params)``, which returns the stored figure as a
+plain dict: two manifest reads and a JSON decode, no pandas, plotly or
+figure construction. If it has not been rendered, or a table it was rendered
+from has been rebuilt since, it is built live and returned as the same dict.
+Code and geometry changes are picked up by the next ``render-figures``.
+"""
+
+import gzip
+import hashlib
+import inspect
+import json
+
+from elections_germany import data, store
+
+FIGURE_DIR = store.DATA_DIR / "figures"
+MANIFEST_PATH = FIGURE_DIR / "manifest.json"
+
+
+# ----------------- FIGURE DEFINITIONS -----------------
+
+
+def _tax_top10():
+    from elections_germany import figures
+
+    return figures.tax_bar_figure(data.taxation(), "top")
+
+
+def _tax_bottom10():
+    from elections_germany import figures
+
+    return figures.tax_bar_figure(data.taxation(), "bottom")
+
+
+def _gdp_growth():
+    from elections_germany import figures
+
+    return figures.gdp_growth_figure(data.gdp())
+
+
+def _gdp_trends(party, show_events):
+    from elections_germany import figures
+
+    return figures.trends_figure(data.national_votes(), data.gdp(), party, show_events)
+
+
+def _gdp_trends_params():
+    from elections_germany import figures
+
+    return [
+        {"party": party, "show_events": show_events}
+        for party in ["All"] + sorted(figures.GDP_PARTY_COLS)
+        for show_events in (False, True)
+    ]
+
+
+def _gdp_correlation(indicator="gdp_lag2_avg", method="pearson"):
+    from elections_germany import correlations, figures
+
+    prefix = "Correlation" if method == "pearson" else "Spearman correlation"
+    return figures.correlation_figure(
+        correlations.lookup(data.correlations(), indicator, method),
+        title=f"Correlation between Vote Share and {correlations.indicator_label(indicator)}",
+        xaxis_title=f"{prefix} with {indicator}",
+    )
+
+
+def _gdp_correlation_params():
+    from elections_germany import correlations
+
+    table = data.correlations()
+    return [
+        {"indicator": indicator, "method": method}
+        for indicator in table["indicator"].unique()
+        for method in correlations.METHODS
+    ]
+
+
+def _county_map(year, kind):
+    from elections_germany import maps, transport
+
+    return maps.map_figure(
+        kind,
+        year,
+        data.elections("county"),
+        data.income(),
+        data.year_alignment(),
+        transport.geometry_url(maps.MAP_ZOOM),
+    )
+
+
+def _county_map_params():
+    from elections_germany import maps
+
+    years = data.year_alignment()["election_year"]
+    return [{"year": int(year), "kind": kind} for year in years for kind in maps.KINDS]
+
+
+def _geometry_version():
+    from elections_germany import maps, transport
+
+    return transport.geometry_url(maps.MAP_ZOOM)
+
+
+class FigureSpec:
+    def __init__(self, build, tables, params=None, version=None):
+        self.build = build
+        self.tables = tables  # store tables the figure is computed from
+        self.params = params or (lambda: [{}])  # every parameter combination
+        self.version = version  # extra input that is not a store table
+
+
+FIGURES = {
+    "tax_top10": FigureSpec(_tax_top10, ["taxation"]),
+    "tax_bottom10": FigureSpec(_tax_bottom10, ["taxation"]),
+    "gdp_growth": FigureSpec(_gdp_growth, ["deu_gdp"]),
+    "gdp_trends": FigureSpec(_gdp_trends, ["gdp_votes", "deu_gdp"], params=_gdp_trends_params),
+    "gdp_correlation": FigureSpec(
+        _gdp_correlation, ["correlations"], params=_gdp_correlation_params
+    ),
+    "county_map": FigureSpec(
+        _county_map,
+        ["vote_cube", "county_incomes", "year_alignment"],
+        params=_county_map_params,
+        version=_geometry_version,
+    ),
+}
+
+
+# ----------------- RENDER -----------------
+
+
+def param_key(params):
+    """File name for a parameter combination, e.g. ``kind=winner,year=2021``."""
+    if not params:
+        return "default"
+    return ",".join(f"{k}={params[k]}" for k in sorted(params))
+
+
+def figure_path(name, params):
+    return FIGURE_DIR / name / f"{param_key(params)}.json.gz"
+
+
+def code_hash(spec):
+    """Hash of the builder of a figure set and of the modules it draws with."""
+    from elections_germany import correlations, cube, figures, maps
+
+    digest = hashlib.sha256()
+    digest.update(inspect.getsource(spec.build).encode())
+    for module in (figures, maps, correlations, cube):
+        digest.update(inspect.getsource(module).encode())
+    return digest.hexdigest()
+
+
+def inputs(spec):
+    """The inputs of a figure set: its code hash, the source hash of each table and its version."""
+    manifest = store.build_store(spec.tables) if spec.tables else {}
+    return {
+        "code_sha256": code_hash(spec),
+        "tables": {table: manifest[table]["source_sha256"] for table in spec.tables},
+        "version": spec.version() if spec.version is not None else None,
+    }
+
+
+def inputs_hash(spec_inputs):
+    return hashlib.sha256(json.dumps(spec_inputs, sort_keys=True).encode()).hexdigest()
+
+
+def read_manifest():
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def render_figure_set(name, manifest, force=False):
+    """Render every parameter combination of one figure; returns its entry."""
+    spec = FIGURES[name]
+    spec_inputs = inputs(spec)
+    source_hash = inputs_hash(spec_inputs)
+    entry = manifest.get(name)
+    if (
+        not force
+        and entry is not None
+        and entry["inputs_sha256"] == source_hash
+        and all(figure_path(name, p).exists() for p in spec.params())
+    ):
+        return entry
+
+    rendered = {}
+    for params in spec.params():
+        fig = spec.build(**params)
+        # None (e.g. no income data for a year) is stored as JSON null
+        text = "null" if fig is None else fig.to_json()
+        path = figure_path(name, params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=9) as f:
+            f.write(text)
+        tmp.replace(path)
+        rendered[param_key(params)] = {
+            "sha256": hashlib.sha256(text.encode()).hexdigest(),
+            "bytes": path.stat().st_size,
+        }
+
+    entry = {"inputs_sha256": source_hash, "inputs": spec_inputs, "figures": rendered}
+    manifest[name] = entry
+    return entry
+
+
+def render_figures(names=None, force=False):
+    """Render (or refresh) every figure set in ``names`` (default: all)."""
+    manifest = read_manifest()
+    for name in names or FIGURES:
+        render_figure_set(name, manifest, force=force)
+
+    FIGURE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = MANIFEST_PATH.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    tmp.replace(MANIFEST_PATH)
+    return manifest
+
+
+# ----------------- LOAD -----------------
+
+
+def load_figure(name, **params):
+    """
+    The stored figure as a dict (None for a stored "no figure"). Raises
+    FileNotFoundError if it has not been rendered.
+    """
+    with gzip.open(figure_path(name, params), "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def is_current(entry):
+    """Whether every table a figure set was rendered from is still the one in the store."""
+    if entry is None or "inputs" not in entry:
+        return False
+    tables = data.source_hashes()
+    return all(tables.get(table) == h for table, h in entry["inputs"]["tables"].items())
+
+
+def figure(name, **params):
+    """Stored figure if rendered from the current tables, otherwise built live."""
+    if is_current(read_manifest().get(name)):
+        try:
+            return load_figure(name, **params)
+        except FileNotFoundError:
+            pass
+    fig = FIGURES[name].build(**params)
+    # the same dict as a stored figure
+    return None if fig is None else json.loads(fig.to_json())
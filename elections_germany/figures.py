@@ -0,0 +1,326 @@
+"""
+Figures of pages 01 and 03 that only depend on static data.
+
+Each builder takes its data as arguments and returns a ``go.Figure``; the
+pages and ``figure_store`` both call them.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+# page 03 party columns and colours
+GDP_PARTY_COLS = ['cdu_csu', 'spd_total', 'gruene_total', 'fdp_total', 'afd_total', 'linke_pds_total']
+
+GDP_PARTY_COLORS = {
+    'cdu_csu': '#003B6F',
+    'spd_total': '#A6006B',
+    'gruene_total': '#1AA037',
+    'fdp_total': '#FFEF00',
+    'linke_pds_total': '#E3000F',
+    'afd_total': '#0489DB',
+}
+
+GDP_EVENTS = {
+    2008: "Global financial crisis",
+    2015: "Migration crisis",
+    2020: "COVID-19",
+    2022: "Energy & inflation shock",
+}
+
+# page 01 scatter plots: SVG markers up to SCATTERGL_POINTS points per figure,
+# WebGL markers up to DENSITY_POINTS, above that one marker per non-empty
+# cell of a DENSITY_BINS x DENSITY_BINS histogram
+SCATTERGL_POINTS = 2_000
+DENSITY_POINTS = 50_000
+DENSITY_BINS = 80
+
+
+# ----------------- PAGE 01 -----------------
+
+
+def tax_bar_figure(income_tax_df, which):
+    """Top (``which="top"``) or bottom 10 districts by tax per taxpayer."""
+    tax_df = income_tax_df.dropna(subset=["Tax_per_Taxpayer"])
+    if which == "top":
+        rows = tax_df.nlargest(10, "Tax_per_Taxpayer")
+        color, title = "green", "Top 10 Districts – Highest Tax per Taxpayer"
+    else:
+        rows = tax_df.nsmallest(10, "Tax_per_Taxpayer")
+        color, title = "crimson", "Bottom 10 Districts – Lowest Tax per Taxpayer"
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=rows["Region_Name"],
+                y=rows["Tax_per_Taxpayer"],
+                text=rows["Tax_per_Taxpayer"].round(2),
+                textposition="auto",
+                marker_color=color,
+            )
+        ]
+    )
+    fig.update_layout(
+        title=title,
+        xaxis_title="District",
+        yaxis_title="Tax per taxpayer (€)",
+        template="plotly_white",
+        height=500,
+    )
+    return fig
+
+
+def scatter_mode(n_points):
+    """``"svg"``, ``"webgl"`` or ``"density"`` for a figure of ``n_points`` markers."""
+    if n_points <= SCATTERGL_POINTS:
+        return "svg"
+    if n_points <= DENSITY_POINTS:
+        return "webgl"
+    return "density"
+
+
+def scatter_trace(x, y, name, color, mode, size=8):
+    """
+    Markers of ``y`` against ``x`` in a ``scatter_mode``. In ``"density"``
+    mode the points are binned with ``np.histogram2d`` on the server and every
+    non-empty cell becomes one marker, sized by its number of points.
+    """
+    x = np.asarray(x, dtype="float32")
+    y = np.asarray(y, dtype="float32")
+    if mode == "svg":
+        return go.Scatter(x=x, y=y, mode="markers", name=name, marker=dict(color=color, size=size))
+    if mode == "webgl":
+        return go.Scattergl(x=x, y=y, mode="markers", name=name, marker=dict(color=color, size=size))
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=DENSITY_BINS)
+    ix, iy = np.nonzero(counts)
+    n = counts[ix, iy]
+    return go.Scattergl(
+        x=((x_edges[ix] + x_edges[ix + 1]) / 2).astype("float32"),
+        y=((y_edges[iy] + y_edges[iy + 1]) / 2).astype("float32"),
+        mode="markers",
+        name=name,
+        customdata=n.astype("int32"),
+        hovertemplate="%{x:.0f}, %{y:.3f}<br>%{customdata} points<extra>" + name + "</extra>",
+        marker=dict(
+            color=color,
+            size=(3 + 3 * np.sqrt(n / n.max()) * size).astype("float32"),
+            opacity=0.7,
+        ),
+    )
+
+
+def tax_vote_scatter_figure(analysis_df, parties, party_colors, size=8):
+    """
+    Vote share of every party in ``parties`` against the tax per taxpayer,
+    one trace each; the rendering switches to WebGL and then to server-side
+    binning as the number of points grows (see ``scatter_mode``).
+    """
+    mode = scatter_mode(len(analysis_df) * len(parties))
+    fig = go.Figure([
+        scatter_trace(
+            analysis_df["Tax_per_Taxpayer"],
+            analysis_df[party],
+            party,
+            party_colors[party],
+            mode,
+            size=size,
+        )
+        for party in parties
+    ])
+    fig.update_layout(
+        xaxis_title="Tax per Taxpayer (€)",
+        yaxis_title="Vote Share" if len(parties) > 1 else f"{parties[0]} Vote Share",
+        template="plotly_white",
+    )
+    if mode == "density":
+        fig.update_layout(
+            title=f"{len(analysis_df):,} municipalities, binned: marker size = number of municipalities"
+        )
+    return fig
+
+
+def income_bracket_figure(bin_labels, mean_by_bin_percent, party_colors):
+    """
+    Stacked mean vote share (%) per income bracket, labelled with the median
+    tax per taxpayer of each bracket (see ``brackets.income_brackets``).
+    """
+    fig = go.Figure()
+
+    for party in mean_by_bin_percent.columns:
+        fig.add_trace(go.Bar(
+            x=bin_labels.index,                    # internal bin index 0, 1, ...
+            y=mean_by_bin_percent[party],
+            name=party,
+            marker_color=party_colors.get(party, "#666666"),
+        ))
+
+    fig.update_layout(
+        barmode="stack",
+        template="plotly_white",
+        height=500,
+        xaxis=dict(
+            title="Income Group (Median Tax per Taxpayer in €)",
+            tickmode="array",
+            tickvals=bin_labels.index,
+            ticktext=[f"€{v:,.0f}" for v in bin_labels],  # human labels e.g. €5,300
+        ),
+        yaxis=dict(
+            title="Average Vote Share (%)",
+            ticksuffix="%",
+            range=[0, 100],
+        ),
+        legend_title="Party",
+    )
+    return fig
+
+
+# ----------------- PAGE 03 -----------------
+
+
+def gdp_growth_figure(deu_gdp):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=deu_gdp.index,
+        y=deu_gdp['gdp_growth'],
+        mode='lines+markers',
+        name='Germany',
+        line=dict(color='royalblue', width=2),
+        marker=dict(size=6),
+        hovertemplate='Year: %{x}<br>GDP growth: %{y:.2f}%<extra></extra>'
+    ))
+    fig.update_layout(
+        title='GDP Growth in Germany Over Time',
+        xaxis_title='Year',
+        yaxis_title='GDP Growth (%)',
+        template='plotly_white',
+        hovermode='x unified'
+    )
+    return fig
+
+
+def trends_figure(gdp_votes, deu_gdp, party="All", show_events=False):
+    """GDP growth bars with the vote share of one party (or all of them)."""
+    if party == "All":
+        parties_to_plot = GDP_PARTY_COLS
+    else:
+        parties_to_plot = [party]
+
+    df_gdp = deu_gdp.assign(election_year=deu_gdp.index.astype(int))
+    df_gdp = df_gdp[df_gdp['election_year'] >= 1990]
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Bar(
+            x=df_gdp['election_year'],
+            y=df_gdp['gdp_growth'],
+            name="GDP Growth (%)",
+            marker_color='lightblue',
+            opacity=0.6,
+            yaxis="y1"
+        )
+    )
+
+    for p in parties_to_plot:
+        fig.add_trace(
+            go.Scatter(
+                x=gdp_votes['election_year'],
+                y=gdp_votes[p],
+                mode='lines+markers',
+                name=p,
+                line=dict(color=GDP_PARTY_COLORS.get(p, 'gray')),
+                yaxis="y2",
+                hovertemplate=(
+                    f"<b>{p}</b><br>"
+                    "Year: %{x}<br>"
+                    "Vote Share: %{y:.2f}%<extra></extra>"
+                )
+            )
+        )
+
+    fig.update_layout(
+        title="GDP Growth (%) and Party Vote Shares Over Time",
+        xaxis=dict(title="Election Year"),
+        yaxis=dict(
+            title="GDP Growth (%)",
+            side="left",
+            showgrid=False
+        ),
+        yaxis2=dict(
+            title="Vote Share (%)",
+            overlaying="y",
+            side="right"
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.3,
+            xanchor="right",
+            x=1
+        ),
+        template="plotly_white",
+        width=900,
+        height=600,
+        margin=dict(t=110),
+    )
+
+    if show_events:
+        for year in GDP_EVENTS:
+            fig.add_vline(
+                x=year,
+                line_width=1,
+                line_dash="dash",
+                line_color="gray",
+                opacity=0.7
+            )
+
+        for i, (year, label) in enumerate(GDP_EVENTS.items()):
+            fig.add_annotation(
+                x=year,
+                xref="x",
+                y=1.00 if i % 2 == 0 else 1.05,
+                yref="paper",
+                text=label,
+                showarrow=True,
+                font=dict(size=10),
+                align="center"
+            )
+
+    return fig
+
+
+def correlation_figure(correlations, title, xaxis_title):
+    """
+    Horizontal bars of the ``r`` column of ``correlations`` (indexed by
+    party, see ``correlations.lookup``) with its bootstrap interval.
+    """
+    parties = list(correlations.index)
+    values = correlations["r"]
+
+    fig = go.Figure(go.Bar(
+        x=values,
+        y=parties,
+        orientation='h',
+        marker_color=[GDP_PARTY_COLORS[p] for p in parties],
+        opacity=0.85,
+        error_x=dict(
+            type="data",
+            symmetric=False,
+            array=correlations["ci_high"] - values,
+            arrayminus=values - correlations["ci_low"],
+            color="gray",
+        ),
+        customdata=correlations[["ci_low", "ci_high", "n"]],
+        hovertemplate=
+        "<b>%{y}</b><br>" +
+        "Correlation: %{x:.3f}<br>" +
+        "95% CI: %{customdata[0]:.2f} to %{customdata[1]:.2f} (%{customdata[2]} elections)<extra></extra>"
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title="Political Party",
+        width=900,
+        height=450,
+        template="plotly_white"
+    )
+    return fig
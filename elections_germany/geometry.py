@@ -0,0 +1,257 @@
+"""
+Simplified county geometry at several levels of detail.
+
+The full-resolution ``data/georef-germany-kreis.geojson`` is far more
+detailed than a map at ``zoom=4.5`` can show, but it is serialized into every
+choropleth. ``build_geometry`` writes topology-preserving simplified copies
+to ``data/geo/`` and ``geojson_for_zoom`` picks the coarsest one that is still
+below half a pixel at the given zoom.
+
+Simplification works on arcs rather than on whole polygons: every ring is
+cut at the vertices where the set of rings sharing a vertex changes, so a
+border between two counties is one arc that both counties reference. Each
+distinct arc is simplified once (Douglas-Peucker, in a canonical direction)
+and the same result is used on both sides, which keeps shared borders
+identical and leaves no gaps or overlaps between neighbours.
+"""
+
+import json
+from pathlib import Path
+
+from elections_germany import store
+
+SOURCE_PATH = store.DATA_DIR / "georef-germany-kreis.geojson"
+GEO_DIR = store.DATA_DIR / "geo"
+MANIFEST_PATH = GEO_DIR / "manifest.json"
+
+# Douglas-Peucker tolerances in degrees, finest first
+TOLERANCES = [0.001, 0.004, 0.015]
+
+# map tiles are 512 px wide at zoom 0
+TILE_SIZE = 512
+
+
+# ----------------- SIMPLIFICATION -----------------
+
+
+def douglas_peucker(points, tolerance):
+    """Indices of ``points`` kept by Douglas-Peucker (always both ends)."""
+    import numpy as np
+
+    n = len(points)
+    if n < 3:
+        return np.arange(n)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = points[first], points[last]
+        inner = points[first + 1:last]
+        chord = end - start
+        length = np.hypot(*chord)
+        if length == 0:
+            dist = np.hypot(*(inner - start).T)
+        else:
+            offset = inner - start
+            dist = np.abs(chord[0] * offset[:, 1] - chord[1] * offset[:, 0]) / length
+        i = int(dist.argmax())
+        if dist[i] > tolerance:
+            mid = first + 1 + i
+            keep[mid] = True
+            stack.append((first, mid))
+            stack.append((mid, last))
+    return np.flatnonzero(keep)
+
+
+def _rings(geometry):
+    """Yield (polygon index, ring index, ring) for a (Multi)Polygon."""
+    if geometry["type"] == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return
+    for p, polygon in enumerate(polygons):
+        for r, ring in enumerate(polygon):
+            yield p, r, [tuple(pt[:2]) for pt in ring]
+
+
+def _fixed_vertices(ring, membership):
+    """
+    Positions in ``ring`` (without the closing point) that must be kept: the
+    vertices where the set of rings sharing the vertex changes.
+    """
+    n = len(ring)
+    sets = [membership[pt] for pt in ring]
+    fixed = [
+        i for i in range(n)
+        if sets[i] != sets[i - 1] or sets[i] != sets[(i + 1) % n]
+    ]
+    if not fixed:
+        # the whole ring has one set of owners (an island, or an enclave and
+        # the hole around it): anchor it at points every owner agrees on
+        fixed = sorted({ring.index(min(ring)), ring.index(max(ring))})
+    return fixed
+
+
+def _arc_key(arc):
+    """``(key, reverse)``: the arc in its canonical direction, and whether ``arc`` runs the other way."""
+    reverse = arc[-1] < arc[0] or (arc[-1] == arc[0] and arc[-2] < arc[1])
+    return (tuple(reversed(arc)) if reverse else tuple(arc)), reverse
+
+
+def _simplify_arc(arc, tolerance, cache):
+    """Simplify one arc; equal arcs give equal results in either direction."""
+    import numpy as np
+
+    key, reverse = _arc_key(arc)
+    if key not in cache:
+        points = np.asarray(key)
+        cache[key] = [key[i] for i in douglas_peucker(points, tolerance)]
+    result = cache[key]
+    return result[::-1] if reverse else result
+
+
+def simplify_geojson(geojson, tolerance, precision=6):
+    """Return a copy of ``geojson`` simplified with shared borders kept intact."""
+    # vertex -> ids of the rings it belongs to
+    rings = {}
+    membership = {}
+    for f, feature in enumerate(geojson["features"]):
+        for p, r, ring in _rings(feature["geometry"]):
+            ring = ring[:-1] if ring[0] == ring[-1] else ring
+            rings[f, p, r] = ring
+            for pt in ring:
+                membership.setdefault(pt, set()).add((f, p, r))
+    membership = {pt: frozenset(ids) for pt, ids in membership.items()}
+
+    arcs = {}
+    for ring_id, ring in rings.items():
+        fixed = _fixed_vertices(ring, membership)
+        arcs[ring_id] = [
+            [ring[i % len(ring)] for i in range(a, b + 1)]
+            for a, b in zip(fixed, fixed[1:] + [fixed[0] + len(ring)])
+        ]
+
+    cache = {}
+
+    def assemble(ring_arcs):
+        out = []
+        for arc in ring_arcs:
+            out.extend(_simplify_arc(arc, tolerance, cache)[:-1])
+        out.append(out[0])
+        return out
+
+    # an outer ring that collapses keeps its full detail, and so do its arcs
+    # in every other ring that shares them, so its borders still match
+    for ring_id, ring_arcs in arcs.items():
+        if ring_id[2] == 0 and len(assemble(ring_arcs)) < 4:
+            for arc in ring_arcs:
+                key, _ = _arc_key(arc)
+                cache[key] = list(key)
+
+    simplified = {}
+    for ring_id, ring_arcs in arcs.items():
+        out = assemble(ring_arcs)
+        # collapsed holes disappear
+        simplified[ring_id] = None if len(out) < 4 else out
+
+    features = []
+    for f, feature in enumerate(geojson["features"]):
+        geometry = feature["geometry"]
+        polygons = {}
+        for p, r, _ in _rings(geometry):
+            ring = simplified[f, p, r]
+            if ring is not None:
+                polygons.setdefault(p, []).append(
+                    [[round(x, precision), round(y, precision)] for x, y in ring]
+                )
+        coordinates = list(polygons.values())
+        if geometry["type"] == "Polygon":
+            coordinates = coordinates[0]
+        features.append({
+            "type": "Feature",
+            "properties": feature.get("properties", {}),
+            "geometry": {"type": geometry["type"], "coordinates": coordinates},
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+# ----------------- LEVELS OF DETAIL -----------------
+
+
+def level_path(tolerance):
+    return GEO_DIR / f"kreis_{tolerance:g}.geojson"
+
+
+def degrees_per_pixel(zoom):
+    return 360 / (TILE_SIZE * 2 ** zoom)
+
+
+def tolerance_for_zoom(zoom):
+    """Coarsest tolerance that stays below half a pixel at ``zoom``."""
+    usable = [t for t in TOLERANCES if t <= degrees_per_pixel(zoom) / 2]
+    return max(usable) if usable else None
+
+
+def build_geometry(source=SOURCE_PATH, force=False):
+    """Write one simplified GeoJSON per tolerance and return the manifest."""
+    source = Path(source)
+    source_hash = store.file_hash(source)
+
+    manifest = {}
+    if MANIFEST_PATH.exists():
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    if (
+        not force
+        and manifest.get("source_sha256") == source_hash
+        and all(level_path(t).exists() for t in TOLERANCES)
+    ):
+        return manifest
+
+    with open(source) as f:
+        geojson = json.load(f)
+
+    GEO_DIR.mkdir(parents=True, exist_ok=True)
+    levels = {}
+    for tolerance in TOLERANCES:
+        simplified = simplify_geojson(geojson, tolerance)
+        path = level_path(tolerance)
+        with open(path, "w") as f:
+            json.dump(simplified, f, separators=(",", ":"))
+        levels[f"{tolerance:g}"] = {
+            "file": path.name,
+            "bytes": path.stat().st_size,
+            "vertices": sum(
+                len(ring) for ft in simplified["features"]
+                for _, _, ring in _rings(ft["geometry"])
+            ),
+        }
+
+    manifest = {
+        "source": str(source.relative_to(store.ROOT)),
+        "source_sha256": source_hash,
+        "source_bytes": source.stat().st_size,
+        "levels": levels,
+    }
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def geometry_path_for_zoom(zoom):
+    """Simplified file for ``zoom``, or the full-resolution source if not built."""
+    tolerance = tolerance_for_zoom(zoom)
+    if tolerance is not None and level_path(tolerance).exists():
+        return level_path(tolerance)
+    return SOURCE_PATH
+
+
+def geojson_for_zoom(zoom):
+    with open(geometry_path_for_zoom(zoom)) as f:
+        return json.load(f)
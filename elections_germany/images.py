@@ -0,0 +1,205 @@
+"""
+Responsive variants of the yearly figures of page 05.
+
+The PNGs in ``figures/`` are about 1800 px wide and 850 KB each, and the page
+used to send them at full size whatever the viewport. ``build_images`` writes,
+for every ``figures/<year>.png``:
+
+- WebP (and AVIF, if this Pillow build supports it) copies at every width in
+  ``WIDTHS``, for a ``<picture>`` with ``srcset`` so the browser picks the
+  smallest one that fills the column;
+- a Deep Zoom Image pyramid (``<year>.dzi`` and ``<year>_files/``) of WebP
+  tiles, so the zoom viewer only fetches the tiles in view at the resolution
+  it shows.
+
+Everything goes to ``static/img/`` (served at ``app/static/img/``) and is
+only rebuilt for figures whose PNG changed (``static/img/manifest.json``).
+"""
+
+import json
+import math
+import shutil
+
+from elections_germany import store, transport
+
+SOURCE_DIR = store.ROOT / "figures"
+IMAGE_DIR = transport.STATIC_DIR / "img"
+IMAGE_URL = f"{transport.STATIC_URL}/img"
+MANIFEST_PATH = IMAGE_DIR / "manifest.json"
+
+WIDTHS = (480, 960, 1440)
+THUMBNAIL_WIDTH = WIDTHS[0]
+QUALITY = {"webp": 80, "avif": 60}
+
+TILE_SIZE = 254  # + 2 x overlap = 256 px tiles
+TILE_OVERLAP = 1
+TILE_FORMAT = "webp"
+
+
+def formats():
+    """Formats this Pillow build can write, preferred (smallest) first."""
+    from PIL import features
+
+    return [fmt for fmt in ("avif", "webp") if features.check(fmt)]
+
+
+def figure_years():
+    """Years with a figure in ``figures/``, oldest first."""
+    return sorted(int(path.stem) for path in SOURCE_DIR.glob("*.png") if path.stem.isdigit())
+
+
+def variant_name(year, width, fmt):
+    return f"{year}-{width}.{fmt}"
+
+
+# ----------------- BUILD -----------------
+
+
+def _save(image, path, fmt):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # method 6: slowest, smallest WebP encoding; the build runs once
+    options = {"method": 6} if fmt == "webp" else {}
+    image.save(path, format=fmt.upper(), quality=QUALITY[fmt], **options)
+
+
+def write_variants(image, year, fmts):
+    """Every width of ``WIDTHS`` narrower than the figure, plus the full width."""
+    from PIL import Image
+
+    widths = sorted({w for w in WIDTHS if w < image.width} | {image.width})
+    variants = []
+    for width in widths:
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt in fmts:
+            path = IMAGE_DIR / variant_name(year, width, fmt)
+            _save(resized, path, fmt)
+            variants.append({"file": path.name, "width": width, "format": fmt, "bytes": path.stat().st_size})
+    return variants
+
+
+def write_pyramid(image, year):
+    """
+    Deep Zoom pyramid: level ``L`` is the image scaled to ``ceil(size / 2^(max - L))``,
+    cut into ``TILE_SIZE`` tiles with ``TILE_OVERLAP`` px of overlap.
+    """
+    from PIL import Image
+
+    files = IMAGE_DIR / f"{year}_files"
+    # a smaller figure has fewer levels, do not keep the old ones around
+    shutil.rmtree(files, ignore_errors=True)
+    max_level = math.ceil(math.log2(max(image.size)))
+    tiles = 0
+    for level in range(max_level + 1):
+        scale = 2 ** (max_level - level)
+        width, height = math.ceil(image.width / scale), math.ceil(image.height / scale)
+        scaled = image if scale == 1 else image.resize((width, height), Image.LANCZOS)
+        for col in range(math.ceil(width / TILE_SIZE)):
+            for row in range(math.ceil(height / TILE_SIZE)):
+                box = (
+                    max(col * TILE_SIZE - TILE_OVERLAP, 0),
+                    max(row * TILE_SIZE - TILE_OVERLAP, 0),
+                    min((col + 1) * TILE_SIZE + TILE_OVERLAP, width),
+                    min((row + 1) * TILE_SIZE + TILE_OVERLAP, height),
+                )
+                _save(scaled.crop(box), files / str(level) / f"{col}_{row}.{TILE_FORMAT}", TILE_FORMAT)
+                tiles += 1
+
+    descriptor = IMAGE_DIR / f"{year}.dzi"
+    descriptor.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" Format="{TILE_FORMAT}" '
+        f'Overlap="{TILE_OVERLAP}" TileSize="{TILE_SIZE}">\n'
+        f'  <Size Width="{image.width}" Height="{image.height}"/>\n'
+        "</Image>\n"
+    )
+    return {"file": descriptor.name, "levels": max_level + 1, "tiles": tiles}
+
+
+def build_images(years=None, force=False):
+    """Variants and pyramid of every figure in ``years`` (default: all); returns the manifest."""
+    from PIL import Image
+
+    manifest = read_manifest()
+    fmts = formats()
+    for year in years or figure_years():
+        source = SOURCE_DIR / f"{year}.png"
+        source_hash = store.file_hash(source)
+        entry = manifest.get(str(year))
+        if not force and entry and entry["source_sha256"] == source_hash and entry["formats"] == fmts:
+            continue
+
+        with Image.open(source) as image:
+            # WebP and AVIF keep the alpha channel, the figures have a transparent background
+            image = image.convert("RGBA")
+            manifest[str(year)] = {
+                "source_sha256": source_hash,
+                "width": image.width,
+                "height": image.height,
+                "formats": fmts,
+                "variants": write_variants(image, year, fmts),
+                "pyramid": write_pyramid(image, year),
+            }
+
+    IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest():
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+# ----------------- PAGE -----------------
+
+
+def picture_html(year, entry, alt):
+    """
+    A ``<picture>`` with one ``srcset`` per format; the browser loads the
+    narrowest variant that fills the page column.
+    """
+    sources = []
+    for fmt in entry["formats"]:
+        srcset = ", ".join(
+            f"{IMAGE_URL}/{v['file']} {v['width']}w"
+            for v in entry["variants"] if v["format"] == fmt
+        )
+        sources.append(f'<source type="image/{fmt}" srcset="{srcset}" sizes="100vw">')
+    fallback = min(
+        (v for v in entry["variants"] if v["format"] == entry["formats"][-1]),
+        key=lambda v: abs(v["width"] - THUMBNAIL_WIDTH),
+    )
+    return (
+        "<picture>" + "".join(sources)
+        + f'<img src="{IMAGE_URL}/{fallback["file"]}" alt="{alt}" loading="lazy" '
+        f'width="{entry["width"]}" height="{entry["height"]}" style="width:100%;height:auto">'
+        "</picture>"
+    )
+
+
+# vendored in static/openseadragon/ (script, button images and licence), so
+# the viewer, like the exported site, does not depend on a third-party CDN
+OPENSEADRAGON_URL = f"{transport.STATIC_URL}/openseadragon"
+
+
+def zoom_viewer_html(year, height):
+    """OpenSeadragon viewer of the Deep Zoom pyramid; it fetches tiles as the user zooms."""
+    return f"""
+<div id="zoom-{year}" style="width:100%;height:{height}px;background:white"></div>
+<script src="{OPENSEADRAGON_URL}/openseadragon.min.js"></script>
+<script>
+  // an about:srcdoc frame resolves relative URLs against the page, as the maps do
+  const base = new URL("{IMAGE_URL}/", document.baseURI);
+  OpenSeadragon({{
+    id: "zoom-{year}",
+    prefixUrl: new URL("{OPENSEADRAGON_URL}/images/", document.baseURI).href,
+    tileSources: new URL("{year}.dzi", base).href,
+    showNavigator: true,
+    maxZoomPixelRatio: 2,
+  }});
+</script>
+"""
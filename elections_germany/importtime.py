@@ -0,0 +1,95 @@
+"""
+Import-time budget of the pages.
+
+A page's imports run on the first visit of every replica, before anything
+is drawn. For every page the top-level ``import`` statements are run in a
+fresh interpreter under ``python -X importtime``, after ``import
+streamlit`` (which the server has loaded already), and the self time of
+every module they load is summed up::
+
+    python -m elections_germany import-budget
+
+fails if a page exceeds its entry in ``BUDGETS_MS`` (``DEFAULT_BUDGET_MS``
+for pages without one) and lists the slowest modules of that page, so a
+heavy top-level import in a page or a shared module is caught before it
+ships. Heavy libraries belong inside the functions that use them.
+"""
+
+import ast
+import re
+import subprocess
+import sys
+
+from elections_germany import store
+
+# pages that read no table: only the paths of the store and their own code
+DEFAULT_BUDGET_MS = 100
+# pages that read tables load pandas and pyarrow (about 500 ms), page 01 also plotly.express
+BUDGETS_MS = {
+    "Home.py": 900,
+    "pages/01_Income_Tax_and_Political_Impact.py": 1000,
+    "pages/02_Elections_and_unemployment.py": 900,
+    "pages/03_GDP_Growth_and_Elections.py": 900,
+    "pages/04_Elections_and_Income.py": 900,
+}
+REPEAT = 3  # fresh interpreters per page; the fastest one counts
+TIMEOUT = 120  # seconds per interpreter
+
+MARKER = "--- page imports ---"
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \| *(\S+)$")
+
+
+def page_imports(page):
+    """Source of the top-level import statements of a page script."""
+    source = (store.ROOT / page).read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    return "\n".join(
+        ast.get_source_segment(source, node)
+        for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
+def measure(code):
+    """``{module: self µs}`` of the modules ``code`` loads after streamlit."""
+    script = f"import streamlit\nimport sys\nprint({MARKER!r}, file=sys.stderr)\n{code}\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=store.ROOT, capture_output=True, text=True, timeout=TIMEOUT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    lines = result.stderr.split(MARKER, 1)[1].splitlines()
+    modules = {}
+    for line in lines:
+        match = LINE.match(line)
+        if match:
+            modules[match.group(2)] = int(match.group(1))
+    return modules
+
+
+def page_import_time(page, repeat=REPEAT):
+    """Fastest of ``repeat`` measurements: ``(total ms, {module: self µs})``."""
+    code = page_imports(page)
+    runs = [measure(code) for _ in range(repeat)]
+    best = min(runs, key=lambda modules: sum(modules.values()))
+    return sum(best.values()) / 1000, best
+
+
+def budget(page):
+    return BUDGETS_MS.get(page, DEFAULT_BUDGET_MS)
+
+
+def check(pages, repeat=REPEAT, top=8, log=print):
+    """Measure every page; returns the pages over budget."""
+    over = []
+    for page in pages:
+        total, modules = page_import_time(page, repeat)
+        limit = budget(page)
+        status = "ok" if total <= limit else "OVER BUDGET"
+        log(f"{page:<50}{total:8.0f} ms  (budget {limit} ms, {len(modules)} modules)  {status}")
+        if total > limit:
+            over.append(page)
+            for name, micros in sorted(modules.items(), key=lambda m: -m[1])[:top]:
+                log(f"    {micros / 1000:8.1f} ms  {name}")
+    return over
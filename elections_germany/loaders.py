@@ -0,0 +1,34 @@
+"""
+Cached loaders of the pages that ``prewarm`` fills at server start.
+
+Streamlit keys a cached function on its module and qualified name, and a
+page script runs as ``__main__``: a loader defined inside a page can only be
+filled by a rerun of that page. The loaders here live in an importable
+module, so the pages and the prewarm thread call the very same functions
+and share their cache entries. Tables are read through ``data``, whose cache
+is process-wide already.
+"""
+
+import streamlit as st
+
+from elections_germany import data, figure_store, profiling
+from elections_germany.maps import KINDS
+
+MAX_MAP_YEARS = 32  # election years (per store version) whose maps are kept
+
+
+# ----------------- PAGE 04 -----------------
+
+
+def generate_maps(year):
+    """The maps of page 04 for one election year, cached per store version."""
+    return _maps(int(year), data.store_version())
+
+
+# the maps are pre-rendered by `python -m elections_germany render-figures`;
+# they reference the county geometry by URL, so the browser downloads it once
+@profiling.step("generate_maps")
+@st.cache_resource(max_entries=MAX_MAP_YEARS)
+@profiling.computed
+def _maps(year, version):
+    return [figure_store.figure("county_map", year=year, kind=kind) for kind in KINDS]
@@ -0,0 +1,190 @@
+"""
+County choropleths of page 04: election winner, income, far-left and
+far-right vote share for one election year, and the municipal winner map
+drawn from the vector tiles of ``tile_server``.
+"""
+
+from elections_germany.alignment import income_year_for
+from elections_germany.store import county_key
+from elections_germany.transport import compact_frame
+
+# initial zoom of every map; the county geometry is simplified to match it
+MAP_ZOOM = 4.5
+
+# in the order page 04 shows them
+KINDS = ("winner", "income", "far_left", "far_right")
+
+WINNER_COLORS = {
+    'cdu': '#003B6F',
+    'spd': '#A6006B',
+    'gruene': '#1AA037',
+    'fdp': '#FFEF00',
+    'linke_pds': '#E3000F',
+    'afd': '#0489DB',
+}
+
+# winners of a municipality that never win a county
+MUNICIPAL_COLORS = {**WINNER_COLORS, 'csu': '#0080C8', 'other_parties': '#9E9E9E'}
+
+MAP_LAYOUT = dict(
+    map_center={"lat": 51, "lon": 10},
+    autosize=False,
+    margin={"r": 0, "t": 0, "l": 0, "b": 0},
+)
+
+
+def year_elections(counties, year):
+    """County level of the vote cube for one year, with shares in percent."""
+    rows = counties[counties["election_year"] == year]
+    year_elects = compact_frame(
+        rows.assign(
+            county=rows["region"],
+            perc_far_left_w_linke=rows["far_left_w_linke"] * 100,
+            perc_far_right=rows["far_right"] * 100,
+        ),
+        ["county", "winner", "perc_far_left_w_linke", "perc_far_right"],
+        numeric=["perc_far_left_w_linke", "perc_far_right"],
+    )
+    year_elects["county"] = county_key(year_elects["county"]).to_numpy()
+    year_elects["winner"] = year_elects["winner"].astype(str)
+    return year_elects
+
+
+def winner_map(year_elects, geojson):
+    import plotly.express as px
+
+    fig = px.choropleth_map(
+        year_elects,
+        geojson=geojson,
+        locations="county",
+        featureidkey="properties.krs_code",
+        color="winner",
+        hover_name="winner",
+        zoom=MAP_ZOOM,
+        title="Elected party per district",
+        labels={'winner': 'Winner party'},
+        color_discrete_map=WINNER_COLORS,
+    )
+    fig.update_layout(title_text="Elected party per district", **MAP_LAYOUT)
+    return fig
+
+
+def share_map(year_elects, geojson, column, title, color_scale):
+    import plotly.express as px
+
+    fig = px.choropleth_map(
+        year_elects,
+        geojson=geojson,
+        locations="county",
+        featureidkey="properties.krs_code",
+        color=column,
+        hover_name="county",
+        zoom=MAP_ZOOM,
+        title=title,
+        labels={column: 'Votes (%)'},
+        color_continuous_scale=color_scale,
+        range_color=(0, 50),
+    )
+    fig.update_layout(**MAP_LAYOUT)
+    return fig
+
+
+def income_map(sorted_incomes, income_year, geojson):
+    import plotly.express as px
+
+    year_incomes = compact_frame(
+        sorted_incomes[sorted_incomes["year"] == income_year],
+        ["code", "region", "income_per_capita"],
+        numeric=["income_per_capita"],
+    )
+    year_incomes["code"] = county_key(year_incomes["code"]).to_numpy()
+    year_incomes["region"] = year_incomes["region"].astype(str)
+    fig = px.choropleth_map(
+        year_incomes,
+        geojson=geojson,
+        locations="code",
+        featureidkey="properties.krs_code",
+        color="income_per_capita",
+        hover_name="region",
+        zoom=MAP_ZOOM,
+        title="Income",
+        labels={'income_per_capita': 'Income \n(TSD Euro)'},
+        color_continuous_scale="Purples",
+        range_color=(year_incomes["income_per_capita"].min(), year_incomes["income_per_capita"].max()),
+    )
+    fig.update_layout(**MAP_LAYOUT)
+    return fig
+
+
+def map_figure(kind, year, counties, sorted_incomes, year_alignment, geojson):
+    """
+    One map of ``KINDS`` for an election year, from the county level of the
+    vote cube. The income map uses the aligned income year and is None if
+    there is none.
+    """
+    if kind == "income":
+        income_year = income_year_for(year_alignment, year)
+        if income_year is None:
+            return None
+        return income_map(sorted_incomes, income_year, geojson)
+
+    year_elects = year_elections(counties, year)
+    if kind == "winner":
+        return winner_map(year_elects, geojson)
+    if kind == "far_left":
+        return share_map(
+            year_elects, geojson, "perc_far_left_w_linke",
+            "Percentage of people voting far left", "Reds",
+        )
+    if kind == "far_right":
+        return share_map(
+            year_elects, geojson, "perc_far_right",
+            "Percentage of people voting far right", "Blues",
+        )
+    raise ValueError(f"unknown map kind {kind!r}")
+
+
+def generate_maps(year, counties, sorted_incomes, year_alignment, geojson):
+    """All maps of ``KINDS`` for an election year, in page order."""
+    return [
+        map_figure(kind, year, counties, sorted_incomes, year_alignment, geojson)
+        for kind in KINDS
+    ]
+
+
+def municipal_winner_map(year, tile_url, parties=tuple(MUNICIPAL_COLORS)):
+    """
+    Winner of every municipality as vector tile layers, one fill layer per
+    party; the browser fetches only the tiles in view from ``tile_url``.
+    """
+    import plotly.graph_objects as go
+
+    source = f"{tile_url.rstrip('/')}/tiles/{int(year)}/{{z}}/{{x}}/{{y}}.pbf"
+    fig = go.Figure()
+    # the layers have no legend entries of their own
+    for party in parties:
+        fig.add_trace(go.Scattermap(
+            lat=[None], lon=[None], mode="markers", name=party,
+            marker={"size": 12, "color": MUNICIPAL_COLORS[party]},
+        ))
+    fig.update_layout(
+        map={
+            "center": MAP_LAYOUT["map_center"],
+            "zoom": MAP_ZOOM,
+            "layers": [
+                {
+                    "sourcetype": "vector",
+                    "source": [source],
+                    "sourcelayer": party,
+                    "type": "fill",
+                    "color": MUNICIPAL_COLORS[party],
+                    "opacity": 0.8,
+                    "below": "traces",
+                }
+                for party in parties
+            ],
+        },
+        legend_title_text="Winner party",
+        **{k: v for k, v in MAP_LAYOUT.items() if k != "map_center"},
+    )
+    return fig
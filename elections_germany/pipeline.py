@@ -0,0 +1,273 @@
+"""
+ETL pipeline for the derived election and income tables.
+
+This replaces the cells of ``notebooks/exploratory_notebook.ipynb`` that
+produce ``data/sorted_elects.csv`` and ``data/sorted_incomes.csv``. The work
+is split into named stages that form a DAG::
+
+    gerda_municipal -> elections_clean -> elections_by_county -> sorted_elects
+    genesis_income  -> income_by_county ----------------------> sorted_incomes
+
+Every stage result is memoized in ``data/.pipeline_cache/`` under a key that
+hashes the stage code, its parameters and the keys of its inputs (source
+files are keyed by their SHA-256). Stages whose inputs are ready run
+together in a process pool, so the election and income branches are derived
+in parallel. A new GERDA release is re-derived with::
+
+    python -m elections_germany run-pipeline
+"""
+
+import hashlib
+import inspect
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from elections_germany import store
+
+CACHE_DIR = store.DATA_DIR / ".pipeline_cache"
+
+# first and last party columns of the GERDA files (column order matters)
+MAIN_PARTIES = ("cdu", "zentrum")
+OTHER_PARTIES = ("npd", "werteunion")
+
+LAND_CODES = [f"{i:02d}" for i in range(1, 17)]
+
+
+# ----------------- STAGES -----------------
+# Each stage takes its inputs as DataFrames (in the order of ``inputs``) plus
+# its parameters as keyword arguments and returns a DataFrame. Source stages
+# get the path of their source file instead.
+
+
+def gerda_municipal(path):
+    """Raw GERDA federal results per municipality."""
+    return store.read_gerda_municipal(path)
+
+
+def elections_clean(elections):
+    """Zero-padded keys, party NaNs as 0 and small parties summed up."""
+    elections = elections.copy()
+
+    # county / state codes as zero-padded strings, as used by the geodata
+    elections["county"] = elections["county"].astype("int64").astype(str).str.zfill(5)
+    elections["state_code"] = elections["state"].astype("int64").astype(str).str.zfill(2)
+
+    main = elections.loc[:, MAIN_PARTIES[0]:MAIN_PARTIES[1]].columns
+    others = elections.loc[:, OTHER_PARTIES[0]:OTHER_PARTIES[1]].columns
+    elections[main] = elections[main].fillna(0)
+
+    elections["other_parties"] = elections[others].sum(axis=1)
+    elections["votes_sum"] = elections.loc[:, MAIN_PARTIES[0]:OTHER_PARTIES[1]].sum(axis=1)
+
+    unused = ["ags", "state", "eligible_voters_orig", "number_voters_orig", "area_cw"]
+    return elections.drop(columns=list(others) + unused, errors="ignore")
+
+
+def elections_by_county(elections):
+    """Average municipal shares per county, with the winning party."""
+    grouped = (
+        elections.groupby(["election_year", "state_code", "county"])
+        .mean(numeric_only=True)
+        .reset_index()
+    )
+
+    party_cols = list(grouped.loc[:, "cdu":"afd"].columns) + ["other_parties"]
+    shares = grouped[party_cols].to_numpy()
+    grouped["votes_sum_recalc"] = shares.sum(axis=1)
+    grouped["winner"] = np.asarray(party_cols)[shares.argmax(axis=1)]
+
+    grouped = grouped.sort_values("election_year").reset_index(drop=True)
+    grouped["perc_far_left_w_linke"] = grouped["far_left_w_linke"] * 100
+    grouped["perc_far_right"] = grouped["far_right"] * 100
+    return grouped
+
+
+def genesis_income(path):
+    """Raw GENESIS income tax table 73111-01-01-4 (Kreise and Länder)."""
+    return pd.read_csv(
+        path,
+        encoding="ISO-8859-1",
+        sep=";",
+        skiprows=7,
+        names=["year", "code", "region", "anzahl_steuerpflichtige", "gesamtbetrag", "steuer"],
+        dtype={"code": str},
+        skipfooter=4,
+        engine="python",
+    )
+
+
+def income_by_county(income):
+    """Income per taxpayer and tax rate for every Kreis."""
+    income = income.copy()
+    numeric_cols = ["anzahl_steuerpflichtige", "gesamtbetrag", "steuer"]
+    income[numeric_cols] = income[numeric_cols].apply(pd.to_numeric, errors="coerce")
+
+    income["tax_perc"] = (income["steuer"] / income["gesamtbetrag"]) * 100
+    income["income_per_capita"] = income["gesamtbetrag"] / income["anzahl_steuerpflichtige"]
+
+    # drop Germany ("DG") and the Länder, keep Kreise
+    kreise = income[(income["code"] != "DG") & ~income["code"].isin(LAND_CODES)].copy()
+    kreise["state_code"] = kreise["code"].str[:2]
+
+    return kreise.sort_values("year").reset_index(drop=True)
+
+
+class Stage:
+    def __init__(self, name, func, inputs=(), source=None, output=None, **params):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.source = source  # file inside data/, for source stages
+        self.output = output  # CSV inside data/ written after the run
+        self.params = params
+
+
+STAGES = {
+    s.name: s
+    for s in [
+        Stage("gerda_municipal", gerda_municipal, source="federal_muni_harm_25.csv"),
+        Stage("elections_clean", elections_clean, inputs=["gerda_municipal"]),
+        Stage(
+            "elections_by_county",
+            elections_by_county,
+            inputs=["elections_clean"],
+            output="sorted_elects.csv",
+        ),
+        Stage("genesis_income", genesis_income, source="income.csv"),
+        Stage(
+            "income_by_county",
+            income_by_county,
+            inputs=["genesis_income"],
+            output="sorted_incomes.csv",
+        ),
+    ]
+}
+
+# pipeline outputs that are also tables of the data store
+STORE_TABLES = {"sorted_elects.csv": "sorted_elects", "sorted_incomes.csv": "sorted_incomes"}
+
+
+# ----------------- RUNNER -----------------
+
+
+def stage_key(stage, keys):
+    """Hash of the stage code, its parameters and the keys of its inputs."""
+    digest = hashlib.sha256()
+    digest.update(stage.name.encode())
+    digest.update(inspect.getsource(stage.func).encode())
+    digest.update(json.dumps(stage.params, sort_keys=True, default=str).encode())
+    if stage.source is not None:
+        digest.update(store.file_hash(store.DATA_DIR / stage.source).encode())
+    for name in stage.inputs:
+        digest.update(keys[name].encode())
+    return digest.hexdigest()[:16]
+
+
+def cache_path(name, key):
+    return CACHE_DIR / f"{name}-{key}.parquet"
+
+
+def upstream(targets):
+    """All stages needed for ``targets``, in topological order."""
+    order = []
+
+    def visit(name):
+        if name in order:
+            return
+        for dep in STAGES[name].inputs:
+            visit(dep)
+        order.append(name)
+
+    for name in targets:
+        visit(name)
+    return order
+
+
+def _run_stage(name, key, input_paths):
+    """Execute one stage in a worker process and persist its result."""
+    stage = STAGES[name]
+    if stage.source is not None:
+        args = [store.DATA_DIR / stage.source]
+    else:
+        args = [pd.read_parquet(path) for path in input_paths]
+
+    df = stage.func(*args, **stage.params)
+
+    out = cache_path(name, key)
+    tmp = out.with_suffix(".tmp")
+    df.to_parquet(tmp)
+    tmp.replace(out)
+    return name
+
+
+def run(targets=None, force=False, workers=None, log=print):
+    """
+    Run the pipeline up to ``targets`` (default: every stage with an output).
+
+    Returns the cache path of every stage that was run or reused.
+    """
+    if targets is None:
+        targets = [s.name for s in STAGES.values() if s.output]
+
+    order = upstream(targets)
+
+    # stages whose source file is missing are dropped with everything below
+    missing = {
+        s for s in order
+        if STAGES[s].source and not (store.DATA_DIR / STAGES[s].source).exists()
+    }
+    for name in order:
+        if any(dep in missing for dep in STAGES[name].inputs):
+            missing.add(name)
+    for name in sorted(missing):
+        if STAGES[name].source:
+            log(f"{name:<22} skipped (data/{STAGES[name].source} not found)")
+    order = [s for s in order if s not in missing]
+
+    keys = {}
+    for name in order:
+        keys[name] = stage_key(STAGES[name], keys)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    done = {n for n in order if not force and cache_path(n, keys[n]).exists()}
+    for name in order:
+        if name in done:
+            log(f"{name:<22} cached  ({keys[name]})")
+
+    pending = [n for n in order if n not in done]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending:
+            ready = [n for n in pending if all(d in done for d in STAGES[n].inputs)]
+            futures = [
+                pool.submit(
+                    _run_stage,
+                    name,
+                    keys[name],
+                    [cache_path(d, keys[d]) for d in STAGES[name].inputs],
+                )
+                for name in ready
+            ]
+            for future in futures:
+                name = future.result()
+                log(f"{name:<22} ran     ({keys[name]})")
+                done.add(name)
+            pending = [n for n in pending if n not in done]
+
+    paths = {name: cache_path(name, keys[name]) for name in order}
+    publish(paths, log=log)
+    return paths
+
+
+def publish(paths, log=print):
+    """Write the output stages to their CSVs and refresh the data store."""
+    for name, path in paths.items():
+        output = STAGES[name].output
+        if output is None:
+            continue
+        pd.read_parquet(path).to_csv(store.DATA_DIR / output, index=False)
+        log(f"{name:<22} -> data/{output}")
+        if output in STORE_TABLES:
+            store.build_store([STORE_TABLES[output]])
@@ -0,0 +1,198 @@
+"""
+Fill the page caches at server start, before the first visitor.
+
+``python -m elections_germany serve`` runs the app with ``streamlit run``
+in this process and, next to it,
+
+- a prewarm thread that waits for the Streamlit runtime, builds the missing
+  or stale store tables once (so the tasks do not build them side by side),
+  lists the cache entries the pages read (``tasks``) and fills them through
+  the same accessors of ``data`` and loaders of ``loaders`` as the pages, in
+  a thread pool. Tasks start in priority order: the entries every visitor
+  needs, then the maps of one election year after the other, most visited
+  (by default: latest) year first;
+- a health endpoint, ``GET /health`` on its own port, which answers 200
+  once every task has run and 503 while the caches are warming or when a
+  step failed ("degraded"), with the progress as JSON, so a load balancer
+  only routes traffic to a warm replica.
+
+The caches live in this process, so the pool is a thread pool; the loaders
+spend their time in pyarrow and pandas, which release the GIL.
+"""
+
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from elections_germany import store
+
+DEFAULT_HEALTH_PORT = 8767
+DEFAULT_WORKERS = 4
+RUNTIME_POLL = 0.1  # seconds between checks for the Streamlit runtime
+
+# warns about every cached call made outside a script run, i.e. every prewarm task
+CONTEXT_LOGGER = "streamlit.runtime.scriptrunner_utils.script_run_context"
+
+
+
+def tasks(years=None):
+    """
+    ``(name, loader, args)`` of every cache entry to fill, in priority order.
+    ``years`` orders the election years of the maps (default: latest first);
+    years it leaves out follow, latest first.
+    """
+    from elections_germany import data, loaders
+    from elections_germany.regions import PANEL_PARTIES
+
+    election_years = sorted((int(y) for y in data.year_alignment()["election_year"]), reverse=True)
+    order = [y for y in years or () if y in election_years]
+    order += [y for y in election_years if y not in order]
+
+    # what every visitor of page 01 and 04 reads (with the same columns, which are part
+    # of the cache key), including the default year of page 04
+    votes_01 = ["ags", "county", "election_year", "valid_votes"] + PANEL_PARTIES
+    first = [
+        ("year_alignment()", data.year_alignment, ()),
+        (f"generate_maps({order[0]})", loaders.generate_maps, (order[0],)),
+        ("taxation()", data.taxation, ()),
+        ("municipal_votes(2021)", data.municipal_votes, (2021, votes_01)),
+        ("tax_votes()", data.tax_votes, ()),
+    ]
+    return first + [(f"generate_maps({y})", loaders.generate_maps, (y,)) for y in order[1:]]
+
+
+class Prewarm:
+    """Progress of one prewarm run, read by the health endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = None
+        self.done = []
+        self.failed = {}
+        self.running = set()
+        self.started = time.time()
+        self.finished = None
+
+    def ready(self):
+        """Every task has run and none failed."""
+        return self.finished is not None and not self.failed
+
+    def status(self):
+        with self._lock:
+            if self.finished is None:
+                status = "warming"
+            else:
+                status = "degraded" if self.failed else "ready"
+            return {
+                "status": status,
+                "done": len(self.done) + len(self.failed),
+                "total": self.total,
+                "running": sorted(self.running),
+                "failed": dict(self.failed),
+                "seconds": round((self.finished or time.time()) - self.started, 2),
+            }
+
+    def _run_task(self, name, loader, args, log):
+        with self._lock:
+            self.running.add(name)
+        start = time.perf_counter()
+        try:
+            loader(*args)
+        except Exception as e:
+            # a failed entry stays cold and is computed by the first visitor as before
+            with self._lock:
+                self.failed[name] = repr(e)
+                log(f"prewarm {name} failed: {e!r}")
+        else:
+            with self._lock:
+                self.done.append(name)
+                log(f"prewarm {name} {time.perf_counter() - start:.2f} s")
+        finally:
+            with self._lock:
+                self.running.discard(name)
+
+    def run(self, years=None, workers=DEFAULT_WORKERS, log=print):
+        from streamlit import runtime
+
+        logging.getLogger(CONTEXT_LOGGER).addFilter(
+            lambda record: not record.threadName.startswith("prewarm")
+        )
+        while not runtime.exists():
+            time.sleep(RUNTIME_POLL)
+        try:
+            store.build_store()
+        except Exception as e:
+            # the tasks build what they need one by one, serialized by store.BUILD_LOCK
+            with self._lock:
+                self.failed["build_store"] = repr(e)
+                log(f"prewarm could not build the store: {e!r}")
+        try:
+            todo = tasks(years)
+        except Exception as e:
+            todo = []
+            with self._lock:
+                self.failed["tasks"] = repr(e)
+                log(f"prewarm could not list its tasks: {e!r}")
+        self.total = len(todo)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prewarm") as pool:
+            for name, loader, args in todo:
+                pool.submit(self._run_task, name, loader, args, log)
+        self.finished = time.time()
+        state = f"degraded ({len(self.failed)} failed)" if self.failed else "ready"
+        log(f"prewarm {state} after {self.finished - self.started:.1f} s")
+
+    def start(self, years=None, workers=DEFAULT_WORKERS, log=print):
+        thread = threading.Thread(
+            target=self.run, args=(years, workers, log), name="prewarm", daemon=True,
+        )
+        thread.start()
+        return thread
+
+
+# ----------------- HEALTH -----------------
+
+
+def health_handler(prewarm):
+    class HealthHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/health":
+                self.send_error(404, "expected /health")
+                return
+            body = json.dumps(prewarm.status()).encode()
+            self.send_response(200 if prewarm.ready() else 503)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return HealthHandler
+
+
+def serve_health(prewarm, host, port):
+    server = ThreadingHTTPServer((host, port), health_handler(prewarm))
+    threading.Thread(target=server.serve_forever, name="health", daemon=True).start()
+    return server
+
+
+# ----------------- SERVER -----------------
+
+
+def serve(streamlit_args=(), health_host="0.0.0.0", health_port=DEFAULT_HEALTH_PORT,
+          workers=DEFAULT_WORKERS, years=None):
+    """``streamlit run Home.py`` with the prewarm thread and the health endpoint."""
+    from streamlit.web import cli
+
+    prewarm = Prewarm()
+    serve_health(prewarm, health_host, health_port)
+    print(f"health on http://{health_host}:{health_port}/health")
+    prewarm.start(years, workers)
+    sys.argv = ["streamlit", "run", str(store.ROOT / "Home.py"), *streamlit_args]
+    cli.main()
@@ -0,0 +1,243 @@
+"""
+Per-rerun timing of the app's loaders, figure builders and heavy blocks.
+
+Wrap a function or a block in a named step::
+
+    @profiling.step("load_data")
+    @st.cache_data
+    @profiling.computed
+    def load_data(name): ...
+
+    with profiling.step("merge_2021"):
+        merged_df = ...
+
+Every step records its wall time, its offset from the start of the rerun and
+the size of its result. ``computed`` sits under the Streamlit cache and only
+runs on a miss, so a cached step whose body did not run was a hit. The
+``data`` accessors report to the step around them in the same way
+(``computed`` on their cached body, ``cached`` on their result), so
+``with step("taxation"): data.taxation()`` shows hit/miss and size too.
+
+A page calls ``begin()`` after ``st.set_page_config`` and ``panel()`` at the
+end. With ``?debug`` in the URL the panel draws the steps of the rerun as a
+waterfall in the sidebar; ``?debug=profile`` also writes a cProfile dump of
+the rerun to ``data/profiles/`` (``?debug=pyinstrument`` an HTML report, if
+pyinstrument is installed). Without ``?debug`` steps cost two clock reads.
+"""
+
+import cProfile
+import functools
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from elections_germany import store
+
+PROFILE_DIR = store.DATA_DIR / "profiles"
+
+# one rerun per script thread
+_local = threading.local()
+
+
+def _state():
+    if not hasattr(_local, "steps"):
+        _local.steps = []
+        _local.stack = []
+        _local.start = time.perf_counter()
+        _local.profiler = None
+    return _local
+
+
+def output_size(obj):
+    """Approximate size of a step result in bytes, or None."""
+    if hasattr(obj, "memory_usage"):  # DataFrame / Series
+        usage = obj.memory_usage(index=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if isinstance(obj, (bytes, str)):
+        return len(obj)
+    if isinstance(obj, (list, tuple)):
+        sizes = [output_size(item) for item in obj]
+        return sum(s for s in sizes if s is not None) if any(s is not None for s in sizes) else None
+    return None
+
+
+class step:
+    """Times a block (``with step(name):``) or every call of a function."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        state = _state()
+        self.record = {"name": self.name, "depth": len(state.stack), "cache": None, "bytes": None}
+        state.stack.append(self.record)
+        self.record["start"] = time.perf_counter() - state.start
+        return self.record
+
+    def __exit__(self, *exc):
+        state = _state()
+        self.record["seconds"] = time.perf_counter() - state.start - self.record["start"]
+        state.stack.pop()
+        state.steps.append(self.record)
+        return False
+
+    def __call__(self, func):
+        # st.cache_data / st.cache_resource functions have a ``clear``
+        is_cached = hasattr(func, "clear")
+        name = self.name
+
+        def wrapper(*args, **kwargs):
+            with step(name) as record:
+                result = func(*args, **kwargs)
+                if is_cached and record["cache"] is None:
+                    record["cache"] = "hit"
+                record["bytes"] = output_size(result)
+            return result
+
+        wrapper.__name__ = getattr(func, "__name__", name)
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        if is_cached:
+            wrapper.clear = func.clear
+        return wrapper
+
+
+def computed(func):
+    """Marks the body of a cached function; it only runs on a cache miss."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = _state().stack
+        if stack:
+            stack[-1]["cache"] = "miss"
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def cached(result):
+    """Records a cached call on the innermost step: a hit unless ``computed`` ran, and its size."""
+    stack = _state().stack
+    if stack:
+        record = stack[-1]
+        if record["cache"] is None:
+            record["cache"] = "hit"
+        size = output_size(result)
+        if size is not None:
+            record["bytes"] = (record["bytes"] or 0) + size
+    return result
+
+
+# ----------------- PER RERUN -----------------
+
+
+def debug_mode():
+    """Value of the ``debug`` query parameter ("" if present without value), or None."""
+    import streamlit as st
+
+    return st.query_params.get("debug")
+
+
+def begin():
+    """Starts a rerun: clears the recorded steps and starts the profiler."""
+    state = _state()
+    state.steps = []
+    state.stack = []
+    state.start = time.perf_counter()
+    state.profiler = None
+
+    mode = debug_mode()
+    if mode == "profile":
+        state.profiler = cProfile.Profile()
+        state.profiler.enable()
+    elif mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            return
+        state.profiler = Profiler()
+        state.profiler.start()
+
+
+def steps():
+    """Steps of the current rerun, in the order they finished."""
+    return list(_state().steps)
+
+
+def _dump_profile(profiler, page):
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    if isinstance(profiler, cProfile.Profile):
+        profiler.disable()
+        path = PROFILE_DIR / f"{page}-{stamp}.prof"
+        profiler.dump_stats(path)
+    else:
+        profiler.stop()
+        path = PROFILE_DIR / f"{page}-{stamp}.html"
+        path.write_text(profiler.output_html())
+    return path
+
+
+def waterfall(records):
+    """Horizontal bars from each step's start offset to its end."""
+    import plotly.graph_objects as go
+
+    records = sorted(records, key=lambda r: r["start"])
+    colors = {"hit": "#1AA037", "miss": "#E3000F", None: "#888888"}
+    fig = go.Figure(go.Bar(
+        x=[r["seconds"] * 1000 for r in records],
+        base=[r["start"] * 1000 for r in records],
+        y=[" " * 2 * r["depth"] + r["name"] for r in records],
+        orientation="h",
+        marker_color=[colors[r["cache"]] for r in records],
+        hovertemplate="%{y}<br>%{x:.1f} ms<extra></extra>",
+    ))
+    fig.update_layout(
+        xaxis_title="ms since rerun start",
+        yaxis=dict(autorange="reversed"),
+        template="plotly_white",
+        height=max(200, 24 * len(records) + 80),
+        margin=dict(l=0, r=0, t=10, b=0),
+        showlegend=False,
+    )
+    return fig
+
+
+def panel(page):
+    """Sidebar waterfall of this rerun (only with ``?debug``)."""
+    import streamlit as st
+
+    mode = debug_mode()
+    if mode is None:
+        return
+
+    state = _state()
+    total = time.perf_counter() - state.start
+    records = steps()
+
+    st.sidebar.subheader("Rerun timing")
+    st.sidebar.write(f"Total: {total * 1000:.0f} ms, green = cache hit, red = miss")
+    if records:
+        st.sidebar.plotly_chart(waterfall(records), use_container_width=True)
+        st.sidebar.dataframe(
+            [
+                {
+                    "step": r["name"],
+                    "ms": round(r["seconds"] * 1000, 1),
+                    "cache": r["cache"] or "",
+                    "bytes": r.get("bytes"),
+                }
+                for r in records
+            ],
+            hide_index=True,
+        )
+
+    if state.profiler is not None:
+        path = _dump_profile(state.profiler, Path(page).stem)
+        state.profiler = None
+        st.sidebar.caption(f"Profile written to {path.relative_to(store.ROOT)}")
+    elif mode == "pyinstrument":
+        st.sidebar.caption("pyinstrument is not installed; use ?debug=profile for cProfile")
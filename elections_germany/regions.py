@@ -0,0 +1,93 @@
+"""
+Region keys and the tax x vote panel of page 01.
+
+German statistics identify regions by the prefix digits of the AGS
+(Amtlicher Gemeindeschlüssel): 2 digits for a Land, 3 for a
+Regierungsbezirk, 5 for a Kreis and 8 for a Gemeinde. ``region_keys``
+validates such codes once and splits them into integer ``land`` /
+``kreis`` / ``ags`` keys plus their level, so joins compare integers of
+the same level instead of codes parsed as floats ("02" and "02000" are
+different regions, not the numbers 2 and 2000).
+
+``tax_vote_panel`` joins the Kreis-level income tax of every tax year with
+the municipal results of every election year in one merge; it is
+materialized as the derived store table ``tax_votes``.
+"""
+
+import pandas as pd
+
+LEVELS = {2: "land", 3: "bezirk", 5: "kreis", 8: "gemeinde"}
+
+# top 6 parties of page 01, vote shares 0-1
+PANEL_PARTIES = ["cdu_csu", "spd", "gruene", "fdp", "linke_pds", "afd"]
+
+# elections up to 2021 use the results harmonised to 2021 boundaries (the
+# boundaries of the tax statistics), later ones the 2025 release
+LAST_2021_BOUNDARY_ELECTION = 2021
+
+
+def region_keys(codes):
+    """
+    Integer keys of region codes like "01", "031", "01001", "01051001".
+
+    Returns a frame aligned with ``codes`` with ``level`` (see ``LEVELS``,
+    None for codes that are not 2/3/5/8 digits) and the nullable integer
+    keys ``land``, ``kreis`` and ``ags`` of the levels a code covers.
+    """
+    codes = pd.Series(codes, dtype="string").str.strip()
+    length = codes.str.len()
+    valid = codes.str.fullmatch(r"\d+").fillna(False) & length.isin(list(LEVELS))
+
+    def prefix(digits, min_length):
+        keep = valid & (length >= min_length)
+        return pd.to_numeric(codes.str[:digits].where(keep), errors="coerce").astype("Int32")
+
+    return pd.DataFrame({
+        "level": length.map(LEVELS).where(valid, None),
+        "land": prefix(2, 2),
+        "kreis": prefix(5, 5),
+        "ags": prefix(8, 8),
+    }, index=codes.index)
+
+
+def municipal_votes(gerda, years=None):
+    """Election results per municipality with CDU + CSU combined, as on page 01."""
+    if years is not None:
+        gerda = gerda[gerda["election_year"].isin(years)]
+    votes = gerda.copy()
+    if "cdu_csu" not in votes.columns:
+        votes["cdu_csu"] = votes["cdu"].fillna(0) + votes["csu"].fillna(0)
+    return votes[["ags", "county", "election_year", "valid_votes"] + PANEL_PARTIES]
+
+
+def tax_vote_panel(taxation, votes):
+    """
+    Every municipality and election year in ``votes`` joined with the tax
+    per taxpayer of its Kreis in every tax year (inner join on integer
+    Kreis keys).
+    """
+    keys = region_keys(taxation["Region_Code"])
+    kreis = keys["level"] == "kreis"
+    tax = pd.DataFrame({
+        "tax_year": taxation.loc[kreis, "Year"].astype("int16"),
+        "county": keys.loc[kreis, "kreis"].astype("int32"),
+        "Region_Name": taxation.loc[kreis, "Region_Name"].str.strip(),
+        "Taxpayer_Count": taxation.loc[kreis, "Taxpayer_Count"],
+        "Tax_per_Taxpayer": taxation.loc[kreis, "Tax_per_Taxpayer"],
+    }).dropna(subset=["Tax_per_Taxpayer"])
+
+    votes = votes.assign(county=votes["county"].astype("int32"))
+    panel = votes.merge(tax, on="county", how="inner")
+    panel["Region_Name"] = panel["Region_Name"].astype("category")
+    return panel.sort_values(["tax_year", "election_year", "ags"], ignore_index=True)
+
+
+def panel_year(panel, election_year, tax_year=None):
+    """Rows of one election year (and tax year, default: the latest one)."""
+    if tax_year is None:
+        tax_year = panel["tax_year"].max()
+    rows = (panel["election_year"].to_numpy() == election_year) & (
+        panel["tax_year"].to_numpy() == tax_year
+    )
+    return panel[rows]
+
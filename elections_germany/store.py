@@ -0,0 +1,500 @@
+"""
+Columnar data store.
+
+Every raw CSV in ``data/`` is parsed once by ``build_store`` into a typed,
+zstd-compressed Parquet file in ``data/store/``. The pages then read these
+files with ``load_table``, which memory-maps them and only decodes the
+requested columns, instead of tokenizing the CSVs on every cold start.
+
+``data/store/manifest.json`` records, for every table, a SHA-256 of the
+source file it was built from and of the code that reads or computes it, and
+the resulting Arrow schema, so a table is only rebuilt when its source or
+its code actually changed. Builds are serialized by
+``BUILD_LOCK``, so threads that find the same table missing build it once.
+
+pandas and pyarrow are imported by the functions that use them: a page that
+only needs the paths below does not pay for them.
+"""
+
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data"
+STORE_DIR = DATA_DIR / "store"
+MANIFEST_PATH = STORE_DIR / "manifest.json"
+
+COMPRESSION = "zstd"
+
+# reentrant: a derived table loads, and so may build, its upstream tables
+BUILD_LOCK = threading.RLock()
+
+
+# ----------------- SOURCE READERS -----------------
+# One function per raw file. Each returns a cleaned DataFrame; all parsing
+# quirks (encodings, skipped rows, German decimal commas) live here.
+
+
+def read_sorted_elects(path):
+    import pandas as pd
+
+    return pd.read_csv(path)
+
+
+def read_sorted_incomes(path):
+    import pandas as pd
+
+    df = pd.read_csv(path)
+    # GENESIS indents region names by their level
+    df["region"] = df["region"].str.strip()
+    return df
+
+
+def read_taxation(path):
+    """Income tax by district (GENESIS 73111-01-01-5), as used on page 01."""
+    import pandas as pd
+
+    df = pd.read_csv(
+        path,
+        sep=";",
+        encoding="ISO-8859-1",
+        skiprows=7,  # skip metadata lines at the top
+        dtype=str,
+    )
+    df.columns = [
+        "Year",
+        "Region_Code",
+        "Region_Name",
+        "Taxpayer_Count",
+        "Total_Income_KEuros",
+        "Total_Taxes_KEuros",
+    ]
+
+    # The footer holds notes and the copyright line; they have no year
+    df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
+    df = df.dropna(subset=["Year"]).reset_index(drop=True)
+    df["Year"] = df["Year"].astype("int16")
+
+    numeric_cols = ["Taxpayer_Count", "Total_Income_KEuros", "Total_Taxes_KEuros"]
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
+
+    # Tax paid per taxpayer (convert from thousands of euros to euros)
+    df["Tax_per_Taxpayer"] = (
+        df["Total_Taxes_KEuros"] * 1000 / df["Taxpayer_Count"]
+    ).round(2)
+
+    return df
+
+
+def read_county_crosswalk(path):
+    """Kreis reforms, see ``elections_germany/crosswalk.py``."""
+    import pandas as pd
+
+    return pd.read_csv(path, dtype={"from_code": str, "to_code": str})
+
+
+def read_gerda_municipal(path):
+    """Harmonised GERDA federal election results per municipality."""
+    import pandas as pd
+
+    return pd.read_csv(path, low_memory=False)
+
+
+def read_indexed_csv(path):
+    """CSVs written by the notebook with the pandas index as first column."""
+    import pandas as pd
+
+    return pd.read_csv(path, index_col=0)
+
+
+def read_world_gdp(path):
+    """World Bank GDP growth table (one row per country, one column per year)."""
+    import pandas as pd
+
+    df = pd.read_csv(path, skiprows=3)
+    return df.iloc[:, :-1]
+
+
+def read_unemployment(path):
+    """Destatis unemployment rate per year, with German decimal commas."""
+    import pandas as pd
+
+    df = pd.read_csv(path, sep=";", encoding="cp1252", skiprows=1)
+    df = df.iloc[2:]
+    df = df.drop(columns=df.columns[1:5])
+    df = df.drop(columns=df.columns[2:])
+    df = df.iloc[:-132]  # footnotes and the monthly breakdown
+    df.columns = ["year", "unemployment_percentage"]
+
+    df["unemployment_percentage"] = (
+        df["unemployment_percentage"]
+        .str.replace(",", ".", regex=False)
+        .astype(float)
+    )
+    df["year"] = df["year"].astype(int)
+    return df.reset_index(drop=True)
+
+
+# table name -> (source file inside data/, reader)
+SOURCES = {
+    "sorted_elects": ("sorted_elects.csv", read_sorted_elects),
+    "sorted_incomes": ("sorted_incomes.csv", read_sorted_incomes),
+    "taxation": ("taxationbydistrict.csv", read_taxation),
+    "county_crosswalk": ("county_crosswalk.csv", read_county_crosswalk),
+    "federal_muni_harm_21": ("federal_muni_harm_21.csv", read_gerda_municipal),
+    "federal_muni_harm_25": ("federal_muni_harm_25.csv", read_gerda_municipal),
+    "gdp_votes": ("gdp_votes.csv", read_indexed_csv),
+    "deu_gdp": ("deu_gdp.csv", read_indexed_csv),
+    "world_gdp": ("gdp.csv", read_world_gdp),
+    "unemployment": ("unemployment.csv", read_unemployment),
+}
+
+
+# ----------------- SCHEMAS -----------------
+# Declared dtypes, applied when a table is built. Keys are small integers
+# (format them with ``county_key`` where a zero-padded string is needed),
+# names and party codes are categoricals, and every float column that is not
+# listed is stored as float32: shares and county/municipality vote counts fit
+# well within its 7 significant digits. ``st.cache_data`` pickles and copies
+# its results, so this is paid once per caller.
+
+GERDA_MUNICIPAL_SCHEMA = {
+    "ags": "int32",
+    "county": "int32",
+    "state": "int8",
+    "election_year": "int16",
+}
+
+SCHEMAS = {
+    "sorted_elects": {
+        "election_year": "int16",
+        "state_code": "int8",
+        "county": "int32",
+        "winner": "category",
+    },
+    "sorted_incomes": {
+        "year": "int16",
+        "code": "int32",
+        "state_code": "int8",
+        "region": "category",
+    },
+    "county_incomes": {
+        "year": "int16",
+        "code": "int32",
+        "state_code": "int8",
+        "region": "category",
+    },
+    "county_crosswalk": {
+        "reform_year": "int16",
+        "from_code": "int32",
+        "to_code": "int32",
+    },
+    "federal_muni_harm_21": GERDA_MUNICIPAL_SCHEMA,
+    "federal_muni_harm_25": GERDA_MUNICIPAL_SCHEMA,
+    "vote_cube": {
+        "election_year": "int16",
+        "region": "int32",
+        "winner": "category",
+        "runner_up": "category",
+    },
+}
+
+
+def apply_schema(df, schema):
+    """Cast ``df`` to a declared schema; unlisted float64 columns become float32."""
+    dtypes = {}
+    for col in df.columns:
+        dtype = schema.get(col)
+        if dtype is None and df[col].dtype == "float64":
+            dtype = "float32"
+        if dtype is not None and str(df[col].dtype) != dtype:
+            # integer keys with gaps stay nullable instead of failing
+            if dtype.startswith("int") and df[col].isna().any():
+                dtype = dtype.capitalize()
+            dtypes[col] = dtype
+    return df.astype(dtypes)
+
+
+def county_key(codes):
+    """County codes as the zero-padded 5-digit keys of the map geometry ("01001")."""
+    import pandas as pd
+
+    return pd.Series(codes).astype("int64").astype(str).str.zfill(5)
+
+
+# ----------------- DERIVED TABLES -----------------
+# Small aggregates computed from other store tables, so pages that only need
+# a summary never touch the large file behind it.
+
+
+def build_vote_cube():
+    """Vote-weighted results per municipality, county, state and country (see ``cube``)."""
+    from elections_germany.cube import vote_cube
+
+    return vote_cube(load_table("federal_muni_harm_25"))
+
+
+def build_county_incomes():
+    """``sorted_incomes`` with old Kreise re-based to today's (see ``crosswalk``)."""
+    from elections_germany.crosswalk import INCOME_LAYOUT_LAG, check_recode, rebase
+
+    crosswalk = load_table("county_crosswalk")
+    check_recode(crosswalk)
+    return rebase(
+        load_table("sorted_incomes"),
+        crosswalk,
+        sums=["anzahl_steuerpflichtige", "gesamtbetrag", "steuer"],
+        means={"tax_perc": "gesamtbetrag", "income_per_capita": "anzahl_steuerpflichtige"},
+        layout_lag=INCOME_LAYOUT_LAG,
+    )
+
+
+def build_elections_income():
+    """Every county and election year joined with the closest income year."""
+    from elections_germany.alignment import join_income
+
+    return join_income(load_table("sorted_elects"), load_table("county_incomes"))
+
+
+def build_year_alignment():
+    """Income year used for every election year (see ``alignment.align_years``)."""
+    from elections_germany.alignment import align_years
+
+    election_years = load_table("sorted_elects", columns=["election_year"])["election_year"]
+    income_years = load_table("sorted_incomes", columns=["year"])["year"]
+    return align_years(election_years.unique(), income_years.unique())
+
+
+def build_correlations():
+    """Party vote shares vs. economic indicators (see ``correlations``)."""
+    from elections_germany.correlations import correlation_table
+
+    return correlation_table(
+        load_table("gdp_votes"), load_table("deu_gdp"), load_table("unemployment")
+    )
+
+
+def build_tax_votes():
+    """Kreis income tax x municipal election results, every year (see ``regions``)."""
+    import pandas as pd
+
+    from elections_germany.regions import (
+        LAST_2021_BOUNDARY_ELECTION,
+        municipal_votes,
+        tax_vote_panel,
+    )
+
+    votes_21 = load_table("federal_muni_harm_21")
+    votes_25 = load_table("federal_muni_harm_25")
+    years_21 = votes_21["election_year"].unique()
+    years_25 = [y for y in votes_25["election_year"].unique() if y > LAST_2021_BOUNDARY_ELECTION]
+    votes = pd.concat(
+        [municipal_votes(votes_21, years_21), municipal_votes(votes_25, years_25)],
+        ignore_index=True,
+    )
+    return tax_vote_panel(load_table("taxation"), votes)
+
+
+# table name -> (store tables it is computed from, builder)
+DERIVED = {
+    "vote_cube": (("federal_muni_harm_25",), build_vote_cube),
+    "year_alignment": (("sorted_elects", "sorted_incomes"), build_year_alignment),
+    "county_incomes": (("sorted_incomes", "county_crosswalk"), build_county_incomes),
+    "elections_income": (("sorted_elects", "county_incomes"), build_elections_income),
+    "correlations": (("gdp_votes", "deu_gdp", "unemployment"), build_correlations),
+    "tax_votes": (
+        ("taxation", "federal_muni_harm_21", "federal_muni_harm_25"),
+        build_tax_votes,
+    ),
+}
+
+# modules a derived table is computed with, besides its builder
+DERIVED_CODE = {
+    "vote_cube": ("elections_germany.cube", "elections_germany.pipeline"),
+    "year_alignment": ("elections_germany.alignment",),
+    "county_incomes": ("elections_germany.crosswalk",),
+    "elections_income": ("elections_germany.alignment",),
+    "correlations": ("elections_germany.correlations",),
+    "tax_votes": ("elections_germany.regions",),
+}
+
+TABLES = list(SOURCES) + list(DERIVED)
+
+
+# ----------------- MANIFEST -----------------
+
+
+def file_hash(path):
+    """SHA-256 of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_hash(name):
+    """SHA-256 of the code a table is built with: reader or builder, ``apply_schema`` and ``DERIVED_CODE``."""
+    func = DERIVED[name][1] if name in DERIVED else SOURCES[name][1]
+    digest = hashlib.sha256(inspect.getsource(func).encode())
+    digest.update(inspect.getsource(apply_schema).encode())
+    for module in DERIVED_CODE.get(name, ()):
+        digest.update(inspect.getsource(importlib.import_module(module)).encode())
+    return digest.hexdigest()
+
+
+def read_manifest():
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest):
+    """Merge the entries of ``manifest`` into the manifest on disk."""
+    with BUILD_LOCK:
+        current = read_manifest()
+        merged = {**current, **manifest}
+        # unchanged: keep the file (and its mtime, the version readers key on)
+        if merged == current:
+            return
+        STORE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = tmp_path(MANIFEST_PATH)
+        with open(tmp, "w") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+        tmp.replace(MANIFEST_PATH)
+
+
+def table_path(name):
+    return STORE_DIR / f"{name}.parquet"
+
+
+def tmp_path(path):
+    """Temporary file next to ``path``, unique per process and thread."""
+    return path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+# ----------------- BUILD -----------------
+
+
+def source_label(name):
+    if name in DERIVED:
+        return "store:" + "+".join(DERIVED[name][0])
+    return f"data/{SOURCES[name][0]}"
+
+
+def build_table(name, manifest=None, force=False):
+    """
+    Convert one source into ``data/store/<name>.parquet``.
+
+    Returns the manifest entry, or None if the source file is not present
+    (e.g. the large GERDA files, which are not checked into the repo).
+    Source tables are keyed on their file and reader, derived tables on the
+    source hashes and declared schemas of their upstream tables and on their
+    builder (``code_hash``).
+    """
+    with BUILD_LOCK:
+        return _build_table(name, read_manifest() if manifest is None else manifest, force)
+
+
+def _build_table(name, manifest, force):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if name in DERIVED:
+        upstream, builder = DERIVED[name]
+        upstream_entries = [build_table(u, manifest=manifest) for u in upstream]
+        if any(e is None for e in upstream_entries):
+            return None
+        # an upstream schema change rebuilds the table as well
+        source_hash = hashlib.sha256(
+            "".join(
+                e["source_sha256"] + json.dumps(e.get("declared_schema", {}), sort_keys=True)
+                for e in upstream_entries
+            ).encode()
+            + code_hash(name).encode()
+        ).hexdigest()
+    else:
+        filename, reader = SOURCES[name]
+        source = DATA_DIR / filename
+        if not source.exists():
+            return None
+        source_hash = hashlib.sha256((file_hash(source) + code_hash(name)).encode()).hexdigest()
+
+    schema = SCHEMAS.get(name, {})
+    entry = manifest.get(name)
+    if (
+        not force
+        and entry is not None
+        and entry["source_sha256"] == source_hash
+        and entry.get("declared_schema", {}) == schema
+        and table_path(name).exists()
+    ):
+        return entry
+
+    df = builder() if name in DERIVED else reader(source)
+    if name in SCHEMAS:
+        df = apply_schema(df, schema)
+    table = pa.Table.from_pandas(df, preserve_index=name not in DERIVED)
+
+    STORE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = tmp_path(table_path(name))
+    pq.write_table(table, tmp, compression=COMPRESSION)
+    tmp.replace(table_path(name))
+
+    entry = {
+        "source": source_label(name),
+        "source_sha256": source_hash,
+        "rows": table.num_rows,
+        "schema": {field.name: str(field.type) for field in table.schema},
+        "declared_schema": schema,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    manifest[name] = entry
+    return entry
+
+
+def build_store(names=None, force=False):
+    """Build (or refresh) every table in ``names`` (default: all tables)."""
+    with BUILD_LOCK:
+        manifest = read_manifest()
+        built = {}
+        for name in names or TABLES:
+            entry = build_table(name, manifest=manifest, force=force)
+            if entry is not None:
+                built[name] = entry
+        write_manifest(manifest)
+    return built
+
+
+# ----------------- LOAD -----------------
+
+
+def load_table(name, columns=None, filters=None):
+    """
+    Read a table from the store as a DataFrame.
+
+    The Parquet file is memory-mapped and only ``columns`` (and the rows
+    matching the pyarrow ``filters``) are decoded. If the table has not been
+    built yet it is built from its source first.
+    """
+    import pyarrow.parquet as pq
+
+    path = table_path(name)
+    if not path.exists():
+        with BUILD_LOCK:
+            # another thread may have built it while this one waited for the lock
+            if not path.exists():
+                manifest = read_manifest()
+                if build_table(name, manifest=manifest) is None:
+                    raise FileNotFoundError(f"{source_label(name)} not found, cannot build '{name}'")
+                write_manifest(manifest)
+
+    table = pq.read_table(path, columns=columns, filters=filters, memory_map=True)
+    return table.to_pandas()
@@ -0,0 +1,224 @@
+"""
+Local endpoint for the municipal vector tiles (see ``tiles``).
+
+    GET /tiles/<election year>/<z>/<x>/<y>.pbf
+
+returns one Mapbox Vector Tile with a layer per winning party (``cdu``,
+``spd``, ...), so the map can colour every layer with a plain fill colour.
+Every feature carries the properties ``ags``, ``share`` (vote share of the
+winner, %) and ``margin`` (share points ahead of the runner-up), joined from
+the municipal level of the vote cube by AGS. Encoded tiles are kept in an
+LRU cache, keyed on the version of the vote cube and of the tile build, and
+sent gzipped when the client accepts it.
+
+The encoder writes the few protobuf messages of the MVT 2.1 spec by hand,
+so the server only needs the standard library and numpy.
+"""
+
+import gzip
+import re
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from elections_germany import tiles
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+CACHE_SIZE = 4096  # encoded tiles kept in memory
+YEARS_CACHE_SIZE = 16  # election years (per vote cube version) kept in memory
+MAX_AGE = 86400  # seconds browsers may reuse a tile
+
+TILE_PATH = re.compile(r"^/tiles/(\d{4})/(\d+)/(\d+)/(\d+)\.pbf$")
+CONTENT_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+# ----------------- MVT ENCODING -----------------
+
+MOVE_TO, LINE_TO, CLOSE_PATH = 1, 2, 7
+POLYGON = 3
+
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _key(field, wire_type):
+    return _varint(field << 3 | wire_type)
+
+
+def _bytes_field(field, payload):
+    return _key(field, 2) + _varint(len(payload)) + payload
+
+
+def _packed(field, values):
+    return _bytes_field(field, b"".join(_varint(int(v)) for v in values))
+
+
+def _command(command, count):
+    return command & 0x7 | count << 3
+
+
+def encode_geometry(rings):
+    """Command integers of a polygon feature: MoveTo, LineTo, ClosePath per ring."""
+    commands = []
+    cursor = np.zeros(2, dtype=np.int64)
+    for ring in rings:
+        points = ring.astype(np.int64)
+        deltas = np.diff(np.vstack([cursor, points]), axis=0)
+        cursor = points[-1]
+        # zigzag: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ...
+        zigzag = ((deltas << 1) ^ (deltas >> 63)).ravel().tolist()
+        commands += [_command(MOVE_TO, 1), *zigzag[:2], _command(LINE_TO, len(points) - 1), *zigzag[2:]]
+        commands.append(_command(CLOSE_PATH, 1))
+    return commands
+
+
+def _value(value):
+    """A Layer.Value: unsigned ints as uint_value, everything else as double_value."""
+    if isinstance(value, int):
+        return _key(5, 0) + _varint(value)
+    return _key(3, 1) + np.float64(value).tobytes()
+
+
+def encode_layer(name, features, keys):
+    """
+    One layer of ``features`` (``(id, rings, properties)`` with properties in
+    the order of ``keys``).
+    """
+    values, value_index, body = [], {}, []
+    for feature_id, rings, properties in features:
+        tags = []
+        for k, value in enumerate(properties):
+            # 1 and 1.0 are different values in the tile
+            typed = (type(value), value)
+            if typed not in value_index:
+                value_index[typed] = len(values)
+                values.append(value)
+            tags += [k, value_index[typed]]
+        feature = (
+            _key(1, 0) + _varint(feature_id)
+            + _packed(2, tags)
+            + _key(3, 0) + _varint(POLYGON)
+            + _packed(4, encode_geometry(rings))
+        )
+        body.append(_bytes_field(2, feature))
+
+    layer = (
+        _key(15, 0) + _varint(2)
+        + _bytes_field(1, name.encode())
+        + b"".join(body)
+        + b"".join(_bytes_field(3, k.encode()) for k in keys)
+        + b"".join(_bytes_field(4, _value(v)) for v in values)
+        + _key(5, 0) + _varint(tiles.EXTENT)
+    )
+    return _bytes_field(3, layer)
+
+
+# ----------------- TILES -----------------
+
+PROPERTIES = ("ags", "share", "margin")
+
+
+@lru_cache(maxsize=YEARS_CACHE_SIZE)
+def year_results(year, version=None):
+    """
+    ``{ags: (winner, share %, margin points)}`` of one election year, None if
+    unknown; ``version`` is the ``vote_cube`` version it is cached for.
+    """
+    from elections_germany import cube, data
+
+    rows = data.elections("municipality", year, columns=["region", "winner", "margin"] + cube.PARTIES)
+    if rows.empty:
+        return None
+    winners = rows["winner"].astype(str).to_numpy()
+    shares = rows[cube.PARTIES].to_numpy(dtype="float64")
+    share = np.nan_to_num(shares.max(axis=1)) * 100
+    margin = rows["margin"].to_numpy(dtype="float64") * 100
+    return {
+        int(ags): (winner, round(float(s), 2), round(float(m), 2))
+        for ags, winner, s, m in zip(rows["region"].to_numpy(), winners, share, margin)
+    }
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def encoded_tile(year, zoom, x, y, version=None, tiles_version=None):
+    """
+    The MVT bytes of one tile, None if ``year`` has no results; cached per
+    ``vote_cube`` version and ``tiles.tiles_version``.
+    """
+    results = year_results(year, version)
+    if results is None:
+        return None
+
+    layers = {}
+    for ags, rings in tiles.tile_features(zoom, x, y):
+        if ags not in results:
+            continue
+        winner, share, margin = results[ags]
+        layers.setdefault(winner, []).append((ags, rings, (ags, share, margin)))
+    return b"".join(encode_layer(name, features, PROPERTIES) for name, features in sorted(layers.items()))
+
+
+def clear_cache():
+    year_results.cache_clear()
+    encoded_tile.cache_clear()
+    tiles._zoom_tiles.cache_clear()
+
+
+# ----------------- SERVER -----------------
+
+
+class TileHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        match = TILE_PATH.match(self.path.split("?", 1)[0])
+        if not match:
+            self.send_error(404, "expected /tiles/<year>/<z>/<x>/<y>.pbf")
+            return
+        year, zoom, x, y = map(int, match.groups())
+        if not (0 <= x < 2 ** zoom and 0 <= y < 2 ** zoom):
+            self.send_error(404, "tile outside the pyramid")
+            return
+
+        from elections_germany import data
+
+        body = encoded_tile(year, zoom, x, y, data.table_version("vote_cube"), tiles.tiles_version())
+        if body is None:
+            self.send_error(404, f"no municipal results for {year}")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", f"public, max-age={MAX_AGE}")
+        if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    if tiles.max_zoom() is None:
+        raise FileNotFoundError(f"{tiles.TILE_DIR} has no tiles, run `python -m elections_germany build-tiles`")
+    server = ThreadingHTTPServer((host, port), TileHandler)
+    print(f"serving tiles on http://{host}:{port}/tiles/<year>/<z>/<x>/<y>.pbf")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
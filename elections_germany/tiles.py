@@ -0,0 +1,294 @@
+"""
+Municipal vector tiles for the winner map of page 04.
+
+A choropleth of the ~11,000 Gemeinden cannot carry its GeoJSON inline the
+way the county maps do. ``build_tiles`` cuts the Gemeinde geometry once into
+tiles of the Web Mercator pyramid at the zoom levels in ``ZOOMS``: every
+ring is simplified for its zoom (shared borders stay shared, see
+``geometry.simplify_geojson``), projected to tile coordinates, clipped to
+each tile it touches (with a small buffer) and stored as integer points in
+``data/tiles/z<zoom>.npz``.
+
+``tile_server`` serves them as Mapbox Vector Tiles. The election results
+are joined per tile by AGS when a tile is requested, one MVT layer per
+winning party, so the same geometry serves every election year. Zooms above
+the last pre-cut level are cut from it on request. The loaded zooms are
+cached per ``tiles_version``, so a new ``build_tiles`` is picked up without
+restarting the server.
+"""
+
+import hashlib
+import inspect
+import json
+import math
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from elections_germany import geometry, store
+
+SOURCE_PATH = store.DATA_DIR / "georef-germany-gemeinde.geojson"
+# AGS of a feature in the Gemeinde export (e.g. "01001000")
+ID_PROPERTY = "gem_code"
+
+TILE_DIR = store.DATA_DIR / "tiles"
+MANIFEST_PATH = TILE_DIR / "manifest.json"
+
+ZOOMS = range(5, 11)
+ZOOM_CACHE_SIZE = 2 * len(ZOOMS)  # loaded zooms kept in memory, across tile versions
+EXTENT = 4096  # tile coordinates per tile side, as in the MVT spec
+BUFFER = 64  # tile coordinates drawn beyond each edge, so borders join cleanly
+
+
+# ----------------- PROJECTION AND CLIPPING -----------------
+
+
+def project(lon_lat, zoom):
+    """Lon/lat (n, 2) to Web Mercator tile coordinates (``EXTENT`` per tile) at ``zoom``."""
+    scale = EXTENT * 2 ** zoom
+    lon = np.radians(lon_lat[:, 0])
+    lat = np.radians(np.clip(lon_lat[:, 1], -85.0511, 85.0511))
+    x = (lon / math.pi + 1) / 2 * scale
+    y = (1 - np.log(np.tan(lat) + 1 / np.cos(lat)) / math.pi) / 2 * scale
+    return np.column_stack([x, y])
+
+
+def _clip_edge(points, axis, limit, keep_below):
+    """Sutherland-Hodgman against one edge of the tile box."""
+    if len(points) == 0:
+        return points
+    inside = points[:, axis] <= limit if keep_below else points[:, axis] >= limit
+    previous = np.roll(points, 1, axis=0)
+    previous_inside = np.roll(inside, 1)
+
+    out = []
+    for point, prev, point_in, prev_in in zip(points, previous, inside, previous_inside):
+        if point_in != prev_in:
+            t = (limit - prev[axis]) / (point[axis] - prev[axis])
+            out.append(prev + t * (point - prev))
+        if point_in:
+            out.append(point)
+    return np.array(out).reshape(-1, 2)
+
+
+def clip_ring(points, low=-BUFFER, high=EXTENT + BUFFER):
+    """
+    A ring (n, 2, without the closing point) clipped to the square
+    [low, high], as integer points without repeats; None if nothing with an
+    area is left.
+    """
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    if (hi < low).any() or (lo > high).any():
+        return None
+    if (lo < low).any() or (hi > high).any():
+        for axis in (0, 1):
+            points = _clip_edge(points, axis, low, keep_below=False)
+            points = _clip_edge(points, axis, high, keep_below=True)
+    if len(points) < 3:
+        return None
+
+    points = np.rint(points).astype(np.int32)
+    repeat = (points == np.roll(points, 1, axis=0)).all(axis=1)
+    points = points[~repeat]
+    if len(points) < 3 or ring_area(points) == 0:
+        return None
+    return points
+
+
+def ring_area(points):
+    """Signed area in tile coordinates (y down); positive for MVT exterior rings."""
+    x, y = points[:, 0].astype(np.int64), points[:, 1].astype(np.int64)
+    return int((x * np.roll(y, -1) - np.roll(x, -1) * y).sum())
+
+
+def _oriented(points, exterior):
+    """Exterior rings with positive, holes with negative area, as the MVT spec wants."""
+    if (ring_area(points) > 0) != exterior:
+        return points[::-1]
+    return points
+
+
+# ----------------- BUILD -----------------
+
+
+def _ags(value):
+    # some exports store the code as a one-element list
+    if isinstance(value, list):
+        value = value[0]
+    return int(value)
+
+
+def cut_zoom(geojson, zoom):
+    """
+    Every tile at ``zoom`` touched by a feature: ``{(x, y): [(ags, rings)]}``
+    with the rings of a feature in tile coordinates, exteriors first within
+    each polygon.
+    """
+    simplified = geometry.simplify_geojson(geojson, geometry.degrees_per_pixel(zoom) / 2)
+    tiles = {}
+    for feature in simplified["features"]:
+        ags = _ags(feature["properties"][ID_PROPERTY])
+        per_tile = {}
+        exteriors = set()  # (tile, polygon) whose exterior ring is in the tile
+        for p, r, ring in geometry._rings(feature["geometry"]):
+            world = project(np.asarray(ring[:-1], dtype="float64"), zoom)
+            lo = np.floor((world.min(axis=0) - BUFFER) / EXTENT).astype(int)
+            hi = np.floor((world.max(axis=0) + BUFFER) / EXTENT).astype(int)
+            for tx in range(lo[0], hi[0] + 1):
+                for ty in range(lo[1], hi[1] + 1):
+                    clipped = clip_ring(world - (tx * EXTENT, ty * EXTENT))
+                    if clipped is None:
+                        continue
+                    if r == 0:
+                        exteriors.add((tx, ty, p))
+                    elif (tx, ty, p) not in exteriors:
+                        # the exterior was clipped away, nothing to cut a hole in
+                        continue
+                    per_tile.setdefault((tx, ty), []).append(_oriented(clipped, exterior=r == 0))
+        for key, rings in per_tile.items():
+            tiles.setdefault(key, []).append((ags, rings))
+    return tiles
+
+
+def write_zoom(tiles, path):
+    """Store the tiles of one zoom as flat arrays with offsets."""
+    keys = sorted(tiles)
+    features = [feature for key in keys for feature in tiles[key]]
+    rings = [ring for _, feature_rings in features for ring in feature_rings]
+    # written aside and moved into place: a running server never reads half a file
+    tmp = store.tmp_path(path)
+    with open(tmp, "wb") as f:
+        np.savez_compressed(
+            f,
+            tile_xy=np.array(keys, dtype=np.int32).reshape(-1, 2),
+            tile_start=np.cumsum([0] + [len(tiles[key]) for key in keys]),
+            ags=np.array([ags for ags, _ in features], dtype=np.int64),
+            feature_start=np.cumsum([0] + [len(r) for _, r in features]),
+            ring_start=np.cumsum([0] + [len(ring) for ring in rings]),
+            points=np.concatenate(rings).astype(np.int16) if rings else np.zeros((0, 2), np.int16),
+        )
+    tmp.replace(path)
+
+
+def zoom_path(zoom):
+    return TILE_DIR / f"z{zoom}.npz"
+
+
+def code_hash():
+    """SHA-256 of the code the tiles are cut with (this module and ``geometry``)."""
+    digest = hashlib.sha256()
+    for module in (sys.modules[__name__], geometry):
+        digest.update(inspect.getsource(module).encode())
+    return digest.hexdigest()
+
+
+def build_tiles(source=SOURCE_PATH, force=False):
+    """Cut the Gemeinde geometry for every zoom in ``ZOOMS``; returns the manifest."""
+    source = Path(source)
+    source_hash = store.file_hash(source)
+    code = code_hash()
+    manifest = read_manifest()
+    if (
+        not force
+        and manifest.get("source_sha256") == source_hash
+        and manifest.get("code_sha256") == code
+        and all(zoom_path(z).exists() for z in ZOOMS)
+    ):
+        return manifest
+
+    with open(source) as f:
+        geojson = json.load(f)
+
+    TILE_DIR.mkdir(parents=True, exist_ok=True)
+    zooms = {}
+    for zoom in ZOOMS:
+        tiles = cut_zoom(geojson, zoom)
+        path = zoom_path(zoom)
+        write_zoom(tiles, path)
+        zooms[str(zoom)] = {
+            "file": path.name,
+            "tiles": len(tiles),
+            "bytes": path.stat().st_size,
+        }
+
+    manifest = {
+        "source": str(source.relative_to(store.ROOT)) if source.is_relative_to(store.ROOT) else str(source),
+        "source_sha256": source_hash,
+        "code_sha256": code,
+        "zooms": zooms,
+    }
+    # written last: its mtime is the version the server caches the zooms under
+    tmp = store.tmp_path(MANIFEST_PATH)
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    tmp.replace(MANIFEST_PATH)
+    return manifest
+
+
+def read_manifest():
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+# ----------------- LOOKUP -----------------
+
+
+def tiles_version():
+    """Changes whenever ``build_tiles`` rewrites the tiles (a ``stat``, no read)."""
+    try:
+        return MANIFEST_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=ZOOM_CACHE_SIZE)
+def _zoom_tiles(zoom, version):
+    with np.load(zoom_path(zoom)) as data:
+        arrays = {name: data[name] for name in data.files}
+    arrays["index"] = {tuple(xy): i for i, xy in enumerate(arrays["tile_xy"].tolist())}
+    return arrays
+
+
+def max_zoom():
+    """Highest pre-cut zoom, or None if the tiles have not been built."""
+    built = [z for z in ZOOMS if zoom_path(z).exists()]
+    return max(built) if built else None
+
+
+def tile_features(zoom, x, y):
+    """
+    ``[(ags, rings)]`` of one tile, rings as int32 (n, 2) tile coordinates.
+    Zooms above ``max_zoom()`` are cut from the pre-cut ancestor tile.
+    """
+    top = max_zoom()
+    if top is None:
+        raise FileNotFoundError(f"{TILE_DIR} has no tiles, run `python -m elections_germany build-tiles`")
+    if zoom < ZOOMS.start:
+        return []
+
+    over = max(0, zoom - top)
+    data = _zoom_tiles(min(zoom, top), tiles_version())
+    i = data["index"].get((x >> over, y >> over))
+    if i is None:
+        return []
+
+    scale = 2 ** over
+    offset = np.array([x % scale, y % scale]) * EXTENT
+    points, ring_start, feature_start = data["points"], data["ring_start"], data["feature_start"]
+    features = []
+    for f in range(data["tile_start"][i], data["tile_start"][i + 1]):
+        rings = []
+        for r in range(feature_start[f], feature_start[f + 1]):
+            ring = points[ring_start[r]:ring_start[r + 1]].astype(np.int32)
+            if over:
+                ring = clip_ring(ring.astype("float64") * scale - offset)
+                if ring is None:
+                    continue
+            rings.append(ring)
+        if rings:
+            features.append((int(data["ags"][f]), rings))
+    return features
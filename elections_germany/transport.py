@@ -0,0 +1,46 @@
+"""
+Compact transport of the map figures to the browser.
+
+Every ``px.choropleth_map`` used to carry its own copy of the county
+GeoJSON, so the four maps of page 04 sent the same geometry four times on
+every rerun. Instead, the geometry is published once as a static file (see
+``[server] enableStaticServing`` in ``.streamlit/config.toml``) and the
+figures only reference it by URL. Plotly.js fetches a GeoJSON URL once and
+keeps it in its ``PlotlyGeoAssets`` cache, so a session downloads it a single
+time, whatever the number of maps and reruns.
+
+The numeric columns that end up as ``z`` are cast to float32, which plotly
+serializes as base64 typed arrays instead of JSON number lists.
+"""
+
+import shutil
+
+from elections_germany import geometry, store
+
+STATIC_DIR = store.ROOT / "static"
+STATIC_URL = "app/static"
+
+
+def geometry_url(zoom):
+    """
+    Publish the county geometry for ``zoom`` under ``static/geo/`` and return
+    its URL. The file name contains a content hash, so browsers never keep a
+    stale copy after the geometry is rebuilt.
+    """
+    path = geometry.geometry_path_for_zoom(zoom)
+    name = f"{path.stem}-{store.file_hash(path)[:12]}.geojson"
+    target = STATIC_DIR / "geo" / name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(".tmp")
+        shutil.copyfile(path, tmp)
+        tmp.replace(target)
+    return f"{STATIC_URL}/geo/{name}"
+
+
+def compact_frame(df, columns, numeric=()):
+    """Only ``columns`` of ``df``, with the ``numeric`` ones as float32."""
+    out = df[list(columns)].copy()
+    for col in numeric:
+        out[col] = out[col].astype("float32")
+    return out
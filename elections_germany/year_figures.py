@@ -0,0 +1,245 @@
+"""
+The yearly composite figures of page 05 (``figures/<year>.png``).
+
+Each figure shows the four county maps of page 04 for one election year:
+winner, income, far-left and far-right vote share. They used to be
+screenshots taken in the notebook and went stale whenever the data changed;
+``render_years`` now draws them with matplotlib from the same store tables
+as the maps (``vote_cube``, ``county_incomes``, ``year_alignment``) and the
+county geometry, one year per worker of a process pool.
+
+``figures/manifest.json`` records, per year, a hash of that year's rows, the
+geometry, ``STYLE`` and the drawing code; years whose hash is unchanged are
+skipped, so a new election costs a single render.
+"""
+
+import hashlib
+import inspect
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import pandas as pd
+
+from elections_germany import data, geometry, maps, store
+
+FIGURE_DIR = store.ROOT / "figures"
+MANIFEST_PATH = FIGURE_DIR / "manifest.json"
+
+# the figures cover the elections since 2009
+FIRST_YEAR = 2009
+
+STYLE = {
+    "figsize": [18.24, 10.74],
+    "dpi": 100,
+    "edgecolor": "#333333",
+    "linewidth": 0.2,
+    "background": "#F5F3EF",
+    "share_range": [0, 50],
+    # lon / lat extent of every map
+    "extent": [5.5, 15.5, 47.0, 55.2],
+    "cmaps": {"income": "Purples", "far_left": "Reds", "far_right": "Blues"},
+    "winner_colors": maps.MUNICIPAL_COLORS,
+}
+
+
+# ----------------- INPUTS -----------------
+
+
+def year_inputs(year, counties, incomes, alignment):
+    """The rows one figure is drawn from: county results and incomes (None if there are none)."""
+    from elections_germany.alignment import income_year_for
+
+    elects = maps.year_elections(counties, year)
+    income_year = income_year_for(alignment, year)
+    income = None
+    if income_year is not None:
+        rows = incomes[incomes["year"] == income_year]
+        income = pd.DataFrame({
+            "county": store.county_key(rows["code"]).to_numpy(),
+            "income_per_capita": rows["income_per_capita"].to_numpy(dtype="float32"),
+        })
+    return {"year": year, "income_year": income_year, "elects": elects, "income": income}
+
+
+def inputs_hash(inputs, geometry_path):
+    digest = hashlib.sha256()
+    digest.update(inspect.getsource(sys.modules[__name__]).encode())
+    digest.update(json.dumps(STYLE, sort_keys=True).encode())
+    digest.update(store.file_hash(geometry_path).encode())
+    digest.update(str(inputs["income_year"]).encode())
+    for frame in (inputs["elects"], inputs["income"]):
+        if frame is not None:
+            digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# ----------------- DRAWING -----------------
+
+
+@lru_cache(maxsize=None)
+def _county_paths(geometry_path):
+    """``{krs_code: matplotlib Path}`` of every county, holes included."""
+    from matplotlib.path import Path
+
+    with open(geometry_path) as f:
+        geojson = json.load(f)
+    paths = {}
+    for feature in geojson["features"]:
+        rings = [Path(ring, closed=True) for _, _, ring in geometry._rings(feature["geometry"])]
+        paths[feature["properties"]["krs_code"]] = Path.make_compound_path(*rings)
+    return paths
+
+
+def _draw_counties(ax, paths, colors):
+    from matplotlib.collections import PathCollection
+
+    ax.add_collection(PathCollection(
+        list(paths), facecolors=colors,
+        edgecolors=STYLE["edgecolor"], linewidths=STYLE["linewidth"],
+    ))
+    west, east, south, north = STYLE["extent"]
+    ax.set_xlim(west, east)
+    ax.set_ylim(south, north)
+    # a degree of longitude is 0.63 degrees of latitude at 51° N
+    ax.set_aspect(1 / 0.63)
+    ax.set_facecolor(STYLE["background"])
+    ax.set_xticks([])
+    ax.set_yticks([])
+
+
+def _category_panel(ax, paths, frame):
+    from matplotlib.patches import Patch
+
+    frame = frame[frame["county"].isin(paths)]
+    colors = [STYLE["winner_colors"].get(w, "#9E9E9E") for w in frame["winner"]]
+    _draw_counties(ax, [paths[c] for c in frame["county"]], colors)
+    present = [w for w in STYLE["winner_colors"] if w in set(frame["winner"])]
+    ax.legend(
+        handles=[Patch(color=STYLE["winner_colors"][w], label=w) for w in present],
+        title="Winner party", loc="upper left", bbox_to_anchor=(1.01, 1), frameon=False,
+    )
+
+
+def _scale_panel(ax, paths, frame, column, cmap, value_range, label):
+    from matplotlib import colormaps
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.colors import Normalize
+
+    frame = frame[frame["county"].isin(paths)]
+    norm = Normalize(*value_range)
+    _draw_counties(ax, [paths[c] for c in frame["county"]], colormaps[cmap](norm(frame[column].to_numpy())))
+    ax.figure.colorbar(ScalarMappable(norm, cmap), ax=ax, shrink=0.7, label=label)
+
+
+def draw_year(inputs, geometry_path):
+    """The 2 x 2 figure of one election year."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    year, elects, income = inputs["year"], inputs["elects"], inputs["income"]
+    paths = _county_paths(str(geometry_path))
+    fig = plt.figure(figsize=STYLE["figsize"], dpi=STYLE["dpi"], layout="constrained")
+    # one sub-figure per map, titled like the sections of page 04
+    panels = fig.subfigures(2, 2).ravel()
+    titles = [
+        f"Election Results for {year} (per district)",
+        f"Income in Thousands of Euros in {year}",
+        f"Extreme Left-Leaning Votes for {year}",
+        f"Extreme Right-Leaning Votes for {year}",
+    ]
+    axes = []
+    for panel, title in zip(panels, titles):
+        panel.suptitle(title, x=0.02, ha="left", fontsize=18)
+        axes.append(panel.subplots())
+
+    _category_panel(axes[0], paths, elects)
+    if income is None or income.empty:
+        axes[1].set_axis_off()
+        axes[1].text(0.5, 0.5, f"No income data for {year}", ha="center", transform=axes[1].transAxes)
+    else:
+        values = income["income_per_capita"]
+        _scale_panel(
+            axes[1], paths, income, "income_per_capita", STYLE["cmaps"]["income"],
+            (values.min(), values.max()), "Income (TSD Euro)",
+        )
+    _scale_panel(
+        axes[2], paths, elects, "perc_far_left_w_linke", STYLE["cmaps"]["far_left"],
+        STYLE["share_range"], "Votes (%)",
+    )
+    _scale_panel(
+        axes[3], paths, elects, "perc_far_right", STYLE["cmaps"]["far_right"],
+        STYLE["share_range"], "Votes (%)",
+    )
+    return fig
+
+
+def _render_year(inputs, geometry_path, path):
+    """Draw one year in a worker process and write its PNG."""
+    import matplotlib.pyplot as plt
+
+    fig = draw_year(inputs, geometry_path)
+    tmp = path.with_suffix(".tmp.png")
+    fig.savefig(tmp, facecolor="white")
+    plt.close(fig)
+    tmp.replace(path)
+    return inputs["year"]
+
+
+# ----------------- RENDER -----------------
+
+
+def figure_path(year):
+    return FIGURE_DIR / f"{year}.png"
+
+
+def read_manifest():
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def election_years():
+    """Election years since ``FIRST_YEAR`` with county results."""
+    years = data.year_alignment()["election_year"]
+    return sorted(int(y) for y in years if y >= FIRST_YEAR)
+
+
+def render_years(years=None, force=False, workers=None, log=print):
+    """Render every year in ``years`` (default: ``election_years()``) whose inputs changed."""
+    years = years or election_years()
+    counties = data.elections("county")
+    incomes = data.income()
+    alignment = data.year_alignment()
+    geometry_path = geometry.geometry_path_for_zoom(maps.MAP_ZOOM)
+
+    manifest = read_manifest()
+    pending = {}
+    for year in years:
+        inputs = year_inputs(year, counties, incomes, alignment)
+        key = inputs_hash(inputs, geometry_path)
+        entry = manifest.get(str(year))
+        if not force and entry and entry["inputs_sha256"] == key and figure_path(year).exists():
+            log(f"{year}  unchanged")
+            continue
+        pending[year] = (inputs, key)
+
+    FIGURE_DIR.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_render_year, inputs, geometry_path, figure_path(year))
+            for year, (inputs, _) in pending.items()
+        ]
+        for future in futures:
+            year = future.result()
+            path = figure_path(year)
+            manifest[str(year)] = {"inputs_sha256": pending[year][1], "bytes": path.stat().st_size}
+            log(f"{year}  rendered -> figures/{path.name}")
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
@@ -4,76 +4,23 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
+from elections_germany import data, figure_store, profiling
+from elections_germany.figures import income_bracket_figure, tax_vote_scatter_figure
+from elections_germany.brackets import DEFAULT_WEIGHTING, WEIGHTINGS, income_brackets
+from elections_germany.regions import PANEL_PARTIES, panel_year
+
 st.set_page_config(page_title="Income Tax and Political Impact", layout="wide")
+profiling.begin()
 
 # ----------------- DATA LOADING FUNCTIONS -----------------
 
 
-@st.cache_data
-def load_income_tax_data():
-    """Load and clean the German income tax dataset."""
-    df = pd.read_csv(
-        "data/taxationbydistrict.csv",
-        sep=";",
-        encoding="ISO-8859-1",
-        skiprows=7,  # skip metadata lines at the top
-    )
-
-    # Rename columns to English
-    df.columns = [
-        "Year",
-        "Region_Code",
-        "Region_Name",
-        "Taxpayer_Count",
-        "Total_Income_KEuros",
-        "Total_Taxes_KEuros",
-    ]
-
-    # Ensure numeric columns are actually numbers
-    numeric_cols = ["Taxpayer_Count", "Total_Income_KEuros", "Total_Taxes_KEuros"]
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
-
-    # Tax paid per taxpayer (convert from thousands of euros to euros)
-    df["Tax_per_Taxpayer"] = (
-        df["Total_Taxes_KEuros"] * 1000 / df["Taxpayer_Count"]
-    ).round(2)
-
-    return df
-
-
-@st.cache_data
-def load_voting_data(year: int = 2021):
-    """
-    Load the harmonised federal municipal election data for a given year
-    and keep only the top 6 parties, with CDU + CSU combined.
-    """
-
-    # Choose file based on year (21 vs 25)
-    if year == 2025:
-        filename = "data/federal_muni_harm_25.csv"
-    else:  # default / 2021
-        filename = "data/federal_muni_harm_21.csv"
-
-    df = pd.read_csv(filename)
-
-    # Focus on the requested election year
-    df = df[df["election_year"] == year].copy()
-
-    # Ensure we have a combined CDU/CSU column
-    if "cdu_csu" not in df.columns:
-        df["cdu_csu"] = df["cdu"].fillna(0) + df["csu"].fillna(0)
-
-    # Column with absolute valid votes (check this name in your CSV)
-    vote_count_col = "valid_votes"
-
-    # Top 6 parties we care about (vote shares, 0–1)
-    party_cols = ["cdu_csu", "spd", "gruene", "fdp", "linke_pds", "afd"]
-
-    # Keep region code at municipal and county level + election/votes/parties
-    keep_cols = ["ags", "county", "election_year", vote_count_col] + party_cols
-    df = df[keep_cols]
-
-    return df, vote_count_col, party_cols
+@profiling.step("load_figure")
+@st.cache_resource
+@profiling.computed
+def load_figure(name):
+    """Stored figure from the figure store (built live if not rendered)."""
+    return figure_store.figure(name)
 
 
 # ----------------- STREAMLIT UI -----------------
@@ -86,11 +33,13 @@ st.write(
 )
 
 # Load cleaned data once
-income_tax_df = load_income_tax_data()
+with profiling.step("taxation"):
+    income_tax_df = data.taxation()
 
 # ---- Data preview ----
 st.subheader("Districts in Germany by Taxpayer & Total Income")
-st.dataframe(income_tax_df)
+with profiling.step("st.dataframe taxation"):
+    st.dataframe(income_tax_df)
 
 st.write("Number of rows:", income_tax_df.shape[0])
 st.write("Number of columns:", income_tax_df.shape[1])
@@ -124,68 +73,28 @@ if st.checkbox("Show Tax per Taxpayer Summary"):
 
 st.subheader("Top & Bottom Districts by Tax per Taxpayer")
 
-# Drop rows with missing values
-tax_df = income_tax_df.dropna(subset=["Tax_per_Taxpayer"])
+# Pre-rendered by `python -m elections_germany render-figures`
+st.plotly_chart(load_figure("tax_top10"), use_container_width=True)
 
-# Compute Top 10 and Bottom 10
-top10 = tax_df.nlargest(10, "Tax_per_Taxpayer")
-bottom10 = tax_df.nsmallest(10, "Tax_per_Taxpayer")
-
-# -------- TOP 10 FIGURE --------
-fig_top = go.Figure(
-    data=[
-        go.Bar(
-            x=top10["Region_Name"],
-            y=top10["Tax_per_Taxpayer"],
-            text=top10["Tax_per_Taxpayer"].round(2),
-            textposition="auto",
-            marker_color="green",
-        )
-    ]
-)
-
-fig_top.update_layout(
-    title="Top 10 Districts – Highest Tax per Taxpayer",
-    xaxis_title="District",
-    yaxis_title="Tax per taxpayer (€)",
-    template="plotly_white",
-    height=500,
-)
-
-st.plotly_chart(fig_top, use_container_width=True)
-
-# -------- BOTTOM 10 FIGURE --------
-fig_bottom = go.Figure(
-    data=[
-        go.Bar(
-            x=bottom10["Region_Name"],
-            y=bottom10["Tax_per_Taxpayer"],
-            text=bottom10["Tax_per_Taxpayer"].round(2),
-            textposition="auto",
-            marker_color="crimson",
-        )
-    ]
-)
-
-fig_bottom.update_layout(
-    title="Bottom 10 Districts – Lowest Tax per Taxpayer",
-    xaxis_title="District",
-    yaxis_title="Tax per taxpayer (€)",
-    template="plotly_white",
-    height=500,
-)
-
-st.plotly_chart(fig_bottom, use_container_width=True)
+st.plotly_chart(load_figure("tax_bottom10"), use_container_width=True)
 
 
 # ---- Voting background: top 6 parties (CDU/CSU combined) ----
 
 st.subheader("Voting Background – Top 6 Parties (Bundestag 2021)")
 
-voting_top6_df, vote_count_col, party_cols = load_voting_data(2021)
+# Column with absolute valid votes
+vote_count_col = "valid_votes"
+
+# Top 6 parties we care about (vote shares, 0–1), with CDU + CSU combined
+party_cols = PANEL_PARTIES
+
+# Keep region code at municipal and county level + election/votes/parties
+with profiling.step("municipal_votes"):
+    voting_df = data.municipal_votes(2021, ["ags", "county", "election_year", vote_count_col] + party_cols)
 
 # For display, show party shares as percentages
-voting_display = voting_top6_df.copy()
+voting_display = voting_df.copy()
 voting_display[party_cols] = (voting_display[party_cols] * 100).round(2)
 
 st.write("Rows:", voting_display.shape[0], " | Columns:", voting_display.shape[1])
@@ -196,8 +105,6 @@ st.dataframe(voting_display.head(50))
 
 st.subheader("Total Votes by Party (Bundestag 2021)")
 
-voting_df, vote_count_col, party_cols = load_voting_data(2021)
-
 party_info = {
     "cdu_csu": ("CDU/CSU", "#003B6F"),      # black
     "spd": ("SPD", "#A6006B"),             # red
@@ -245,51 +152,53 @@ fig_votes.update_layout(
 st.plotly_chart(fig_votes, use_container_width=True)
 
 
-# ---- MERGE TAX DATA WITH VOTING DATA (2021) ----
-
-st.subheader("Merged Dataset: Tax & Voting Information (2021)")
+# ---- MERGE TAX DATA WITH VOTING DATA ----
 
-voting_df_21, vote_count_col_21, party_cols_21 = load_voting_data(2021)
+# Kreis tax x municipal votes for every tax and election year, joined once
+with profiling.step("tax_votes"):
+    tax_votes = data.tax_votes()
 
-# 1. Convert join keys to numeric safely
-tax_for_merge_21 = income_tax_df.copy()
-vote_for_merge_21 = voting_df_21.copy()
+election_years = sorted(tax_votes["election_year"].unique(), reverse=True)
+tax_years = sorted(tax_votes["tax_year"].unique(), reverse=True)
 
-tax_for_merge_21["Region_Code_num"] = pd.to_numeric(
-    tax_for_merge_21["Region_Code"], errors="coerce"
-)
-vote_for_merge_21["county_num"] = pd.to_numeric(
-    vote_for_merge_21["county"], errors="coerce"
+year_col, tax_year_col = st.columns(2)
+election_year = year_col.selectbox(
+    "Election year:",
+    election_years,
+    index=election_years.index(2021) if 2021 in election_years else 0,
 )
+tax_year = tax_year_col.selectbox("Tax year:", tax_years)
 
-# 2. Drop rows where conversion failed
-tax_for_merge_21 = tax_for_merge_21.dropna(subset=["Region_Code_num"])
-vote_for_merge_21 = vote_for_merge_21.dropna(subset=["county_num"])
+st.subheader(f"Merged Dataset: Tax & Voting Information ({election_year})")
 
-# 3. Merge on the cleaned numeric codes
-merged_df = tax_for_merge_21.merge(
-    vote_for_merge_21,
-    left_on="Region_Code_num",
-    right_on="county_num",
-    how="inner",
-)
+with profiling.step("panel_year"):
+    merged_df = panel_year(tax_votes, election_year, tax_year)
 
 st.write("Merged rows:", merged_df.shape[0])
 st.write("Merged columns:", merged_df.shape[1])
 st.dataframe(merged_df.head())
 
 
-# ---- CREATE ANALYSIS DATAFRAME (2021) ----
+# ---- CREATE ANALYSIS DATAFRAME ----
 
-analysis_cols = ["Tax_per_Taxpayer"] + party_cols_21
+analysis_cols = ["Tax_per_Taxpayer"] + PANEL_PARTIES
 analysis_df = merged_df[analysis_cols].dropna()
 
-st.subheader("Analysis DataFrame (Correlation Inputs, 2021)")
+st.subheader(f"Analysis DataFrame (Correlation Inputs, {election_year})")
 st.dataframe(analysis_df.head())
 
 # ---- SCATTER PLOTS FOR EACH PARTY ----
 
-st.subheader("Tax per Taxpayer vs Party Vote Share (2021)")
+# every election year of the tax year at once: tens of thousands of
+# municipalities, drawn with WebGL or binned (see figures.scatter_mode)
+all_years = st.checkbox("Plot every election year")
+if all_years:
+    scatter_df = tax_votes.loc[tax_votes["tax_year"] == tax_year, analysis_cols].dropna()
+else:
+    scatter_df = analysis_df
+years_label = "all elections" if all_years else election_year
+
+st.subheader(f"Tax per Taxpayer vs Party Vote Share ({years_label})")
 
 party_colors = {
     "cdu_csu": "#003B6F",
@@ -301,204 +210,93 @@ party_colors = {
 }
 
 # Dropdown to choose the party to visualize
-party_choice = st.selectbox("Choose a party:", party_cols_21)
+party_choice = st.selectbox("Choose a party:", PANEL_PARTIES)
 
-fig_scatter = go.Figure()
-
-fig_scatter.add_trace(go.Scatter(
-    x=analysis_df["Tax_per_Taxpayer"],
-    y=analysis_df[party_choice],
-    mode="markers",
-    marker=dict(color=party_colors[party_choice], size=8),
-    name=party_choice
-))
-
-fig_scatter.update_layout(
-    xaxis_title="Tax per Taxpayer (€)",
-    yaxis_title=f"{party_choice} Vote Share",
-    template="plotly_white",
-    height=500,
-)
+with profiling.step("scatter_figures"):
+    fig_scatter = tax_vote_scatter_figure(scatter_df, [party_choice], party_colors)
+    fig_scatter.update_layout(height=500)
+    fig_multi = tax_vote_scatter_figure(scatter_df, PANEL_PARTIES, party_colors, size=6)
 
 st.plotly_chart(fig_scatter, use_container_width=True)
 
 if st.checkbox("Show regression line"):
-    fig_reg = px.scatter(
-        analysis_df,
-        x="Tax_per_Taxpayer",
-        y=party_choice,
-        trendline="ols",
-        opacity=0.6,
-        hover_data=["Tax_per_Taxpayer"],
-    )
-    fig_reg.update_layout(
-        xaxis_title="Tax per Taxpayer (€)",
-        yaxis_title=f"{party_choice} Vote Share",
-        template="plotly_white"
-    )
-    st.plotly_chart(fig_reg, use_container_width=True)
-
-st.subheader("All Parties: Tax-per-Taxpayer Relationship (2021)")
-
-rows = []
-for col in party_cols_21:
-    rows.append(go.Scatter(
-        x=analysis_df["Tax_per_Taxpayer"],
-        y=analysis_df[col],
-        mode="markers",
-        name=col,
-        marker=dict(color=party_colors[col], size=6)
-    ))
-
-fig_multi = go.Figure(rows)
-fig_multi.update_layout(
-    template="plotly_white",
-    xaxis_title="Tax per Taxpayer (€)",
-    yaxis_title="Vote Share",
-)
-st.plotly_chart(fig_multi, use_container_width=True)
-
-
-# ---- Vote Share (2021) by Income Bracket (with labels) ----
-
-st.subheader("Vote Share (2021) by Income Bracket")
-
-# 1. Create 5 quantile bins of Tax_per_Taxpayer
-analysis_df["TaxBin"] = pd.qcut(
-    analysis_df["Tax_per_Taxpayer"],
-    5,
-    labels=False
-)
-
-# 2. Median tax per taxpayer for each bin → used as x-axis labels
-bin_labels = (
-    analysis_df.groupby("TaxBin")["Tax_per_Taxpayer"]
-    .median()
-    .round(0)
-    .astype(int)
-)
-
-# 3. Mean vote share for each party in each bin
-mean_by_bin = analysis_df.groupby("TaxBin")[party_cols_21].mean()
-
-# 4. Convert from fractions (0–1) to percentages
-mean_by_bin_percent = (mean_by_bin * 100).round(1)
-
-# 5. Build stacked bar chart with readable labels
-fig_bins = go.Figure()
-
-for party in party_cols_21:
-    fig_bins.add_trace(go.Bar(
-        x=bin_labels.index,                    # internal bin index 0–4
-        y=mean_by_bin_percent[party],
-        name=party,
-        marker_color=party_colors.get(party, "#666666"),
-    ))
-
-fig_bins.update_layout(
-    barmode="stack",
-    template="plotly_white",
-    height=500,
-    xaxis=dict(
-        title="Income Group (Median Tax per Taxpayer in €)",
-        tickmode="array",
-        tickvals=bin_labels.index,             # 0–4
-        ticktext=[f"€{v:,.0f}" for v in bin_labels],  # human labels e.g. €5,300
-    ),
-    yaxis=dict(
-        title="Average Vote Share (%)",
-        ticksuffix="%",
-        range=[0, 100],
-    ),
-    legend_title="Party",
-)
+    with profiling.step("ols_trendline"):
+        fig_reg = px.scatter(
+            analysis_df,
+            x="Tax_per_Taxpayer",
+            y=party_choice,
+            trendline="ols",
+            opacity=0.6,
+            hover_data=["Tax_per_Taxpayer"],
+        )
+        fig_reg.update_layout(
+            xaxis_title="Tax per Taxpayer (€)",
+            yaxis_title=f"{party_choice} Vote Share",
+            template="plotly_white"
+        )
+        st.plotly_chart(fig_reg, use_container_width=True)
 
-st.plotly_chart(fig_bins, use_container_width=True)
+st.subheader(f"All Parties: Tax-per-Taxpayer Relationship ({years_label})")
 
+st.plotly_chart(fig_multi, use_container_width=True)
 
-# ---- Vote Share (2025) by Income Bracket ----
 
-st.subheader("Vote Share (2025) by Income Bracket")
+# ---- Vote Share by Income Bracket (with labels) ----
 
-# 1. Build a fresh analysis_df for 2025 (same pipeline as 2021, but different year)
-voting_2025_df, vote_count_col_2025, party_cols_2025 = load_voting_data(2025)
+st.subheader(f"Vote Share ({election_year}) by Income Bracket")
 
-tax_for_merge_2025 = income_tax_df.copy()
-vote_for_merge_2025 = voting_2025_df.copy()
+weighting_labels = {
+    "valid_votes": "valid votes",
+    "taxpayers": "taxpayers",
+    "none": "nothing (each municipality counts once)",
+}
 
-tax_for_merge_2025["Region_Code_num"] = pd.to_numeric(
-    tax_for_merge_2025["Region_Code"], errors="coerce"
-)
-vote_for_merge_2025["county_num"] = pd.to_numeric(
-    vote_for_merge_2025["county"], errors="coerce"
+bins_col, weighting_col = st.columns(2)
+n_bins = bins_col.slider("Number of income brackets:", min_value=3, max_value=10, value=5)
+weighting = weighting_col.selectbox(
+    "Weight municipalities by:",
+    WEIGHTINGS,
+    index=WEIGHTINGS.index(DEFAULT_WEIGHTING),
+    format_func=weighting_labels.get,
 )
 
-tax_for_merge_2025 = tax_for_merge_2025.dropna(subset=["Region_Code_num"])
-vote_for_merge_2025 = vote_for_merge_2025.dropna(subset=["county_num"])
+with profiling.step("income_brackets"):
+    # quantile brackets of Tax_per_Taxpayer: median tax per bracket (x-axis
+    # labels) and vote share per party, in percent
+    bin_labels, mean_by_bin = income_brackets(election_year, tax_year, n_bins, weighting)
+    mean_by_bin_percent = (mean_by_bin * 100).round(1)
 
-merged_2025 = tax_for_merge_2025.merge(
-    vote_for_merge_2025,
-    left_on="Region_Code_num",
-    right_on="county_num",
-    how="inner",
+st.plotly_chart(
+    income_bracket_figure(bin_labels, mean_by_bin_percent, party_colors),
+    use_container_width=True,
 )
 
-analysis_2025 = merged_2025[["Tax_per_Taxpayer"] + party_cols_2025].dropna()
 
-# 2. Create 5 quantile bins for 2025
-analysis_2025["TaxBin"] = pd.qcut(
-    analysis_2025["Tax_per_Taxpayer"],
-    5,
-    labels=False
-)
+# ---- Vote Share of a second election by Income Bracket ----
 
-# 3. Median tax per taxpayer per bin (x-axis labels)
-bin_labels_2025 = (
-    analysis_2025.groupby("TaxBin")["Tax_per_Taxpayer"]
-    .median()
-    .round(0)
-    .astype(int)
+compare_year = st.selectbox(
+    "Compare with election year:",
+    election_years,
+    index=0,
 )
 
-# 4. Mean vote share per party per bin
-mean_by_bin_2025 = analysis_2025.groupby("TaxBin")[party_cols_2025].mean()
-mean_by_bin_2025_pct = (mean_by_bin_2025 * 100).round(1)
+st.subheader(f"Vote Share ({compare_year}) by Income Bracket")
 
-# 5. Build stacked bar chart
-fig_bins_2025 = go.Figure()
+with profiling.step("income_brackets_compare"):
+    bin_labels_compare, mean_by_bin_compare = income_brackets(compare_year, tax_year, n_bins, weighting)
+    mean_by_bin_compare_pct = (mean_by_bin_compare * 100).round(1)
 
-for party in party_cols_2025:
-    fig_bins_2025.add_trace(go.Bar(
-        x=bin_labels_2025.index,
-        y=mean_by_bin_2025_pct[party],
-        name=party,
-        marker_color=party_colors.get(party, "#666666"),
-    ))
-
-fig_bins_2025.update_layout(
-    barmode="stack",
-    template="plotly_white",
-    height=500,
-    xaxis=dict(
-        title="Income Group (Median Tax per Taxpayer in €)",
-        tickmode="array",
-        tickvals=bin_labels_2025.index,
-        ticktext=[f"€{v:,.0f}" for v in bin_labels_2025],
-    ),
-    yaxis=dict(
-        title="Average Vote Share (%)",
-        ticksuffix="%",
-        range=[0, 100],
-    ),
-    legend_title="Party",
+# keyed: comparing a year with itself draws the same chart twice
+st.plotly_chart(
+    income_bracket_figure(bin_labels_compare, mean_by_bin_compare_pct, party_colors),
+    use_container_width=True,
+    key="income_brackets_compare",
 )
 
-st.plotly_chart(fig_bins_2025, use_container_width=True)
 
+# ---- Heatmap for the selected election (optional) ----
 
-# ---- Heatmap for 2021 (optional) ----
-
-st.subheader("Vote Share Heatmap by Tax Level (2021)")
+st.subheader(f"Vote Share Heatmap by Tax Level ({election_year})")
 
 fig_heat = px.imshow(
     mean_by_bin,
@@ -507,3 +305,5 @@ fig_heat = px.imshow(
     color_continuous_scale="RdBu"
 )
 st.plotly_chart(fig_heat, use_container_width=True)
+
+profiling.panel(__file__)
@@ -1,5 +1,7 @@
 import streamlit as st
 
+from elections_germany import images
+
 st.set_page_config(page_title="Election Results in Germany and Income in Images", layout="wide")
 
 st.title("Election Results in Germany and Income")
@@ -7,14 +9,17 @@ st.markdown("""
             *⚠️ **Cave** The dataset doesn't mention which parties are considered extreme right and extreme left, these results might vary according to this definition.*
             """)
 
-with st.expander("2013"):
-    st.image("figures/2013.png", caption="2013")
-
-with st.expander("2017"):
-    st.image("figures/2017.png", caption="2017")
-
-with st.expander("2021"):
-    st.image("figures/2021.png", caption="2021")
+# WebP/AVIF variants and zoom tiles from `python -m elections_germany build-images`;
+# the browser loads the smallest variant that fits and zoom tiles on demand
+manifest = images.read_manifest()
 
-with st.expander("2025"):
-    st.image("figures/2025.png", caption="2025")
\ No newline at end of file
+for year in images.figure_years():
+    with st.expander(str(year)):
+        entry = manifest.get(str(year))
+        if entry is None:
+            st.image(f"figures/{year}.png", caption=str(year))
+            continue
+        st.markdown(images.picture_html(year, entry, alt=str(year)), unsafe_allow_html=True)
+        st.caption(str(year))
+        if st.checkbox("Zoom in", key=f"zoom_{year}"):
+            st.iframe(images.zoom_viewer_html(year, height=600), height=610)
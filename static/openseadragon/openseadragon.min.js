@@ -0,0 +1,1756 @@
+//! openseadragon 6.0.2
+//! Built on 2026-03-12
+//! Git commit: v6.0.2-0-7842cd92
+//! http://openseadragon.github.io
+//! License: http://openseadragon.github.io/license/
+function OpenSeadragon(options){return new OpenSeadragon.Viewer(options);}
+(function($){$.version={versionStr:'6.0.2',major:parseInt('6',10),minor:parseInt('0',10),revision:parseInt('2',10)};const class2type={'[object Boolean]':'boolean','[object Number]':'number','[object String]':'string','[object Function]':'function','[object AsyncFunction]':'function','[object Promise]':'promise','[object Array]':'array','[object Date]':'date','[object RegExp]':'regexp','[object Object]':'object','[object HTMLUnknownElement]':'dom-node','[object HTMLImageElement]':'image','[object HTMLCanvasElement]':'canvas','[object CanvasRenderingContext2D]':'context2d'};const toString=Object.prototype.toString;const hasOwn=Object.prototype.hasOwnProperty;$.isFunction=function(obj){return $.type(obj)==="function";};$.isArray=Array.isArray||function(obj){return $.type(obj)==="array";};$.isWindow=function(obj){return obj&&typeof obj==="object"&&"setInterval"in obj;};$.type=function(obj){return(obj===null)||(obj===undefined)?String(obj):class2type[toString.call(obj)]||"object";};$.isPlainObject=function(obj){if(!obj||OpenSeadragon.type(obj)!=="object"||obj.nodeType||$.isWindow(obj)){return false;}
+if(obj.constructor&&!hasOwn.call(obj,"constructor")&&!hasOwn.call(obj.constructor.prototype,"isPrototypeOf")){return false;}
+let lastKey;for(const key in obj){lastKey=key;}
+return lastKey===undefined||hasOwn.call(obj,lastKey);};$.isEmptyObject=function(obj){for(const name in obj){return false;}
+return true;};$.freezeObject=function(obj){if(Object.freeze){$.freezeObject=Object.freeze;}else{$.freezeObject=function(obj){return obj;};}
+return $.freezeObject(obj);};$.supportsCanvas=(function(){const canvasElement=document.createElement('canvas');return!!($.isFunction(canvasElement.getContext)&&canvasElement.getContext('2d'));}());$.isCanvasTainted=function(canvas){let isTainted=false;try{canvas.getContext('2d').getImageData(0,0,1,1);}catch(e){isTainted=true;}
+return isTainted;};$.supportsAddEventListener=(function(){return!!(document.documentElement.addEventListener&&document.addEventListener);}());$.supportsRemoveEventListener=(function(){return!!(document.documentElement.removeEventListener&&document.removeEventListener);}());$.supportsEventListenerOptions=(function(){let supported=0;if($.supportsAddEventListener){try{const options={get capture(){supported++;return false;},get once(){supported++;return false;},get passive(){supported++;return false;}};window.addEventListener("test",null,options);window.removeEventListener("test",null,options);}catch(e){supported=0;}}
+return supported>=3;}());$.supportsAsync=true;$.getCurrentPixelDensityRatio=function(){if($.supportsCanvas){const context=document.createElement('canvas').getContext('2d');const devicePixelRatio=window.devicePixelRatio||1;const backingStoreRatio=context.webkitBackingStorePixelRatio||context.mozBackingStorePixelRatio||context.msBackingStorePixelRatio||context.oBackingStorePixelRatio||context.backingStorePixelRatio||1;return Math.max(devicePixelRatio,1)/backingStoreRatio;}else{return 1;}};$.pixelDensityRatio=$.getCurrentPixelDensityRatio();}(OpenSeadragon));(function($){$.extend=function(){let options;let name;let src;let copy;let copyIsArray;let clone;let target=arguments[0]||{};const length=arguments.length;let deep=false;let i=1;if(typeof target==="boolean"){deep=target;target=arguments[1]||{};i=2;}
+if(typeof target!=="object"&&!OpenSeadragon.isFunction(target)){target={};}
+if(length===i){target=this;--i;}
+for(;i<length;i++){options=arguments[i];if(options!==null||options!==undefined){for(name in options){const descriptor=Object.getOwnPropertyDescriptor(options,name);if(descriptor!==undefined){if(descriptor.get||descriptor.set){Object.defineProperty(target,name,descriptor);continue;}
+copy=descriptor.value;}else{$.console.warn('Could not copy inherited property "'+name+'".');continue;}
+if(target===copy){continue;}
+if(deep&&copy&&(OpenSeadragon.isPlainObject(copy)||(copyIsArray=OpenSeadragon.isArray(copy)))){src=target[name];if(copyIsArray){copyIsArray=false;clone=src&&OpenSeadragon.isArray(src)?src:[];}else{clone=src&&OpenSeadragon.isPlainObject(src)?src:{};}
+target[name]=OpenSeadragon.extend(deep,clone,copy);}else if(copy!==undefined){target[name]=copy;}}}}
+return target;};const isIOSDevice=function(){if(typeof navigator!=='object'){return false;}
+const userAgent=navigator.userAgent;if(typeof userAgent!=='string'){return false;}
+return userAgent.indexOf('iPhone')!==-1||userAgent.indexOf('iPad')!==-1||userAgent.indexOf('iPod')!==-1;};$.extend($,{DEFAULT_SETTINGS:{xmlPath:null,tileSources:null,tileHost:null,initialPage:0,crossOriginPolicy:false,ajaxWithCredentials:false,loadTilesWithAjax:false,ajaxHeaders:{},splitHashDataForPost:false,callTileLoadedWithCachedData:false,panHorizontal:true,panVertical:true,constrainDuringPan:false,wrapHorizontal:false,wrapVertical:false,visibilityRatio:0.5,minPixelRatio:0.5,defaultZoomLevel:0,minZoomLevel:null,maxZoomLevel:null,homeFillsViewer:false,clickTimeThreshold:300,clickDistThreshold:5,dblClickTimeThreshold:300,dblClickDistThreshold:20,springStiffness:6.5,animationTime:1.2,loadDestinationTilesOnAnimation:true,gestureSettingsMouse:{dragToPan:true,scrollToZoom:true,clickToZoom:true,dblClickToZoom:false,dblClickDragToZoom:false,pinchToZoom:false,zoomToRefPoint:true,flickEnabled:false,flickMinSpeed:120,flickMomentum:0.25,pinchRotate:false},gestureSettingsTouch:{dragToPan:true,scrollToZoom:false,clickToZoom:false,dblClickToZoom:true,dblClickDragToZoom:true,pinchToZoom:true,zoomToRefPoint:true,flickEnabled:true,flickMinSpeed:120,flickMomentum:0.25,pinchRotate:false},gestureSettingsPen:{dragToPan:true,scrollToZoom:false,clickToZoom:true,dblClickToZoom:false,dblClickDragToZoom:false,pinchToZoom:false,zoomToRefPoint:true,flickEnabled:false,flickMinSpeed:120,flickMomentum:0.25,pinchRotate:false},gestureSettingsUnknown:{dragToPan:true,scrollToZoom:false,clickToZoom:false,dblClickToZoom:true,dblClickDragToZoom:false,pinchToZoom:true,zoomToRefPoint:true,flickEnabled:true,flickMinSpeed:120,flickMomentum:0.25,pinchRotate:false},zoomPerClick:2,zoomPerScroll:1.2,zoomPerDblClickDrag:1.2,zoomPerSecond:1.0,blendTime:0,alwaysBlend:false,autoHideControls:true,immediateRender:false,minZoomImageRatio:0.9,maxZoomPixelRatio:1.1,smoothTileEdgesMinZoom:1.1,iOSDevice:isIOSDevice(),pixelsPerWheelLine:40,pixelsPerArrowPress:40,autoResize:true,preserveImageSizeOnResize:false,minScrollDeltaTime:50,rotationIncrement:90,maxTilesPerFrame:1,showSequenceControl:true,sequenceControlAnchor:null,preserveViewport:false,preserveOverlays:false,navPrevNextWrap:false,showNavigationControl:true,navigationControlAnchor:null,showZoomControl:true,showHomeControl:true,showFullPageControl:true,showRotationControl:false,showFlipControl:false,controlsFadeDelay:2000,controlsFadeLength:1500,mouseNavEnabled:true,keyboardNavEnabled:true,showNavigator:false,navigatorElement:null,navigatorId:null,navigatorPosition:null,navigatorSizeRatio:0.2,navigatorMaintainSizeRatio:false,navigatorTop:null,navigatorLeft:null,navigatorHeight:null,navigatorWidth:null,navigatorAutoFade:true,navigatorRotate:true,navigatorBackground:'#000',navigatorOpacity:0.8,navigatorBorderColor:'#555',navigatorDisplayRegionColor:'#900',degrees:0,flipped:false,overlayPreserveContentDirection:true,opacity:1,compositeOperation:null,drawer:['auto','webgl','canvas','html'],drawerOptions:{},preload:false,imageSmoothingEnabled:true,placeholderFillStyle:null,subPixelRoundingForTransparency:null,showReferenceStrip:false,referenceStripScroll:'horizontal',referenceStripElement:null,referenceStripHeight:null,referenceStripWidth:null,referenceStripPosition:'BOTTOM_LEFT',referenceStripSizeRatio:0.2,collectionRows:3,collectionColumns:0,collectionLayout:'horizontal',collectionMode:false,collectionTileSize:800,collectionTileMargin:80,imageLoaderLimit:0,maxImageCacheCount:200,timeout:30000,tileRetryMax:0,tileRetryDelay:2500,prefixUrl:"/images/",navImages:{zoomIn:{REST:'zoomin_rest.png',GROUP:'zoomin_grouphover.png',HOVER:'zoomin_hover.png',DOWN:'zoomin_pressed.png'},zoomOut:{REST:'zoomout_rest.png',GROUP:'zoomout_grouphover.png',HOVER:'zoomout_hover.png',DOWN:'zoomout_pressed.png'},home:{REST:'home_rest.png',GROUP:'home_grouphover.png',HOVER:'home_hover.png',DOWN:'home_pressed.png'},fullpage:{REST:'fullpage_rest.png',GROUP:'fullpage_grouphover.png',HOVER:'fullpage_hover.png',DOWN:'fullpage_pressed.png'},rotateleft:{REST:'rotateleft_rest.png',GROUP:'rotateleft_grouphover.png',HOVER:'rotateleft_hover.png',DOWN:'rotateleft_pressed.png'},rotateright:{REST:'rotateright_rest.png',GROUP:'rotateright_grouphover.png',HOVER:'rotateright_hover.png',DOWN:'rotateright_pressed.png'},flip:{REST:'flip_rest.png',GROUP:'flip_grouphover.png',HOVER:'flip_hover.png',DOWN:'flip_pressed.png'},previous:{REST:'previous_rest.png',GROUP:'previous_grouphover.png',HOVER:'previous_hover.png',DOWN:'previous_pressed.png'},next:{REST:'next_rest.png',GROUP:'next_grouphover.png',HOVER:'next_hover.png',DOWN:'next_pressed.png'}},debugMode:false,debugGridColor:['#437AB2','#1B9E77','#D95F02','#7570B3','#E7298A','#66A61E','#E6AB02','#A6761D','#666666'],silenceMultiImageWarnings:false},delegate:function(object,method){return function(){let args=arguments;if(args===undefined){args=[];}
+return method.apply(object,args);};},BROWSERS:{UNKNOWN:0,IE:1,FIREFOX:2,SAFARI:3,CHROME:4,OPERA:5,EDGE:6,CHROMEEDGE:7},SUBPIXEL_ROUNDING_OCCURRENCES:{NEVER:0,ONLY_AT_REST:1,ALWAYS:2},_viewers:new Map(),getViewer:function(element){return $._viewers.get(this.getElement(element));},getElement:function(element){if(typeof(element)==="string"){element=document.getElementById(element);}
+return element;},getElementPosition:function(element){let result=new $.Point();let isFixed;let offsetParent;element=$.getElement(element);isFixed=$.getElementStyle(element).position==="fixed";offsetParent=getOffsetParent(element,isFixed);while(offsetParent){result.x+=element.offsetLeft;result.y+=element.offsetTop;if(isFixed){result=result.plus($.getPageScroll());}
+element=offsetParent;isFixed=$.getElementStyle(element).position==="fixed";offsetParent=getOffsetParent(element,isFixed);}
+return result;},getElementOffset:function(element){element=$.getElement(element);const doc=element&&element.ownerDocument;let boundingRect={top:0,left:0};if(!doc){return new $.Point();}
+const docElement=doc.documentElement;if(typeof element.getBoundingClientRect!==typeof undefined){boundingRect=element.getBoundingClientRect();}
+const win=(doc===doc.window)?doc:(doc.nodeType===9)?doc.defaultView||doc.parentWindow:false;return new $.Point(boundingRect.left+(win.pageXOffset||docElement.scrollLeft)-(docElement.clientLeft||0),boundingRect.top+(win.pageYOffset||docElement.scrollTop)-(docElement.clientTop||0));},getElementSize:function(element){element=$.getElement(element);return new $.Point(element.clientWidth,element.clientHeight);},getElementStyle:document.documentElement.currentStyle?function(element){element=$.getElement(element);return element.currentStyle;}:function(element){element=$.getElement(element);return window.getComputedStyle(element,"");},getCssPropertyWithVendorPrefix:function(property){const memo={};$.getCssPropertyWithVendorPrefix=function(property){if(memo[property]!==undefined){return memo[property];}
+const style=document.createElement('div').style;let result=null;if(style[property]!==undefined){result=property;}else{const prefixes=['Webkit','Moz','MS','O','webkit','moz','ms','o'];const suffix=$.capitalizeFirstLetter(property);for(let i=0;i<prefixes.length;i++){const prop=prefixes[i]+suffix;if(style[prop]!==undefined){result=prop;break;}}}
+memo[property]=result;return result;};return $.getCssPropertyWithVendorPrefix(property);},capitalizeFirstLetter:function(string){return string.charAt(0).toUpperCase()+string.slice(1);},positiveModulo:function(number,modulo){let result=number%modulo;if(result<0){result+=modulo;}
+return result;},pointInElement:function(element,point){element=$.getElement(element);const offset=$.getElementOffset(element);const size=$.getElementSize(element);return point.x>=offset.x&&point.x<offset.x+size.x&&point.y<offset.y+size.y&&point.y>=offset.y;},getMousePosition:function(event){if(typeof(event.pageX)==="number"){$.getMousePosition=function(event){const result=new $.Point();result.x=event.pageX;result.y=event.pageY;return result;};}else if(typeof(event.clientX)==="number"){$.getMousePosition=function(event){const result=new $.Point();result.x=event.clientX+
+document.body.scrollLeft+
+document.documentElement.scrollLeft;result.y=event.clientY+
+document.body.scrollTop+
+document.documentElement.scrollTop;return result;};}else{throw new Error("Unknown event mouse position, no known technique.");}
+return $.getMousePosition(event);},getPageScroll:function(){const docElement=document.documentElement||{};const body=document.body||{};if(typeof(window.pageXOffset)==="number"){$.getPageScroll=function(){return new $.Point(window.pageXOffset,window.pageYOffset);};}else if(body.scrollLeft||body.scrollTop){$.getPageScroll=function(){return new $.Point(document.body.scrollLeft,document.body.scrollTop);};}else if(docElement.scrollLeft||docElement.scrollTop){$.getPageScroll=function(){return new $.Point(document.documentElement.scrollLeft,document.documentElement.scrollTop);};}else{return new $.Point(0,0);}
+return $.getPageScroll();},setPageScroll:function(scroll){if(typeof(window.scrollTo)!=="undefined"){$.setPageScroll=function(scroll){window.scrollTo(scroll.x,scroll.y);};}else{const originalScroll=$.getPageScroll();if(originalScroll.x===scroll.x&&originalScroll.y===scroll.y){return;}
+document.body.scrollLeft=scroll.x;document.body.scrollTop=scroll.y;let currentScroll=$.getPageScroll();if(currentScroll.x!==originalScroll.x&&currentScroll.y!==originalScroll.y){$.setPageScroll=function(scroll){document.body.scrollLeft=scroll.x;document.body.scrollTop=scroll.y;};return;}
+document.documentElement.scrollLeft=scroll.x;document.documentElement.scrollTop=scroll.y;currentScroll=$.getPageScroll();if(currentScroll.x!==originalScroll.x&&currentScroll.y!==originalScroll.y){$.setPageScroll=function(scroll){document.documentElement.scrollLeft=scroll.x;document.documentElement.scrollTop=scroll.y;};return;}
+$.setPageScroll=function(scroll){};}
+$.setPageScroll(scroll);},getWindowSize:function(){const docElement=document.documentElement||{};const body=document.body||{};if(typeof(window.innerWidth)==='number'){$.getWindowSize=function(){return new $.Point(window.innerWidth,window.innerHeight);};}else if(docElement.clientWidth||docElement.clientHeight){$.getWindowSize=function(){return new $.Point(document.documentElement.clientWidth,document.documentElement.clientHeight);};}else if(body.clientWidth||body.clientHeight){$.getWindowSize=function(){return new $.Point(document.body.clientWidth,document.body.clientHeight);};}else{throw new Error("Unknown window size, no known technique.");}
+return $.getWindowSize();},makeCenteredNode:function(element){element=$.getElement(element);const wrappers=[$.makeNeutralElement('div'),$.makeNeutralElement('div'),$.makeNeutralElement('div')];$.extend(wrappers[0].style,{display:"table",height:"100%",width:"100%"});$.extend(wrappers[1].style,{display:"table-row"});$.extend(wrappers[2].style,{display:"table-cell",verticalAlign:"middle",textAlign:"center"});wrappers[0].appendChild(wrappers[1]);wrappers[1].appendChild(wrappers[2]);wrappers[2].appendChild(element);return wrappers[0];},trace:function(tile,stacktrace=false){this.__traceLogs=[];setInterval(()=>{if(!this.__traceLogs.length){return;}
+console.log(this.__traceLogs.join('\n'));this.__traceLogs=[];},2000);this.trace=function(tile,stacktrace=false){if(typeof tile==='string'){this.__traceLogs.push(tile);if(stacktrace){this.__traceLogs.push(...new Error().stack.split('\n').slice(1));}
+return;}
+if(tile instanceof OpenSeadragon.Tile){tile=tile.getCache(tile.originalCacheKey);}
+const cacheTile=tile._tiles[0];this.__traceLogs.push(`Cache ${cacheTile.toString()} loaded ${cacheTile.loaded} loading ${cacheTile.loading} cacheCount ${Object.keys(cacheTile._caches).length} - CACHE ${tile.__invStamp}`);if(stacktrace){this.__traceLogs.push(...new Error().stack.split('\n').slice(1));}};this.trace(tile,stacktrace);},makeNeutralElement:function(tagName){const element=document.createElement(tagName);const style=element.style;style.background="transparent none";style.border="none";style.margin="0px";style.padding="0px";style.position="static";return element;},now:function(){if(Date.now){$.now=Date.now;}else{$.now=function(){return new Date().getTime();};}
+return $.now();},makeTransparentImage:function(src){const img=$.makeNeutralElement("img");img.src=src;return img;},setElementOpacity:function(element,opacity,usesAlpha){let ieOpacity;let ieFilter;element=$.getElement(element);if(usesAlpha&&!$.Browser.alpha){opacity=Math.round(opacity);}
+if($.Browser.opacity){element.style.opacity=opacity<1?opacity:"";}else{if(opacity<1){ieOpacity=Math.round(100*opacity);ieFilter="alpha(opacity="+ieOpacity+")";element.style.filter=ieFilter;}else{element.style.filter="";}}},setElementTouchActionNone:function(element){element=$.getElement(element);if(typeof element.style.touchAction!=='undefined'){element.style.touchAction='none';}else if(typeof element.style.msTouchAction!=='undefined'){element.style.msTouchAction='none';}},setElementPointerEvents:function(element,value){element=$.getElement(element);if(typeof element.style!=='undefined'&&typeof element.style.pointerEvents!=='undefined'){element.style.pointerEvents=value;}},setElementPointerEventsNone:function(element){$.setElementPointerEvents(element,'none');},addClass:function(element,className){element=$.getElement(element);if(!element.className){element.className=className;}else if((' '+element.className+' ').indexOf(' '+className+' ')===-1){element.className+=' '+className;}},indexOf:function(array,searchElement,fromIndex){if(Array.prototype.indexOf){this.indexOf=function(array,searchElement,fromIndex){return array.indexOf(searchElement,fromIndex);};}else{this.indexOf=function(array,searchElement,fromIndex){let pivot=(fromIndex)?fromIndex:0;if(!array){throw new TypeError();}
+const length=array.length;if(length===0||pivot>=length){return-1;}
+if(pivot<0){pivot=length-Math.abs(pivot);}
+for(let i=pivot;i<length;i++){if(array[i]===searchElement){return i;}}
+return-1;};}
+return this.indexOf(array,searchElement,fromIndex);},removeClass:function(element,className){const newClasses=[];element=$.getElement(element);const oldClasses=element.className.split(/\s+/);for(let i=0;i<oldClasses.length;i++){if(oldClasses[i]&&oldClasses[i]!==className){newClasses.push(oldClasses[i]);}}
+element.className=newClasses.join(' ');},normalizeEventListenerOptions:function(options){let opts;if(typeof options!=='undefined'){if(typeof options==='boolean'){opts=$.supportsEventListenerOptions?{capture:options}:options;}else{opts=$.supportsEventListenerOptions?options:((typeof options.capture!=='undefined')?options.capture:false);}}else{opts=$.supportsEventListenerOptions?{capture:false}:false;}
+return opts;},addEvent:(function(){if($.supportsAddEventListener){return function(element,eventName,handler,options){options=$.normalizeEventListenerOptions(options);element=$.getElement(element);element.addEventListener(eventName,handler,options);};}else if(document.documentElement.attachEvent&&document.attachEvent){return function(element,eventName,handler){element=$.getElement(element);element.attachEvent('on'+eventName,handler);};}else{throw new Error("No known event model.");}}()),removeEvent:(function(){if($.supportsRemoveEventListener){return function(element,eventName,handler,options){options=$.normalizeEventListenerOptions(options);element=$.getElement(element);element.removeEventListener(eventName,handler,options);};}else if(document.documentElement.detachEvent&&document.detachEvent){return function(element,eventName,handler){element=$.getElement(element);element.detachEvent('on'+eventName,handler);};}else{throw new Error("No known event model.");}}()),cancelEvent:function(event){event.preventDefault();},eventIsCanceled:function(event){return event.defaultPrevented;},stopEvent:function(event){event.stopPropagation();},getUrlParameter:function(key){const value=URLPARAMS[key];return value?value:null;},getUrlProtocol:function(url){const match=url.match(/^([a-z]+:)\/\//i);if(match===null){return window.location.protocol;}
+return match[1].toLowerCase();},createAjaxRequest:function(){if(window.XMLHttpRequest){$.createAjaxRequest=function(){return new XMLHttpRequest();};return new XMLHttpRequest();}else{throw new Error("Browser doesn't support XMLHttpRequest.");}},makeAjaxRequest:function(url,onSuccess,onError){let withCredentials;let headers;let responseType;let postData;if($.isPlainObject(url)){onSuccess=url.success;onError=url.error;withCredentials=url.withCredentials;headers=url.headers;responseType=url.responseType||null;postData=url.postData||null;url=url.url;}else{$.console.warn("OpenSeadragon.makeAjaxRequest() deprecated usage!");}
+const protocol=$.getUrlProtocol(url);const request=$.createAjaxRequest();if(!$.isFunction(onSuccess)){throw new Error("makeAjaxRequest requires a success callback");}
+request.onreadystatechange=function(){if(request.readyState===4){request.onreadystatechange=function(){};if((request.status>=200&&request.status<300)||(request.status===0&&protocol!=="http:"&&protocol!=="https:")){onSuccess(request);}else{if($.isFunction(onError)){onError(request);}else{$.console.error("AJAX request returned %d: %s",request.status,url);}}}};const method=postData?"POST":"GET";try{request.open(method,url,true);if(responseType){request.responseType=responseType;}
+if(headers){for(const headerName in headers){if(Object.prototype.hasOwnProperty.call(headers,headerName)&&headers[headerName]){request.setRequestHeader(headerName,headers[headerName]);}}}
+if(withCredentials){request.withCredentials=true;}
+request.send(postData);}catch(e){$.console.error("%s while making AJAX request: %s",e.name,e.message);request.onreadystatechange=function(){};if($.isFunction(onError)){onError(request,e);}}
+return request;},jsonp:function(options){let script;let url=options.url;const head=document.head||document.getElementsByTagName("head")[0]||document.documentElement;const jsonpCallback=options.callbackName||'openseadragon'+$.now();const previous=window[jsonpCallback];const replace="$1"+jsonpCallback+"$2";const callbackParam=options.param||'callback';const callback=options.callback;url=url.replace(/(=)\?(&|$)|\?\?/i,replace);url+=(/\?/.test(url)?"&":"?")+callbackParam+"="+jsonpCallback;window[jsonpCallback]=function(response){if(!previous){try{delete window[jsonpCallback];}catch(e){}}else{window[jsonpCallback]=previous;}
+if(callback&&$.isFunction(callback)){callback(response);}};script=document.createElement("script");if(undefined!==options.async||false!==options.async){script.async="async";}
+if(options.scriptCharset){script.charset=options.scriptCharset;}
+script.src=url;script.onload=script.onreadystatechange=function(_,isAbort){if(isAbort||!script.readyState||/loaded|complete/.test(script.readyState)){script.onload=script.onreadystatechange=null;if(head&&script.parentNode){head.removeChild(script);}
+script=undefined;}};head.insertBefore(script,head.firstChild);},createFromDZI:function(){throw"OpenSeadragon.createFromDZI is deprecated, use Viewer.open.";},parseXml:function(string){if(window.DOMParser){$.parseXml=function(string){let xmlDoc=null;const parser=new DOMParser();xmlDoc=parser.parseFromString(string,"text/xml");return xmlDoc;};}else{throw new Error("Browser doesn't support XML DOM.");}
+return $.parseXml(string);},parseJSON:function(string){$.parseJSON=window.JSON.parse;return $.parseJSON(string);},imageFormatSupported:function(extension){extension=extension?extension:"";return!!FILEFORMATS[extension.toLowerCase()];},setImageFormatsSupported:function(formats){$.extend(FILEFORMATS,formats);},});const nullfunction=function(msg){};$.console=window.console||{log:nullfunction,debug:nullfunction,info:nullfunction,warn:nullfunction,error:nullfunction,assert:nullfunction};$.Browser={vendor:$.BROWSERS.UNKNOWN,version:0,alpha:true};const FILEFORMATS={avif:true,bmp:false,jpeg:true,jpg:true,png:true,tif:false,wdp:false,webp:true};const URLPARAMS={};(function(){const ver=navigator.appVersion;const ua=navigator.userAgent;let regex;switch(navigator.appName){case"Microsoft Internet Explorer":if(!!window.attachEvent&&!!window.ActiveXObject){$.Browser.vendor=$.BROWSERS.IE;$.Browser.version=parseFloat(ua.substring(ua.indexOf("MSIE")+5,ua.indexOf(";",ua.indexOf("MSIE"))));}
+break;case"Netscape":if(window.addEventListener){if(ua.indexOf("Edge")>=0){$.Browser.vendor=$.BROWSERS.EDGE;$.Browser.version=parseFloat(ua.substring(ua.indexOf("Edge")+5));}else if(ua.indexOf("Edg")>=0){$.Browser.vendor=$.BROWSERS.CHROMEEDGE;$.Browser.version=parseFloat(ua.substring(ua.indexOf("Edg")+4));}else if(ua.indexOf("Firefox")>=0){$.Browser.vendor=$.BROWSERS.FIREFOX;$.Browser.version=parseFloat(ua.substring(ua.indexOf("Firefox")+8));}else if(ua.indexOf("Safari")>=0){$.Browser.vendor=ua.indexOf("Chrome")>=0?$.BROWSERS.CHROME:$.BROWSERS.SAFARI;$.Browser.version=parseFloat(ua.substring(ua.substring(0,ua.indexOf("Safari")).lastIndexOf("/")+1,ua.indexOf("Safari")));}else{regex=new RegExp("Trident/.*rv:([0-9]{1,}[.0-9]{0,})");if(regex.exec(ua)!==null){$.Browser.vendor=$.BROWSERS.IE;$.Browser.version=parseFloat(RegExp.$1);}}}
+break;case"Opera":$.Browser.vendor=$.BROWSERS.OPERA;$.Browser.version=parseFloat(ver);break;}
+const query=window.location.search.substring(1);const parts=query.split('&');for(let i=0;i<parts.length;i++){const part=parts[i];const sep=part.indexOf('=');if(sep>0){const key=part.substring(0,sep);const value=part.substring(sep+1);try{URLPARAMS[key]=decodeURIComponent(value);}catch(e){$.console.error("Ignoring malformed URL parameter: %s=%s",key,value);}}}
+$.Browser.alpha=!($.Browser.vendor===$.BROWSERS.CHROME&&$.Browser.version<2);$.Browser.opacity=true;if($.Browser.vendor===$.BROWSERS.IE){$.console.error('Internet Explorer is not supported by OpenSeadragon');}})();(function(w){const requestAnimationFrame=w.requestAnimationFrame||w.mozRequestAnimationFrame||w.webkitRequestAnimationFrame||w.msRequestAnimationFrame;const cancelAnimationFrame=w.cancelAnimationFrame||w.mozCancelAnimationFrame||w.webkitCancelAnimationFrame||w.msCancelAnimationFrame;if(requestAnimationFrame&&cancelAnimationFrame){$.requestAnimationFrame=function(){return requestAnimationFrame.apply(w,arguments);};$.cancelAnimationFrame=function(){return cancelAnimationFrame.apply(w,arguments);};}else{let aAnimQueue=[];let processing=[];let iIntervalId;let iRequestId=0;$.requestAnimationFrame=function(callback){aAnimQueue.push([++iRequestId,callback]);if(!iIntervalId){iIntervalId=setInterval(function(){if(aAnimQueue.length){const time=$.now();const temp=processing;processing=aAnimQueue;aAnimQueue=temp;while(processing.length){processing.shift()[1](time);}}else{clearInterval(iIntervalId);iIntervalId=undefined;}},1000/50);}
+return iRequestId;};$.cancelAnimationFrame=function(requestId){let i,j;for(i=0,j=aAnimQueue.length;i<j;i+=1){if(aAnimQueue[i][0]===requestId){aAnimQueue.splice(i,1);return;}}
+for(i=0,j=processing.length;i<j;i+=1){if(processing[i][0]===requestId){processing.splice(i,1);return;}}};}})(window);function getOffsetParent(element,isFixed){if(isFixed&&element!==document.body){return document.body;}else{return element.offsetParent;}}
+$.Promise=window["Promise"]&&$.supportsAsync?window["Promise"]:class{constructor(handler){this._error=false;this.__value=undefined;try{handler((value)=>{while(value instanceof $.Promise){value=value._value;}
+this._value=value;},(error)=>{while(error instanceof $.Promise){error=error._value;}
+this._value=error;this._error=true;});}catch(e){this._value=e;this._error=true;}}
+then(handler){if(!this._error){try{this._value=handler(this._value);}catch(e){this._value=e;this._error=true;}}
+return this;}
+catch(handler){if(this._error){try{this._value=handler(this._value);this._error=false;}catch(e){this._value=e;this._error=true;}}
+return this;}
+get _value(){return this.__value;}
+set _value(val){if(val&&val.constructor===this.constructor){val=val._value;}
+this.__value=val;}
+static resolve(value){return new this((resolve)=>resolve(value));}
+static reject(error){return new this((_,reject)=>reject(error));}
+static all(functions){return new this((resolve)=>{return resolve(functions.map(fn=>fn()));});}
+static race(functions){if(functions.length<1){return this.resolve();}
+return new this((resolve)=>{return resolve(functions[0]());});}};}(OpenSeadragon));(function(root,$){if(typeof define==='function'&&define.amd){define([],function(){return $;});}else if(typeof module==='object'&&module.exports){module.exports=$;}else{if(!root){root=typeof window==='object'&&window;if(!root){$.console.error("OpenSeadragon must run in browser environment!");}}
+root.OpenSeadragon=$;}}(this,OpenSeadragon));(function($){class Mat3{constructor(values){if(!values){values=[0,0,0,0,0,0,0,0,0];}
+this.values=values;}
+static makeIdentity(){return new Mat3([1,0,0,0,1,0,0,0,1]);}
+static makeTranslation(tx,ty){return new Mat3([1,0,0,0,1,0,tx,ty,1,]);}
+static makeRotation(angleInRadians){const c=Math.cos(angleInRadians);const s=Math.sin(angleInRadians);return new Mat3([c,-s,0,s,c,0,0,0,1,]);}
+static makeScaling(sx,sy){return new Mat3([sx,0,0,0,sy,0,0,0,1,]);}
+multiply(other){let a=this.values;let b=other.values;const a00=a[0*3+0],a01=a[0*3+1],a02=a[0*3+2];const a10=a[1*3+0],a11=a[1*3+1],a12=a[1*3+2];const a20=a[2*3+0],a21=a[2*3+1],a22=a[2*3+2];const b00=b[0*3+0],b01=b[0*3+1],b02=b[0*3+2];const b10=b[1*3+0],b11=b[1*3+1],b12=b[1*3+2];const b20=b[2*3+0],b21=b[2*3+1],b22=b[2*3+2];return new Mat3([b00*a00+b01*a10+b02*a20,b00*a01+b01*a11+b02*a21,b00*a02+b01*a12+b02*a22,b10*a00+b11*a10+b12*a20,b10*a01+b11*a11+b12*a21,b10*a02+b11*a12+b12*a22,b20*a00+b21*a10+b22*a20,b20*a01+b21*a11+b22*a21,b20*a02+b21*a12+b22*a22,]);}
+setValues(a00,a01,a02,a10,a11,a12,a20,a21,a22){this.values[0]=a00;this.values[1]=a01;this.values[2]=a02;this.values[3]=a10;this.values[4]=a11;this.values[5]=a12;this.values[6]=a20;this.values[7]=a21;this.values[8]=a22;}
+scaleAndTranslate(sx,sy,tx,ty){const a=this.values;const a00=a[0];const a01=a[1];const a02=a[2];const a10=a[3];const a11=a[4];const a12=a[5];return new Mat3([sx*a00,sx*a01,sx*a02,sy*a10,sy*a11,sy*a12,tx*a00+ty*a10,tx*a01+ty*a11,tx*a02+ty*a12,]);}
+scaleAndTranslateSelf(sx,sy,tx,ty){const a=this.values;const m00=a[0],m01=a[1],m02=a[2];const m10=a[3],m11=a[4],m12=a[5];a[0]=sx*m00;a[1]=sx*m01;a[2]=sx*m02;a[3]=sy*m10;a[4]=sy*m11;a[5]=sy*m12;a[6]=tx*m00+ty*m10+a[6];a[7]=tx*m01+ty*m11+a[7];a[8]=tx*m02+ty*m12+a[8];}
+scaleAndTranslateOtherSetSelf(other){const a=other.values;const out=this.values;const sx=out[0];const sy=out[4];const tx=out[6];const ty=out[7];out[0]=sx*a[0];out[1]=sx*a[1];out[2]=sx*a[2];out[3]=sy*a[3];out[4]=sy*a[4];out[5]=sy*a[5];out[6]=tx*a[0]+ty*a[3]+a[6];out[7]=tx*a[1]+ty*a[4]+a[7];out[8]=tx*a[2]+ty*a[5]+a[8];}}
+$.Mat3=Mat3;}(OpenSeadragon));(function($){const fullScreenApi={supportsFullScreen:false,isFullScreen:function(){return false;},getFullScreenElement:function(){return null;},requestFullScreen:function(){},exitFullScreen:function(){},cancelFullScreen:function(){},fullScreenEventName:'',fullScreenErrorEventName:''};if(document.exitFullscreen){fullScreenApi.supportsFullScreen=true;fullScreenApi.getFullScreenElement=function(){return document.fullscreenElement;};fullScreenApi.requestFullScreen=function(element){return element.requestFullscreen().catch(function(msg){$.console.error('Fullscreen request failed: ',msg);});};fullScreenApi.exitFullScreen=function(){document.exitFullscreen().catch(function(msg){$.console.error('Error while exiting fullscreen: ',msg);});};fullScreenApi.fullScreenEventName="fullscreenchange";fullScreenApi.fullScreenErrorEventName="fullscreenerror";}else if(document.msExitFullscreen){fullScreenApi.supportsFullScreen=true;fullScreenApi.getFullScreenElement=function(){return document.msFullscreenElement;};fullScreenApi.requestFullScreen=function(element){return element.msRequestFullscreen();};fullScreenApi.exitFullScreen=function(){document.msExitFullscreen();};fullScreenApi.fullScreenEventName="MSFullscreenChange";fullScreenApi.fullScreenErrorEventName="MSFullscreenError";}else if(document.webkitExitFullscreen){fullScreenApi.supportsFullScreen=true;fullScreenApi.getFullScreenElement=function(){return document.webkitFullscreenElement;};fullScreenApi.requestFullScreen=function(element){return element.webkitRequestFullscreen();};fullScreenApi.exitFullScreen=function(){document.webkitExitFullscreen();};fullScreenApi.fullScreenEventName="webkitfullscreenchange";fullScreenApi.fullScreenErrorEventName="webkitfullscreenerror";}else if(document.webkitCancelFullScreen){fullScreenApi.supportsFullScreen=true;fullScreenApi.getFullScreenElement=function(){return document.webkitCurrentFullScreenElement;};fullScreenApi.requestFullScreen=function(element){return element.webkitRequestFullScreen();};fullScreenApi.exitFullScreen=function(){document.webkitCancelFullScreen();};fullScreenApi.fullScreenEventName="webkitfullscreenchange";fullScreenApi.fullScreenErrorEventName="webkitfullscreenerror";}else if(document.mozCancelFullScreen){fullScreenApi.supportsFullScreen=true;fullScreenApi.getFullScreenElement=function(){return document.mozFullScreenElement;};fullScreenApi.requestFullScreen=function(element){return element.mozRequestFullScreen();};fullScreenApi.exitFullScreen=function(){document.mozCancelFullScreen();};fullScreenApi.fullScreenEventName="mozfullscreenchange";fullScreenApi.fullScreenErrorEventName="mozfullscreenerror";}
+fullScreenApi.isFullScreen=function(){return fullScreenApi.getFullScreenElement()!==null;};fullScreenApi.cancelFullScreen=function(){$.console.error("cancelFullScreen is deprecated. Use exitFullScreen instead.");fullScreenApi.exitFullScreen();};$.extend($,fullScreenApi);})(OpenSeadragon);(function($){$.EventSource=function(){this.events={};this._rejectedEventList={};};$.EventSource.prototype={addOnceHandler:function(eventName,handler,userData,times,priority){const self=this;times=times||1;let count=0;const onceHandler=function(event){count++;if(count===times){self.removeHandler(eventName,onceHandler);}
+return handler(event);};return this.addHandler(eventName,onceHandler,userData,priority);},addHandler:function(eventName,handler,userData,priority){if(Object.prototype.hasOwnProperty.call(this._rejectedEventList,eventName)){$.console.error(`Error adding handler for ${eventName}. ${this._rejectedEventList[eventName]}`);return false;}
+let events=this.events[eventName];if(!events){this.events[eventName]=events=[];}
+if(handler&&$.isFunction(handler)){let index=events.length,event={handler:handler,userData:userData||null,priority:priority||0};events[index]=event;while(index>0&&events[index-1].priority<events[index].priority){events[index]=events[index-1];events[index-1]=event;index--;}}
+return true;},removeHandler:function(eventName,handler){const events=this.events[eventName];const handlers=[];if(!events){return;}
+if($.isArray(events)){for(let i=0;i<events.length;i++){if(events[i].handler!==handler){handlers.push(events[i]);}}
+this.events[eventName]=handlers;}},numberOfHandlers:function(eventName){const events=this.events[eventName];if(!events){return 0;}
+return events.length;},removeAllHandlers:function(eventName){if(eventName){this.events[eventName]=[];}else{for(let eventType in this.events){this.events[eventType]=[];}}},getHandler:function(eventName){let events=this.events[eventName];if(!events||!events.length){return null;}
+events=events.length===1?[events[0]]:Array.apply(null,events);return function(source,args){let length=events.length;for(let i=0;i<length;i++){if(events[i]){args.eventSource=source;args.userData=events[i].userData;events[i].handler(args);if(args.stopPropagation&&(typeof args.stopPropagation!=="function"||args.stopPropagation()===true)){break;}}}};},getAwaitingHandler:function(eventName,bindTarget){let events=this.events[eventName];if(!events||!events.length){return null;}
+events=events.length===1?[events[0]]:Array.apply(null,events);return function(source,args){return new $.Promise((resolve,reject)=>{const length=events.length;function loop(index){if(index>=length||!events[index]){resolve(bindTarget);return null;}
+args.eventSource=source;args.userData=events[index].userData;let result;try{result=events[index].handler(args);}catch(e){return reject(e);}
+result=(!result||$.type(result)!=="promise")?$.Promise.resolve():result;return result.then(()=>{if(!args.stopPropagation||(typeof args.stopPropagation==="function"&&args.stopPropagation()===false)){return loop(index+1);}
+return loop(length);});}
+loop(0).catch(reject);});};},raiseEvent:function(eventName,eventArgs){if(Object.prototype.hasOwnProperty.call(this._rejectedEventList,eventName)){$.console.error(`Error adding handler for ${eventName}. ${this._rejectedEventList[eventName]}`);return false;}
+const handler=this.getHandler(eventName);if(handler){handler(this,eventArgs||{});}
+return true;},raiseEventAwaiting:function(eventName,eventArgs,bindTarget=null){const awaitingHandler=this.getAwaitingHandler(eventName,bindTarget);if(awaitingHandler){return awaitingHandler(this,eventArgs||{});}
+return $.Promise.resolve(bindTarget);},rejectEventHandler(eventName,errorMessage=''){this._rejectedEventList[eventName]=errorMessage;},allowEventHandler(eventName){delete this._rejectedEventList[eventName];}};}(OpenSeadragon));(function($){const MOUSETRACKERS=[];const THIS={};$.MouseTracker=function(options){MOUSETRACKERS.push(this);const args=arguments;if(!$.isPlainObject(options)){options={element:args[0],clickTimeThreshold:args[1],clickDistThreshold:args[2]};}
+this.hash=uniqueHash();this.element=$.getElement(options.element);this.clickTimeThreshold=options.clickTimeThreshold||$.DEFAULT_SETTINGS.clickTimeThreshold;this.clickDistThreshold=options.clickDistThreshold||$.DEFAULT_SETTINGS.clickDistThreshold;this.dblClickTimeThreshold=options.dblClickTimeThreshold||$.DEFAULT_SETTINGS.dblClickTimeThreshold;this.dblClickDistThreshold=options.dblClickDistThreshold||$.DEFAULT_SETTINGS.dblClickDistThreshold;this.userData=options.userData||null;this.stopDelay=options.stopDelay||50;this.preProcessEventHandler=options.preProcessEventHandler||null;this.contextMenuHandler=options.contextMenuHandler||null;this.enterHandler=options.enterHandler||null;this.leaveHandler=options.leaveHandler||null;this.exitHandler=options.exitHandler||null;this.overHandler=options.overHandler||null;this.outHandler=options.outHandler||null;this.pressHandler=options.pressHandler||null;this.nonPrimaryPressHandler=options.nonPrimaryPressHandler||null;this.releaseHandler=options.releaseHandler||null;this.nonPrimaryReleaseHandler=options.nonPrimaryReleaseHandler||null;this.moveHandler=options.moveHandler||null;this.scrollHandler=options.scrollHandler||null;this.clickHandler=options.clickHandler||null;this.dblClickHandler=options.dblClickHandler||null;this.dragHandler=options.dragHandler||null;this.dragEndHandler=options.dragEndHandler||null;this.pinchHandler=options.pinchHandler||null;this.stopHandler=options.stopHandler||null;this.keyDownHandler=options.keyDownHandler||null;this.keyUpHandler=options.keyUpHandler||null;this.keyHandler=options.keyHandler||null;this.focusHandler=options.focusHandler||null;this.blurHandler=options.blurHandler||null;const _this=this;THIS[this.hash]={click:function(event){onClick(_this,event);},dblclick:function(event){onDblClick(_this,event);},keydown:function(event){onKeyDown(_this,event);},keyup:function(event){onKeyUp(_this,event);},keypress:function(event){onKeyPress(_this,event);},focus:function(event){onFocus(_this,event);},blur:function(event){onBlur(_this,event);},contextmenu:function(event){onContextMenu(_this,event);},wheel:function(event){onWheel(_this,event);},mousewheel:function(event){onMouseWheel(_this,event);},DOMMouseScroll:function(event){onMouseWheel(_this,event);},MozMousePixelScroll:function(event){onMouseWheel(_this,event);},losecapture:function(event){onLoseCapture(_this,event);},mouseenter:function(event){onPointerEnter(_this,event);},mouseleave:function(event){onPointerLeave(_this,event);},mouseover:function(event){onPointerOver(_this,event);},mouseout:function(event){onPointerOut(_this,event);},mousedown:function(event){onPointerDown(_this,event);},mouseup:function(event){onPointerUp(_this,event);},mousemove:function(event){onPointerMove(_this,event);},touchstart:function(event){onTouchStart(_this,event);},touchend:function(event){onTouchEnd(_this,event);},touchmove:function(event){onTouchMove(_this,event);},touchcancel:function(event){onTouchCancel(_this,event);},gesturestart:function(event){onGestureStart(_this,event);},gesturechange:function(event){onGestureChange(_this,event);},gotpointercapture:function(event){onGotPointerCapture(_this,event);},lostpointercapture:function(event){onLostPointerCapture(_this,event);},pointerenter:function(event){onPointerEnter(_this,event);},pointerleave:function(event){onPointerLeave(_this,event);},pointerover:function(event){onPointerOver(_this,event);},pointerout:function(event){onPointerOut(_this,event);},pointerdown:function(event){onPointerDown(_this,event);},pointerup:function(event){onPointerUp(_this,event);},pointermove:function(event){onPointerMove(_this,event);},pointercancel:function(event){onPointerCancel(_this,event);},pointerupcaptured:function(event){onPointerUpCaptured(_this,event);},pointermovecaptured:function(event){onPointerMoveCaptured(_this,event);},tracking:false,activePointersLists:[],lastClickPos:null,dblClickTimeOut:null,pinchGPoints:[],lastPinchDist:0,currentPinchDist:0,lastPinchCenter:null,currentPinchCenter:null,sentDragEvent:false};if($.MouseTracker.havePointerEvents){$.setElementPointerEvents(this.element,'auto');}
+if(this.exitHandler){$.console.error("MouseTracker.exitHandler is deprecated. Use MouseTracker.leaveHandler instead.");}
+if(!options.startDisabled){this.setTracking(true);}};$.MouseTracker.prototype={destroy:function(){stopTracking(this);this.element=null;for(let i=0;i<MOUSETRACKERS.length;i++){if(MOUSETRACKERS[i]===this){MOUSETRACKERS.splice(i,1);break;}}
+THIS[this.hash]=null;delete THIS[this.hash];},isTracking:function(){return THIS[this.hash].tracking;},setTracking:function(track){if(track){startTracking(this);}else{stopTracking(this);}
+return this;},getActivePointersListByType:function(type){const delegate=THIS[this.hash];const len=delegate?delegate.activePointersLists.length:0;let list;for(let i=0;i<len;i++){if(delegate.activePointersLists[i].type===type){return delegate.activePointersLists[i];}}
+list=new $.MouseTracker.GesturePointList(type);if(delegate){delegate.activePointersLists.push(list);}
+return list;},getActivePointerCount:function(){const delegate=THIS[this.hash];const len=delegate.activePointersLists.length;let count=0;for(let i=0;i<len;i++){count+=delegate.activePointersLists[i].getLength();}
+return count;},get hasGestureHandlers(){return!!(this.pressHandler||this.nonPrimaryPressHandler||this.releaseHandler||this.nonPrimaryReleaseHandler||this.clickHandler||this.dblClickHandler||this.dragHandler||this.dragEndHandler||this.pinchHandler);},get hasScrollHandler(){return!!this.scrollHandler;},preProcessEventHandler:function(){},contextMenuHandler:function(){},enterHandler:function(){},leaveHandler:function(){},exitHandler:function(){},overHandler:function(){},outHandler:function(){},pressHandler:function(){},nonPrimaryPressHandler:function(){},releaseHandler:function(){},nonPrimaryReleaseHandler:function(){},moveHandler:function(){},scrollHandler:function(){},clickHandler:function(){},dblClickHandler:function(){},dragHandler:function(){},dragEndHandler:function(){},pinchHandler:function(){},stopHandler:function(){},keyDownHandler:function(){},keyUpHandler:function(){},keyHandler:function(){},focusHandler:function(){},blurHandler:function(){}};const isInIframe=(function(){try{return window.self!==window.top;}catch(e){return true;}})();function canAccessEvents(target){try{return target.addEventListener&&target.removeEventListener;}catch(e){return false;}}
+$.MouseTracker.gesturePointVelocityTracker=(function(){const trackerPoints=[];let intervalId=0;let lastTime=0;const _generateGuid=function(tracker,gPoint){return tracker.hash.toString()+gPoint.type+gPoint.id.toString();};const _doTracking=function(){const len=trackerPoints.length;const now=$.now();let distance;let speed;const elapsedTime=now-lastTime;lastTime=now;for(let i=0;i<len;i++){const trackPoint=trackerPoints[i];const gPoint=trackPoint.gPoint;gPoint.direction=Math.atan2(gPoint.currentPos.y-trackPoint.lastPos.y,gPoint.currentPos.x-trackPoint.lastPos.x);distance=trackPoint.lastPos.distanceTo(gPoint.currentPos);trackPoint.lastPos=gPoint.currentPos;speed=1000*distance/(elapsedTime+1);gPoint.speed=0.75*speed+0.25*gPoint.speed;}};const addPoint=function(tracker,gPoint){const guid=_generateGuid(tracker,gPoint);trackerPoints.push({guid:guid,gPoint:gPoint,lastPos:gPoint.currentPos});if(trackerPoints.length===1){lastTime=$.now();intervalId=window.setInterval(_doTracking,50);}};const removePoint=function(tracker,gPoint){const guid=_generateGuid(tracker,gPoint);let len=trackerPoints.length;for(let i=0;i<len;i++){if(trackerPoints[i].guid===guid){trackerPoints.splice(i,1);len--;if(len===0){window.clearInterval(intervalId);}
+break;}}};return{addPoint:addPoint,removePoint:removePoint};})();$.MouseTracker.captureElement=document;$.MouseTracker.wheelEventName=('onwheel'in document.createElement('div'))?'wheel':document.onmousewheel!==undefined?'mousewheel':'DOMMouseScroll';$.MouseTracker.subscribeEvents=["click","dblclick","keydown","keyup","keypress","focus","blur","contextmenu",$.MouseTracker.wheelEventName];if($.MouseTracker.wheelEventName==="DOMMouseScroll"){$.MouseTracker.subscribeEvents.push("MozMousePixelScroll");}
+if(window.PointerEvent){$.MouseTracker.havePointerEvents=true;$.MouseTracker.subscribeEvents.push("pointerenter","pointerleave","pointerover","pointerout","pointerdown","pointerup","pointermove","pointercancel");$.MouseTracker.havePointerCapture=(function(){const divElement=document.createElement('div');return $.isFunction(divElement.setPointerCapture)&&$.isFunction(divElement.releasePointerCapture);}());if($.MouseTracker.havePointerCapture){$.MouseTracker.subscribeEvents.push("gotpointercapture","lostpointercapture");}}else{$.MouseTracker.havePointerEvents=false;$.MouseTracker.subscribeEvents.push("mouseenter","mouseleave","mouseover","mouseout","mousedown","mouseup","mousemove");$.MouseTracker.mousePointerId="legacy-mouse";$.MouseTracker.havePointerCapture=(function(){const divElement=document.createElement('div');return $.isFunction(divElement.setCapture)&&$.isFunction(divElement.releaseCapture);}());if($.MouseTracker.havePointerCapture){$.MouseTracker.subscribeEvents.push("losecapture");}
+if('ontouchstart'in window){$.MouseTracker.subscribeEvents.push("touchstart","touchend","touchmove","touchcancel");}
+if('ongesturestart'in window){$.MouseTracker.subscribeEvents.push("gesturestart","gesturechange");}}
+$.MouseTracker.GesturePointList=function(type){this._gPoints=[];this.type=type;this.buttons=0;this.contacts=0;this.clicks=0;this.captureCount=0;};$.MouseTracker.GesturePointList.prototype={getLength:function(){return this._gPoints.length;},asArray:function(){return this._gPoints;},add:function(gp){return this._gPoints.push(gp);},removeById:function(id){const len=this._gPoints.length;for(let i=0;i<len;i++){if(this._gPoints[i].id===id){this._gPoints.splice(i,1);break;}}
+return this._gPoints.length;},getByIndex:function(index){if(index<this._gPoints.length){return this._gPoints[index];}
+return null;},getById:function(id){const len=this._gPoints.length;for(let i=0;i<len;i++){if(this._gPoints[i].id===id){return this._gPoints[i];}}
+return null;},getPrimary:function(id){const len=this._gPoints.length;for(let i=0;i<len;i++){if(this._gPoints[i].isPrimary){return this._gPoints[i];}}
+return null;},addContact:function(){++this.contacts;if(this.contacts>1&&(this.type==="mouse"||this.type==="pen")){$.console.warn('GesturePointList.addContact() Implausible contacts value');this.contacts=1;}},removeContact:function(){--this.contacts;if(this.contacts<0){this.contacts=0;}}};function clearTrackedPointers(tracker){const delegate=THIS[tracker.hash];const pointerListCount=delegate.activePointersLists.length;for(let i=0;i<pointerListCount;i++){const pointsList=delegate.activePointersLists[i];if(pointsList.getLength()>0){const gPointsToRemove=[];const gPoints=pointsList.asArray();for(let j=0;j<gPoints.length;j++){gPointsToRemove.push(gPoints[j]);}
+for(let j=0;j<gPointsToRemove.length;j++){stopTrackingPointer(tracker,pointsList,gPointsToRemove[j]);}}}
+for(let i=0;i<pointerListCount;i++){delegate.activePointersLists.pop();}
+delegate.sentDragEvent=false;}
+function startTracking(tracker){const delegate=THIS[tracker.hash];if(!delegate.tracking){for(let i=0;i<$.MouseTracker.subscribeEvents.length;i++){const event=$.MouseTracker.subscribeEvents[i];$.addEvent(tracker.element,event,delegate[event],event===$.MouseTracker.wheelEventName?{passive:false,capture:false}:false);}
+clearTrackedPointers(tracker);delegate.tracking=true;}}
+function stopTracking(tracker){const delegate=THIS[tracker.hash];if(delegate.tracking){for(let i=0;i<$.MouseTracker.subscribeEvents.length;i++){const event=$.MouseTracker.subscribeEvents[i];$.removeEvent(tracker.element,event,delegate[event],false);}
+clearTrackedPointers(tracker);delegate.tracking=false;}}
+function getCaptureEventParams(tracker,pointerType){const delegate=THIS[tracker.hash];if(pointerType==='pointerevent'){return{upName:'pointerup',upHandler:delegate.pointerupcaptured,moveName:'pointermove',moveHandler:delegate.pointermovecaptured};}else if(pointerType==='mouse'){return{upName:'pointerup',upHandler:delegate.pointerupcaptured,moveName:'pointermove',moveHandler:delegate.pointermovecaptured};}else if(pointerType==='touch'){return{upName:'touchend',upHandler:delegate.touchendcaptured,moveName:'touchmove',moveHandler:delegate.touchmovecaptured};}else{throw new Error("MouseTracker.getCaptureEventParams: Unknown pointer type.");}}
+function capturePointer(tracker,gPoint){if($.MouseTracker.havePointerCapture){if($.MouseTracker.havePointerEvents){try{tracker.element.setPointerCapture(gPoint.id);}catch(e){$.console.warn('setPointerCapture() called on invalid pointer ID');return;}}else{tracker.element.setCapture(true);}}else{const eventParams=getCaptureEventParams(tracker,$.MouseTracker.havePointerEvents?'pointerevent':gPoint.type);if(isInIframe&&canAccessEvents(window.top)){$.addEvent(window.top,eventParams.upName,eventParams.upHandler,true);}
+$.addEvent($.MouseTracker.captureElement,eventParams.upName,eventParams.upHandler,true);$.addEvent($.MouseTracker.captureElement,eventParams.moveName,eventParams.moveHandler,true);}
+updatePointerCaptured(tracker,gPoint,true);}
+function releasePointer(tracker,gPoint){if($.MouseTracker.havePointerCapture){if($.MouseTracker.havePointerEvents){const pointsList=tracker.getActivePointersListByType(gPoint.type);const cachedGPoint=pointsList.getById(gPoint.id);if(!cachedGPoint||!cachedGPoint.captured){return;}
+try{tracker.element.releasePointerCapture(gPoint.id);}catch(e){}}else{tracker.element.releaseCapture();}}else{const eventParams=getCaptureEventParams(tracker,$.MouseTracker.havePointerEvents?'pointerevent':gPoint.type);if(isInIframe&&canAccessEvents(window.top)){$.removeEvent(window.top,eventParams.upName,eventParams.upHandler,true);}
+$.removeEvent($.MouseTracker.captureElement,eventParams.moveName,eventParams.moveHandler,true);$.removeEvent($.MouseTracker.captureElement,eventParams.upName,eventParams.upHandler,true);}
+updatePointerCaptured(tracker,gPoint,false);}
+function getPointerId(event){return($.MouseTracker.havePointerEvents)?event.pointerId:$.MouseTracker.mousePointerId;}
+function getPointerType(event){return $.MouseTracker.havePointerEvents&&event.pointerType?event.pointerType:'mouse';}
+function getIsPrimary(event){return($.MouseTracker.havePointerEvents)?event.isPrimary:true;}
+function getMouseAbsolute(event){return $.getMousePosition(event);}
+function getMouseRelative(event,element){return getPointRelativeToAbsolute(getMouseAbsolute(event),element);}
+function getPointRelativeToAbsolute(point,element){const offset=$.getElementOffset(element);return point.minus(offset);}
+function getCenterPoint(point1,point2){return new $.Point((point1.x+point2.x)/2,(point1.y+point2.y)/2);}
+function onClick(tracker,event){const eventInfo={originalEvent:event,eventType:'click',pointerType:'mouse',isEmulated:false};preProcessEvent(tracker,eventInfo);if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onDblClick(tracker,event){const eventInfo={originalEvent:event,eventType:'dblclick',pointerType:'mouse',isEmulated:false};preProcessEvent(tracker,eventInfo);if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onKeyDown(tracker,event){let eventArgs=null;const eventInfo={originalEvent:event,eventType:'keydown',pointerType:'',isEmulated:false};preProcessEvent(tracker,eventInfo);if(tracker.keyDownHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventArgs={eventSource:tracker,keyCode:event.keyCode?event.keyCode:event.charCode,ctrl:event.ctrlKey,shift:event.shiftKey,alt:event.altKey,meta:event.metaKey,originalEvent:event,preventDefault:eventInfo.preventDefault||eventInfo.defaultPrevented,userData:tracker.userData};tracker.keyDownHandler(eventArgs);}
+if((eventArgs&&eventArgs.preventDefault)||(eventInfo.preventDefault&&!eventInfo.defaultPrevented)){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onKeyUp(tracker,event){let eventArgs=null;const eventInfo={originalEvent:event,eventType:'keyup',pointerType:'',isEmulated:false};preProcessEvent(tracker,eventInfo);if(tracker.keyUpHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventArgs={eventSource:tracker,keyCode:event.keyCode?event.keyCode:event.charCode,ctrl:event.ctrlKey,shift:event.shiftKey,alt:event.altKey,meta:event.metaKey,originalEvent:event,preventDefault:eventInfo.preventDefault||eventInfo.defaultPrevented,userData:tracker.userData};tracker.keyUpHandler(eventArgs);}
+if((eventArgs&&eventArgs.preventDefault)||(eventInfo.preventDefault&&!eventInfo.defaultPrevented)){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onKeyPress(tracker,event){let eventArgs=null;const eventInfo={originalEvent:event,eventType:'keypress',pointerType:'',isEmulated:false};preProcessEvent(tracker,eventInfo);if(tracker.keyHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventArgs={eventSource:tracker,keyCode:event.keyCode?event.keyCode:event.charCode,ctrl:event.ctrlKey,shift:event.shiftKey,alt:event.altKey,meta:event.metaKey,originalEvent:event,preventDefault:eventInfo.preventDefault||eventInfo.defaultPrevented,userData:tracker.userData};tracker.keyHandler(eventArgs);}
+if((eventArgs&&eventArgs.preventDefault)||(eventInfo.preventDefault&&!eventInfo.defaultPrevented)){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onFocus(tracker,event){const eventInfo={originalEvent:event,eventType:'focus',pointerType:'',isEmulated:false};preProcessEvent(tracker,eventInfo);if(tracker.focusHandler&&!eventInfo.preventGesture){tracker.focusHandler({eventSource:tracker,originalEvent:event,userData:tracker.userData});}}
+function onBlur(tracker,event){const eventInfo={originalEvent:event,eventType:'blur',pointerType:'',isEmulated:false};preProcessEvent(tracker,eventInfo);if(tracker.blurHandler&&!eventInfo.preventGesture){tracker.blurHandler({eventSource:tracker,originalEvent:event,userData:tracker.userData});}}
+function onContextMenu(tracker,event){let eventArgs=null;const eventInfo={originalEvent:event,eventType:'contextmenu',pointerType:'mouse',isEmulated:false};preProcessEvent(tracker,eventInfo);if(tracker.contextMenuHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventArgs={eventSource:tracker,position:getPointRelativeToAbsolute(getMouseAbsolute(event),tracker.element),originalEvent:eventInfo.originalEvent,preventDefault:eventInfo.preventDefault||eventInfo.defaultPrevented,userData:tracker.userData};tracker.contextMenuHandler(eventArgs);}
+if((eventArgs&&eventArgs.preventDefault)||(eventInfo.preventDefault&&!eventInfo.defaultPrevented)){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onWheel(tracker,event){handleWheelEvent(tracker,event,event);}
+function onMouseWheel(tracker,event){const simulatedEvent={target:event.target||event.srcElement,type:"wheel",shiftKey:event.shiftKey||false,clientX:event.clientX,clientY:event.clientY,pageX:event.pageX?event.pageX:event.clientX,pageY:event.pageY?event.pageY:event.clientY,deltaMode:event.type==="MozMousePixelScroll"?0:1,deltaX:0,deltaZ:0};if($.MouseTracker.wheelEventName==="mousewheel"){simulatedEvent.deltaY=-event.wheelDelta/$.DEFAULT_SETTINGS.pixelsPerWheelLine;}else{simulatedEvent.deltaY=event.detail;}
+handleWheelEvent(tracker,simulatedEvent,event);}
+function handleWheelEvent(tracker,event,originalEvent){let nDelta=0;let eventInfo;let eventArgs=null;nDelta=event.deltaY?(event.deltaY<0?1:-1):0;eventInfo={originalEvent:event,eventType:'wheel',pointerType:'mouse',isEmulated:event!==originalEvent};preProcessEvent(tracker,eventInfo);if(tracker.scrollHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventArgs={eventSource:tracker,pointerType:'mouse',position:getMouseRelative(event,tracker.element),scroll:nDelta,shift:event.shiftKey,isTouchEvent:false,originalEvent:originalEvent,preventDefault:eventInfo.preventDefault||eventInfo.defaultPrevented,userData:tracker.userData};tracker.scrollHandler(eventArgs);}
+if(eventInfo.stopPropagation){$.stopEvent(originalEvent);}
+if((eventArgs&&eventArgs.preventDefault)||(eventInfo.preventDefault&&!eventInfo.defaultPrevented)){$.cancelEvent(originalEvent);}}
+function onLoseCapture(tracker,event){const gPoint={id:$.MouseTracker.mousePointerId,type:'mouse'};const eventInfo={originalEvent:event,eventType:'lostpointercapture',pointerType:'mouse',isEmulated:false};preProcessEvent(tracker,eventInfo);if(event.target===tracker.element){updatePointerCaptured(tracker,gPoint,false);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onTouchStart(tracker,event){const touchCount=event.changedTouches.length;const pointsList=tracker.getActivePointersListByType('touch');const time=$.now();if(pointsList.getLength()>event.touches.length-touchCount){$.console.warn('Tracked touch contact count doesn\'t match event.touches.length');}
+const eventInfo={originalEvent:event,eventType:'pointerdown',pointerType:'touch',isEmulated:false};preProcessEvent(tracker,eventInfo);for(let i=0;i<touchCount;i++){const gPoint={id:event.changedTouches[i].identifier,type:'touch',isPrimary:pointsList.getLength()===0,currentPos:getMouseAbsolute(event.changedTouches[i]),currentTime:time};updatePointerEnter(tracker,eventInfo,gPoint);updatePointerDown(tracker,eventInfo,gPoint,0);updatePointerCaptured(tracker,gPoint,true);}
+if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onTouchEnd(tracker,event){const touchCount=event.changedTouches.length;const time=$.now();const eventInfo={originalEvent:event,eventType:'pointerup',pointerType:'touch',isEmulated:false};preProcessEvent(tracker,eventInfo);for(let i=0;i<touchCount;i++){const gPoint={id:event.changedTouches[i].identifier,type:'touch',currentPos:getMouseAbsolute(event.changedTouches[i]),currentTime:time};updatePointerUp(tracker,eventInfo,gPoint,0);updatePointerCaptured(tracker,gPoint,false);updatePointerLeave(tracker,eventInfo,gPoint);}
+if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onTouchMove(tracker,event){const touchCount=event.changedTouches.length;const time=$.now();const eventInfo={originalEvent:event,eventType:'pointermove',pointerType:'touch',isEmulated:false};preProcessEvent(tracker,eventInfo);for(let i=0;i<touchCount;i++){const gPoint={id:event.changedTouches[i].identifier,type:'touch',currentPos:getMouseAbsolute(event.changedTouches[i]),currentTime:time};updatePointerMove(tracker,eventInfo,gPoint);}
+if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onTouchCancel(tracker,event){const touchCount=event.changedTouches.length;const eventInfo={originalEvent:event,eventType:'pointercancel',pointerType:'touch',isEmulated:false};preProcessEvent(tracker,eventInfo);for(let i=0;i<touchCount;i++){const gPoint={id:event.changedTouches[i].identifier,type:'touch'};updatePointerCancel(tracker,eventInfo,gPoint);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onGestureStart(tracker,event){if(!$.eventIsCanceled(event)){event.preventDefault();}
+return false;}
+function onGestureChange(tracker,event){if(!$.eventIsCanceled(event)){event.preventDefault();}
+return false;}
+function onGotPointerCapture(tracker,event){const eventInfo={originalEvent:event,eventType:'gotpointercapture',pointerType:getPointerType(event),isEmulated:false};preProcessEvent(tracker,eventInfo);if(event.target===tracker.element){updatePointerCaptured(tracker,{id:event.pointerId,type:getPointerType(event)},true);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onLostPointerCapture(tracker,event){const eventInfo={originalEvent:event,eventType:'lostpointercapture',pointerType:getPointerType(event),isEmulated:false};preProcessEvent(tracker,eventInfo);if(event.target===tracker.element){updatePointerCaptured(tracker,{id:event.pointerId,type:getPointerType(event)},false);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onPointerEnter(tracker,event){const gPoint={id:getPointerId(event),type:getPointerType(event),isPrimary:getIsPrimary(event),currentPos:getMouseAbsolute(event),currentTime:$.now()};const eventInfo={originalEvent:event,eventType:'pointerenter',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerEnter(tracker,eventInfo,gPoint);}
+function onPointerLeave(tracker,event){const gPoint={id:getPointerId(event),type:getPointerType(event),isPrimary:getIsPrimary(event),currentPos:getMouseAbsolute(event),currentTime:$.now()};const eventInfo={originalEvent:event,eventType:'pointerleave',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerLeave(tracker,eventInfo,gPoint);}
+function onPointerOver(tracker,event){const gPoint={id:getPointerId(event),type:getPointerType(event),isPrimary:getIsPrimary(event),currentPos:getMouseAbsolute(event),currentTime:$.now()};const eventInfo={originalEvent:event,eventType:'pointerover',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerOver(tracker,eventInfo,gPoint);if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onPointerOut(tracker,event){const gPoint={id:getPointerId(event),type:getPointerType(event),isPrimary:getIsPrimary(event),currentPos:getMouseAbsolute(event),currentTime:$.now()};const eventInfo={originalEvent:event,eventType:'pointerout',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerOut(tracker,eventInfo,gPoint);if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onPointerDown(tracker,event){const gPoint={id:getPointerId(event),type:getPointerType(event),isPrimary:getIsPrimary(event),currentPos:getMouseAbsolute(event),currentTime:$.now()};const implicitlyCaptured=$.MouseTracker.havePointerEvents&&gPoint.type==='touch';const eventInfo={originalEvent:event,eventType:'pointerdown',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerDown(tracker,eventInfo,gPoint,event.button);if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}
+if(eventInfo.shouldCapture){if(implicitlyCaptured){updatePointerCaptured(tracker,gPoint,true);}else{capturePointer(tracker,gPoint);}}}
+function onPointerUp(tracker,event){handlePointerUp(tracker,event);}
+function onPointerUpCaptured(tracker,event){const pointsList=tracker.getActivePointersListByType(getPointerType(event));if(pointsList.getById(event.pointerId)){handlePointerUp(tracker,event);}
+$.stopEvent(event);}
+function handlePointerUp(tracker,event){const gPoint={id:getPointerId(event),type:getPointerType(event),isPrimary:getIsPrimary(event),currentPos:getMouseAbsolute(event),currentTime:$.now()};const eventInfo={originalEvent:event,eventType:'pointerup',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerUp(tracker,eventInfo,gPoint,event.button);if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}
+if(eventInfo.shouldReleaseCapture){if(event.target===tracker.element){releasePointer(tracker,gPoint);}else{updatePointerCaptured(tracker,gPoint,false);}}}
+function onPointerMove(tracker,event){handlePointerMove(tracker,event);}
+function onPointerMoveCaptured(tracker,event){const pointsList=tracker.getActivePointersListByType(getPointerType(event));if(pointsList.getById(event.pointerId)){handlePointerMove(tracker,event);}
+$.stopEvent(event);}
+function handlePointerMove(tracker,event){const gPoint={id:getPointerId(event),type:getPointerType(event),isPrimary:getIsPrimary(event),currentPos:getMouseAbsolute(event),currentTime:$.now()};const eventInfo={originalEvent:event,eventType:'pointermove',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerMove(tracker,eventInfo,gPoint);if(eventInfo.preventDefault&&!eventInfo.defaultPrevented){$.cancelEvent(event);}
+if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function onPointerCancel(tracker,event){const gPoint={id:event.pointerId,type:getPointerType(event)};const eventInfo={originalEvent:event,eventType:'pointercancel',pointerType:gPoint.type,isEmulated:false};preProcessEvent(tracker,eventInfo);updatePointerCancel(tracker,eventInfo,gPoint);if(eventInfo.stopPropagation){$.stopEvent(event);}}
+function startTrackingPointer(pointsList,gPoint){gPoint.speed=0;gPoint.direction=0;gPoint.contactPos=gPoint.currentPos;gPoint.contactTime=gPoint.currentTime;gPoint.lastPos=gPoint.currentPos;gPoint.lastTime=gPoint.currentTime;return pointsList.add(gPoint);}
+function stopTrackingPointer(tracker,pointsList,gPoint){let listLength;const trackedGPoint=pointsList.getById(gPoint.id);if(trackedGPoint){if(trackedGPoint.captured){$.console.warn('stopTrackingPointer() called on captured pointer');releasePointer(tracker,trackedGPoint);}
+pointsList.removeContact();listLength=pointsList.removeById(gPoint.id);}else{listLength=pointsList.getLength();}
+return listLength;}
+function getEventProcessDefaults(tracker,eventInfo){switch(eventInfo.eventType){case'pointermove':eventInfo.isStoppable=true;eventInfo.isCancelable=true;eventInfo.preventDefault=false;eventInfo.preventGesture=!tracker.hasGestureHandlers;eventInfo.stopPropagation=false;break;case'pointerover':case'pointerout':case'contextmenu':case'keydown':case'keyup':case'keypress':eventInfo.isStoppable=true;eventInfo.isCancelable=true;eventInfo.preventDefault=false;eventInfo.preventGesture=false;eventInfo.stopPropagation=false;break;case'pointerdown':eventInfo.isStoppable=true;eventInfo.isCancelable=true;eventInfo.preventDefault=false;eventInfo.preventGesture=!tracker.hasGestureHandlers;eventInfo.stopPropagation=false;break;case'pointerup':eventInfo.isStoppable=true;eventInfo.isCancelable=true;eventInfo.preventDefault=false;eventInfo.preventGesture=!tracker.hasGestureHandlers;eventInfo.stopPropagation=false;break;case'wheel':eventInfo.isStoppable=true;eventInfo.isCancelable=true;eventInfo.preventDefault=false;eventInfo.preventGesture=!tracker.hasScrollHandler;eventInfo.stopPropagation=false;break;case'gotpointercapture':case'lostpointercapture':case'pointercancel':eventInfo.isStoppable=true;eventInfo.isCancelable=false;eventInfo.preventDefault=false;eventInfo.preventGesture=false;eventInfo.stopPropagation=false;break;case'click':eventInfo.isStoppable=true;eventInfo.isCancelable=true;eventInfo.preventDefault=!!tracker.clickHandler;eventInfo.preventGesture=false;eventInfo.stopPropagation=false;break;case'dblclick':eventInfo.isStoppable=true;eventInfo.isCancelable=true;eventInfo.preventDefault=!!tracker.dblClickHandler;eventInfo.preventGesture=false;eventInfo.stopPropagation=false;break;case'focus':case'blur':case'pointerenter':case'pointerleave':default:eventInfo.isStoppable=false;eventInfo.isCancelable=false;eventInfo.preventDefault=false;eventInfo.preventGesture=false;eventInfo.stopPropagation=false;break;}}
+function preProcessEvent(tracker,eventInfo){eventInfo.eventSource=tracker;eventInfo.eventPhase=eventInfo.originalEvent?((typeof eventInfo.originalEvent.eventPhase!=='undefined')?eventInfo.originalEvent.eventPhase:0):0;eventInfo.defaultPrevented=$.eventIsCanceled(eventInfo.originalEvent);eventInfo.shouldCapture=false;eventInfo.shouldReleaseCapture=false;eventInfo.userData=tracker.userData;getEventProcessDefaults(tracker,eventInfo);if(tracker.preProcessEventHandler){tracker.preProcessEventHandler(eventInfo);}}
+function updatePointerCaptured(tracker,gPoint,isCaptured){const pointsList=tracker.getActivePointersListByType(gPoint.type);const updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){if(isCaptured&&!updateGPoint.captured){updateGPoint.captured=true;pointsList.captureCount++;}else if(!isCaptured&&updateGPoint.captured){updateGPoint.captured=false;pointsList.captureCount--;if(pointsList.captureCount<0){pointsList.captureCount=0;$.console.warn('updatePointerCaptured() - pointsList.captureCount went negative');}}}else{$.console.warn('updatePointerCaptured() called on untracked pointer');}}
+function updatePointerEnter(tracker,eventInfo,gPoint){const pointsList=tracker.getActivePointersListByType(gPoint.type);const updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){updateGPoint.insideElement=true;updateGPoint.lastPos=updateGPoint.currentPos;updateGPoint.lastTime=updateGPoint.currentTime;updateGPoint.currentPos=gPoint.currentPos;updateGPoint.currentTime=gPoint.currentTime;gPoint=updateGPoint;}else{gPoint.captured=false;gPoint.insideElementPressed=false;gPoint.insideElement=true;startTrackingPointer(pointsList,gPoint);}
+if(tracker.enterHandler){tracker.enterHandler({eventSource:tracker,pointerType:gPoint.type,position:getPointRelativeToAbsolute(gPoint.currentPos,tracker.element),buttons:pointsList.buttons,pointers:tracker.getActivePointerCount(),insideElementPressed:gPoint.insideElementPressed,buttonDownAny:pointsList.buttons!==0,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}}
+function updatePointerLeave(tracker,eventInfo,gPoint){const pointsList=tracker.getActivePointersListByType(gPoint.type);const updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){if(updateGPoint.captured){updateGPoint.insideElement=false;updateGPoint.lastPos=updateGPoint.currentPos;updateGPoint.lastTime=updateGPoint.currentTime;updateGPoint.currentPos=gPoint.currentPos;updateGPoint.currentTime=gPoint.currentTime;}else{stopTrackingPointer(tracker,pointsList,updateGPoint);}
+gPoint=updateGPoint;}else{gPoint.captured=false;gPoint.insideElementPressed=false;}
+if(tracker.leaveHandler||tracker.exitHandler){const dispatchEventObj={eventSource:tracker,pointerType:gPoint.type,position:gPoint.currentPos&&getPointRelativeToAbsolute(gPoint.currentPos,tracker.element),buttons:pointsList.buttons,pointers:tracker.getActivePointerCount(),insideElementPressed:gPoint.insideElementPressed,buttonDownAny:pointsList.buttons!==0,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData};if(tracker.leaveHandler){tracker.leaveHandler(dispatchEventObj);}
+if(tracker.exitHandler){tracker.exitHandler(dispatchEventObj);}}}
+function updatePointerOver(tracker,eventInfo,gPoint){const pointsList=tracker.getActivePointersListByType(gPoint.type);const updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){gPoint=updateGPoint;}else{gPoint.captured=false;gPoint.insideElementPressed=false;}
+if(tracker.overHandler){tracker.overHandler({eventSource:tracker,pointerType:gPoint.type,position:getPointRelativeToAbsolute(gPoint.currentPos,tracker.element),buttons:pointsList.buttons,pointers:tracker.getActivePointerCount(),insideElementPressed:gPoint.insideElementPressed,buttonDownAny:pointsList.buttons!==0,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}}
+function updatePointerOut(tracker,eventInfo,gPoint){const pointsList=tracker.getActivePointersListByType(gPoint.type);const updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){gPoint=updateGPoint;}else{gPoint.captured=false;gPoint.insideElementPressed=false;}
+if(tracker.outHandler){tracker.outHandler({eventSource:tracker,pointerType:gPoint.type,position:gPoint.currentPos&&getPointRelativeToAbsolute(gPoint.currentPos,tracker.element),buttons:pointsList.buttons,pointers:tracker.getActivePointerCount(),insideElementPressed:gPoint.insideElementPressed,buttonDownAny:pointsList.buttons!==0,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}}
+function updatePointerDown(tracker,eventInfo,gPoint,buttonChanged){const delegate=THIS[tracker.hash];const pointsList=tracker.getActivePointersListByType(gPoint.type);if(typeof eventInfo.originalEvent.buttons!=='undefined'){pointsList.buttons=eventInfo.originalEvent.buttons;}else{if(buttonChanged===0){pointsList.buttons|=1;}else if(buttonChanged===1){pointsList.buttons|=4;}else if(buttonChanged===2){pointsList.buttons|=2;}else if(buttonChanged===3){pointsList.buttons|=8;}else if(buttonChanged===4){pointsList.buttons|=16;}else if(buttonChanged===5){pointsList.buttons|=32;}}
+if(buttonChanged!==0){eventInfo.shouldCapture=false;eventInfo.shouldReleaseCapture=false;if(tracker.nonPrimaryPressHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventInfo.preventDefault=true;tracker.nonPrimaryPressHandler({eventSource:tracker,pointerType:gPoint.type,position:getPointRelativeToAbsolute(gPoint.currentPos,tracker.element),button:buttonChanged,buttons:pointsList.buttons,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}
+return;}
+const updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){updateGPoint.insideElementPressed=true;updateGPoint.insideElement=true;updateGPoint.originalTarget=eventInfo.originalEvent.target;updateGPoint.contactPos=gPoint.currentPos;updateGPoint.contactTime=gPoint.currentTime;updateGPoint.lastPos=updateGPoint.currentPos;updateGPoint.lastTime=updateGPoint.currentTime;updateGPoint.currentPos=gPoint.currentPos;updateGPoint.currentTime=gPoint.currentTime;gPoint=updateGPoint;}else{gPoint.captured=false;gPoint.insideElementPressed=true;gPoint.insideElement=true;gPoint.originalTarget=eventInfo.originalEvent.target;startTrackingPointer(pointsList,gPoint);}
+pointsList.addContact();if(!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventInfo.shouldCapture=true;eventInfo.shouldReleaseCapture=false;eventInfo.preventDefault=true;if(tracker.dragHandler||tracker.dragEndHandler||tracker.pinchHandler){$.MouseTracker.gesturePointVelocityTracker.addPoint(tracker,gPoint);}
+if(pointsList.contacts===1){if(tracker.pressHandler&&!eventInfo.preventGesture){tracker.pressHandler({eventSource:tracker,pointerType:gPoint.type,position:getPointRelativeToAbsolute(gPoint.contactPos,tracker.element),buttons:pointsList.buttons,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}}else if(pointsList.contacts===2){if(tracker.pinchHandler&&gPoint.type==='touch'){delegate.pinchGPoints=pointsList.asArray();delegate.lastPinchDist=delegate.currentPinchDist=delegate.pinchGPoints[0].currentPos.distanceTo(delegate.pinchGPoints[1].currentPos);delegate.lastPinchCenter=delegate.currentPinchCenter=getCenterPoint(delegate.pinchGPoints[0].currentPos,delegate.pinchGPoints[1].currentPos);}}}else{eventInfo.shouldCapture=false;eventInfo.shouldReleaseCapture=false;}}
+function updatePointerUp(tracker,eventInfo,gPoint,buttonChanged){const delegate=THIS[tracker.hash];const pointsList=tracker.getActivePointersListByType(gPoint.type);let releasePoint;let releaseTime;let wasCaptured=false;let quick;if(typeof eventInfo.originalEvent.buttons!=='undefined'){pointsList.buttons=eventInfo.originalEvent.buttons;}else{if(buttonChanged===0){pointsList.buttons^=~1;}else if(buttonChanged===1){pointsList.buttons^=~4;}else if(buttonChanged===2){pointsList.buttons^=~2;}else if(buttonChanged===3){pointsList.buttons^=~8;}else if(buttonChanged===4){pointsList.buttons^=~16;}else if(buttonChanged===5){pointsList.buttons^=~32;}}
+eventInfo.shouldCapture=false;if(buttonChanged!==0){eventInfo.shouldReleaseCapture=false;if(tracker.nonPrimaryReleaseHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){eventInfo.preventDefault=true;tracker.nonPrimaryReleaseHandler({eventSource:tracker,pointerType:gPoint.type,position:getPointRelativeToAbsolute(gPoint.currentPos,tracker.element),button:buttonChanged,buttons:pointsList.buttons,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}
+return;}
+let updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){pointsList.removeContact();if(updateGPoint.captured){wasCaptured=true;}
+updateGPoint.lastPos=updateGPoint.currentPos;updateGPoint.lastTime=updateGPoint.currentTime;updateGPoint.currentPos=gPoint.currentPos;updateGPoint.currentTime=gPoint.currentTime;if(!updateGPoint.insideElement){stopTrackingPointer(tracker,pointsList,updateGPoint);}
+releasePoint=updateGPoint.currentPos;releaseTime=updateGPoint.currentTime;}else{gPoint.captured=false;gPoint.insideElementPressed=false;gPoint.insideElement=true;startTrackingPointer(pointsList,gPoint);updateGPoint=gPoint;}
+if(!eventInfo.preventGesture&&!eventInfo.defaultPrevented){if(wasCaptured){eventInfo.shouldReleaseCapture=true;eventInfo.preventDefault=true;if(tracker.dragHandler||tracker.dragEndHandler||tracker.pinchHandler){$.MouseTracker.gesturePointVelocityTracker.removePoint(tracker,updateGPoint);}
+if(pointsList.contacts===0){if(tracker.releaseHandler&&releasePoint){tracker.releaseHandler({eventSource:tracker,pointerType:updateGPoint.type,position:getPointRelativeToAbsolute(releasePoint,tracker.element),buttons:pointsList.buttons,insideElementPressed:updateGPoint.insideElementPressed,insideElementReleased:updateGPoint.insideElement,isTouchEvent:updateGPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}
+if(tracker.dragEndHandler&&delegate.sentDragEvent){tracker.dragEndHandler({eventSource:tracker,pointerType:updateGPoint.type,position:getPointRelativeToAbsolute(updateGPoint.currentPos,tracker.element),speed:updateGPoint.speed,direction:updateGPoint.direction,shift:eventInfo.originalEvent.shiftKey,isTouchEvent:updateGPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}
+delegate.sentDragEvent=false;if((tracker.clickHandler||tracker.dblClickHandler)&&updateGPoint.insideElement){quick=releaseTime-updateGPoint.contactTime<=tracker.clickTimeThreshold&&updateGPoint.contactPos.distanceTo(releasePoint)<=tracker.clickDistThreshold;if(tracker.clickHandler){tracker.clickHandler({eventSource:tracker,pointerType:updateGPoint.type,position:getPointRelativeToAbsolute(updateGPoint.currentPos,tracker.element),quick:quick,shift:eventInfo.originalEvent.shiftKey,isTouchEvent:updateGPoint.type==='touch',originalEvent:eventInfo.originalEvent,originalTarget:updateGPoint.originalTarget,userData:tracker.userData});}
+if(tracker.dblClickHandler&&quick){pointsList.clicks++;if(pointsList.clicks===1){delegate.lastClickPos=releasePoint;delegate.dblClickTimeOut=setTimeout(function(){pointsList.clicks=0;},tracker.dblClickTimeThreshold);}else if(pointsList.clicks===2){clearTimeout(delegate.dblClickTimeOut);pointsList.clicks=0;if(delegate.lastClickPos.distanceTo(releasePoint)<=tracker.dblClickDistThreshold){tracker.dblClickHandler({eventSource:tracker,pointerType:updateGPoint.type,position:getPointRelativeToAbsolute(updateGPoint.currentPos,tracker.element),shift:eventInfo.originalEvent.shiftKey,isTouchEvent:updateGPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}
+delegate.lastClickPos=null;}}}}else if(pointsList.contacts===2){if(tracker.pinchHandler&&updateGPoint.type==='touch'){delegate.pinchGPoints=pointsList.asArray();delegate.lastPinchDist=delegate.currentPinchDist=delegate.pinchGPoints[0].currentPos.distanceTo(delegate.pinchGPoints[1].currentPos);delegate.lastPinchCenter=delegate.currentPinchCenter=getCenterPoint(delegate.pinchGPoints[0].currentPos,delegate.pinchGPoints[1].currentPos);}}}else{eventInfo.shouldReleaseCapture=false;if(tracker.releaseHandler&&releasePoint){tracker.releaseHandler({eventSource:tracker,pointerType:updateGPoint.type,position:getPointRelativeToAbsolute(releasePoint,tracker.element),buttons:pointsList.buttons,insideElementPressed:updateGPoint.insideElementPressed,insideElementReleased:updateGPoint.insideElement,isTouchEvent:updateGPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});eventInfo.preventDefault=true;}}}}
+function updatePointerMove(tracker,eventInfo,gPoint){const delegate=THIS[tracker.hash];const pointsList=tracker.getActivePointersListByType(gPoint.type);let delta;if(typeof eventInfo.originalEvent.buttons!=='undefined'){pointsList.buttons=eventInfo.originalEvent.buttons;}
+let updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){updateGPoint.lastPos=updateGPoint.currentPos;updateGPoint.lastTime=updateGPoint.currentTime;updateGPoint.currentPos=gPoint.currentPos;updateGPoint.currentTime=gPoint.currentTime;}else{return;}
+eventInfo.shouldCapture=false;eventInfo.shouldReleaseCapture=false;if(tracker.stopHandler&&gPoint.type==='mouse'){clearTimeout(tracker.stopTimeOut);tracker.stopTimeOut=setTimeout(function(){handlePointerStop(tracker,eventInfo.originalEvent,gPoint.type);},tracker.stopDelay);}
+if(pointsList.contacts===0){if(tracker.moveHandler){tracker.moveHandler({eventSource:tracker,pointerType:gPoint.type,position:getPointRelativeToAbsolute(gPoint.currentPos,tracker.element),buttons:pointsList.buttons,isTouchEvent:gPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}}else if(pointsList.contacts===1){if(tracker.moveHandler){updateGPoint=pointsList.asArray()[0];tracker.moveHandler({eventSource:tracker,pointerType:updateGPoint.type,position:getPointRelativeToAbsolute(updateGPoint.currentPos,tracker.element),buttons:pointsList.buttons,isTouchEvent:updateGPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}
+if(tracker.dragHandler&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){updateGPoint=pointsList.asArray()[0];delta=updateGPoint.currentPos.minus(updateGPoint.lastPos);tracker.dragHandler({eventSource:tracker,pointerType:updateGPoint.type,position:getPointRelativeToAbsolute(updateGPoint.currentPos,tracker.element),buttons:pointsList.buttons,delta:delta,speed:updateGPoint.speed,direction:updateGPoint.direction,shift:eventInfo.originalEvent.shiftKey,isTouchEvent:updateGPoint.type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});eventInfo.preventDefault=true;delegate.sentDragEvent=true;}}else if(pointsList.contacts===2){if(tracker.moveHandler){const gPointArray=pointsList.asArray();tracker.moveHandler({eventSource:tracker,pointerType:gPointArray[0].type,position:getPointRelativeToAbsolute(getCenterPoint(gPointArray[0].currentPos,gPointArray[1].currentPos),tracker.element),buttons:pointsList.buttons,isTouchEvent:gPointArray[0].type==='touch',originalEvent:eventInfo.originalEvent,userData:tracker.userData});}
+if(tracker.pinchHandler&&gPoint.type==='touch'&&!eventInfo.preventGesture&&!eventInfo.defaultPrevented){delta=delegate.pinchGPoints[0].currentPos.distanceTo(delegate.pinchGPoints[1].currentPos);if(delta!==delegate.currentPinchDist){delegate.lastPinchDist=delegate.currentPinchDist;delegate.currentPinchDist=delta;delegate.lastPinchCenter=delegate.currentPinchCenter;delegate.currentPinchCenter=getCenterPoint(delegate.pinchGPoints[0].currentPos,delegate.pinchGPoints[1].currentPos);tracker.pinchHandler({eventSource:tracker,pointerType:'touch',gesturePoints:delegate.pinchGPoints,lastCenter:getPointRelativeToAbsolute(delegate.lastPinchCenter,tracker.element),center:getPointRelativeToAbsolute(delegate.currentPinchCenter,tracker.element),lastDistance:delegate.lastPinchDist,distance:delegate.currentPinchDist,shift:eventInfo.originalEvent.shiftKey,originalEvent:eventInfo.originalEvent,userData:tracker.userData});eventInfo.preventDefault=true;}}}}
+function updatePointerCancel(tracker,eventInfo,gPoint){const pointsList=tracker.getActivePointersListByType(gPoint.type);const updateGPoint=pointsList.getById(gPoint.id);if(updateGPoint){stopTrackingPointer(tracker,pointsList,updateGPoint);}}
+function handlePointerStop(tracker,originalMoveEvent,pointerType){if(tracker.stopHandler){tracker.stopHandler({eventSource:tracker,pointerType:pointerType,position:getMouseRelative(originalMoveEvent,tracker.element),buttons:tracker.getActivePointersListByType(pointerType).buttons,isTouchEvent:pointerType==='touch',originalEvent:originalMoveEvent,userData:tracker.userData});}}
+function uniqueHash(){let uniqueId=Date.now().toString(36)+Math.random().toString(36).substring(2);while(uniqueId in THIS){uniqueId=Date.now().toString(36)+Math.random().toString(36).substring(2);}
+return uniqueId;}}(OpenSeadragon));(function($){$.ControlAnchor={NONE:0,TOP_LEFT:1,TOP_RIGHT:2,BOTTOM_RIGHT:3,BOTTOM_LEFT:4,ABSOLUTE:5};$.Control=function(element,options,container){const parent=element.parentNode;if(typeof options==='number')
+{$.console.error("Passing an anchor directly into the OpenSeadragon.Control constructor is deprecated; "+"please use an options object instead.  "+"Support for this deprecated variant is scheduled for removal in December 2013");options={anchor:options};}
+options.attachToViewer=(typeof options.attachToViewer==='undefined')?true:options.attachToViewer;this.autoFade=(typeof options.autoFade==='undefined')?true:options.autoFade;this.element=element;this.anchor=options.anchor;this.container=container;if(this.anchor===$.ControlAnchor.ABSOLUTE){this.wrapper=$.makeNeutralElement("div");this.wrapper.style.position="absolute";this.wrapper.style.top=typeof(options.top)==="number"?(options.top+'px'):options.top;this.wrapper.style.left=typeof(options.left)==="number"?(options.left+'px'):options.left;this.wrapper.style.height=typeof(options.height)==="number"?(options.height+'px'):options.height;this.wrapper.style.width=typeof(options.width)==="number"?(options.width+'px'):options.width;this.wrapper.style.margin="0px";this.wrapper.style.padding="0px";this.element.style.position="relative";this.element.style.top="0px";this.element.style.left="0px";this.element.style.height="100%";this.element.style.width="100%";}else{this.wrapper=$.makeNeutralElement("div");this.wrapper.style.display="inline-block";if(this.anchor===$.ControlAnchor.NONE){this.wrapper.style.width=this.wrapper.style.height="100%";}}
+this.wrapper.appendChild(this.element);if(options.attachToViewer){if(this.anchor===$.ControlAnchor.TOP_RIGHT||this.anchor===$.ControlAnchor.BOTTOM_RIGHT){this.container.insertBefore(this.wrapper,this.container.firstChild);}else{this.container.appendChild(this.wrapper);}}else{parent.appendChild(this.wrapper);}};$.Control.prototype={destroy:function(){this.wrapper.removeChild(this.element);if(this.anchor!==$.ControlAnchor.NONE){this.container.removeChild(this.wrapper);}},isVisible:function(){return this.wrapper.style.display!=="none";},setVisible:function(visible){this.wrapper.style.display=visible?(this.anchor===$.ControlAnchor.ABSOLUTE?'block':'inline-block'):"none";},setOpacity:function(opacity){$.setElementOpacity(this.wrapper,opacity,true);}};}(OpenSeadragon));(function($){$.ControlDock=function(options){const layouts=['topleft','topright','bottomright','bottomleft'];$.extend(true,this,{id:'controldock-'+$.now()+'-'+Math.floor(Math.random()*1000000),container:$.makeNeutralElement('div'),controls:[]},options);this.container.onsubmit=function(){return false;};if(this.element){this.element=$.getElement(this.element);this.element.appendChild(this.container);if($.getElementStyle(this.element).position==='static'){this.element.style.position='relative';}
+this.container.style.width='100%';this.container.style.height='100%';}
+for(let i=0;i<layouts.length;i++){let layout=layouts[i];this.controls[layout]=$.makeNeutralElement("div");this.controls[layout].style.position='absolute';if(layout.match('left')){this.controls[layout].style.left='0px';}
+if(layout.match('right')){this.controls[layout].style.right='0px';}
+if(layout.match('top')){this.controls[layout].style.top='0px';}
+if(layout.match('bottom')){this.controls[layout].style.bottom='0px';}}
+this.container.appendChild(this.controls.topleft);this.container.appendChild(this.controls.topright);this.container.appendChild(this.controls.bottomright);this.container.appendChild(this.controls.bottomleft);};$.ControlDock.prototype={addControl:function(element,controlOptions){element=$.getElement(element);let div=null;if(getControlIndex(this,element)>=0){return;}
+switch(controlOptions.anchor){case $.ControlAnchor.TOP_RIGHT:div=this.controls.topright;element.style.position="relative";element.style.paddingRight="0px";element.style.paddingTop="0px";break;case $.ControlAnchor.BOTTOM_RIGHT:div=this.controls.bottomright;element.style.position="relative";element.style.paddingRight="0px";element.style.paddingBottom="0px";break;case $.ControlAnchor.BOTTOM_LEFT:div=this.controls.bottomleft;element.style.position="relative";element.style.paddingLeft="0px";element.style.paddingBottom="0px";break;case $.ControlAnchor.TOP_LEFT:div=this.controls.topleft;element.style.position="relative";element.style.paddingLeft="0px";element.style.paddingTop="0px";break;case $.ControlAnchor.ABSOLUTE:div=this.container;element.style.margin="0px";element.style.padding="0px";break;default:case $.ControlAnchor.NONE:div=this.container;element.style.margin="0px";element.style.padding="0px";break;}
+this.controls.push(new $.Control(element,controlOptions,div));element.style.display="inline-block";},removeControl:function(element){element=$.getElement(element);const i=getControlIndex(this,element);if(i>=0){this.controls[i].destroy();this.controls.splice(i,1);}
+return this;},clearControls:function(){while(this.controls.length>0){this.controls.pop().destroy();}
+return this;},areControlsEnabled:function(){for(let i=this.controls.length-1;i>=0;i--){if(this.controls[i].isVisible()){return true;}}
+return false;},setControlsEnabled:function(enabled){for(let i=this.controls.length-1;i>=0;i--){this.controls[i].setVisible(enabled);}
+return this;}};function getControlIndex(dock,element){const controls=dock.controls;for(let i=controls.length-1;i>=0;i--){if(controls[i].element===element){return i;}}
+return-1;}}(OpenSeadragon));(function($){$.Placement=$.freezeObject({CENTER:0,TOP_LEFT:1,TOP:2,TOP_RIGHT:3,RIGHT:4,BOTTOM_RIGHT:5,BOTTOM:6,BOTTOM_LEFT:7,LEFT:8,properties:{0:{isLeft:false,isHorizontallyCentered:true,isRight:false,isTop:false,isVerticallyCentered:true,isBottom:false},1:{isLeft:true,isHorizontallyCentered:false,isRight:false,isTop:true,isVerticallyCentered:false,isBottom:false},2:{isLeft:false,isHorizontallyCentered:true,isRight:false,isTop:true,isVerticallyCentered:false,isBottom:false},3:{isLeft:false,isHorizontallyCentered:false,isRight:true,isTop:true,isVerticallyCentered:false,isBottom:false},4:{isLeft:false,isHorizontallyCentered:false,isRight:true,isTop:false,isVerticallyCentered:true,isBottom:false},5:{isLeft:false,isHorizontallyCentered:false,isRight:true,isTop:false,isVerticallyCentered:false,isBottom:true},6:{isLeft:false,isHorizontallyCentered:true,isRight:false,isTop:false,isVerticallyCentered:false,isBottom:true},7:{isLeft:true,isHorizontallyCentered:false,isRight:false,isTop:false,isVerticallyCentered:false,isBottom:true},8:{isLeft:true,isHorizontallyCentered:false,isRight:false,isTop:false,isVerticallyCentered:true,isBottom:false}}});}(OpenSeadragon));(function($){const THIS={};let nextHash=1;$.Viewer=function(options){const args=arguments;const _this=this;let i;if(!$.isPlainObject(options)){options={id:args[0],xmlPath:args.length>1?args[1]:undefined,prefixUrl:args.length>2?args[2]:undefined,controls:args.length>3?args[3]:undefined,overlays:args.length>4?args[4]:undefined};}
+if(options.config){$.extend(true,options,options.config);delete options.config;}
+const drawerOptionList=['useCanvas',];options.drawerOptions=Object.assign({},drawerOptionList.reduce((drawerOptions,option)=>{drawerOptions[option]=options[option];delete options[option];return drawerOptions;},{}),options.drawerOptions);$.extend(true,this,{id:options.id,hash:options.hash||nextHash++,viewer:null,initialPage:0,element:null,container:null,canvas:null,overlays:[],overlaysContainer:null,previousDisplayValuesOfBodyChildren:[],customControls:[],source:null,drawer:null,drawerCandidates:null,world:null,viewport:null,navigator:null,collectionViewport:null,collectionDrawer:null,navImages:null,buttonGroup:null,profiler:null},$.DEFAULT_SETTINGS,options);if(typeof(this.hash)==="undefined"){throw new Error("A hash must be defined, either by specifying options.id or options.hash.");}
+if(typeof(THIS[this.hash])!=="undefined"){$.console.warn("Hash "+this.hash+" has already been used.");}
+THIS[this.hash]={fsBoundsDelta:new $.Point(1,1),prevContainerSize:null,animating:false,forceRedraw:false,needsResize:false,forceResize:false,mouseInside:false,group:null,zooming:false,zoomFactor:null,lastZoomTime:null,fullPage:false,onfullscreenchange:null,lastClickTime:null,draggingToZoom:false,};this._sequenceIndex=0;this._firstOpen=true;this._updateRequestId=null;this._loadQueue=[];this.currentOverlays=[];this._updatePixelDensityRatioBind=null;this._lastScrollTime=$.now();this._fullyLoaded=false;this._navActionFrames={};this._navActionVirtuallyHeld={};this._minNavActionFrames=10;this._activeActions={panUp:false,panDown:false,panLeft:false,panRight:false,zoomIn:false,zoomOut:false};$.EventSource.call(this);this.addHandler('open-failed',function(event){const msg=$.getString("Errors.OpenFailed",event.eventSource,event.message);_this._showMessage(msg);});$.ControlDock.call(this,options);if(this.xmlPath){this.tileSources=[this.xmlPath];}
+this.element=this.element||document.getElementById(this.id);this.canvas=$.makeNeutralElement("div");this.canvas.className="openseadragon-canvas";if(!document.querySelector('style[data-openseadragon-mobile-css]')){const style=document.createElement('style');style.setAttribute('data-openseadragon-mobile-css','true');style.textContent='@media (hover: none) {'+'    .openseadragon-canvas:focus {'+'        outline: none !important;'+'    }'+'}';document.head.appendChild(style);}
+(function(style){style.width="100%";style.height="100%";style.overflow="hidden";style.position="absolute";style.top="0px";style.left="0px";}(this.canvas.style));$.setElementTouchActionNone(this.canvas);if(options.tabIndex!==""){this.canvas.tabIndex=(options.tabIndex===undefined?0:options.tabIndex);}
+this.container.className="openseadragon-container";(function(style){style.width="100%";style.height="100%";style.position="relative";style.overflow="hidden";style.left="0px";style.top="0px";style.textAlign="left";}(this.container.style));$.setElementTouchActionNone(this.container);this.container.insertBefore(this.canvas,this.container.firstChild);this.element.appendChild(this.container);this.bodyWidth=document.body.style.width;this.bodyHeight=document.body.style.height;this.bodyOverflow=document.body.style.overflow;this.docOverflow=document.documentElement.style.overflow;this.innerTracker=new $.MouseTracker({userData:'Viewer.innerTracker',element:this.canvas,startDisabled:!this.mouseNavEnabled,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,dblClickTimeThreshold:this.dblClickTimeThreshold,dblClickDistThreshold:this.dblClickDistThreshold,contextMenuHandler:$.delegate(this,onCanvasContextMenu),keyDownHandler:$.delegate(this,onCanvasKeyDown),keyUpHandler:$.delegate(this,onCanvasKeyUp),keyHandler:$.delegate(this,onCanvasKeyPress),clickHandler:$.delegate(this,onCanvasClick),dblClickHandler:$.delegate(this,onCanvasDblClick),dragHandler:$.delegate(this,onCanvasDrag),dragEndHandler:$.delegate(this,onCanvasDragEnd),enterHandler:$.delegate(this,onCanvasEnter),leaveHandler:$.delegate(this,onCanvasLeave),pressHandler:$.delegate(this,onCanvasPress),releaseHandler:$.delegate(this,onCanvasRelease),nonPrimaryPressHandler:$.delegate(this,onCanvasNonPrimaryPress),nonPrimaryReleaseHandler:$.delegate(this,onCanvasNonPrimaryRelease),scrollHandler:$.delegate(this,onCanvasScroll),pinchHandler:$.delegate(this,onCanvasPinch),focusHandler:$.delegate(this,onCanvasFocus),blurHandler:$.delegate(this,onCanvasBlur),});this.outerTracker=new $.MouseTracker({userData:'Viewer.outerTracker',element:this.container,startDisabled:!this.mouseNavEnabled,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,dblClickTimeThreshold:this.dblClickTimeThreshold,dblClickDistThreshold:this.dblClickDistThreshold,enterHandler:$.delegate(this,onContainerEnter),leaveHandler:$.delegate(this,onContainerLeave)});if(this.toolbar){this.toolbar=new $.ControlDock({element:this.toolbar});}
+this.bindStandardControls();THIS[this.hash].prevContainerSize=_getSafeElemSize(this.container);if(window.ResizeObserver){this._autoResizePolling=false;this._resizeObserver=new ResizeObserver(function(){THIS[_this.hash].needsResize=true;});this._resizeObserver.observe(this.container,{});}else{this._autoResizePolling=true;}
+this.world=new $.World({viewer:this});this.world.addHandler('add-item',function(event){_this.source=_this.world.getItemAt(0).source;THIS[_this.hash].forceRedraw=true;if(!_this._updateRequestId){_this._updateRequestId=scheduleUpdate(_this,updateMulti);}
+const tiledImage=event.item;const fullyLoadedHandler=function(){const newFullyLoaded=_this._areAllFullyLoaded();if(newFullyLoaded!==_this._fullyLoaded){_this._fullyLoaded=newFullyLoaded;_this.raiseEvent('fully-loaded-change',{fullyLoaded:newFullyLoaded});}};tiledImage._fullyLoadedHandlerForViewer=fullyLoadedHandler;tiledImage.addHandler('fully-loaded-change',fullyLoadedHandler);});this.world.addHandler('remove-item',function(event){const tiledImage=event.item;if(tiledImage._fullyLoadedHandlerForViewer){tiledImage.removeHandler('fully-loaded-change',tiledImage._fullyLoadedHandlerForViewer);delete tiledImage._fullyLoadedHandlerForViewer;}
+if(_this.world.getItemCount()){_this.source=_this.world.getItemAt(0).source;}else{_this.source=null;}
+THIS[_this.hash].forceRedraw=true;});this.world.addHandler('metrics-change',function(event){if(_this.viewport){_this.viewport._setContentBounds(_this.world.getHomeBounds(),_this.world.getContentFactor());}});this.world.addHandler('item-index-change',function(event){_this.source=_this.world.getItemAt(0).source;});this.viewport=new $.Viewport({containerSize:THIS[this.hash].prevContainerSize,springStiffness:this.springStiffness,animationTime:this.animationTime,minZoomImageRatio:this.minZoomImageRatio,maxZoomPixelRatio:this.maxZoomPixelRatio,visibilityRatio:this.visibilityRatio,wrapHorizontal:this.wrapHorizontal,wrapVertical:this.wrapVertical,defaultZoomLevel:this.defaultZoomLevel,minZoomLevel:this.minZoomLevel,maxZoomLevel:this.maxZoomLevel,viewer:this,degrees:this.degrees,flipped:this.flipped,overlayPreserveContentDirection:this.overlayPreserveContentDirection,navigatorRotate:this.navigatorRotate,homeFillsViewer:this.homeFillsViewer,margins:this.viewportMargins,silenceMultiImageWarnings:this.silenceMultiImageWarnings});this.viewport._setContentBounds(this.world.getHomeBounds(),this.world.getContentFactor());this.imageLoader=new $.ImageLoader({jobLimit:this.imageLoaderLimit,timeout:options.timeout,tileRetryMax:this.tileRetryMax,tileRetryDelay:this.tileRetryDelay});this.tileCache=new $.TileCache({viewer:this,maxImageCacheCount:this.maxImageCacheCount});if(Object.prototype.hasOwnProperty.call(this.drawerOptions,'useCanvas')){$.console.error('useCanvas is deprecated, use the "drawer" option to indicate preferred drawer(s)');if(!this.drawerOptions.useCanvas){this.drawer=$.HTMLDrawer;}
+delete this.drawerOptions.useCanvas;}
+let drawerCandidates=Array.isArray(this.drawer)?this.drawer:[this.drawer];if(drawerCandidates.length===0){drawerCandidates=[$.DEFAULT_SETTINGS.drawer].flat();$.console.warn('No valid drawers were selected. Using the default value.');}
+drawerCandidates=drawerCandidates.flatMap(function(c){return c==='auto'?getAutoDrawerCandidates():[c];});drawerCandidates=drawerCandidates.filter(function(c,i,arr){return arr.indexOf(c)===i;});this.drawerCandidates=drawerCandidates.map(getDrawerTypeString).filter(Boolean);this.drawer=null;for(const drawerCandidate of drawerCandidates){const success=this.requestDrawer(drawerCandidate,{mainDrawer:true,redrawImmediately:false});if(success){break;}}
+if(!this.drawer){$.console.error('No drawer could be created!');throw('Error with creating the selected drawer(s)');}
+this.drawer.setImageSmoothingEnabled(this.imageSmoothingEnabled);this.overlaysContainer=$.makeNeutralElement("div");this.canvas.appendChild(this.overlaysContainer);if(!this.drawer.canRotate()){if(this.rotateLeft){i=this.buttonGroup.buttons.indexOf(this.rotateLeft);this.buttonGroup.buttons.splice(i,1);this.buttonGroup.element.removeChild(this.rotateLeft.element);}
+if(this.rotateRight){i=this.buttonGroup.buttons.indexOf(this.rotateRight);this.buttonGroup.buttons.splice(i,1);this.buttonGroup.element.removeChild(this.rotateRight.element);}}
+this._addUpdatePixelDensityRatioEvent();if('navigatorAutoResize'in this){$.console.warn('navigatorAutoResize is deprecated, this value will be ignored.');}
+if(this.showNavigator){this.navigator=new $.Navigator({element:this.navigatorElement,id:this.navigatorId,position:this.navigatorPosition,sizeRatio:this.navigatorSizeRatio,maintainSizeRatio:this.navigatorMaintainSizeRatio,top:this.navigatorTop,left:this.navigatorLeft,width:this.navigatorWidth,height:this.navigatorHeight,autoFade:this.navigatorAutoFade,prefixUrl:this.prefixUrl,viewer:this,navigatorRotate:this.navigatorRotate,background:this.navigatorBackground,opacity:this.navigatorOpacity,borderColor:this.navigatorBorderColor,displayRegionColor:this.navigatorDisplayRegionColor,crossOriginPolicy:this.crossOriginPolicy,animationTime:this.animationTime,drawer:this.drawer.getType(),drawerOptions:this.drawerOptions,loadTilesWithAjax:this.loadTilesWithAjax,ajaxHeaders:this.ajaxHeaders,ajaxWithCredentials:this.ajaxWithCredentials,});}
+if(this.sequenceMode){this.bindSequenceControls();}
+if(this.tileSources){this.open(this.tileSources);}
+for(i=0;i<this.customControls.length;i++){this.addControl(this.customControls[i].id,{anchor:this.customControls[i].anchor});}
+$.requestAnimationFrame(function(){beginControlsAutoHide(_this);});$._viewers.set(this.element,this);};$.extend($.Viewer.prototype,$.EventSource.prototype,$.ControlDock.prototype,{isOpen:function(){return!!this.world.getItemCount();},_areAllFullyLoaded:function(){const count=this.world.getItemCount();for(let i=0;i<count;i++){let tiledImage=this.world.getItemAt(i);if(!tiledImage.getFullyLoaded()){return false;}}
+return true;},getFullyLoaded:function(){return this._fullyLoaded;},whenFullyLoaded:function(callback){if(this.getFullyLoaded()){setTimeout(callback,1);}else{this.addOnceHandler('fully-loaded-change',function(){callback();});}},openDzi:function(dzi){$.console.error("[Viewer.openDzi] this function is deprecated; use Viewer.open() instead.");return this.open(dzi);},openTileSource:function(tileSource){$.console.error("[Viewer.openTileSource] this function is deprecated; use Viewer.open() instead.");return this.open(tileSource);},get buttons(){$.console.warn('Viewer.buttons is deprecated; Please use Viewer.buttonGroup');return this.buttonGroup;},open:function(tileSources,initialPage=undefined){const _this=this;this.close();if(!tileSources){return this;}
+if(this.sequenceMode&&$.isArray(tileSources)){if(this.referenceStrip){this.referenceStrip.destroy();this.referenceStrip=null;}
+if(typeof initialPage!=='undefined'&&!isNaN(initialPage)){this.initialPage=initialPage;}
+this.tileSources=tileSources;this._sequenceIndex=Math.max(0,Math.min(this.tileSources.length-1,this.initialPage));if(this.tileSources.length){this.open(this.tileSources[this._sequenceIndex]);if(this.showReferenceStrip){this.addReferenceStrip();}}
+this._updateSequenceButtons(this._sequenceIndex);return this;}
+if(!$.isArray(tileSources)){tileSources=[tileSources];}
+if(!tileSources.length){return this;}
+this._opening=true;const expected=tileSources.length;let successes=0;let failures=0;let failEvent;const checkCompletion=function(){if(successes+failures===expected){if(successes){if(_this._firstOpen||!_this.preserveViewport){_this.viewport.goHome(true);_this.viewport.update();}
+_this._firstOpen=false;let source=tileSources[0];if(source.tileSource){source=source.tileSource;}
+if(_this.overlays&&!_this.preserveOverlays){for(let i=0;i<_this.overlays.length;i++){_this.currentOverlays[i]=getOverlayObject(_this,_this.overlays[i]);}}
+_this._drawOverlays();_this._opening=false;_this.raiseEvent('open',{source:source});}else{_this._opening=false;_this.raiseEvent('open-failed',failEvent);}}};const doOne=function(index,options){if(!$.isPlainObject(options)||!options.tileSource){options={tileSource:options};}
+if(options.index!==undefined){$.console.warn('[Viewer.open] Ignoring user-supplied index; preserving order by setting index to '+index+'. If you need to set indexes, use addTiledImage instead.');delete options.index;options.index=index;}
+if(options.collectionImmediately===undefined){options.collectionImmediately=true;}
+const originalSuccess=options.success;options.success=function(event){successes++;if(options.tileSource.overlays){for(let i=0;i<options.tileSource.overlays.length;i++){_this.addOverlay(options.tileSource.overlays[i]);}}
+if(originalSuccess){originalSuccess(event);}
+checkCompletion();};const originalError=options.error;options.error=function(event){failures++;if(!failEvent){failEvent=event;}
+if(originalError){originalError(event);}
+checkCompletion();};_this.addTiledImage(options);};for(let i=0;i<tileSources.length;i++){doOne(i,tileSources[i]);}
+return this;},requestInvalidate:function(restoreTiles=true){if(!THIS[this.hash]||!this._drawerList){return $.Promise.resolve();}
+const tStamp=$.now();return $.Promise.all(this._drawerList.map(drawer=>drawer.viewer.world.requestInvalidate(restoreTiles,tStamp)));},close:function(){if(!THIS[this.hash]){return this;}
+this._opening=false;if(this.navigator){this.navigator.close();}
+if(!this.preserveOverlays){this.clearOverlays();this.overlaysContainer.innerHTML="";}
+THIS[this.hash].animating=false;this.world.removeAll();this.tileCache.clear();this.imageLoader.clear();this.raiseEvent('close');return this;},destroy:function(){if(!THIS[this.hash]){return;}
+this.raiseEvent('before-destroy');this._removeUpdatePixelDensityRatioEvent();this.close();this.clearOverlays();this.overlaysContainer.innerHTML="";if(this._resizeObserver){this._resizeObserver.disconnect();}
+if(this.referenceStrip){this.referenceStrip.destroy();this.referenceStrip=null;}
+if(this._updateRequestId!==null){$.cancelAnimationFrame(this._updateRequestId);this._updateRequestId=null;}
+if(this.drawer){this.drawer.destroy();}
+if(this.navigator){this.navigator.destroy();THIS[this.navigator.hash]=null;delete THIS[this.navigator.hash];this.navigator=null;}
+if(this.buttonGroup){this.buttonGroup.destroy();}else if(this.customButtons){while(this.customButtons.length){this.customButtons.pop().destroy();}}
+if(this.paging){this.paging.destroy();}
+if(this.container&&this.container.parentNode===this.element){this.element.removeChild(this.container);}
+this.container.onsubmit=null;this.clearControls();if(this.innerTracker){this.innerTracker.destroy();}
+if(this.outerTracker){this.outerTracker.destroy();}
+THIS[this.hash]=null;delete THIS[this.hash];this.canvas=null;this.container=null;$._viewers.delete(this.element);this.element=null;this.raiseEvent('destroy');this.removeAllHandlers();},isDestroyed(){return!THIS[this.hash];},requestDrawer(drawerCandidate,options){const defaultOpts={mainDrawer:true,redrawImmediately:true,drawerOptions:null};options=$.extend(true,defaultOpts,options);const mainDrawer=options.mainDrawer;const redrawImmediately=options.redrawImmediately;const drawerOptions=options.drawerOptions;const oldDrawer=this.drawer;let Drawer=null;if(drawerCandidate&&drawerCandidate.prototype instanceof $.DrawerBase){Drawer=drawerCandidate;drawerCandidate='custom';}else if(typeof drawerCandidate==="string"){Drawer=$.determineDrawer(drawerCandidate);}
+if(!Drawer){$.console.warn('Unsupported drawer %s! Drawer must be an existing string type, or a class that extends OpenSeadragon.DrawerBase.',drawerCandidate);}
+let supported=false;if(Drawer){try{supported=Drawer.isSupported();}catch(e){$.console.warn('Error in %s isSupported(); treating this drawer as unsupported:',drawerCandidate,e&&e.message?e.message:e);}}
+if(supported){if(oldDrawer&&mainDrawer){oldDrawer.destroy();}
+const newDrawer=new Drawer({viewer:this,viewport:this.viewport,element:this.canvas,debugGridColor:this.debugGridColor,options:drawerOptions||this.drawerOptions[drawerCandidate],});if(mainDrawer){this.drawer=newDrawer;if(redrawImmediately){this.forceRedraw();}}
+return newDrawer;}
+return false;},isMouseNavEnabled:function(){return this.innerTracker.tracking;},setMouseNavEnabled:function(enabled){this.innerTracker.setTracking(enabled);this.outerTracker.setTracking(enabled);this.raiseEvent('mouse-enabled',{enabled:enabled});return this;},isKeyboardNavEnabled:function(){return this.keyboardNavEnabled;},setKeyboardNavEnabled:function(enabled){this.keyboardNavEnabled=enabled;this.raiseEvent('keyboard-enabled',{enabled:enabled});return this;},areControlsEnabled:function(){let enabled=this.controls.length;for(let i=0;i<this.controls.length;i++){enabled=enabled&&this.controls[i].isVisible();}
+return enabled;},setControlsEnabled:function(enabled){if(enabled){abortControlsAutoHide(this);}else{beginControlsAutoHide(this);}
+this.raiseEvent('controls-enabled',{enabled:enabled});return this;},setDebugMode:function(debugMode){for(let i=0;i<this.world.getItemCount();i++){this.world.getItemAt(i).debugMode=debugMode;}
+this.debugMode=debugMode;this.forceRedraw();},setAjaxHeaders:function(ajaxHeaders,propagate){if(ajaxHeaders===null){ajaxHeaders={};}
+if(!$.isPlainObject(ajaxHeaders)){$.console.error('[Viewer.setAjaxHeaders] Ignoring invalid headers, must be a plain object');return;}
+if(propagate===undefined){propagate=true;}
+this.ajaxHeaders=ajaxHeaders;if(propagate){for(let i=0;i<this.world.getItemCount();i++){this.world.getItemAt(i)._updateAjaxHeaders(true);}
+if(this.navigator){this.navigator.setAjaxHeaders(this.ajaxHeaders,true);}
+if(this.referenceStrip&&this.referenceStrip.miniViewers){for(const key in this.referenceStrip.miniViewers){this.referenceStrip.miniViewers[key].setAjaxHeaders(this.ajaxHeaders,true);}}}},addButton:function(button){this.buttonGroup.addButton(button);},isFullPage:function(){return THIS[this.hash]&&THIS[this.hash].fullPage;},setFullPage:function(fullPage){const body=document.body;const bodyStyle=body.style;const docStyle=document.documentElement.style;const _this=this;let nodes;if(fullPage===this.isFullPage()){return this;}
+const fullPageEventArgs={fullPage:fullPage,preventDefaultAction:false};this.raiseEvent('pre-full-page',fullPageEventArgs);if(fullPageEventArgs.preventDefaultAction){return this;}
+if(fullPage&&this.element){this.elementSize=$.getElementSize(this.element);this.pageScroll=$.getPageScroll();this.elementMargin=this.element.style.margin;this.element.style.margin="0";this.elementPadding=this.element.style.padding;this.element.style.padding="0";this.bodyMargin=bodyStyle.margin;this.docMargin=docStyle.margin;bodyStyle.margin="0";docStyle.margin="0";this.bodyPadding=bodyStyle.padding;this.docPadding=docStyle.padding;bodyStyle.padding="0";docStyle.padding="0";this.bodyWidth=bodyStyle.width;this.docWidth=docStyle.width;bodyStyle.width="100%";docStyle.width="100%";this.bodyHeight=bodyStyle.height;this.docHeight=docStyle.height;bodyStyle.height="100%";docStyle.height="100%";this.bodyDisplay=bodyStyle.display;bodyStyle.display="block";this.previousDisplayValuesOfBodyChildren=[];THIS[this.hash].prevElementParent=this.element.parentNode;THIS[this.hash].prevNextSibling=this.element.nextSibling;THIS[this.hash].prevElementWidth=this.element.style.width;THIS[this.hash].prevElementHeight=this.element.style.height;nodes=body.children.length;for(let i=0;i<nodes;i++){const element=body.children[i];if(element===this.element){continue;}
+this.previousDisplayValuesOfBodyChildren.push({element,display:element.style.display});element.style.display='none';}
+if(this.toolbar&&this.toolbar.element){this.toolbar.parentNode=this.toolbar.element.parentNode;this.toolbar.nextSibling=this.toolbar.element.nextSibling;body.appendChild(this.toolbar.element);$.addClass(this.toolbar.element,'fullpage');}
+$.addClass(this.element,'fullpage');body.appendChild(this.element);this.element.style.height='100vh';this.element.style.width='100vw';if(this.toolbar&&this.toolbar.element){this.element.style.height=($.getElementSize(this.element).y-$.getElementSize(this.toolbar.element).y)+'px';}
+THIS[this.hash].fullPage=true;$.delegate(this,onContainerEnter)({});}else{this.element.style.margin=this.elementMargin;this.element.style.padding=this.elementPadding;bodyStyle.margin=this.bodyMargin;docStyle.margin=this.docMargin;bodyStyle.padding=this.bodyPadding;docStyle.padding=this.docPadding;bodyStyle.width=this.bodyWidth;docStyle.width=this.docWidth;bodyStyle.height=this.bodyHeight;docStyle.height=this.docHeight;bodyStyle.display=this.bodyDisplay;body.removeChild(this.element);nodes=this.previousDisplayValuesOfBodyChildren.length;for(let i=0;i<nodes;i++){const{element,display}=this.previousDisplayValuesOfBodyChildren[i];element.style.display=display;}
+$.removeClass(this.element,'fullpage');THIS[this.hash].prevElementParent.insertBefore(this.element,THIS[this.hash].prevNextSibling);if(this.toolbar&&this.toolbar.element){body.removeChild(this.toolbar.element);$.removeClass(this.toolbar.element,'fullpage');this.toolbar.parentNode.insertBefore(this.toolbar.element,this.toolbar.nextSibling);delete this.toolbar.parentNode;delete this.toolbar.nextSibling;}
+this.element.style.width=THIS[this.hash].prevElementWidth;this.element.style.height=THIS[this.hash].prevElementHeight;let restoreScrollCounter=0;const restoreScroll=function(){$.setPageScroll(_this.pageScroll);const pageScroll=$.getPageScroll();restoreScrollCounter++;if(restoreScrollCounter<10&&(pageScroll.x!==_this.pageScroll.x||pageScroll.y!==_this.pageScroll.y)){$.requestAnimationFrame(restoreScroll);}};$.requestAnimationFrame(restoreScroll);THIS[this.hash].fullPage=false;$.delegate(this,onContainerLeave)({});}
+if(this.navigator&&this.viewport){this.navigator.update(this.viewport);}
+this.raiseEvent('full-page',{fullPage:fullPage});return this;},setFullScreen:function(fullScreen){const _this=this;if(!$.supportsFullScreen){return this.setFullPage(fullScreen);}
+if($.isFullScreen()===fullScreen){return this;}
+const fullScreenEventArgs={fullScreen:fullScreen,preventDefaultAction:false};this.raiseEvent('pre-full-screen',fullScreenEventArgs);if(fullScreenEventArgs.preventDefaultAction){return this;}
+if(fullScreen){this.setFullPage(true);if(!this.isFullPage()){return this;}
+this.fullPageStyleWidth=this.element.style.width;this.fullPageStyleHeight=this.element.style.height;this.element.style.width='100%';this.element.style.height='100%';const onFullScreenChange=function(){if(!THIS[_this.hash]){$.removeEvent(document,$.fullScreenEventName,onFullScreenChange);$.removeEvent(document,$.fullScreenErrorEventName,onFullScreenChange);return;}
+const isFullScreen=$.isFullScreen();if(!isFullScreen){$.removeEvent(document,$.fullScreenEventName,onFullScreenChange);$.removeEvent(document,$.fullScreenErrorEventName,onFullScreenChange);_this.setFullPage(false);if(_this.isFullPage()){_this.element.style.width=_this.fullPageStyleWidth;_this.element.style.height=_this.fullPageStyleHeight;}}
+if(_this.navigator&&_this.viewport){setTimeout(function(){_this.navigator.update(_this.viewport);});}
+_this.raiseEvent('full-screen',{fullScreen:isFullScreen});};$.addEvent(document,$.fullScreenEventName,onFullScreenChange);$.addEvent(document,$.fullScreenErrorEventName,onFullScreenChange);$.requestFullScreen(document.body);}else{$.exitFullScreen();}
+return this;},isVisible:function(){return this.container.style.visibility!=="hidden";},isFullScreen:function(){return $.isFullScreen()&&this.isFullPage();},setVisible:function(visible){this.container.style.visibility=visible?"":"hidden";this.raiseEvent('visible',{visible:visible});return this;},addTiledImage:function(options){$.console.assert(options,"[Viewer.addTiledImage] options is required");$.console.assert(options.tileSource,"[Viewer.addTiledImage] options.tileSource is required");$.console.assert(!options.replace||(options.index>-1&&options.index<this.world.getItemCount()),"[Viewer.addTiledImage] if options.replace is used, options.index must be a valid index in Viewer.world");this._hideMessage();const originalSuccess=options.success;const originalError=options.error;if(options.replace){options.replaceItem=this.world.getItemAt(options.index);}
+const myQueueItem={options:options};this._loadQueue.push(myQueueItem);const refreshWorld=theItem=>{if(this.collectionMode){this.world.arrange({immediately:theItem.options.collectionImmediately,rows:this.collectionRows,columns:this.collectionColumns,layout:this.collectionLayout,tileSize:this.collectionTileSize,tileMargin:this.collectionTileMargin});this.world.setAutoRefigureSizes(true);}};const raiseAddItemFailed=(event)=>{for(let i=0;i<this._loadQueue.length;i++){if(this._loadQueue[i]===myQueueItem){this._loadQueue.splice(i,1);break;}}
+if(this._loadQueue.length===0){refreshWorld(myQueueItem);}
+this.raiseEvent('add-item-failed',event);if(originalError){originalError(event);}};if($.isArray(options.tileSource)){setTimeout(function(){raiseAddItemFailed({message:"[Viewer.addTiledImage] Sequences can not be added; add them one at a time instead.",source:options.tileSource,options:options});});return;}
+delete myQueueItem.tiledImage;options.success=event=>{myQueueItem.tiledImage=event.item;myQueueItem.originalSuccess=originalSuccess;let queueItem,optionsClone;while(this._loadQueue.length){queueItem=this._loadQueue[0];const tiledImage=queueItem.tiledImage;if(!tiledImage){break;}
+this._loadQueue.splice(0,1);const tileSource=tiledImage.source;if(queueItem.options.replace){const replaced=queueItem.options.replaceItem;const newIndex=this.world.getIndexOfItem(replaced);if(newIndex!==-1){queueItem.options.index=newIndex;}
+if(!replaced._zombieCache&&replaced.source.equals(tileSource)){replaced.allowZombieCache(true);}
+this.world.removeItem(replaced);}
+if(this.collectionMode){this.world.setAutoRefigureSizes(false);}
+if(this.navigator){optionsClone=$.extend({},queueItem.options,{replace:false,originalTiledImage:tiledImage,tileSource:tileSource});this.navigator.addTiledImage(optionsClone);}
+this.world.addItem(tiledImage,{index:queueItem.options.index});if(this._loadQueue.length===0){refreshWorld(queueItem);}
+if(this.world.getItemCount()===1&&!this.preserveViewport){this.viewport.goHome(true);}
+if(queueItem.originalSuccess){queueItem.originalSuccess({item:tiledImage});}
+if(this.drawer){this.drawer.tiledImageCreated(tiledImage);}}};options.error=raiseAddItemFailed;this.instantiateTiledImageClass(options);},instantiateTiledImageClass:function(options){return this.instantiateTileSourceClass(options).then(event=>{const tiledImage=new $.TiledImage({viewer:this,source:event.source,viewport:this.viewport,drawer:this.drawer,tileCache:this.tileCache,imageLoader:this.imageLoader,x:options.x,y:options.y,width:options.width,height:options.height,fitBounds:options.fitBounds,fitBoundsPlacement:options.fitBoundsPlacement,clip:options.clip,placeholderFillStyle:options.placeholderFillStyle,opacity:options.opacity,preload:options.preload,degrees:options.degrees,flipped:options.flipped,compositeOperation:options.compositeOperation,springStiffness:this.springStiffness,animationTime:this.animationTime,minZoomImageRatio:this.minZoomImageRatio,wrapHorizontal:this.wrapHorizontal,wrapVertical:this.wrapVertical,maxTilesPerFrame:this.maxTilesPerFrame,loadDestinationTilesOnAnimation:this.loadDestinationTilesOnAnimation,immediateRender:this.immediateRender,blendTime:this.blendTime,alwaysBlend:this.alwaysBlend,minPixelRatio:this.minPixelRatio,smoothTileEdgesMinZoom:this.smoothTileEdgesMinZoom,iOSDevice:this.iOSDevice,crossOriginPolicy:options.crossOriginPolicy,ajaxWithCredentials:options.ajaxWithCredentials,loadTilesWithAjax:options.loadTilesWithAjax,ajaxHeaders:options.ajaxHeaders,debugMode:this.debugMode,subPixelRoundingForTransparency:this.subPixelRoundingForTransparency,callTileLoadedWithCachedData:this.callTileLoadedWithCachedData,originalDataType:options.originalDataType});options.success({item:tiledImage});return tiledImage;}).catch(e=>{if(options.error){options.error(e);return e;}
+throw e;});},instantiateTileSourceClass(options){return new $.Promise((resolve,reject)=>{if(options.placeholderFillStyle===undefined){options.placeholderFillStyle=this.placeholderFillStyle;}
+if(options.opacity===undefined){options.opacity=this.opacity;}
+if(options.preload===undefined){options.preload=this.preload;}
+if(options.compositeOperation===undefined){options.compositeOperation=this.compositeOperation;}
+if(options.crossOriginPolicy===undefined){options.crossOriginPolicy=options.tileSource.crossOriginPolicy!==undefined?options.tileSource.crossOriginPolicy:this.crossOriginPolicy;}
+if(options.ajaxWithCredentials===undefined){options.ajaxWithCredentials=this.ajaxWithCredentials;}
+if(options.loadTilesWithAjax===undefined){options.loadTilesWithAjax=this.loadTilesWithAjax;}
+if(!$.isPlainObject(options.ajaxHeaders)){options.ajaxHeaders={};}
+let tileSource=options.tileSource;if($.type(tileSource)==='string'){if(tileSource.match(/^\s*<.*>\s*$/)){tileSource=$.parseXml(tileSource);}else if(tileSource.match(/^\s*[{[].*[}\]]\s*$/)){try{tileSource=$.parseJSON(tileSource);}catch(e){}}}
+function waitUntilReady(tileSource,originalTileSource){if(tileSource.ready){resolve({source:tileSource});}else{tileSource.addHandler('ready',function(event){resolve({source:event.tileSource});});tileSource.addHandler('open-failed',function(event){reject({message:event.message,source:originalTileSource});});}}
+setTimeout(()=>{if($.type(tileSource)==='string'){tileSource=new $.TileSource({url:tileSource,crossOriginPolicy:options.crossOriginPolicy!==undefined?options.crossOriginPolicy:this.crossOriginPolicy,ajaxWithCredentials:this.ajaxWithCredentials,ajaxHeaders:$.extend({},this.ajaxHeaders,options.ajaxHeaders),splitHashDataForPost:this.splitHashDataForPost,});waitUntilReady(tileSource,tileSource);}else if($.isPlainObject(tileSource)||tileSource.nodeType){if(tileSource.crossOriginPolicy===undefined&&(options.crossOriginPolicy!==undefined||this.crossOriginPolicy!==undefined)){tileSource.crossOriginPolicy=options.crossOriginPolicy!==undefined?options.crossOriginPolicy:this.crossOriginPolicy;}
+if(tileSource.ajaxWithCredentials===undefined){tileSource.ajaxWithCredentials=this.ajaxWithCredentials;}
+if($.isFunction(tileSource.getTileUrl)){const customTileSource=new $.TileSource(tileSource);customTileSource.getTileUrl=tileSource.getTileUrl;tileSource.ready=false;waitUntilReady(customTileSource,tileSource);}else{const $TileSource=$.TileSource.determineType(this,tileSource,null);if(!$TileSource){reject({message:"Unable to load TileSource",source:tileSource,error:true});return;}
+const tileOptions=$TileSource.prototype.configure.apply(this,[tileSource]);tileOptions.ready=false;waitUntilReady(new $TileSource(tileOptions),tileSource);}}else{waitUntilReady(tileSource,tileSource);}});});},addSimpleImage:function(options){$.console.assert(options,"[Viewer.addSimpleImage] options is required");$.console.assert(options.url,"[Viewer.addSimpleImage] options.url is required");const opts=$.extend({},options,{tileSource:{type:'image',url:options.url}});delete opts.url;this.addTiledImage(opts);},addLayer:function(options){const _this=this;$.console.error("[Viewer.addLayer] this function is deprecated; use Viewer.addTiledImage() instead.");const optionsClone=$.extend({},options,{success:function(event){_this.raiseEvent("add-layer",{options:options,drawer:event.item});},error:function(event){_this.raiseEvent("add-layer-failed",event);}});this.addTiledImage(optionsClone);return this;},getLayerAtLevel:function(level){$.console.error("[Viewer.getLayerAtLevel] this function is deprecated; use World.getItemAt() instead.");return this.world.getItemAt(level);},getLevelOfLayer:function(drawer){$.console.error("[Viewer.getLevelOfLayer] this function is deprecated; use World.getIndexOfItem() instead.");return this.world.getIndexOfItem(drawer);},getLayersCount:function(){$.console.error("[Viewer.getLayersCount] this function is deprecated; use World.getItemCount() instead.");return this.world.getItemCount();},setLayerLevel:function(drawer,level){$.console.error("[Viewer.setLayerLevel] this function is deprecated; use World.setItemIndex() instead.");return this.world.setItemIndex(drawer,level);},removeLayer:function(drawer){$.console.error("[Viewer.removeLayer] this function is deprecated; use World.removeItem() instead.");return this.world.removeItem(drawer);},forceRedraw:function(){THIS[this.hash].forceRedraw=true;return this;},forceResize:function(){THIS[this.hash].needsResize=true;THIS[this.hash].forceResize=true;},bindSequenceControls:function(){const onFocusHandler=$.delegate(this,onFocus);const onBlurHandler=$.delegate(this,onBlur);const onNextHandler=$.delegate(this,this.goToNextPage);const onPreviousHandler=$.delegate(this,this.goToPreviousPage);const navImages=this.navImages;let useGroup=true;if(this.showSequenceControl){if(this.previousButton||this.nextButton){useGroup=false;}
+this.previousButton=new $.Button({element:this.previousButton?$.getElement(this.previousButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.PreviousPage"),srcRest:resolveUrl(this.prefixUrl,navImages.previous.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.previous.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.previous.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.previous.DOWN),onRelease:onPreviousHandler,onFocus:onFocusHandler,onBlur:onBlurHandler});this.nextButton=new $.Button({element:this.nextButton?$.getElement(this.nextButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.NextPage"),srcRest:resolveUrl(this.prefixUrl,navImages.next.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.next.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.next.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.next.DOWN),onRelease:onNextHandler,onFocus:onFocusHandler,onBlur:onBlurHandler});if(!this.navPrevNextWrap){this.previousButton.disable();}
+if(!this.tileSources||!this.tileSources.length){this.nextButton.disable();}
+if(useGroup){this.paging=new $.ButtonGroup({buttons:[this.previousButton,this.nextButton],clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold});this.pagingControl=this.paging.element;if(this.toolbar){this.toolbar.addControl(this.pagingControl,{anchor:$.ControlAnchor.BOTTOM_RIGHT});}else{this.addControl(this.pagingControl,{anchor:this.sequenceControlAnchor||$.ControlAnchor.TOP_LEFT});}}}
+return this;},bindStandardControls:function(){const beginZoomingInHandler=$.delegate(this,this.startZoomInAction);const endZoomingHandler=$.delegate(this,this.endZoomAction);const doSingleZoomInHandler=$.delegate(this,this.singleZoomInAction);const beginZoomingOutHandler=$.delegate(this,this.startZoomOutAction);const doSingleZoomOutHandler=$.delegate(this,this.singleZoomOutAction);const onHomeHandler=$.delegate(this,onHome);const onFullScreenHandler=$.delegate(this,onFullScreen);const onRotateLeftHandler=$.delegate(this,onRotateLeft);const onRotateRightHandler=$.delegate(this,onRotateRight);const onFlipHandler=$.delegate(this,onFlip);const onFocusHandler=$.delegate(this,onFocus);const onBlurHandler=$.delegate(this,onBlur);const navImages=this.navImages;const buttons=[];let useGroup=true;if(this.showNavigationControl){if(this.zoomInButton||this.zoomOutButton||this.homeButton||this.fullPageButton||this.rotateLeftButton||this.rotateRightButton||this.flipButton){useGroup=false;}
+if(this.showZoomControl){buttons.push(this.zoomInButton=new $.Button({element:this.zoomInButton?$.getElement(this.zoomInButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.ZoomIn"),srcRest:resolveUrl(this.prefixUrl,navImages.zoomIn.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.zoomIn.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.zoomIn.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.zoomIn.DOWN),onPress:beginZoomingInHandler,onRelease:endZoomingHandler,onClick:doSingleZoomInHandler,onEnter:beginZoomingInHandler,onExit:endZoomingHandler,onFocus:onFocusHandler,onBlur:onBlurHandler}));buttons.push(this.zoomOutButton=new $.Button({element:this.zoomOutButton?$.getElement(this.zoomOutButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.ZoomOut"),srcRest:resolveUrl(this.prefixUrl,navImages.zoomOut.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.zoomOut.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.zoomOut.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.zoomOut.DOWN),onPress:beginZoomingOutHandler,onRelease:endZoomingHandler,onClick:doSingleZoomOutHandler,onEnter:beginZoomingOutHandler,onExit:endZoomingHandler,onFocus:onFocusHandler,onBlur:onBlurHandler}));}
+if(this.showHomeControl){buttons.push(this.homeButton=new $.Button({element:this.homeButton?$.getElement(this.homeButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.Home"),srcRest:resolveUrl(this.prefixUrl,navImages.home.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.home.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.home.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.home.DOWN),onRelease:onHomeHandler,onFocus:onFocusHandler,onBlur:onBlurHandler}));}
+if(this.showFullPageControl){buttons.push(this.fullPageButton=new $.Button({element:this.fullPageButton?$.getElement(this.fullPageButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.FullPage"),srcRest:resolveUrl(this.prefixUrl,navImages.fullpage.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.fullpage.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.fullpage.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.fullpage.DOWN),onRelease:onFullScreenHandler,onFocus:onFocusHandler,onBlur:onBlurHandler}));}
+if(this.showRotationControl){buttons.push(this.rotateLeftButton=new $.Button({element:this.rotateLeftButton?$.getElement(this.rotateLeftButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.RotateLeft"),srcRest:resolveUrl(this.prefixUrl,navImages.rotateleft.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.rotateleft.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.rotateleft.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.rotateleft.DOWN),onRelease:onRotateLeftHandler,onFocus:onFocusHandler,onBlur:onBlurHandler}));buttons.push(this.rotateRightButton=new $.Button({element:this.rotateRightButton?$.getElement(this.rotateRightButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.RotateRight"),srcRest:resolveUrl(this.prefixUrl,navImages.rotateright.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.rotateright.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.rotateright.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.rotateright.DOWN),onRelease:onRotateRightHandler,onFocus:onFocusHandler,onBlur:onBlurHandler}));}
+if(this.showFlipControl){buttons.push(this.flipButton=new $.Button({element:this.flipButton?$.getElement(this.flipButton):null,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,tooltip:$.getString("Tooltips.Flip"),srcRest:resolveUrl(this.prefixUrl,navImages.flip.REST),srcGroup:resolveUrl(this.prefixUrl,navImages.flip.GROUP),srcHover:resolveUrl(this.prefixUrl,navImages.flip.HOVER),srcDown:resolveUrl(this.prefixUrl,navImages.flip.DOWN),onRelease:onFlipHandler,onFocus:onFocusHandler,onBlur:onBlurHandler}));}
+if(useGroup){this.buttonGroup=new $.ButtonGroup({buttons:buttons,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold});this.navControl=this.buttonGroup.element;this.addHandler('open',$.delegate(this,lightUp));if(this.toolbar){this.toolbar.addControl(this.navControl,{anchor:this.navigationControlAnchor||$.ControlAnchor.TOP_LEFT});}else{this.addControl(this.navControl,{anchor:this.navigationControlAnchor||$.ControlAnchor.TOP_LEFT});}}else{this.customButtons=buttons;}}
+return this;},currentPage:function(){return this._sequenceIndex;},goToPage:function(page){if(this.tileSources&&page>=0&&page<this.tileSources.length){this._sequenceIndex=page;this._updateSequenceButtons(page);this.open(this.tileSources[page]);if(this.referenceStrip){this.referenceStrip.setFocus(page);}
+this.raiseEvent('page',{page:page});}
+return this;},addOverlay:function(element,location,placement,onDraw){let options;if($.isPlainObject(element)){options=element;}else{options={element:element,location:location,placement:placement,onDraw:onDraw};}
+element=$.getElement(options.element);if(getOverlayIndex(this.currentOverlays,element)>=0){return this;}
+const overlay=getOverlayObject(this,options);this.currentOverlays.push(overlay);overlay.drawHTML(this.overlaysContainer,this.viewport);this.raiseEvent('add-overlay',{element:element,location:options.location,placement:options.placement});return this;},updateOverlay:function(element,location,placement){element=$.getElement(element);const i=getOverlayIndex(this.currentOverlays,element);if(i>=0){this.currentOverlays[i].update(location,placement);THIS[this.hash].forceRedraw=true;this.raiseEvent('update-overlay',{element:element,location:location,placement:placement});}
+return this;},removeOverlay:function(element){element=$.getElement(element);const i=getOverlayIndex(this.currentOverlays,element);if(i>=0){this.currentOverlays[i].destroy();this.currentOverlays.splice(i,1);THIS[this.hash].forceRedraw=true;this.raiseEvent('remove-overlay',{element:element});}
+return this;},clearOverlays:function(){while(this.currentOverlays.length>0){this.currentOverlays.pop().destroy();}
+THIS[this.hash].forceRedraw=true;this.raiseEvent('clear-overlay',{});return this;},getOverlayById:function(element){element=$.getElement(element);const i=getOverlayIndex(this.currentOverlays,element);if(i>=0){return this.currentOverlays[i];}else{return null;}},_registerDrawer:function(drawer){if(!this._drawerList){this._drawerList=[];}
+this._drawerList.push(drawer);},_unregisterDrawer:function(drawer){if(!this._drawerList){$.console.warn('Viewer._unregisterDrawer: cannot unregister on viewer that is not meant to share updates.');return;}
+this._drawerList.splice(this._drawerList.indexOf(drawer),1);},_updateSequenceButtons:function(page){if(this.nextButton){if(!this.tileSources||this.tileSources.length-1===page){if(!this.navPrevNextWrap){this.nextButton.disable();}}else{this.nextButton.enable();}}
+if(this.previousButton){if(page>0){this.previousButton.enable();}else{if(!this.navPrevNextWrap){this.previousButton.disable();}}}},_showMessage:function(message){this._hideMessage();const div=$.makeNeutralElement("div");div.appendChild(document.createTextNode(message));this.messageDiv=$.makeCenteredNode(div);$.addClass(this.messageDiv,"openseadragon-message");this.container.appendChild(this.messageDiv);},_hideMessage:function(){const div=this.messageDiv;if(div){div.parentNode.removeChild(div);delete this.messageDiv;}},gestureSettingsByDeviceType:function(type){switch(type){case'mouse':return this.gestureSettingsMouse;case'touch':return this.gestureSettingsTouch;case'pen':return this.gestureSettingsPen;default:return this.gestureSettingsUnknown;}},_drawOverlays:function(){const length=this.currentOverlays.length;for(let i=0;i<length;i++){this.currentOverlays[i].drawHTML(this.overlaysContainer,this.viewport);}},_cancelPendingImages:function(){this._loadQueue=[];},removeReferenceStrip:function(){this.showReferenceStrip=false;if(this.referenceStrip){this.referenceStrip.destroy();this.referenceStrip=null;}},addReferenceStrip:function(){this.showReferenceStrip=true;if(this.sequenceMode){if(this.referenceStrip){return;}
+if(this.tileSources.length&&this.tileSources.length>1){this.referenceStrip=new $.ReferenceStrip({id:this.referenceStripElement,position:this.referenceStripPosition,sizeRatio:this.referenceStripSizeRatio,scroll:this.referenceStripScroll,height:this.referenceStripHeight,width:this.referenceStripWidth,tileSources:this.tileSources,prefixUrl:this.prefixUrl,viewer:this});this.referenceStrip.setFocus(this._sequenceIndex);}}else{$.console.warn('Attempting to display a reference strip while "sequenceMode" is off.');}},_addUpdatePixelDensityRatioEvent:function(){this._updatePixelDensityRatioBind=this._updatePixelDensityRatio.bind(this);$.addEvent(window,'resize',this._updatePixelDensityRatioBind);},_removeUpdatePixelDensityRatioEvent:function(){$.removeEvent(window,'resize',this._updatePixelDensityRatioBind);},_updatePixelDensityRatio:function(){const previusPixelDensityRatio=$.pixelDensityRatio;const currentPixelDensityRatio=$.getCurrentPixelDensityRatio();if(previusPixelDensityRatio!==currentPixelDensityRatio){$.pixelDensityRatio=currentPixelDensityRatio;this.forceResize();}},goToPreviousPage:function(){let previous=this._sequenceIndex-1;if(this.navPrevNextWrap&&previous<0){previous+=this.tileSources.length;}
+this.goToPage(previous);},goToNextPage:function(){let next=this._sequenceIndex+1;if(this.navPrevNextWrap&&next>=this.tileSources.length){next=0;}
+this.goToPage(next);},isAnimating:function(){return THIS[this.hash].animating;},startZoomInAction:function(){THIS[this.hash].lastZoomTime=$.now();THIS[this.hash].zoomFactor=this.zoomPerSecond;THIS[this.hash].zooming=true;scheduleZoom(this);},startZoomOutAction:function(){THIS[this.hash].lastZoomTime=$.now();THIS[this.hash].zoomFactor=1.0/this.zoomPerSecond;THIS[this.hash].zooming=true;scheduleZoom(this);},endZoomAction:function(){THIS[this.hash].zooming=false;},singleZoomInAction:function(){if(this.viewport){THIS[this.hash].zooming=false;this.viewport.zoomBy(this.zoomPerClick/1.0);this.viewport.applyConstraints();}},singleZoomOutAction:function(){if(this.viewport){THIS[this.hash].zooming=false;this.viewport.zoomBy(1.0/this.zoomPerClick);this.viewport.applyConstraints();}},});function _getSafeElemSize(oElement){oElement=$.getElement(oElement);return new $.Point((oElement.clientWidth===0?1:oElement.clientWidth),(oElement.clientHeight===0?1:oElement.clientHeight));}
+function getOverlayObject(viewer,overlay){if(overlay instanceof $.Overlay){return overlay;}
+let element=null;if(overlay.element){element=$.getElement(overlay.element);}else{const id=overlay.id?overlay.id:"openseadragon-overlay-"+Math.floor(Math.random()*10000000);element=$.getElement(overlay.id);if(!element){element=document.createElement("a");element.href="#/overlay/"+id;}
+element.id=id;$.addClass(element,overlay.className?overlay.className:"openseadragon-overlay");}
+let location=overlay.location;let width=overlay.width;let height=overlay.height;if(!location){let x=overlay.x;let y=overlay.y;if(overlay.px!==undefined){const rect=viewer.viewport.imageToViewportRectangle(new $.Rect(overlay.px,overlay.py,width||0,height||0));x=rect.x;y=rect.y;width=width!==undefined?rect.width:undefined;height=height!==undefined?rect.height:undefined;}
+location=new $.Point(x,y);}
+let placement=overlay.placement;if(placement&&$.type(placement)==="string"){placement=$.Placement[overlay.placement.toUpperCase()];}
+return new $.Overlay({element:element,location:location,placement:placement,onDraw:overlay.onDraw,checkResize:overlay.checkResize,width:width,height:height,rotationMode:overlay.rotationMode});}
+function getOverlayIndex(overlays,element){for(let i=overlays.length-1;i>=0;i--){if(overlays[i].element===element){return i;}}
+return-1;}
+function scheduleUpdate(viewer,updateFunc){return $.requestAnimationFrame(function(){updateFunc(viewer);});}
+function scheduleControlsFade(viewer){$.requestAnimationFrame(function(){updateControlsFade(viewer);});}
+function beginControlsAutoHide(viewer){if(!viewer.autoHideControls){return;}
+viewer.controlsShouldFade=true;viewer.controlsFadeBeginTime=$.now()+
+viewer.controlsFadeDelay;window.setTimeout(function(){scheduleControlsFade(viewer);},viewer.controlsFadeDelay);}
+function updateControlsFade(viewer){if(viewer.controlsShouldFade){let currentTime=$.now();let deltaTime=currentTime-viewer.controlsFadeBeginTime;let opacity=1.0-deltaTime/viewer.controlsFadeLength;opacity=Math.min(1.0,opacity);opacity=Math.max(0.0,opacity);for(let i=viewer.controls.length-1;i>=0;i--){if(viewer.controls[i].autoFade){viewer.controls[i].setOpacity(opacity);}}
+if(opacity>0){scheduleControlsFade(viewer);}}}
+function abortControlsAutoHide(viewer){viewer.controlsShouldFade=false;for(let i=viewer.controls.length-1;i>=0;i--){viewer.controls[i].setOpacity(1.0);}}
+function onFocus(){abortControlsAutoHide(this);}
+function onBlur(){beginControlsAutoHide(this);}
+function onCanvasContextMenu(event){const eventArgs={tracker:event.eventSource,position:event.position,originalEvent:event.originalEvent,preventDefault:event.preventDefault};this.raiseEvent('canvas-contextmenu',eventArgs);event.preventDefault=eventArgs.preventDefault;}
+function getActiveActionFromKey(code,shift){switch(code){case'ArrowUp':case'KeyW':return shift?'zoomIn':'panUp';case'ArrowDown':case'KeyS':return shift?'zoomOut':'panDown';case'ArrowLeft':case'KeyA':return'panLeft';case'ArrowRight':case'KeyD':return'panRight';case'Equal':return'zoomIn';case'Minus':return'zoomOut';default:return null;}}
+function onCanvasKeyUp(event){const processCombo=(code,shift)=>{const action=getActiveActionFromKey(code,shift);if(action&&this._activeActions[action]){this._activeActions[action]=false;if(this._navActionFrames[action]<this._minNavActionFrames){this._navActionVirtuallyHeld[action]=true;}}};const code=event.originalEvent.code;processCombo(code,true);processCombo(code,false);}
+function onCanvasKeyDown(event){const canvasKeyDownEventArgs={originalEvent:event.originalEvent,preventDefaultAction:!this.keyboardNavEnabled,preventVerticalPan:event.preventVerticalPan||!this.panVertical,preventHorizontalPan:event.preventHorizontalPan||!this.panHorizontal};this.raiseEvent('canvas-key',canvasKeyDownEventArgs);if(!canvasKeyDownEventArgs.preventDefaultAction&&!event.ctrl&&!event.alt&&!event.meta){const code=event.originalEvent.code;const shift=event.shift;const action=getActiveActionFromKey(code,shift);if(action&&!this._activeActions[action]){this._activeActions[action]=true;this._navActionFrames[action]=0;event.preventDefault=true;return;}
+switch(event.keyCode){case 48:this.viewport.goHome();this.viewport.applyConstraints();event.preventDefault=true;break;case 82:if(event.shift){if(this.viewport.flipped){this.viewport.setRotation(this.viewport.getRotation()+this.rotationIncrement);}else{this.viewport.setRotation(this.viewport.getRotation()-this.rotationIncrement);}}else{if(this.viewport.flipped){this.viewport.setRotation(this.viewport.getRotation()-this.rotationIncrement);}else{this.viewport.setRotation(this.viewport.getRotation()+this.rotationIncrement);}}
+this.viewport.applyConstraints();event.preventDefault=true;break;case 70:this.viewport.toggleFlip();event.preventDefault=true;break;case 74:this.goToPreviousPage();break;case 75:this.goToNextPage();break;default:event.preventDefault=false;break;}}else{event.preventDefault=false;}}
+function onCanvasKeyPress(event){const canvasKeyPressEventArgs={originalEvent:event.originalEvent,};this.raiseEvent('canvas-key-press',canvasKeyPressEventArgs);}
+function onCanvasClick(event){let gestureSettings;const haveKeyboardFocus=document.activeElement===this.canvas;if(!haveKeyboardFocus){this.canvas.focus();}
+if(this.viewport.flipped){event.position.x=this.viewport.getContainerSize().x-event.position.x;}
+const canvasClickEventArgs={tracker:event.eventSource,position:event.position,quick:event.quick,shift:event.shift,originalEvent:event.originalEvent,originalTarget:event.originalTarget,preventDefaultAction:false};this.raiseEvent('canvas-click',canvasClickEventArgs);if(!canvasClickEventArgs.preventDefaultAction&&this.viewport&&event.quick){gestureSettings=this.gestureSettingsByDeviceType(event.pointerType);if(gestureSettings.clickToZoom===true){this.viewport.zoomBy(event.shift?1.0/this.zoomPerClick:this.zoomPerClick,gestureSettings.zoomToRefPoint?this.viewport.pointFromPixel(event.position,true):null);this.viewport.applyConstraints();}
+if(gestureSettings.dblClickDragToZoom){if(THIS[this.hash].draggingToZoom===true){THIS[this.hash].lastClickTime=null;THIS[this.hash].draggingToZoom=false;}
+else{THIS[this.hash].lastClickTime=$.now();}}}}
+function onCanvasDblClick(event){let gestureSettings;const canvasDblClickEventArgs={tracker:event.eventSource,position:event.position,shift:event.shift,originalEvent:event.originalEvent,preventDefaultAction:false};this.raiseEvent('canvas-double-click',canvasDblClickEventArgs);if(!canvasDblClickEventArgs.preventDefaultAction&&this.viewport){gestureSettings=this.gestureSettingsByDeviceType(event.pointerType);if(gestureSettings.dblClickToZoom){this.viewport.zoomBy(event.shift?1.0/this.zoomPerClick:this.zoomPerClick,gestureSettings.zoomToRefPoint?this.viewport.pointFromPixel(event.position,true):null);this.viewport.applyConstraints();}}}
+function onCanvasDrag(event){let gestureSettings;const canvasDragEventArgs={tracker:event.eventSource,pointerType:event.pointerType,position:event.position,delta:event.delta,speed:event.speed,direction:event.direction,shift:event.shift,originalEvent:event.originalEvent,preventDefaultAction:false};this.raiseEvent('canvas-drag',canvasDragEventArgs);gestureSettings=this.gestureSettingsByDeviceType(event.pointerType);if(!canvasDragEventArgs.preventDefaultAction&&this.viewport){if(gestureSettings.dblClickDragToZoom&&THIS[this.hash].draggingToZoom){const factor=Math.pow(this.zoomPerDblClickDrag,event.delta.y/50);this.viewport.zoomBy(factor);}
+else if(gestureSettings.dragToPan&&!THIS[this.hash].draggingToZoom){if(!this.panHorizontal){event.delta.x=0;}
+if(!this.panVertical){event.delta.y=0;}
+if(this.viewport.flipped){event.delta.x=-event.delta.x;}
+if(this.constrainDuringPan){const delta=this.viewport.deltaPointsFromPixels(event.delta.negate());this.viewport.centerSpringX.target.value+=delta.x;this.viewport.centerSpringY.target.value+=delta.y;const constrainedBounds=this.viewport.getConstrainedBounds();this.viewport.centerSpringX.target.value-=delta.x;this.viewport.centerSpringY.target.value-=delta.y;if(constrainedBounds.xConstrained){event.delta.x=0;}
+if(constrainedBounds.yConstrained){event.delta.y=0;}}
+this.viewport.panBy(this.viewport.deltaPointsFromPixels(event.delta.negate()),gestureSettings.flickEnabled&&!this.constrainDuringPan);}}}
+function onCanvasDragEnd(event){let gestureSettings;const canvasDragEndEventArgs={tracker:event.eventSource,pointerType:event.pointerType,position:event.position,speed:event.speed,direction:event.direction,shift:event.shift,originalEvent:event.originalEvent,preventDefaultAction:false};this.raiseEvent('canvas-drag-end',canvasDragEndEventArgs);gestureSettings=this.gestureSettingsByDeviceType(event.pointerType);if(!canvasDragEndEventArgs.preventDefaultAction&&this.viewport){if(!THIS[this.hash].draggingToZoom&&gestureSettings.dragToPan&&gestureSettings.flickEnabled&&event.speed>=gestureSettings.flickMinSpeed){let amplitudeX=0;if(this.panHorizontal){amplitudeX=gestureSettings.flickMomentum*event.speed*Math.cos(event.direction);}
+let amplitudeY=0;if(this.panVertical){amplitudeY=gestureSettings.flickMomentum*event.speed*Math.sin(event.direction);}
+const center=this.viewport.pixelFromPoint(this.viewport.getCenter(true));const target=this.viewport.pointFromPixel(new $.Point(center.x-amplitudeX,center.y-amplitudeY));this.viewport.panTo(target,false);}
+this.viewport.applyConstraints();}
+if(gestureSettings.dblClickDragToZoom&&THIS[this.hash].draggingToZoom===true){THIS[this.hash].draggingToZoom=false;}}
+function onCanvasEnter(event){this.raiseEvent('canvas-enter',{tracker:event.eventSource,pointerType:event.pointerType,position:event.position,buttons:event.buttons,pointers:event.pointers,insideElementPressed:event.insideElementPressed,buttonDownAny:event.buttonDownAny,originalEvent:event.originalEvent});}
+function onCanvasLeave(event){this.raiseEvent('canvas-exit',{tracker:event.eventSource,pointerType:event.pointerType,position:event.position,buttons:event.buttons,pointers:event.pointers,insideElementPressed:event.insideElementPressed,buttonDownAny:event.buttonDownAny,originalEvent:event.originalEvent});}
+function onCanvasPress(event){this.raiseEvent('canvas-press',{tracker:event.eventSource,pointerType:event.pointerType,position:event.position,insideElementPressed:event.insideElementPressed,insideElementReleased:event.insideElementReleased,originalEvent:event.originalEvent});const gestureSettings=this.gestureSettingsByDeviceType(event.pointerType);if(gestureSettings.dblClickDragToZoom){const lastClickTime=THIS[this.hash].lastClickTime;const currClickTime=$.now();if(lastClickTime===null){return;}
+if((currClickTime-lastClickTime)<this.dblClickTimeThreshold){THIS[this.hash].draggingToZoom=true;}
+THIS[this.hash].lastClickTime=null;}}
+function onCanvasRelease(event){this.raiseEvent('canvas-release',{tracker:event.eventSource,pointerType:event.pointerType,position:event.position,insideElementPressed:event.insideElementPressed,insideElementReleased:event.insideElementReleased,originalEvent:event.originalEvent});}
+function onCanvasNonPrimaryPress(event){this.raiseEvent('canvas-nonprimary-press',{tracker:event.eventSource,position:event.position,pointerType:event.pointerType,button:event.button,buttons:event.buttons,originalEvent:event.originalEvent});}
+function onCanvasNonPrimaryRelease(event){this.raiseEvent('canvas-nonprimary-release',{tracker:event.eventSource,position:event.position,pointerType:event.pointerType,button:event.button,buttons:event.buttons,originalEvent:event.originalEvent});}
+function onCanvasPinch(event){let centerPt;let lastCenterPt;let panByPt;const canvasPinchEventArgs={tracker:event.eventSource,pointerType:event.pointerType,gesturePoints:event.gesturePoints,lastCenter:event.lastCenter,center:event.center,lastDistance:event.lastDistance,distance:event.distance,shift:event.shift,originalEvent:event.originalEvent,preventDefaultPanAction:false,preventDefaultZoomAction:false,preventDefaultRotateAction:false};this.raiseEvent('canvas-pinch',canvasPinchEventArgs);if(this.viewport){let gestureSettings=this.gestureSettingsByDeviceType(event.pointerType);if(gestureSettings.pinchToZoom&&(!canvasPinchEventArgs.preventDefaultPanAction||!canvasPinchEventArgs.preventDefaultZoomAction)){centerPt=this.viewport.pointFromPixel(event.center,true);if(gestureSettings.zoomToRefPoint&&!canvasPinchEventArgs.preventDefaultPanAction){lastCenterPt=this.viewport.pointFromPixel(event.lastCenter,true);panByPt=lastCenterPt.minus(centerPt);if(!this.panHorizontal){panByPt.x=0;}
+if(!this.panVertical){panByPt.y=0;}
+this.viewport.panBy(panByPt,true);}
+if(!canvasPinchEventArgs.preventDefaultZoomAction){this.viewport.zoomBy(event.distance/event.lastDistance,centerPt,true);}
+this.viewport.applyConstraints();}
+if(gestureSettings.pinchRotate&&!canvasPinchEventArgs.preventDefaultRotateAction){const angle1=Math.atan2(event.gesturePoints[0].currentPos.y-event.gesturePoints[1].currentPos.y,event.gesturePoints[0].currentPos.x-event.gesturePoints[1].currentPos.x);const angle2=Math.atan2(event.gesturePoints[0].lastPos.y-event.gesturePoints[1].lastPos.y,event.gesturePoints[0].lastPos.x-event.gesturePoints[1].lastPos.x);centerPt=this.viewport.pointFromPixel(event.center,true);this.viewport.rotateTo(this.viewport.getRotation(true)+((angle1-angle2)*(180/Math.PI)),centerPt,true);}}}
+function onCanvasFocus(event){this.raiseEvent('canvas-focus',{tracker:event.eventSource,originalEvent:event.originalEvent});}
+function onCanvasBlur(event){for(const action in this._activeActions){this._activeActions[action]=false;}
+for(const action in this._navActionVirtuallyHeld){this._navActionVirtuallyHeld[action]=false;}
+this.raiseEvent('canvas-blur',{tracker:event.eventSource,originalEvent:event.originalEvent});}
+function onCanvasScroll(event){let canvasScrollEventArgs;let gestureSettings;let factor;const thisScrollTime=$.now();const deltaScrollTime=thisScrollTime-this._lastScrollTime;if(deltaScrollTime>this.minScrollDeltaTime){this._lastScrollTime=thisScrollTime;canvasScrollEventArgs={tracker:event.eventSource,position:event.position,scroll:event.scroll,shift:event.shift,originalEvent:event.originalEvent,preventDefaultAction:false,preventDefault:true};this.raiseEvent('canvas-scroll',canvasScrollEventArgs);if(!canvasScrollEventArgs.preventDefaultAction&&this.viewport){if(this.viewport.flipped){event.position.x=this.viewport.getContainerSize().x-event.position.x;}
+gestureSettings=this.gestureSettingsByDeviceType(event.pointerType);if(gestureSettings.scrollToZoom){factor=Math.pow(this.zoomPerScroll,event.scroll);this.viewport.zoomBy(factor,gestureSettings.zoomToRefPoint?this.viewport.pointFromPixel(event.position,true):null);this.viewport.applyConstraints();}}
+event.preventDefault=canvasScrollEventArgs.preventDefault;}else{event.preventDefault=true;}}
+function onContainerEnter(event){THIS[this.hash].mouseInside=true;abortControlsAutoHide(this);this.raiseEvent('container-enter',{tracker:event.eventSource,pointerType:event.pointerType,position:event.position,buttons:event.buttons,pointers:event.pointers,insideElementPressed:event.insideElementPressed,buttonDownAny:event.buttonDownAny,originalEvent:event.originalEvent});}
+function onContainerLeave(event){if(event.pointers<1){THIS[this.hash].mouseInside=false;if(!THIS[this.hash].animating){beginControlsAutoHide(this);}}
+this.raiseEvent('container-exit',{tracker:event.eventSource,pointerType:event.pointerType,position:event.position,buttons:event.buttons,pointers:event.pointers,insideElementPressed:event.insideElementPressed,buttonDownAny:event.buttonDownAny,originalEvent:event.originalEvent});}
+function updateMulti(viewer){updateOnce(viewer);if(viewer.isOpen()){viewer._updateRequestId=scheduleUpdate(viewer,updateMulti);}else{viewer._updateRequestId=false;}}
+function doViewerResize(viewer,containerSize){const viewport=viewer.viewport;const zoom=viewport.getZoom();const center=viewport.getCenter();viewport.resize(containerSize,viewer.preserveImageSizeOnResize);viewport.panTo(center,true);let resizeRatio;if(viewer.preserveImageSizeOnResize){resizeRatio=THIS[viewer.hash].prevContainerSize.x/containerSize.x;}else{const origin=new $.Point(0,0);const prevDiag=new $.Point(THIS[viewer.hash].prevContainerSize.x,THIS[viewer.hash].prevContainerSize.y).distanceTo(origin);const newDiag=new $.Point(containerSize.x,containerSize.y).distanceTo(origin);resizeRatio=newDiag/prevDiag*THIS[viewer.hash].prevContainerSize.x/containerSize.x;}
+viewport.zoomTo(zoom*resizeRatio,null,true);THIS[viewer.hash].prevContainerSize=containerSize;THIS[viewer.hash].forceRedraw=true;THIS[viewer.hash].needsResize=false;THIS[viewer.hash].forceResize=false;}
+function handleNavKeys(viewer){for(const action in viewer._activeActions){if(viewer._activeActions[action]||viewer._navActionVirtuallyHeld[action]){viewer._navActionFrames[action]++;if(viewer._navActionFrames[action]>=viewer._minNavActionFrames){viewer._navActionVirtuallyHeld[action]=false;}}}
+function isDown(action){return viewer._activeActions[action]||viewer._navActionVirtuallyHeld[action];}
+const pixels=viewer.pixelsPerArrowPress/10;const panDelta=viewer.viewport.deltaPointsFromPixels(new OpenSeadragon.Point(pixels,pixels));if(isDown('zoomIn')){viewer.viewport.zoomBy(1.01,null,true);viewer.viewport.applyConstraints();return;}
+if(isDown('zoomOut')){viewer.viewport.zoomBy(0.99,null,true);viewer.viewport.applyConstraints();return;}
+let dx=0;let dy=0;if(!viewer.preventVerticalPan){if(isDown('panUp')){dy-=panDelta.y;}
+if(isDown('panDown')){dy+=panDelta.y;}}
+if(!viewer.preventHorizontalPan){if(isDown('panLeft')){dx-=panDelta.x;}
+if(isDown('panRight')){dx+=panDelta.x;}}
+if(dx!==0||dy!==0){viewer.viewport.panBy(new OpenSeadragon.Point(dx,dy),true);viewer.viewport.applyConstraints();}}
+function updateOnce(viewer){handleNavKeys(viewer);if(viewer._opening||!THIS[viewer.hash]){return;}
+let viewerWasResized=false;if(viewer.autoResize||THIS[viewer.hash].forceResize){let containerSize;if(viewer._autoResizePolling){containerSize=_getSafeElemSize(viewer.container);const prevContainerSize=THIS[viewer.hash].prevContainerSize;if(!containerSize.equals(prevContainerSize)){THIS[viewer.hash].needsResize=true;}}
+if(THIS[viewer.hash].needsResize){doViewerResize(viewer,containerSize||_getSafeElemSize(viewer.container));viewerWasResized=true;}}
+const viewportChange=viewer.viewport.update()||viewerWasResized;let animated=viewer.world.update(viewportChange)||viewportChange;if(viewportChange){viewer.raiseEvent('viewport-change');}
+if(viewer.referenceStrip){animated=viewer.referenceStrip.update(viewer.viewport)||animated;}
+const currentAnimating=THIS[viewer.hash].animating;if(!currentAnimating&&animated){viewer.raiseEvent("animation-start");abortControlsAutoHide(viewer);}
+const isAnimationFinished=currentAnimating&&!animated;if(isAnimationFinished){THIS[viewer.hash].animating=false;}
+if(animated||isAnimationFinished||THIS[viewer.hash].forceRedraw||viewer.world.needsDraw()){drawWorld(viewer);viewer._drawOverlays();if(viewer.navigator){viewer.navigator.update(viewer.viewport);}
+THIS[viewer.hash].forceRedraw=false;if(animated){viewer.raiseEvent("animation");}}
+if(isAnimationFinished){viewer.raiseEvent("animation-finish");if(!THIS[viewer.hash].mouseInside){beginControlsAutoHide(viewer);}}
+THIS[viewer.hash].animating=animated;}
+function drawWorld(viewer){viewer.imageLoader.clear();viewer.world.draw();viewer.raiseEvent('update-viewport',{});}
+function resolveUrl(prefix,url){return prefix?prefix+url:url;}
+function scheduleZoom(viewer){$.requestAnimationFrame($.delegate(viewer,doZoom));}
+function doZoom(){if(THIS[this.hash].zooming&&this.viewport){const currentTime=$.now();const deltaTime=currentTime-THIS[this.hash].lastZoomTime;const adjustedFactor=Math.pow(THIS[this.hash].zoomFactor,deltaTime/1000);this.viewport.zoomBy(adjustedFactor);this.viewport.applyConstraints();THIS[this.hash].lastZoomTime=currentTime;scheduleZoom(this);}}
+function lightUp(){if(this.buttonGroup){this.buttonGroup.emulateEnter();this.buttonGroup.emulateLeave();}}
+function onHome(){if(this.viewport){this.viewport.goHome();}}
+function onFullScreen(){if(this.isFullPage()&&!$.isFullScreen()){this.setFullPage(false);}else{this.setFullScreen(!this.isFullPage());}
+if(this.buttonGroup){this.buttonGroup.emulateLeave();}
+this.fullPageButton.element.focus();if(this.viewport){this.viewport.applyConstraints();}}
+function onRotateLeft(){if(this.viewport){let currRotation=this.viewport.getRotation();if(this.viewport.flipped){currRotation+=this.rotationIncrement;}else{currRotation-=this.rotationIncrement;}
+this.viewport.setRotation(currRotation);}}
+function onRotateRight(){if(this.viewport){let currRotation=this.viewport.getRotation();if(this.viewport.flipped){currRotation-=this.rotationIncrement;}else{currRotation+=this.rotationIncrement;}
+this.viewport.setRotation(currRotation);}}
+function onFlip(){this.viewport.toggleFlip();}
+function getDrawerTypeString(candidate){if(typeof candidate==='string'){return candidate;}
+const proto=candidate&&candidate.prototype;if(proto&&proto instanceof OpenSeadragon.DrawerBase&&$.isFunction(proto.getType)){return proto.getType.call(candidate);}
+return undefined;}
+function getAutoDrawerCandidates(){const isPrimaryTouch=window.matchMedia('(pointer: coarse)').matches;const isIOSDevice=/iPad|iPhone|iPod|Mac/.test(navigator.userAgent)&&isPrimaryTouch;return isIOSDevice?['canvas']:['webgl','canvas'];}
+$.determineDrawer=function(id){if(id==='auto'){id=getAutoDrawerCandidates()[0];}
+for(const property in OpenSeadragon){const drawer=OpenSeadragon[property];const proto=drawer.prototype;if(proto&&proto instanceof OpenSeadragon.DrawerBase&&$.isFunction(proto.getType)&&proto.getType.call(drawer)===id){return drawer;}}
+return null;};}(OpenSeadragon));(function($){$.Navigator=function(options){const viewer=options.viewer;const _this=this;let viewerSize;let navigatorSize;if(options.element||options.id){if(options.element){if(options.id){$.console.warn("Given option.id for Navigator was ignored since option.element was provided and is being used instead.");}
+if(options.element.id){options.id=options.element.id;}else{options.id='navigator-'+$.now();}
+this.element=options.element;}else{this.element=document.getElementById(options.id);}
+options.controlOptions={anchor:$.ControlAnchor.NONE,attachToViewer:false,autoFade:false};}else{options.id='navigator-'+$.now();this.element=$.makeNeutralElement("div");options.controlOptions={anchor:$.ControlAnchor.TOP_RIGHT,attachToViewer:true,autoFade:options.autoFade};if(options.position){if('BOTTOM_RIGHT'===options.position){options.controlOptions.anchor=$.ControlAnchor.BOTTOM_RIGHT;}else if('BOTTOM_LEFT'===options.position){options.controlOptions.anchor=$.ControlAnchor.BOTTOM_LEFT;}else if('TOP_RIGHT'===options.position){options.controlOptions.anchor=$.ControlAnchor.TOP_RIGHT;}else if('TOP_LEFT'===options.position){options.controlOptions.anchor=$.ControlAnchor.TOP_LEFT;}else if('ABSOLUTE'===options.position){options.controlOptions.anchor=$.ControlAnchor.ABSOLUTE;options.controlOptions.top=options.top;options.controlOptions.left=options.left;options.controlOptions.height=options.height;options.controlOptions.width=options.width;}}}
+this.element.id=options.id;this.element.className+=' navigator';options=$.extend(true,{sizeRatio:$.DEFAULT_SETTINGS.navigatorSizeRatio},options,{element:this.element,tabIndex:-1,showNavigator:false,mouseNavEnabled:false,showNavigationControl:false,showSequenceControl:false,immediateRender:true,blendTime:0,animationTime:options.animationTime,autoResize:false,minZoomImageRatio:1.0,background:options.background,opacity:options.opacity,borderColor:options.borderColor,displayRegionColor:options.displayRegionColor});options.minPixelRatio=this.minPixelRatio=viewer.minPixelRatio;$.setElementTouchActionNone(this.element);this.borderWidth=2;this.fudge=new $.Point(1,1);this.totalBorderWidths=new $.Point(this.borderWidth*2,this.borderWidth*2).minus(this.fudge);if(options.controlOptions.anchor!==$.ControlAnchor.NONE){(function(style,borderWidth){style.margin='0px';style.border=borderWidth+'px solid '+options.borderColor;style.padding='0px';style.background=options.background;style.opacity=options.opacity;style.overflow='hidden';}(this.element.style,this.borderWidth));}
+this.displayRegion=$.makeNeutralElement("div");this.displayRegion.id=this.element.id+'-displayregion';this.displayRegion.className='displayregion';(function(style,borderWidth){style.position='relative';style.top='0px';style.left='0px';style.fontSize='0px';style.overflow='hidden';style.border=borderWidth+'px solid '+options.displayRegionColor;style.margin='0px';style.padding='0px';style.background='transparent';style['float']='left';style.cssFloat='left';style.zIndex=999999999;style.cursor='default';style.boxSizing='content-box';}(this.displayRegion.style,this.borderWidth));$.setElementPointerEventsNone(this.displayRegion);$.setElementTouchActionNone(this.displayRegion);this.displayRegionContainer=$.makeNeutralElement("div");this.displayRegionContainer.id=this.element.id+'-displayregioncontainer';this.displayRegionContainer.className="displayregioncontainer";this.displayRegionContainer.style.width="100%";this.displayRegionContainer.style.height="100%";$.setElementPointerEventsNone(this.displayRegionContainer);$.setElementTouchActionNone(this.displayRegionContainer);viewer.addControl(this.element,options.controlOptions);this._resizeWithViewer=options.controlOptions.anchor!==$.ControlAnchor.ABSOLUTE&&options.controlOptions.anchor!==$.ControlAnchor.NONE;if(options.width&&options.height){this.setWidth(options.width);this.setHeight(options.height);}else if(this._resizeWithViewer){viewerSize=$.getElementSize(viewer.element);this.element.style.height=Math.round(viewerSize.y*options.sizeRatio)+'px';this.element.style.width=Math.round(viewerSize.x*options.sizeRatio)+'px';this.oldViewerSize=viewerSize;navigatorSize=$.getElementSize(this.element);this.elementArea=navigatorSize.x*navigatorSize.y;}
+this.oldContainerSize=new $.Point(0,0);$.Viewer.apply(this,[options]);this.displayRegionContainer.appendChild(this.displayRegion);this.element.getElementsByTagName('div')[0].appendChild(this.displayRegionContainer);function rotate(degrees,immediately){_setTransformRotate(_this.displayRegionContainer,degrees);_setTransformRotate(_this.displayRegion,-degrees);_this.viewport.setRotation(degrees,immediately);}
+if(options.navigatorRotate){const degrees=options.viewer.viewport?options.viewer.viewport.getRotation():options.viewer.degrees||0;rotate(degrees,true);options.viewer.addHandler("rotate",function(args){rotate(args.degrees,args.immediately);});}
+this.innerTracker.destroy();this.innerTracker=new $.MouseTracker({userData:'Navigator.innerTracker',element:this.element,dragHandler:$.delegate(this,onCanvasDrag),clickHandler:$.delegate(this,onCanvasClick),releaseHandler:$.delegate(this,onCanvasRelease),scrollHandler:$.delegate(this,onCanvasScroll),preProcessEventHandler:function(eventInfo){if(eventInfo.eventType==='wheel'){eventInfo.preventDefault=true;}}});this.outerTracker.userData='Navigator.outerTracker';$.setElementPointerEventsNone(this.canvas);$.setElementPointerEventsNone(this.container);this.addHandler("reset-size",function(){if(_this.viewport){_this.viewport.goHome(true);}});viewer.world.addHandler("item-index-change",function(event){window.setTimeout(function(){const item=_this.world.getItemAt(event.previousIndex);_this.world.setItemIndex(item,event.newIndex);},1);});viewer.world.addHandler("remove-item",function(event){const theirItem=event.item;const myItem=_this._getMatchingItem(theirItem);if(myItem){_this.world.removeItem(myItem);}});this.update(viewer.viewport);};$.extend($.Navigator.prototype,$.EventSource.prototype,$.Viewer.prototype,{updateSize:function(){if(this.viewport){const containerSize=new $.Point((this.container.clientWidth===0?1:this.container.clientWidth),(this.container.clientHeight===0?1:this.container.clientHeight));if(!containerSize.equals(this.oldContainerSize)){this.viewport.resize(containerSize,true);this.viewport.goHome(true);this.oldContainerSize=containerSize;this.world.update();this.world.draw();this.update(this.viewer.viewport);}}},setWidth:function(width){this.width=width;this.element.style.width=typeof(width)==="number"?(width+'px'):width;this._resizeWithViewer=false;this.updateSize();},setHeight:function(height){this.height=height;this.element.style.height=typeof(height)==="number"?(height+'px'):height;this._resizeWithViewer=false;this.updateSize();},setFlip:function(state){this.viewport.setFlip(state);this.setDisplayTransform(this.viewer.viewport.getFlip()?"scale(-1,1)":"scale(1,1)");return this;},setDisplayTransform:function(rule){setElementTransform(this.canvas,rule);setElementTransform(this.element,rule);},update:function(viewport){let viewerSize;let newWidth;let newHeight;let bounds;let topleft;let bottomright;if(!viewport){viewport=this.viewer.viewport;}
+viewerSize=$.getElementSize(this.viewer.element);if(this._resizeWithViewer&&viewerSize.x&&viewerSize.y&&!viewerSize.equals(this.oldViewerSize)){this.oldViewerSize=viewerSize;if(this.maintainSizeRatio||!this.elementArea){newWidth=viewerSize.x*this.sizeRatio;newHeight=viewerSize.y*this.sizeRatio;}else{newWidth=Math.sqrt(this.elementArea*(viewerSize.x/viewerSize.y));newHeight=this.elementArea/newWidth;}
+this.element.style.width=Math.round(newWidth)+'px';this.element.style.height=Math.round(newHeight)+'px';if(!this.elementArea){this.elementArea=newWidth*newHeight;}
+this.updateSize();}
+if(viewport&&this.viewport){bounds=viewport.getBoundsNoRotate(true);topleft=this.viewport.pixelFromPointNoRotate(bounds.getTopLeft(),false);bottomright=this.viewport.pixelFromPointNoRotate(bounds.getBottomRight(),false).minus(this.totalBorderWidths);if(!this.navigatorRotate){const degrees=viewport.getRotation(true);_setTransformRotate(this.displayRegion,-degrees);}
+const style=this.displayRegion.style;style.display=this.world.getItemCount()?'block':'none';style.top=topleft.y.toFixed(2)+"px";style.left=topleft.x.toFixed(2)+"px";const width=bottomright.x-topleft.x;const height=bottomright.y-topleft.y;style.width=Math.round(Math.max(width,0))+'px';style.height=Math.round(Math.max(height,0))+'px';}},addTiledImage:function(options){const _this=this;const original=options.originalTiledImage;delete options.original;const optionsClone=$.extend({},options,{success:function(event){const myItem=event.item;myItem._originalForNavigator=original;_this._matchBounds(myItem,original,true);_this._matchOpacity(myItem,original);_this._matchCompositeOperation(myItem,original);function matchBounds(){_this._matchBounds(myItem,original);}
+function matchOpacity(){_this._matchOpacity(myItem,original);}
+function matchCompositeOperation(){_this._matchCompositeOperation(myItem,original);}
+original.addHandler('bounds-change',matchBounds);original.addHandler('clip-change',matchBounds);original.addHandler('opacity-change',matchOpacity);original.addHandler('composite-operation-change',matchCompositeOperation);}});return $.Viewer.prototype.addTiledImage.apply(this,[optionsClone]);},destroy:function(){return $.Viewer.prototype.destroy.apply(this);},_getMatchingItem:function(theirItem){const count=this.world.getItemCount();for(let i=0;i<count;i++){let item=this.world.getItemAt(i);if(item._originalForNavigator===theirItem){return item;}}
+return null;},_matchBounds:function(myItem,theirItem,immediately){const bounds=theirItem.getBoundsNoRotate();myItem.setPosition(bounds.getTopLeft(),immediately);myItem.setWidth(bounds.width,immediately);myItem.setRotation(theirItem.getRotation(),immediately);myItem.setClip(theirItem.getClip());myItem.setFlip(theirItem.getFlip());},_matchOpacity:function(myItem,theirItem){myItem.setOpacity(theirItem.opacity);},_matchCompositeOperation:function(myItem,theirItem){myItem.setCompositeOperation(theirItem.compositeOperation);}});function onCanvasClick(event){const canvasClickEventArgs={tracker:event.eventSource,position:event.position,quick:event.quick,shift:event.shift,originalEvent:event.originalEvent,preventDefaultAction:false};this.viewer.raiseEvent('navigator-click',canvasClickEventArgs);if(!canvasClickEventArgs.preventDefaultAction&&event.quick&&this.viewer.viewport&&(this.panVertical||this.panHorizontal)){if(this.viewer.viewport.flipped){event.position.x=this.viewport.getContainerSize().x-event.position.x;}
+const target=this.viewport.pointFromPixel(event.position);if(!this.panVertical){target.y=this.viewer.viewport.getCenter(true).y;}else if(!this.panHorizontal){target.x=this.viewer.viewport.getCenter(true).x;}
+this.viewer.viewport.panTo(target);this.viewer.viewport.applyConstraints();}}
+function onCanvasDrag(event){const canvasDragEventArgs={tracker:event.eventSource,position:event.position,delta:event.delta,speed:event.speed,direction:event.direction,shift:event.shift,originalEvent:event.originalEvent,preventDefaultAction:false};this.viewer.raiseEvent('navigator-drag',canvasDragEventArgs);if(!canvasDragEventArgs.preventDefaultAction&&this.viewer.viewport){if(!this.panHorizontal){event.delta.x=0;}
+if(!this.panVertical){event.delta.y=0;}
+if(this.viewer.viewport.flipped){event.delta.x=-event.delta.x;}
+this.viewer.viewport.panBy(this.viewport.deltaPointsFromPixels(event.delta));if(this.viewer.constrainDuringPan){this.viewer.viewport.applyConstraints();}}}
+function onCanvasRelease(event){if(event.insideElementPressed&&this.viewer.viewport){this.viewer.viewport.applyConstraints();}}
+function onCanvasScroll(event){const eventArgs={tracker:event.eventSource,position:event.position,scroll:event.scroll,shift:event.shift,originalEvent:event.originalEvent,preventDefault:event.preventDefault};this.viewer.raiseEvent('navigator-scroll',eventArgs);event.preventDefault=eventArgs.preventDefault;}
+function _setTransformRotate(element,degrees){setElementTransform(element,"rotate("+degrees+"deg)");}
+function setElementTransform(element,rule){element.style.webkitTransform=rule;element.style.mozTransform=rule;element.style.msTransform=rule;element.style.oTransform=rule;element.style.transform=rule;}}(OpenSeadragon));(function($){const I18N={Errors:{Dzc:"Sorry, we don't support Deep Zoom Collections!",Dzi:"Hmm, this doesn't appear to be a valid Deep Zoom Image.",Xml:"Hmm, this doesn't appear to be a valid Deep Zoom Image.",ImageFormat:"Sorry, we don't support {0}-based Deep Zoom Images.",Security:"It looks like a security restriction stopped us from "+"loading this Deep Zoom Image.",Status:"This space unintentionally left blank ({0} {1}).",OpenFailed:"Unable to open {0}: {1}"},Tooltips:{FullPage:"Toggle full page",Home:"Go home",ZoomIn:"Zoom in",ZoomOut:"Zoom out",NextPage:"Next page",PreviousPage:"Previous page",RotateLeft:"Rotate left",RotateRight:"Rotate right",Flip:"Flip Horizontally"}};$.extend($,{getString:function(prop){const props=prop.split('.');let string=null;const args=arguments;let container=I18N;let i;for(i=0;i<props.length-1;i++){container=container[props[i]]||{};}
+string=container[props[i]];if(typeof(string)!=="string"){$.console.error("Untranslated source string:",prop);string="";}
+return string.replace(/\{\d+\}/g,function(capture){const i=parseInt(capture.match(/\d+/),10)+1;return i<args.length?args[i]:"";});},setString:function(prop,value){const props=prop.split('.');let container=I18N;let i;for(i=0;i<props.length-1;i++){if(!container[props[i]]){container[props[i]]={};}
+container=container[props[i]];}
+container[props[i]]=value;}});}(OpenSeadragon));(function($){$.Point=function(x,y){this.x=typeof(x)==="number"?x:0;this.y=typeof(y)==="number"?y:0;};$.Point.prototype={clone:function(){return new $.Point(this.x,this.y);},plus:function(point){return new $.Point(this.x+point.x,this.y+point.y);},minus:function(point){return new $.Point(this.x-point.x,this.y-point.y);},times:function(factor){return new $.Point(this.x*factor,this.y*factor);},divide:function(factor){return new $.Point(this.x/factor,this.y/factor);},negate:function(){return new $.Point(-this.x,-this.y);},distanceTo:function(point){return Math.sqrt(Math.pow(this.x-point.x,2)+
+Math.pow(this.y-point.y,2));},squaredDistanceTo:function(point){return Math.pow(this.x-point.x,2)+
+Math.pow(this.y-point.y,2);},apply:function(func){return new $.Point(func(this.x),func(this.y));},equals:function(point){return(point instanceof $.Point)&&(this.x===point.x)&&(this.y===point.y);},rotate:function(degrees,pivot){pivot=pivot||new $.Point(0,0);let cos;let sin;if(degrees%90===0){const d=$.positiveModulo(degrees,360);switch(d){case 0:cos=1;sin=0;break;case 90:cos=0;sin=1;break;case 180:cos=-1;sin=0;break;case 270:cos=0;sin=-1;break;}}else{const angle=degrees*Math.PI/180.0;cos=Math.cos(angle);sin=Math.sin(angle);}
+const x=cos*(this.x-pivot.x)-sin*(this.y-pivot.y)+pivot.x;const y=sin*(this.x-pivot.x)+cos*(this.y-pivot.y)+pivot.y;return new $.Point(x,y);},toString:function(){return"("+(Math.round(this.x*100)/100)+","+(Math.round(this.y*100)/100)+")";}};}(OpenSeadragon));(function($){$.TileSource=function(options){$.EventSource.apply(this);this.url=null;this.addHandler('ready',e=>{const source=e.tileSource;this.ready=true;this.aspectRatio=(source.width&&source.height)?(source.width/source.height):1;this.dimensions=new $.Point(source.width,source.height);if(source.tileSize){this._tileWidth=this._tileHeight=source.tileSize;delete this.tileSize;}else{if(source.tileWidth){this._tileWidth=source.tileWidth;delete this.tileWidth;}else{this._tileWidth=0;}
+if(source.tileHeight){this._tileHeight=source.tileHeight;delete this.tileHeight;}else{this._tileHeight=0;}}
+this.tileOverlap=source.tileOverlap?source.tileOverlap:0;this.minLevel=source.minLevel?source.minLevel:0;this.maxLevel=(undefined!==source.maxLevel&&null!==source.maxLevel)?source.maxLevel:((source.width&&source.height)?Math.ceil(Math.log(Math.max(source.width,source.height))/Math.log(2)):0);if(source.success&&$.isFunction(source.success)){source.success(this);}},null,Infinity);if('string'===$.type(options)){this.url=options;options=undefined;}else{$.extend(true,this,options);}
+if(this.url&&!this.ready){this.aspectRatio=1;this.dimensions=new $.Point(10,10);this._tileWidth=0;this._tileHeight=0;this.tileOverlap=0;this.minLevel=0;this.maxLevel=0;this.ready=false;this._uniqueIdentifier=this.url;setTimeout(()=>this.getImageInfo(this.url));}else{this._uniqueIdentifier=Math.floor(Math.random()*1e10).toString(36);if(this.ready||this.ready===undefined){this.raiseEvent('ready',{tileSource:this});}else{setTimeout(()=>this.raiseEvent('ready',{tileSource:this}));}}
+return this;};$.TileSource.prototype={getTileSize:function(level){$.console.error("[TileSource.getTileSize] is deprecated. "+"Use TileSource.getTileWidth() and TileSource.getTileHeight() instead");return this._tileWidth;},getTileWidth:function(level){if(!this._tileWidth){return this.getTileSize(level);}
+return this._tileWidth;},getTileHeight:function(level){if(!this._tileHeight){return this.getTileSize(level);}
+return this._tileHeight;},setMaxLevel:function(level){this.maxLevel=level;this._memoizeLevelScale();},getLevelScale:function(level){this._memoizeLevelScale();return this.getLevelScale(level);},_memoizeLevelScale:function(){const levelScaleCache={};let i;for(i=0;i<=this.maxLevel;i++){levelScaleCache[i]=1/Math.pow(2,this.maxLevel-i);}
+this.getLevelScale=function(_level){return levelScaleCache[_level];};},getNumTiles:function(level){const scale=this.getLevelScale(level);const x=Math.ceil(scale*this.dimensions.x/this.getTileWidth(level));const y=Math.ceil(scale*this.dimensions.y/this.getTileHeight(level));return new $.Point(x,y);},getPixelRatio:function(level){const imageSizeScaled=this.dimensions.times(this.getLevelScale(level));const rx=1.0/imageSizeScaled.x*$.pixelDensityRatio;const ry=1.0/imageSizeScaled.y*$.pixelDensityRatio;return new $.Point(rx,ry);},getClosestLevel:function(){let i;let tiles;for(i=this.minLevel+1;i<=this.maxLevel;i++){tiles=this.getNumTiles(i);if(tiles.x>1||tiles.y>1){break;}}
+return i-1;},getTileAtPoint:function(level,point){const validPoint=point.x>=0&&point.x<=1&&point.y>=0&&point.y<=1/this.aspectRatio;$.console.assert(validPoint,"[TileSource.getTileAtPoint] must be called with a valid point.");const widthScaled=this.dimensions.x*this.getLevelScale(level);const pixelX=point.x*widthScaled;const pixelY=point.y*widthScaled;let x=Math.floor(pixelX/this.getTileWidth(level));let y=Math.floor(pixelY/this.getTileHeight(level));if(point.x>=1){x=this.getNumTiles(level).x-1;}
+const EPSILON=1e-15;if(point.y>=1/this.aspectRatio-EPSILON){y=this.getNumTiles(level).y-1;}
+return new $.Point(x,y);},getTileBounds:function(level,x,y,isSource){const dimensionsScaled=this.dimensions.times(this.getLevelScale(level));const tileWidth=this.getTileWidth(level);const tileHeight=this.getTileHeight(level);const px=(x===0)?0:tileWidth*x-this.tileOverlap;const py=(y===0)?0:tileHeight*y-this.tileOverlap;let sx=tileWidth+(x===0?1:2)*this.tileOverlap;let sy=tileHeight+(y===0?1:2)*this.tileOverlap;const scale=1.0/dimensionsScaled.x;sx=Math.min(sx,dimensionsScaled.x-px);sy=Math.min(sy,dimensionsScaled.y-py);if(isSource){return new $.Rect(0,0,sx,sy);}
+return new $.Rect(px*scale,py*scale,sx*scale,sy*scale);},getImageInfo:function(url){const _this=this;let callbackName;let callback;let readySource;let options;let urlParts;let filename;let lastDot;if(url){urlParts=url.split('/');filename=urlParts[urlParts.length-1];lastDot=filename.lastIndexOf('.');if(lastDot>-1){urlParts[urlParts.length-1]=filename.slice(0,lastDot);}}
+let postData=null;if(this.splitHashDataForPost){const hashIdx=url.indexOf("#");if(hashIdx!==-1){postData=url.substring(hashIdx+1);url=url.substr(0,hashIdx);}}
+callback=function(data){if(typeof(data)==="string"){data=$.parseXml(data);}
+const $TileSource=$.TileSource.determineType(_this,data,url);if(!$TileSource){_this.raiseEvent('open-failed',{message:"Unable to load TileSource",source:url});return;}
+options=$TileSource.prototype.configure.apply(_this,[data,url,postData]);if(options.ajaxWithCredentials===undefined){options.ajaxWithCredentials=_this.ajaxWithCredentials;}
+options.ready=true;readySource=new $TileSource(options);_this.ready=true;_this.raiseEvent('ready',{tileSource:readySource});};if(url.match(/\.js$/)){callbackName=url.split('/').pop().replace('.js','');$.jsonp({url:url,async:false,callbackName:callbackName,callback:callback});}else{$.makeAjaxRequest({url:url,postData:postData,withCredentials:this.ajaxWithCredentials,headers:this.ajaxHeaders,success:function(xhr){const data=processResponse(xhr);callback(data);},error:function(xhr,exc){let msg;try{msg="HTTP "+xhr.status+" attempting to load TileSource: "+url;}catch(e){let formattedExc;if(typeof(exc)==="undefined"||!exc.toString){formattedExc="Unknown error";}else{formattedExc=exc.toString();}
+msg=formattedExc+" attempting to load TileSource: "+url;}
+$.console.error(msg);_this.raiseEvent('open-failed',{message:msg,source:url,postData:postData});}});}},supports:function(data,url){return false;},equals:function(otherSource){return this===otherSource;},batchEnabled(){return false;},batchCompatible(otherSource){return false;},batchMaxJobs(){return-1;},batchTimeout(){return 5;},configure:function(data,url,postData){throw new Error("Method not implemented.");},destroy:function(viewer){},getTileUrl:function(level,x,y){throw new Error("Method not implemented.");},getTilePostData:function(level,x,y){return null;},getTileAjaxHeaders:function(level,x,y){return{};},getTileHashKey:function(level,x,y,url,ajaxHeaders,postData){function withHeaders(hash){return ajaxHeaders?hash+"+"+JSON.stringify(ajaxHeaders):hash;}
+if(typeof url!=="string"){return withHeaders(this._uniqueIdentifier+":"+level+"/"+x+"_"+y);}
+return withHeaders(url);},tileExists:function(level,x,y){const numTiles=this.getNumTiles(level);return level>=this.minLevel&&level<=this.maxLevel&&x>=0&&y>=0&&x<numTiles.x&&y<numTiles.y;},hasTransparency:function(context2D,url,ajaxHeaders,post){return url.match('.png');},downloadTileStart:function(context){if(context.loadWithAjax){context.userData.request=$.makeAjaxRequest({url:context.src,withCredentials:context.ajaxWithCredentials,headers:context.ajaxHeaders,responseType:"arraybuffer",postData:context.postData,success:function(request){let blb;try{blb=new window.Blob([request.response]);}catch(e){const BlobBuilder=(window.BlobBuilder||window.WebKitBlobBuilder||window.MozBlobBuilder||window.MSBlobBuilder);if(e.name==='TypeError'&&BlobBuilder){const bb=new BlobBuilder();bb.append(request.response);blb=bb.getBlob();}}
+if(blb.size===0){context.fail("[downloadTileStart] Empty image response.",request);}else{context.finish(blb,request,"rasterBlob");}},error:function(request){context.fail("[downloadTileStart] Image load aborted - XHR error",request);}});}else{const image=new Image();context.userData.imageRequest=image;image.onload=function(){image.onload=image.onerror=image.onabort=null;context.finish(image,null,"image");};image.onabort=image.onerror=function(){image.onload=image.onerror=image.onabort=null;context.fail("[downloadTileStart] Image load aborted or errored out.",null);};if(typeof context.crossOriginPolicy==="string"){image.crossOrigin=context.crossOriginPolicy;}
+image.src=context.src;}},downloadTileAbort:function(context){if(context.userData.request){context.userData.request.abort();}
+if(context.userData.imageRequest){const image=context.userData.imageRequest;image.onload=image.onerror=image.onabort=null;image.src="";}},downloadTileBatchStart(batchJob){for(let i=0;i<batchJob.jobs.length;i++){this.downloadTileStart(batchJob.jobs[i]);}},downloadTileBatchAbort(batchJob){for(let i=0;i<batchJob.jobs.length;i++){this.downloadTileAbort(batchJob.jobs[i]);}},createTileCache:function(cacheObject,data,tile){$.console.error("[TileSource.createTileCache] has been deprecated. Use cache API of a tile instead.");},destroyTileCache:function(cacheObject){$.console.error("[TileSource.destroyTileCache] has been deprecated. Use cache API of a tile instead.");},getTileCacheData:function(cacheObject){$.console.error("[TileSource.getTileCacheData] has been deprecated. Use cache API of a tile instead.");return cacheObject.getDataAs(undefined,false);},getTileCacheDataAsImage:function(cacheObject){$.console.error("[TileSource.getTileCacheDataAsImage] has been deprecated. Use cache API of a tile instead.");return cacheObject.getImage();},getTileCacheDataAsContext2D:function(cacheObject){$.console.error("[TileSource.getTileCacheDataAsContext2D] has been deprecated. Use cache API of a tile instead.");return cacheObject.getRenderedContext();}};$.extend(true,$.TileSource.prototype,$.EventSource.prototype);function processResponse(xhr){const responseText=xhr.responseText;let status=xhr.status;let statusText;let data;if(!xhr){throw new Error($.getString("Errors.Security"));}else if(xhr.status!==200&&xhr.status!==0){status=xhr.status;statusText=(status===404)?"Not Found":xhr.statusText;throw new Error($.getString("Errors.Status",status,statusText));}
+if(responseText.match(/^\s*<.*/)){try{data=(xhr.responseXML&&xhr.responseXML.documentElement)?xhr.responseXML:$.parseXml(responseText);}catch(e){data=xhr.responseText;}}else if(responseText.match(/\s*[{[].*/)){try{data=$.parseJSON(responseText);}catch(e){data=responseText;}}else{data=responseText;}
+return data;}
+$.TileSource.determineType=function(tileSource,data,url){for(const property in OpenSeadragon){if(property.match(/.+TileSource$/)&&$.isFunction(OpenSeadragon[property])&&$.isFunction(OpenSeadragon[property].prototype.supports)&&OpenSeadragon[property].prototype.supports.call(tileSource,data,url)){return OpenSeadragon[property];}}
+$.console.error("No TileSource was able to open %s %s",url,data);return null;};}(OpenSeadragon));(function($){$.DziTileSource=function(width,height,tileSize,tileOverlap,tilesUrl,fileFormat,displayRects,minLevel,maxLevel){let level;let options;if($.isPlainObject(width)){options=width;}else{options={width:arguments[0],height:arguments[1],tileSize:arguments[2],tileOverlap:arguments[3],tilesUrl:arguments[4],fileFormat:arguments[5],displayRects:arguments[6],minLevel:arguments[7],maxLevel:arguments[8]};}
+this._levelRects={};this.tilesUrl=options.tilesUrl;this.fileFormat=options.fileFormat;this.displayRects=options.displayRects;this.queryParams=options.queryParams||"";if(this.displayRects){for(let i=this.displayRects.length-1;i>=0;i--){const rect=this.displayRects[i];for(level=rect.minLevel;level<=rect.maxLevel;level++){if(!this._levelRects[level]){this._levelRects[level]=[];}
+this._levelRects[level].push(rect);}}}
+$.TileSource.apply(this,[options]);};$.extend($.DziTileSource.prototype,$.TileSource.prototype,{supports:function(data,url){let ns;if(data.Image){ns=data.Image.xmlns;}else if(data.documentElement){if("Image"===data.documentElement.localName||"Image"===data.documentElement.tagName){ns=data.documentElement.namespaceURI;}}
+ns=(ns||'').toLowerCase();return(ns.indexOf('schemas.microsoft.com/deepzoom/2008')!==-1||ns.indexOf('schemas.microsoft.com/deepzoom/2009')!==-1);},configure:function(data,url,postData){let options;if(!$.isPlainObject(data)){options=configureFromXML(this,data);}else{options=configureFromObject(this,data);}
+if(url&&!options.tilesUrl){options.tilesUrl=url.replace(/([^/]+?)(\.(dzi|xml|js)?(\?[^/]*)?)?\/?$/,'$1_files/');if(url.search(/\.(dzi|xml|js)\?/)!==-1){options.queryParams=url.match(/\?.*/);}else{options.queryParams='';}}
+return options;},getTileUrl:function(level,x,y){return[this.tilesUrl,level,'/',x,'_',y,'.',this.fileFormat,this.queryParams].join('');},equals:function(otherSource){return otherSource&&this.tilesUrl===otherSource.tilesUrl;},tileExists:function(level,x,y){const rects=this._levelRects[level];let scale;let xMin;let yMin;let xMax;let yMax;if((this.minLevel&&level<this.minLevel)||(this.maxLevel&&level>this.maxLevel)){return false;}
+if(!rects||!rects.length){return true;}
+for(let i=rects.length-1;i>=0;i--){const rect=rects[i];if(level<rect.minLevel||level>rect.maxLevel){continue;}
+scale=this.getLevelScale(level);xMin=rect.x*scale;yMin=rect.y*scale;xMax=xMin+rect.width*scale;yMax=yMin+rect.height*scale;xMin=Math.floor(xMin/this._tileWidth);yMin=Math.floor(yMin/this._tileWidth);xMax=Math.ceil(xMax/this._tileWidth);yMax=Math.ceil(yMax/this._tileWidth);if(xMin<=x&&x<xMax&&yMin<=y&&y<yMax){return true;}}
+return false;}});function configureFromXML(tileSource,xmlDoc){if(!xmlDoc||!xmlDoc.documentElement){throw new Error($.getString("Errors.Xml"));}
+const root=xmlDoc.documentElement;const rootName=root.localName||root.tagName;const ns=xmlDoc.documentElement.namespaceURI;let configuration=null;const displayRects=[];let dispRectNodes;let dispRectNode;let rectNode;let sizeNode;let i;if(rootName==="Image"){try{sizeNode=root.getElementsByTagName("Size")[0];if(sizeNode===undefined){sizeNode=root.getElementsByTagNameNS(ns,"Size")[0];}
+configuration={Image:{xmlns:"http://schemas.microsoft.com/deepzoom/2008",Url:root.getAttribute("Url"),Format:root.getAttribute("Format"),DisplayRect:null,Overlap:parseInt(root.getAttribute("Overlap"),10),TileSize:parseInt(root.getAttribute("TileSize"),10),Size:{Height:parseInt(sizeNode.getAttribute("Height"),10),Width:parseInt(sizeNode.getAttribute("Width"),10)}}};if(!$.imageFormatSupported(configuration.Image.Format)){throw new Error($.getString("Errors.ImageFormat",configuration.Image.Format.toUpperCase()));}
+dispRectNodes=root.getElementsByTagName("DisplayRect");if(dispRectNodes===undefined){dispRectNodes=root.getElementsByTagNameNS(ns,"DisplayRect")[0];}
+for(i=0;i<dispRectNodes.length;i++){dispRectNode=dispRectNodes[i];rectNode=dispRectNode.getElementsByTagName("Rect")[0];if(rectNode===undefined){rectNode=dispRectNode.getElementsByTagNameNS(ns,"Rect")[0];}
+displayRects.push({Rect:{X:parseInt(rectNode.getAttribute("X"),10),Y:parseInt(rectNode.getAttribute("Y"),10),Width:parseInt(rectNode.getAttribute("Width"),10),Height:parseInt(rectNode.getAttribute("Height"),10),MinLevel:parseInt(dispRectNode.getAttribute("MinLevel"),10),MaxLevel:parseInt(dispRectNode.getAttribute("MaxLevel"),10)}});}
+if(displayRects.length){configuration.Image.DisplayRect=displayRects;}
+return configureFromObject(tileSource,configuration);}catch(e){throw(e instanceof Error)?e:new Error($.getString("Errors.Dzi"));}}else if(rootName==="Collection"){throw new Error($.getString("Errors.Dzc"));}else if(rootName==="Error"){const messageNode=root.getElementsByTagName("Message")[0];const message=messageNode.firstChild.nodeValue;throw new Error(message);}
+throw new Error($.getString("Errors.Dzi"));}
+function configureFromObject(tileSource,configuration){const imageData=configuration.Image;const tilesUrl=imageData.Url;const fileFormat=imageData.Format;const sizeData=imageData.Size;const dispRectData=imageData.DisplayRect||[];const width=parseInt(sizeData.Width,10);const height=parseInt(sizeData.Height,10);const tileSize=parseInt(imageData.TileSize,10);const tileOverlap=parseInt(imageData.Overlap,10);const displayRects=[];let rectData;for(let i=0;i<dispRectData.length;i++){rectData=dispRectData[i].Rect;displayRects.push(new $.DisplayRect(parseInt(rectData.X,10),parseInt(rectData.Y,10),parseInt(rectData.Width,10),parseInt(rectData.Height,10),parseInt(rectData.MinLevel,10),parseInt(rectData.MaxLevel,10)));}
+return $.extend(true,{width:width,height:height,tileSize:tileSize,tileOverlap:tileOverlap,minLevel:null,maxLevel:null,tilesUrl:tilesUrl,fileFormat:fileFormat,displayRects:displayRects},configuration);}}(OpenSeadragon));(function($){$.IIIFTileSource=function(options){$.extend(true,this,options);this._id=this["@id"]||this["id"]||this['identifier']||null;if(!(this.height&&this.width&&this._id)){throw new Error('IIIF required parameters (width, height, or id) not provided.');}
+options.tileSizePerScaleFactor={};this.tileFormat=this.tileFormat||'jpg';this.version=options.version;this.isLevel0=checkLevel0(options);if(this.tile_width&&this.tile_height){options.tileWidth=this.tile_width;options.tileHeight=this.tile_height;}else if(this.tile_width){options.tileSize=this.tile_width;}else if(this.tile_height){options.tileSize=this.tile_height;}else if(this.tiles){if(this.tiles.length===1){options.tileWidth=this.tiles[0].width;options.tileHeight=this.tiles[0].height||this.tiles[0].width;this.scale_factors=this.tiles[0].scaleFactors;}else{this.scale_factors=[];for(let t=0;t<this.tiles.length;t++){for(let sf=0;sf<this.tiles[t].scaleFactors.length;sf++){const scaleFactor=this.tiles[t].scaleFactors[sf];this.scale_factors.push(scaleFactor);options.tileSizePerScaleFactor[scaleFactor]={width:this.tiles[t].width,height:this.tiles[t].height||this.tiles[t].width};}}}}else if(canBeTiled(options)){const shortDim=Math.min(this.height,this.width);const tileOptions=[256,512,1024];const smallerTiles=[];for(let c=0;c<tileOptions.length;c++){if(tileOptions[c]<=shortDim){smallerTiles.push(tileOptions[c]);}}
+if(smallerTiles.length>0){options.tileSize=Math.max.apply(null,smallerTiles);}else{options.tileSize=shortDim;}}else if(this.sizes&&this.sizes.length>0){this.emulateLegacyImagePyramid=true;options.levels=constructLevels(this);$.extend(true,options,{width:options.levels[options.levels.length-1].width,height:options.levels[options.levels.length-1].height,tileSize:Math.max(options.height,options.width),tileOverlap:0,minLevel:0,maxLevel:options.levels.length-1});this.levels=options.levels;}else{$.console.error("Nothing in the info.json to construct image pyramids from");}
+if(!options.maxLevel&&!this.emulateLegacyImagePyramid){if(!this.scale_factors){options.maxLevel=Number(Math.round(Math.log(Math.max(this.width,this.height),2)));}else{const maxScaleFactor=Math.max.apply(null,this.scale_factors);options.maxLevel=Math.round(Math.log(maxScaleFactor)*Math.LOG2E);}}
+if(this.sizes){let sizeLength=this.sizes.length;const sortedSizes=this.sizes.slice().sort((size1,size2)=>size1.width-size2.width);if(sortedSizes[sizeLength-1].width<this.width&&sortedSizes[sizeLength-1].height<this.height){sortedSizes.push({width:this.width,height:this.height});sizeLength++;}
+if(sizeLength===options.maxLevel+1){let isResolutionList=1;if(this.scale_factors&&this.scale_factors.length===sizeLength){for(let i=0;i<sizeLength;i++){const factor=this.scale_factors[sizeLength-i-1];if(Math.round(this.width/sortedSizes[i].width)!==factor||Math.round(this.height/sortedSizes[i].height)!==factor){isResolutionList=0;break;}}}
+if(isResolutionList===1){this.levelSizes=sortedSizes;}}}
+$.TileSource.apply(this,[options]);};$.extend($.IIIFTileSource.prototype,$.TileSource.prototype,{supports:function(data,url){if(data.protocol&&data.protocol==='http://iiif.io/api/image'){return true;}else if(data['@context']&&(data['@context']==="http://library.stanford.edu/iiif/image-api/1.1/context.json"||data['@context']==="http://iiif.io/api/image/1/context.json")){return true;}else if(data.profile&&data.profile.indexOf("http://library.stanford.edu/iiif/image-api/compliance.html")===0){return true;}else if(data.identifier&&data.width&&data.height){return true;}else if(data.documentElement&&"info"===data.documentElement.tagName&&"http://library.stanford.edu/iiif/image-api/ns/"===data.documentElement.namespaceURI){return true;}else{return false;}},configure:function(data,url,postData){if(!$.isPlainObject(data)){const options=configureFromXml10(data);options['@context']="http://iiif.io/api/image/1.0/context.json";options["@id"]=url.replace('/info.xml','');options.version=1;return options;}else{if(!data['@context']){data['@context']='http://iiif.io/api/image/1.0/context.json';data["@id"]=url.replace('/info.json','');data.version=1;}else{let context=data['@context'];if(Array.isArray(context)){for(let i=0;i<context.length;i++){if(typeof context[i]==='string'&&(/^http:\/\/iiif\.io\/api\/image\/[1-3]\/context\.json$/.test(context[i])||context[i]==='http://library.stanford.edu/iiif/image-api/1.1/context.json')){context=context[i];break;}}}
+switch(context){case'http://iiif.io/api/image/1/context.json':case'http://library.stanford.edu/iiif/image-api/1.1/context.json':data.version=1;break;case'http://iiif.io/api/image/2/context.json':data.version=2;break;case'http://iiif.io/api/image/3/context.json':data.version=3;break;default:$.console.error('Data has a @context property which contains no known IIIF context URI.');}}
+if(data.preferredFormats){for(let f=0;f<data.preferredFormats.length;f++){if($.imageFormatSupported(data.preferredFormats[f])){data.tileFormat=data.preferredFormats[f];break;}}}
+return data;}},getTileWidth:function(level){if(this.emulateLegacyImagePyramid){return $.TileSource.prototype.getTileWidth.call(this,level);}
+const scaleFactor=Math.pow(2,this.maxLevel-level);if(this.tileSizePerScaleFactor&&this.tileSizePerScaleFactor[scaleFactor]){return this.tileSizePerScaleFactor[scaleFactor].width;}
+return this._tileWidth;},getTileHeight:function(level){if(this.emulateLegacyImagePyramid){return $.TileSource.prototype.getTileHeight.call(this,level);}
+const scaleFactor=Math.pow(2,this.maxLevel-level);if(this.tileSizePerScaleFactor&&this.tileSizePerScaleFactor[scaleFactor]){return this.tileSizePerScaleFactor[scaleFactor].height;}
+return this._tileHeight;},getLevelScale:function(level){if(this.emulateLegacyImagePyramid){let levelScale=NaN;if(this.levels.length>0&&level>=this.minLevel&&level<=this.maxLevel){levelScale=this.levels[level].width/this.levels[this.maxLevel].width;}
+return levelScale;}
+return $.TileSource.prototype.getLevelScale.call(this,level);},getNumTiles:function(level){if(this.emulateLegacyImagePyramid){const scale=this.getLevelScale(level);if(scale){return new $.Point(1,1);}else{return new $.Point(0,0);}}
+if(this.levelSizes){const levelSize=this.levelSizes[level];const x=Math.ceil(levelSize.width/this.getTileWidth(level));const y=Math.ceil(levelSize.height/this.getTileHeight(level));return new $.Point(x,y);}
+else{return $.TileSource.prototype.getNumTiles.call(this,level);}},getTileAtPoint:function(level,point){if(this.emulateLegacyImagePyramid){return new $.Point(0,0);}
+if(this.levelSizes){const validPoint=point.x>=0&&point.x<=1&&point.y>=0&&point.y<=1/this.aspectRatio;$.console.assert(validPoint,"[TileSource.getTileAtPoint] must be called with a valid point.");const widthScaled=this.levelSizes[level].width;const pixelX=point.x*widthScaled;const pixelY=point.y*widthScaled;let x=Math.floor(pixelX/this.getTileWidth(level));let y=Math.floor(pixelY/this.getTileHeight(level));if(point.x>=1){x=this.getNumTiles(level).x-1;}
+const EPSILON=1e-15;if(point.y>=1/this.aspectRatio-EPSILON){y=this.getNumTiles(level).y-1;}
+return new $.Point(x,y);}
+return $.TileSource.prototype.getTileAtPoint.call(this,level,point);},getTileUrl:function(level,x,y){if(this.emulateLegacyImagePyramid){let url=null;if(this.levels.length>0&&level>=this.minLevel&&level<=this.maxLevel){url=this.levels[level].url;}
+return url;}
+const IIIF_ROTATION='0';const scale=Math.pow(0.5,this.maxLevel-level);let levelWidth;let levelHeight;let tileWidth;let tileHeight;let iiifTileSizeWidth;let iiifTileSizeHeight;let iiifRegion;let iiifTileX;let iiifTileY;let iiifTileW;let iiifTileH;let iiifSize;let iiifSizeW;let iiifSizeH;let iiifQuality;if(this.levelSizes){levelWidth=this.levelSizes[level].width;levelHeight=this.levelSizes[level].height;}
+else{levelWidth=Math.ceil(this.width*scale);levelHeight=Math.ceil(this.height*scale);}
+tileWidth=this.getTileWidth(level);tileHeight=this.getTileHeight(level);iiifTileSizeWidth=Math.round(tileWidth/scale);iiifTileSizeHeight=Math.round(tileHeight/scale);if(this.version===1){iiifQuality="native."+this.tileFormat;}else{iiifQuality="default."+this.tileFormat;}
+if(levelWidth<tileWidth&&levelHeight<tileHeight){if(this.version===2&&levelWidth===this.width){iiifSize="full";}else if(this.version===3&&levelWidth===this.width&&levelHeight===this.height){iiifSize="max";}else if(this.version===3){iiifSize=levelWidth+","+levelHeight;}else{iiifSize=levelWidth+",";}
+iiifRegion='full';}else{iiifTileX=x*iiifTileSizeWidth;iiifTileY=y*iiifTileSizeHeight;iiifTileW=Math.min(iiifTileSizeWidth,this.width-iiifTileX);iiifTileH=Math.min(iiifTileSizeHeight,this.height-iiifTileY);if(x===0&&y===0&&iiifTileW===this.width&&iiifTileH===this.height){iiifRegion="full";}else{iiifRegion=[iiifTileX,iiifTileY,iiifTileW,iiifTileH].join(',');}
+iiifSizeW=Math.min(tileWidth,levelWidth-(x*tileWidth));iiifSizeH=Math.min(tileHeight,levelHeight-(y*tileHeight));if(this.version===2&&iiifSizeW===this.width){iiifSize="full";}else if(this.version===3&&iiifSizeW===this.width&&iiifSizeH===this.height){iiifSize="max";}else if(this.isLevel0&&this.version<3){iiifSize=iiifSizeW+",";}else{iiifSize=iiifSizeW+","+iiifSizeH;}}
+const uri=[this._id,iiifRegion,iiifSize,IIIF_ROTATION,iiifQuality].join('/');return uri;},equals:function(otherSource){return otherSource&&this._id===otherSource._id;},__testonly__:{canBeTiled:canBeTiled,constructLevels:constructLevels}});function checkLevel0(options){const level0Profiles=["http://library.stanford.edu/iiif/image-api/compliance.html#level0","http://library.stanford.edu/iiif/image-api/1.1/compliance.html#level0","http://iiif.io/api/image/2/level0.json","level0","https://iiif.io/api/image/3/level0.json"];const profileLevel=Array.isArray(options.profile)?options.profile[0]:options.profile;const isLevel0=(level0Profiles.indexOf(profileLevel)!==-1);return isLevel0;}
+function canBeTiled(options){const isLevel0=checkLevel0(options);let hasCanonicalSizeFeature=false;if(options.version===2&&options.profile.length>1&&options.profile[1].supports){hasCanonicalSizeFeature=options.profile[1].supports.indexOf("sizeByW")!==-1;}
+if(options.version===3&&options.extraFeatures){hasCanonicalSizeFeature=options.extraFeatures.indexOf("sizeByWh")!==-1;}
+return!isLevel0||hasCanonicalSizeFeature;}
+function constructLevels(options){const levels=[];for(let i=0;i<options.sizes.length;i++){levels.push({url:options._id+'/full/'+options.sizes[i].width+','+
+(options.version===3?options.sizes[i].height:'')+'/0/default.'+options.tileFormat,width:options.sizes[i].width,height:options.sizes[i].height});}
+return levels.sort(function(a,b){return a.width-b.width;});}
+function configureFromXml10(xmlDoc){if(!xmlDoc||!xmlDoc.documentElement){throw new Error($.getString("Errors.Xml"));}
+const root=xmlDoc.documentElement;const rootName=root.tagName;let configuration=null;if(rootName==="info"){try{configuration={};parseXML10(root,configuration);return configuration;}catch(e){throw(e instanceof Error)?e:new Error($.getString("Errors.IIIF"));}}
+throw new Error($.getString("Errors.IIIF"));}
+function parseXML10(node,configuration,property){if(node.nodeType===3&&property){let value=node.nodeValue.trim();if(value.match(/^\d*$/)){value=Number(value);}
+if(!configuration[property]){configuration[property]=value;}else{if(!$.isArray(configuration[property])){configuration[property]=[configuration[property]];}
+configuration[property].push(value);}}else if(node.nodeType===1){for(let i=0;i<node.childNodes.length;i++){parseXML10(node.childNodes[i],configuration,node.nodeName);}}}}(OpenSeadragon));(function($){$.IIPTileSource=function(options){$.EventSource.call(this);if(options&&options.iipsrv&&options.image){$.extend(this,options);this.aspectRatio=1;this.dimensions=new $.Point(10,10);this._tileWidth=0;this._tileHeight=0;this.tileOverlap=0;this.minLevel=0;this.maxLevel=0;this.ready=false;const url=this.getMetadataUrl();this.getImageInfo(url);}};$.extend($.IIPTileSource.prototype,$.TileSource.prototype,{getMetadataUrl:function(){return this.iipsrv+'?FIF='+this.image+'&obj=IIP,1.0&obj=Max-size&obj=Tile-size&obj=Resolution-number&obj=Resolutions';},supports:function(data,url){return(data&&("iipsrv"in data)&&("image"in data));},parseIIP:function(data){let tmp=data.split("Max-size:");if(!tmp[1]){throw new Error("No Max-size returned");}
+let size=tmp[1].split(" ");this.width=parseInt(size[0],10);this.height=parseInt(size[1],10);this.dimensions=new $.Point(this.width,this.height);this.aspectRatio=this.width/this.height;tmp=data.split("Tile-size:");if(!tmp[1]){throw new Error("No Tile-size returned");}
+size=tmp[1].split(" ");this._tileWidth=parseInt(size[0],10);this._tileHeight=parseInt(size[1],10);tmp=data.split("Resolution-number:");const numRes=parseInt(tmp[1],10);this.minLevel=0;this.maxLevel=numRes-1;this.tileOverlap=0;tmp=data.split("Resolutions:");size=tmp[1].split(",");const len=size.length;this.levelSizes=new Array(len);for(let n=0;n<len;n++){const res=size[n].split(" ");const w=parseInt(res[0],10);const h=parseInt(res[1],10);this.levelSizes[n]={width:w,height:h};}},getImageInfo:function(url){const _this=this;$.makeAjaxRequest({url:url,type:"GET",async:false,withCredentials:this.ajaxWithCredentials,headers:this.ajaxHeaders,success:function(xhr){try{OpenSeadragon["IIPTileSource"].prototype.parseIIP.call(_this,xhr.responseText);_this.ready=true;_this.raiseEvent('ready',{tileSource:_this});}
+catch(e){const msg="IIPTileSource: Error parsing IIP metadata: "+e.message;_this.raiseEvent('open-failed',{message:msg,source:url});}},error:function(xhr,exc){const msg="IIPTileSource: Unable to get IIP metadata from "+url;$.console.error(msg);_this.raiseEvent('open-failed',{message:msg,source:url});}});},configure:function(options,url,postData){return options;},getNumTiles:function(level){const levelSize=this.levelSizes[level];let x=Math.ceil(levelSize.width/this._tileWidth);let y=Math.ceil(levelSize.height/this._tileHeight);return new $.Point(x,y);},getTileUrl:function(level,x,y){const levelSize=this.levelSizes[level];const ntlx=Math.ceil(levelSize.width/this._tileWidth);let url=this.iipsrv+'?FIF='+this.image+'&';if(this.transform){if(this.transform.stack){url+='SDS='+this.transform.stack+'&';}
+if(this.transform.contrast){url+='CNT='+this.transform.contrast+'&';}
+if(this.transform.gamma){url+='GAM='+this.transform.gamma+'&';}
+if(this.transform.invert&&this.transform.invert===true){url+='INV&';}
+if(this.transform.color){url+='COL='+this.transform.color+'&';}
+if(this.transform.twist){url+='CTW='+this.transform.twist+'&';}
+if(this.transform.convolution){url+='CNV='+this.transform.convolution+'&';}
+if(this.transform.quality){url+='QLT='+this.transform.quality+'&';}
+if(this.transform.colormap){url+='CMP='+this.transform.colormap+'&';}
+if(this.transform.minmax){url+='MINMAX='+this.transform.minmax+'&';}
+if(this.transform.hillshade){url+='SHD='+this.transform.hillshade+'&';}}
+let format="JTL";if(this.format==="png"){format="PTL";}else if(this.format==="webp"){format="WTL";}else if(this.format==="avif"){format="ATL";}
+const tile=(y*ntlx)+x;return url+format+'='+level+','+tile;}});$.extend(true,$.IIPTileSource.prototype,$.EventSource.prototype);}(OpenSeadragon));(function($){$.IrisTileSource=function(options){$.TileSource.apply(this,[options]);if(!options.serverUrl||!options.slideId){throw new Error("IrisTileSource requires serverUrl and slideId");}
+this.serverUrl=options.serverUrl;this.slideId=options.slideId;this.ready=false;if(options.metadata){this.parseMetadata(options.metadata);this.ready=true;this.raiseEvent('ready',{tileSource:this});}else{const url=this.getMetadataUrl();this.getImageInfo(url);}};$.extend($.IrisTileSource.prototype,$.TileSource.prototype,{getMetadataUrl:function(){return this.serverUrl+'/slides/'+this.slideId+'/metadata';},supports:function(data){return(data&&data.type==="iris"&&data.serverUrl&&data.slideId);},parseMetadata:function(data){this._tileWidth=256;this._tileHeight=256;this.tileSize=this._tileWidth;this.tileOverlap=0;const layers=data.extent.layers;const maxLayer=layers.length-1;const maxScale=layers[maxLayer].scale;this.width=Math.ceil(data.extent.width*maxScale);this.height=Math.ceil(data.extent.height*maxScale);this.dimensions=new $.Point(this.width,this.height);this.aspectRatio=this.width/this.height;this.levelSizes=layers.map(level=>({width:Math.ceil(level.x_tiles*this._tileWidth),height:Math.ceil(level.y_tiles*this._tileHeight),xTiles:Math.ceil(level.x_tiles),yTiles:Math.ceil(level.y_tiles)}));this.levelScales=layers.map(level=>level.scale/maxScale);this.minLevel=0;this.maxLevel=Math.ceil(this.levelSizes.length-1);},getImageInfo:function(url){const _this=this;$.makeAjaxRequest({url:url,type:"GET",async:true,success:function(xhr){try{const data=JSON.parse(xhr.responseText);_this.parseMetadata(data);_this.ready=true;_this.raiseEvent('ready',{tileSource:_this});}
+catch(e){const msg="IrisTileSource: Error parsing metadata: "+e.message;$.console.error(msg);_this.raiseEvent('open-failed',{message:msg,source:url});}},error:function(xhr,exc){const msg="IrisTileSource: Unable to get metadata from "+url;$.console.error(msg);_this.raiseEvent('open-failed',{message:msg,source:url});}});},getNumTiles:function(level){if(level<this.minLevel||level>this.maxLevel||!this.levelSizes[level]){return new $.Point(0,0);}
+return new $.Point(Math.ceil(this.levelSizes[level].xTiles),Math.ceil(this.levelSizes[level].yTiles));},getTileUrl:function(level,x,y){const pos=y*this.levelSizes[level].xTiles+x;return`${this.serverUrl}/slides/${this.slideId}/layers/${level}/tiles/${pos}`;},getLevelScale:function(level){return this.levelScales[level];},configure:function(options){return options;}});$.extend(true,$.IrisTileSource.prototype,$.EventSource.prototype);}(OpenSeadragon));(function($){$.OsmTileSource=function(width,height,tileSize,tileOverlap,tilesUrl){let options;if($.isPlainObject(width)){options=width;}else{options={width:arguments[0],height:arguments[1],tileSize:arguments[2],tileOverlap:arguments[3],tilesUrl:arguments[4]};}
+if(!options.width||!options.height){options.width=67108864;options.height=67108864;}
+if(!options.tileSize){options.tileSize=256;options.tileOverlap=0;}
+if(!options.tilesUrl){options.tilesUrl="http://tile.openstreetmap.org/";}
+options.minLevel=8;$.TileSource.apply(this,[options]);};$.extend($.OsmTileSource.prototype,$.TileSource.prototype,{supports:function(data,url){return(data.type&&"openstreetmaps"===data.type);},configure:function(data,url,postData){return data;},getTileUrl:function(level,x,y){return this.tilesUrl+(level-8)+"/"+x+"/"+y+".png";},equals:function(otherSource){return otherSource&&this.tilesUrl===otherSource.tilesUrl;}});}(OpenSeadragon));(function($){$.TmsTileSource=function(width,height,tileSize,tileOverlap,tilesUrl){let options;if($.isPlainObject(width)){options=width;}else{options={width:arguments[0],height:arguments[1],tileSize:arguments[2],tileOverlap:arguments[3],tilesUrl:arguments[4]};}
+const bufferedWidth=Math.ceil(options.width/256)*256;const bufferedHeight=Math.ceil(options.height/256)*256;let max;if(bufferedWidth>bufferedHeight){max=bufferedWidth/256;}else{max=bufferedHeight/256;}
+options.maxLevel=Math.ceil(Math.log(max)/Math.log(2))-1;options.tileSize=256;options.width=bufferedWidth;options.height=bufferedHeight;$.TileSource.apply(this,[options]);};$.extend($.TmsTileSource.prototype,$.TileSource.prototype,{supports:function(data,url){return(data.type&&"tiledmapservice"===data.type);},configure:function(data,url,postData){return data;},getTileUrl:function(level,x,y){const yTiles=this.getNumTiles(level).y-1;return this.tilesUrl+level+"/"+x+"/"+(yTiles-y)+".png";},equals:function(otherSource){return otherSource&&this.tilesUrl===otherSource.tilesUrl;}});}(OpenSeadragon));(function($){$.ZoomifyTileSource=function(options){if(typeof options.tileSize==='undefined'){options.tileSize=256;}
+if(typeof options.fileFormat==='undefined'){options.fileFormat='jpg';this.fileFormat=options.fileFormat;}
+const currentImageSize={x:options.width,y:options.height};options.imageSizes=[{x:options.width,y:options.height}];options.gridSize=[this._getGridSize(options.width,options.height,options.tileSize)];while(parseInt(currentImageSize.x,10)>options.tileSize||parseInt(currentImageSize.y,10)>options.tileSize){currentImageSize.x=Math.floor(currentImageSize.x/2);currentImageSize.y=Math.floor(currentImageSize.y/2);options.imageSizes.push({x:currentImageSize.x,y:currentImageSize.y});options.gridSize.push(this._getGridSize(currentImageSize.x,currentImageSize.y,options.tileSize));}
+options.imageSizes.reverse();options.gridSize.reverse();options.minLevel=0;options.maxLevel=options.gridSize.length-1;$.TileSource.apply(this,[options]);};$.extend($.ZoomifyTileSource.prototype,$.TileSource.prototype,{_getGridSize:function(width,height,tileSize){return{x:Math.ceil(width/tileSize),y:Math.ceil(height/tileSize)};},_calculateAbsoluteTileNumber:function(level,x,y){let num=0;let size={};for(let z=0;z<level;z++){size=this.gridSize[z];num+=size.x*size.y;}
+size=this.gridSize[level];num+=size.x*y+x;return num;},supports:function(data,url){return(data.type&&"zoomifytileservice"===data.type);},configure:function(data,url,postData){return data;},getTileUrl:function(level,x,y){let result=0;const num=this._calculateAbsoluteTileNumber(level,x,y);result=Math.floor(num/256);return this.tilesUrl+'TileGroup'+result+'/'+level+'-'+x+'-'+y+'.'+this.fileFormat;},equals:function(otherSource){return otherSource&&this.tilesUrl===otherSource.tilesUrl;}});}(OpenSeadragon));(function($){$.LegacyTileSource=function(levels){let options;let width;let height;if($.isArray(levels)){options={type:'legacy-image-pyramid',levels:levels};}
+options.levels=filterFiles(options.levels);if(options.levels.length>0){width=options.levels[options.levels.length-1].width;height=options.levels[options.levels.length-1].height;}
+else{width=0;height=0;$.console.error("No supported image formats found");}
+$.extend(true,options,{width:width,height:height,tileSize:Math.max(height,width),tileOverlap:0,minLevel:0,maxLevel:options.levels.length>0?options.levels.length-1:0});$.TileSource.apply(this,[options]);this.levels=options.levels;};$.extend($.LegacyTileSource.prototype,$.TileSource.prototype,{supports:function(data,url){return(data.type&&"legacy-image-pyramid"===data.type)||(data.documentElement&&"legacy-image-pyramid"===data.documentElement.getAttribute('type'));},configure:function(configuration,dataUrl,postData){let options;if(!$.isPlainObject(configuration)){options=configureFromXML(this,configuration);}else{options=configureFromObject(this,configuration);}
+return options;},getLevelScale:function(level){let levelScale=NaN;if(this.levels.length>0&&level>=this.minLevel&&level<=this.maxLevel){levelScale=this.levels[level].width/this.levels[this.maxLevel].width;}
+return levelScale;},getNumTiles:function(level){const scale=this.getLevelScale(level);if(scale){return new $.Point(1,1);}else{return new $.Point(0,0);}},getTileUrl:function(level,x,y){let url=null;if(this.levels.length>0&&level>=this.minLevel&&level<=this.maxLevel){url=this.levels[level].url;}
+return url;},equals:function(otherSource){if(!otherSource||!otherSource.levels||otherSource.levels.length!==this.levels.length){return false;}
+for(let i=this.minLevel;i<=this.maxLevel;i++){if(this.levels[i].url!==otherSource.levels[i].url){return false;}}
+return true;}});function filterFiles(files){const filtered=[];let file;for(let i=0;i<files.length;i++){file=files[i];if(file.height&&file.width&&file.url){filtered.push({url:file.url,width:Number(file.width),height:Number(file.height)});}
+else{$.console.error('Unsupported image format: %s',file.url?file.url:'<no URL>');}}
+return filtered.sort(function(a,b){return a.height-b.height;});}
+function configureFromXML(tileSource,xmlDoc){if(!xmlDoc||!xmlDoc.documentElement){throw new Error($.getString("Errors.Xml"));}
+const root=xmlDoc.documentElement;const rootName=root.tagName;let conf=null;let levels=[];let level;if(rootName==="image"){try{conf={type:root.getAttribute("type"),levels:[]};levels=root.getElementsByTagName("level");for(let i=0;i<levels.length;i++){level=levels[i];conf.levels.push({url:level.getAttribute("url"),width:parseInt(level.getAttribute("width"),10),height:parseInt(level.getAttribute("height"),10)});}
+return configureFromObject(tileSource,conf);}catch(e){throw(e instanceof Error)?e:new Error('Unknown error parsing Legacy Image Pyramid XML.');}}else if(rootName==="collection"){throw new Error('Legacy Image Pyramid Collections not yet supported.');}else if(rootName==="error"){throw new Error('Error: '+xmlDoc);}
+throw new Error('Unknown element '+rootName);}
+function configureFromObject(tileSource,configuration){return configuration.levels;}}(OpenSeadragon));(function($){$.ImageTileSource=class extends $.TileSource{constructor(props){super($.extend({buildPyramid:true,crossOriginPolicy:false,ajaxWithCredentials:false,},props));}
+supports(data,url){return data.type&&data.type==="image";}
+configure(options,dataUrl,postData){return options;}
+getImageInfo(url){const image=new Image(),_this=this;if(this.crossOriginPolicy){image.crossOrigin=this.crossOriginPolicy;}
+$.addEvent(image,'load',function(){_this.width=image.naturalWidth;_this.height=image.naturalHeight;_this.tileWidth=_this.width;_this.tileHeight=_this.height;_this.tileOverlap=0;_this.minLevel=0;_this.image=image;_this.levels=_this._buildLevels(image);_this.maxLevel=_this.levels.length-1;_this.raiseEvent('ready',{tileSource:_this});});$.addEvent(image,'error',function(){_this.image=null;_this.raiseEvent('open-failed',{message:"Error loading image at "+url,source:url});});image.src=url;}
+getLevelScale(level){let levelScale=NaN;if(level>=this.minLevel&&level<=this.maxLevel){levelScale=this.levels[level].width/this.levels[this.maxLevel].width;}
+return levelScale;}
+getNumTiles(level){if(this.getLevelScale(level)){return new $.Point(1,1);}
+return new $.Point(0,0);}
+getTileUrl(level,x,y){if(level===this.maxLevel){return this.url;}
+return`${this.url}?l=${level}&x=${x}&y=${y}`;}
+equals(otherSource){return this.url===otherSource.url;}
+getTilePostData(level,x,y){return{level:level,x:x,y:y};}
+getContext2D(level,x,y){$.console.error('Using [TiledImage.getContext2D] (for plain images only) is deprecated. '+'Use overridden downloadTileStart (https://openseadragon.github.io/examples/advanced-data-model/) instead.');return this._createContext2D();}
+downloadTileStart(job){const tileData=job.postData;if(tileData.level===this.maxLevel){job.finish(this.image,null,"image");return;}
+if(tileData.level>=this.minLevel&&tileData.level<=this.maxLevel){const levelData=this.levels[tileData.level];const context=this._createContext2D(this.image,levelData.width,levelData.height);job.finish(context,null,"context2d");return;}
+job.fail(`Invalid level ${tileData.level} for plain image source. Did you forget to set buildPyramid=true?`);}
+downloadTileAbort(job){}
+_buildLevels(image){const levels=[{url:image.src,width:image.naturalWidth,height:image.naturalHeight}];if(!this.buildPyramid||!$.supportsCanvas||!this.useCanvas){return levels;}
+let currentWidth=image.naturalWidth,currentHeight=image.naturalHeight;while(currentWidth>=2&&currentHeight>=2){currentWidth=Math.floor(currentWidth/2);currentHeight=Math.floor(currentHeight/2);levels.push({width:currentWidth,height:currentHeight,});}
+return levels.reverse();}
+_createContext2D(data,w,h){const canvas=document.createElement("canvas"),context=canvas.getContext("2d");canvas.width=w;canvas.height=h;context.drawImage(data,0,0,w,h);return context;}};}(OpenSeadragon));(function($){$.TileSourceCollection=function(tileSize,tileSources,rows,layout){$.console.error('TileSourceCollection is deprecated; use World instead');};}(OpenSeadragon));(function($){const OpenSeadragon=$;OpenSeadragon.PriorityQueue=class PriorityQueue{constructor(optHeap=undefined){this.nodes_=[];if(optHeap){this.insertAll(optHeap);}}
+insert(key,value){this.insertNode(new Node(key,value));}
+insertNode(node){const nodes=this.nodes_;node.index=nodes.length;nodes.push(node);this.moveUp_(node.index);}
+insertAll(heap){let keys,values;if(heap instanceof $.PriorityQueue){keys=heap.getKeys();values=heap.getValues();if(this.getCount()<=0){const nodes=this.nodes_;for(let i=0;i<keys.length;i++){const node=new Node(keys[i],values[i]);node.index=nodes.length;nodes.push(node);}
+return;}}else{throw"insertAll supports only OpenSeadragon.PriorityQueue object!";}
+for(let i=0;i<keys.length;i++){this.insert(keys[i],values[i]);}}
+remove(){const nodes=this.nodes_;const count=nodes.length;const rootNode=nodes[0];if(count<=0){return undefined;}else if(count==1){nodes.length=0;}else{nodes[0]=nodes.pop();if(nodes[0]){nodes[0].index=0;}
+this.moveDown_(0);}
+if(rootNode){delete rootNode.index;}
+return rootNode;}
+peek(){const nodes=this.nodes_;if(nodes.length==0){return undefined;}
+return nodes[0].value;}
+peekKey(){return this.nodes_[0]&&this.nodes_[0].key;}
+decreaseKey(node,key){if(node.index===undefined){node.key=key;this.insertNode(node);}else{node.key=key;this.moveUp_(node.index);}}
+moveDown_(index){const nodes=this.nodes_;const count=nodes.length;const node=nodes[index];while(index<(count>>1)){const leftChildIndex=this.getLeftChildIndex_(index);const rightChildIndex=this.getRightChildIndex_(index);const smallerChildIndex=rightChildIndex<count&&nodes[rightChildIndex].key<nodes[leftChildIndex].key?rightChildIndex:leftChildIndex;if(nodes[smallerChildIndex].key>node.key){break;}
+nodes[index]=nodes[smallerChildIndex];nodes[index].index=index;index=smallerChildIndex;}
+nodes[index]=node;if(node){node.index=index;}}
+moveUp_(index){const nodes=this.nodes_;const node=nodes[index];while(index>0){const parentIndex=this.getParentIndex_(index);if(nodes[parentIndex].key>node.key){nodes[index]=nodes[parentIndex];nodes[index].index=index;index=parentIndex;}else{break;}}
+nodes[index]=node;if(node){node.index=index;}}
+getLeftChildIndex_(index){return index*2+1;}
+getRightChildIndex_(index){return index*2+2;}
+getParentIndex_(index){return(index-1)>>1;}
+getValues(){return this.nodes_.map(n=>n.value);}
+getKeys(){return this.nodes_.map(n=>n.key);}
+containsValue(val){return this.nodes_.some((node)=>node.value==val);}
+containsKey(key){return this.nodes_.some((node)=>node.value==key);}
+clone(){return new $.PriorityQueue(this);}
+getCount(){return this.nodes_.length;}
+isEmpty(){return this.nodes_.length===0;}
+clear(){this.nodes_.length=0;}};OpenSeadragon.PriorityQueue.Node=class Node{constructor(key,value){this.key=key;this.value=value;this.index=0;}
+clone(){return new Node(this.key,this.value);}};}(OpenSeadragon));(function($){const OpenSeadragon=$;class WeightedGraph{constructor(){this.adjacencyList={};this.vertices={};}
+addVertex(vertex){if(!this.vertices[vertex]){this.vertices[vertex]=new $.PriorityQueue.Node(0,vertex);this.adjacencyList[vertex]=[];return true;}
+return false;}
+addEdge(vertex1,vertex2,weight,transform){if(weight<0){$.console.error("WeightedGraph: negative weights will make for invalid shortest path computation!");}
+const outgoingPaths=this.adjacencyList[vertex1],replacedEdgeIndex=outgoingPaths.findIndex(edge=>edge.target===this.vertices[vertex2]),newEdge={target:this.vertices[vertex2],origin:this.vertices[vertex1],weight,transform};if(replacedEdgeIndex<0){this.adjacencyList[vertex1].push(newEdge);return true;}
+this.adjacencyList[vertex1][replacedEdgeIndex]=newEdge;return false;}
+dijkstra(start,finish){const path=[];if(start===finish){return{path:path,cost:0};}
+const nodes=new OpenSeadragon.PriorityQueue();let smallestNode;for(let vertex in this.vertices){vertex=this.vertices[vertex];if(vertex.value===start){vertex.key=0;nodes.insertNode(vertex);}else{vertex.key=Infinity;delete vertex.index;}
+vertex._previous=null;}
+while(nodes.getCount()>0){smallestNode=nodes.remove();if(smallestNode.value===finish){break;}
+const neighbors=this.adjacencyList[smallestNode.value];for(const neighborKey in neighbors){const edge=neighbors[neighborKey];const newCost=smallestNode.key+edge.weight;const nextNeighbor=edge.target;if(newCost<nextNeighbor.key){nextNeighbor._previous=smallestNode;nodes.decreaseKey(nextNeighbor,newCost);}}}
+if(!smallestNode||!smallestNode._previous||smallestNode.value!==finish){return undefined;}
+const finalCost=smallestNode.key;while(smallestNode._previous){const to=smallestNode.value,parent=smallestNode._previous,from=parent.value;path.push(this.adjacencyList[from].find(x=>x.target.value===to));smallestNode=parent;}
+return{path:path.reverse(),cost:finalCost};}}
+let _imageConversionWorker;let _conversionId=0;const _pendingConversions=new Map();let __warnedNoSAB=false;const __hasSAB=typeof SharedArrayBuffer!=='undefined'&&self.crossOriginIsolated===true;function getIBWorker(){if(_imageConversionWorker){return _imageConversionWorker;}
+const code=`
+self.onmessage = async (e) => {
+  const { id, op, } = e.data;
+  let error;
+  try {
+    if (op === 'decodeFromBlob') {
+      const bmp = await createImageBitmap(e.data.blob, { colorSpaceConversion: 'none' });
+      postMessage({ id, ok: true, bmp }, [bmp]);
+      return;
+    }
+    if (op === 'decodeFromBytes') {
+      const u8 = new Uint8Array(e.data.bytes);
+      const b  = new Blob([u8], { type: e.data.mime || '' });
+      const bmp = await createImageBitmap(b, { colorSpaceConversion: 'none' });
+      postMessage({ id, ok: true, bmp }, [bmp]);
+      return;
+    }
+    if (op === 'fetchDecode') {
+      const res = await fetch(e.data.url, e.data.setup);
+      if (!res.ok) throw new Error('HTTP ' + res.status);
+      const b = await res.blob();
+      const bmp = await createImageBitmap(b, { colorSpaceConversion: 'none' });
+      postMessage({ id, ok: true, bmp }, [bmp]);
+      return;
+    }
+    error = 'Unknown op: ' + op;
+  } catch (err) {
+    error = String(err && err.message || err);
+  }
+  postMessage({ id, ok: false, err: error });
+};
+`;const url=URL.createObjectURL(new Blob([code],{type:'text/javascript'}));_imageConversionWorker=new Worker(url);_imageConversionWorker.onmessage=(e)=>{const{id,ok,bmp,err}=e.data||{};const entry=_pendingConversions.get(id);if(!entry){return;}
+_pendingConversions.delete(id);if(entry.timer){clearTimeout(entry.timer);entry.timer=null;}
+if(ok){entry.resolve(bmp);}else{entry.reject(new Error(err));}};_imageConversionWorker.onerror=(e)=>{for(const[,entry]of _pendingConversions){if(entry.timer){clearTimeout(entry.timer);entry.timer=null;}
+entry.reject(new Error('Worker error'));}
+_pendingConversions.clear();};return _imageConversionWorker;}
+function postWorker(op,payload,{timeoutMs=15000}={}){const worker=getIBWorker();const id=++_conversionId;return new $.Promise((resolve,reject)=>{payload.id=id;payload.op=op;const entry={resolve,reject,timer:null};if(timeoutMs>0){entry.timer=setTimeout(()=>{entry.timer=null;_pendingConversions.delete(id);reject(new Error(`Worker timeout (${op})`));},timeoutMs);}
+_pendingConversions.set(id,entry);if(op==='decodeFromBytes'){if(__hasSAB){const u8=payload.u8;const sab=new SharedArrayBuffer(u8.byteLength);new Uint8Array(sab).set(u8);worker.postMessage({id,op,bytes:sab,mime:payload.mime});}else{if(!__warnedNoSAB){__warnedNoSAB=true;console.warn('[Converter] SharedArrayBuffer unavailable; falling back to ArrayBuffer.');}
+const u8=payload.u8;const tight=(u8.byteOffset===0&&u8.byteLength===u8.buffer.byteLength)?u8:u8.slice();worker.postMessage({id,op,bytes:tight.buffer,mime:payload.mime},[tight.buffer]);}
+return;}
+worker.postMessage(payload);});}
+OpenSeadragon.DataTypeConverter=class DataTypeConverter{constructor(){this.graph=new WeightedGraph();this.destructors={};this.copyings={};const imageCreator=(tile,url)=>new $.Promise((resolve,reject)=>{if(!$.supportsAsync){return reject("Not supported in sync mode!");}
+const img=new Image();img.onerror=img.onabort=e=>reject(`Failed to load image: ${url}`);img.onload=()=>resolve(img);if(tile.tiledImage&&tile.tiledImage.crossOriginPolicy){img.crossOrigin=tile.tiledImage.crossOriginPolicy;}
+img.src=url;return undefined;});const canvasContextCreator=(tile,imageData)=>{const canvas=document.createElement('canvas');canvas.width=imageData.width;canvas.height=imageData.height;const context=canvas.getContext('2d',{willReadFrequently:true});context.drawImage(imageData,0,0);return context;};this.learn("rasterBlob","image",(tile,blob)=>new $.Promise((resolve,reject)=>{const url=(window.URL||window.webkitURL).createObjectURL(blob);if(!$.supportsAsync){return reject("Not supported in sync mode!");}
+const img=new Image();img.onerror=img.onabort=e=>{(window.URL||window.webkitURL).revokeObjectURL(blob);reject(e);};img.onload=()=>{(window.URL||window.webkitURL).revokeObjectURL(blob);resolve(img);};img.decoding='async';img.src=url;return undefined;}),1,2);this.learn("context2d","rasterBlob",(tile,ctx)=>new $.Promise((resolve,reject)=>{if(!$.supportsAsync){return reject("Not supported in sync mode!");}
+ctx.canvas.toBlob(resolve);return undefined;}),1,2);this.learn("rasterBlob","imageBitmap",(tile,blob)=>new $.Promise((resolve,reject)=>{if(!$.supportsAsync){return reject("Not supported in sync mode!");}
+if(_imageConversionWorker){postWorker('decodeFromBlob',{blob}).then(resolve).catch(reject);}else{createImageBitmap(blob,{colorSpaceConversion:'none'}).then(resolve).catch(reject);}
+return undefined;}),1,1);this.learn("imageBitmap","context2d",(tile,bmp)=>{const canvas=document.createElement('canvas');canvas.width=bmp.width;canvas.height=bmp.height;const ctx=canvas.getContext('2d',{willReadFrequently:true});ctx.drawImage(bmp,0,0);return ctx;},1,2);this.learn("image","imageBitmap",(tile,img)=>{return createImageBitmap(img,{colorSpaceConversion:'none'});},1,2);this.learn("image","context2d",canvasContextCreator,1,2);this.learn("image","image",(tile,image)=>imageCreator(tile,image.src),1,1);this.learn("context2d","context2d",(tile,ctx)=>canvasContextCreator(tile,ctx.canvas));this.learn("rasterBlob","rasterBlob",(tile,blob)=>blob,0,1);this.learn("imageBitmap","imageBitmap",(tile,bmp)=>new $.Promise((resolve,reject)=>{try{if(!$.supportsAsync){return reject("Not supported in sync mode!");}
+if(!bmp){return reject(new Error("No ImageBitmap to copy"));}
+if(typeof OffscreenCanvas!=='undefined'&&bmp.width&&bmp.height){const oc=new OffscreenCanvas(bmp.width,bmp.height);const ctx=oc.getContext('2d',{willReadFrequently:false});ctx.drawImage(bmp,0,0);if(typeof oc.transferToImageBitmap==='function'){const copy=oc.transferToImageBitmap();return resolve(copy);}
+return createImageBitmap(oc,{colorSpaceConversion:'none'}).then(resolve);}
+return createImageBitmap(bmp,{colorSpaceConversion:'none'}).then(resolve);}catch(e){return reject(e);}}),1,1);this.learnDestroy("context2d",ctx=>{ctx.canvas.width=0;ctx.canvas.height=0;});}
+guessType(x){if(Array.isArray(x)){const types=[];for(const item of x){if(item===undefined||item===null){continue;}
+const type=this.guessType(item);if(!types.includes(type)){types.push(type);}}
+types.sort();return`Array [${types.join(",")}]`;}
+const guessType=$.type(x);if(guessType==="dom-node"){return guessType.nodeName.toLowerCase();}
+if(guessType==="object"){if($.isFunction(x.getType)){return x.getType();}}
+return guessType;}
+learn(from,to,callback,costPower=0,costMultiplier=1){$.console.assert(costPower>=0&&costPower<=7,"[DataTypeConverter] Conversion costPower must be between <0, 7>.");$.console.assert($.isFunction(callback),"[DataTypeConverter:learn] Callback must be a valid function!");if(from===to){this.copyings[to]=callback;}else{costPower++;costMultiplier=Math.min(Math.max(costMultiplier,1),10^5);this.graph.addVertex(from);this.graph.addVertex(to);this.graph.addEdge(from,to,costPower*10^5+costMultiplier,callback);this._known={};}}
+learnDestroy(type,callback){this.destructors[type]=callback;}
+convert(tile,data,from,...to){const conversionPath=this.getConversionPath(from,to);if(!conversionPath){$.console.error(`[OpenSeadragon.converter.convert] Conversion ${from} ---> ${to} cannot be done!`);return $.Promise.resolve();}
+const stepCount=conversionPath.length;const _this=this;const step=(x,i,destroy=true)=>{if(i>=stepCount){return $.Promise.resolve(x);}
+const edge=conversionPath[i];let y;try{y=edge.transform(tile,x);}catch(err){if(destroy){_this.destroy(x,edge.origin.value);}
+return $.Promise.reject(`[OpenSeadragon.converter.convert] sync failure (while converting using ${edge.origin.value} -> ${edge.target.value})`);}
+if(y===undefined){if(destroy){_this.destroy(x,edge.origin.value);}
+return $.Promise.reject(`[OpenSeadragon.converter.convert] data mid result undefined value (while converting using ${edge.origin.value} -> ${edge.target.value})`);}
+if(destroy){_this.destroy(x,edge.origin.value);}
+const result=$.type(y)==="promise"?y:$.Promise.resolve(y);return result.then(res=>step(res,i+1));};return step(data,0,false);}
+copy(tile,data,type){const copyTransform=this.copyings[type];if(copyTransform){const y=copyTransform(tile,data);return $.type(y)==="promise"?y:$.Promise.resolve(y);}
+$.console.warn(`[OpenSeadragon.converter.copy] is not supported with type %s`,type);return $.Promise.resolve(undefined);}
+destroy(data,type){const destructor=this.destructors[type];if(destructor){const y=destructor(data);return $.type(y)==="promise"?y:$.Promise.resolve(y);}
+return undefined;}
+getConversionPath(from,to){let bestConverterPath;let knownFrom=this._known[from];if(!knownFrom){this._known[from]=knownFrom={};}
+if(Array.isArray(to)){$.console.assert(to.length>0,"[getConversionPath] conversion 'to' type must be defined.");let bestCost=Infinity;for(const outType of to){let conversion=knownFrom[outType];if(conversion===undefined){knownFrom[outType]=conversion=this.graph.dijkstra(from,outType);}
+if(conversion&&bestCost>conversion.cost){bestConverterPath=conversion;bestCost=conversion.cost;}}}else{$.console.assert(typeof to==="string","[getConversionPath] conversion 'to' type must be defined.");bestConverterPath=knownFrom[to];if(bestConverterPath===undefined){bestConverterPath=this.graph.dijkstra(from,to);this._known[from][to]=bestConverterPath;}}
+return bestConverterPath?bestConverterPath.path:undefined;}
+getConversionPathFinalType(path){if(!path||!path.length){return undefined;}
+return path[path.length-1].target.value;}
+getKnownTypes(){return Object.keys(this.graph.vertices);}
+existsType(type){return!!this.graph.vertices[type];}};$.converter=new $.DataTypeConverter();$.converter.learn("__private__imageUrl","imageBitmap",(tile,url)=>new $.Promise((resolve,reject)=>{if(!$.supportsAsync){return reject("Not supported in sync mode!");}
+let setup;if(tile.tiledImage&&tile.tiledImage.crossOriginPolicy){const policy=tile.tiledImage.crossOriginPolicy;if(policy==='anonymous'){setup={mode:'cors',credentials:'omit',};}else if(policy==='use-credentials'){setup={mode:'cors',credentials:'include',};}else if(policy){$.console.error(`Unsupported crossOriginPolicy ${policy}. Ignoring the property.`);}}
+if(_imageConversionWorker){return postWorker('fetchDecode',{url,setup}).then(resolve).catch(reject);}
+return fetch(url,setup).then(res=>{if(!res.ok){throw new Error(`HTTP ${res.status} loading ${url}`);}
+return res.blob();}).then(blob=>createImageBitmap(blob,{colorSpaceConversion:'none'})).then(resolve).catch(reject);}),1,1);$.converter.learn("__private__imageUrl","__private__imageUrl",(tile,url)=>url,0,1);}(OpenSeadragon));(function($){$.ButtonState={REST:0,GROUP:1,HOVER:2,DOWN:3};$.Button=function(options){const _this=this;$.EventSource.call(this);$.extend(true,this,{tooltip:null,srcRest:null,srcGroup:null,srcHover:null,srcDown:null,clickTimeThreshold:$.DEFAULT_SETTINGS.clickTimeThreshold,clickDistThreshold:$.DEFAULT_SETTINGS.clickDistThreshold,fadeDelay:0,fadeLength:2000,onPress:null,onRelease:null,onClick:null,onEnter:null,onExit:null,onFocus:null,onBlur:null,userData:null},options);this.element=options.element||$.makeNeutralElement("div");if(!options.element){this.imgRest=$.makeTransparentImage(this.srcRest);this.imgGroup=$.makeTransparentImage(this.srcGroup);this.imgHover=$.makeTransparentImage(this.srcHover);this.imgDown=$.makeTransparentImage(this.srcDown);this.imgRest.alt=this.imgGroup.alt=this.imgHover.alt=this.imgDown.alt=this.tooltip;$.setElementPointerEventsNone(this.imgRest);$.setElementPointerEventsNone(this.imgGroup);$.setElementPointerEventsNone(this.imgHover);$.setElementPointerEventsNone(this.imgDown);this.element.style.position="relative";$.setElementTouchActionNone(this.element);this.imgGroup.style.position=this.imgHover.style.position=this.imgDown.style.position="absolute";this.imgGroup.style.top=this.imgHover.style.top=this.imgDown.style.top="0px";this.imgGroup.style.left=this.imgHover.style.left=this.imgDown.style.left="0px";this.imgHover.style.visibility=this.imgDown.style.visibility="hidden";this.element.appendChild(this.imgRest);this.element.appendChild(this.imgGroup);this.element.appendChild(this.imgHover);this.element.appendChild(this.imgDown);}
+this.addHandler("press",this.onPress);this.addHandler("release",this.onRelease);this.addHandler("click",this.onClick);this.addHandler("enter",this.onEnter);this.addHandler("exit",this.onExit);this.addHandler("focus",this.onFocus);this.addHandler("blur",this.onBlur);this.currentState=$.ButtonState.GROUP;this.fadeBeginTime=null;this.shouldFade=false;this.element.style.display="inline-block";this.element.style.position="relative";this.element.title=this.tooltip;this.tracker=new $.MouseTracker({userData:'Button.tracker',element:this.element,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,enterHandler:function(event){if(event.insideElementPressed){inTo(_this,$.ButtonState.DOWN);_this.raiseEvent("enter",{originalEvent:event.originalEvent});}else if(!event.buttonDownAny){inTo(_this,$.ButtonState.HOVER);}},focusHandler:function(event){_this.tracker.enterHandler(event);_this.raiseEvent("focus",{originalEvent:event.originalEvent});},leaveHandler:function(event){outTo(_this,$.ButtonState.GROUP);if(event.insideElementPressed){_this.raiseEvent("exit",{originalEvent:event.originalEvent});}},blurHandler:function(event){_this.tracker.leaveHandler(event);_this.raiseEvent("blur",{originalEvent:event.originalEvent});},pressHandler:function(event){inTo(_this,$.ButtonState.DOWN);_this.raiseEvent("press",{originalEvent:event.originalEvent});},releaseHandler:function(event){if(event.insideElementPressed&&event.insideElementReleased){outTo(_this,$.ButtonState.HOVER);_this.raiseEvent("release",{originalEvent:event.originalEvent});}else if(event.insideElementPressed){outTo(_this,$.ButtonState.GROUP);}else{inTo(_this,$.ButtonState.HOVER);}},clickHandler:function(event){if(event.quick){_this.raiseEvent("click",{originalEvent:event.originalEvent});}},keyHandler:function(event){if(13===event.keyCode){_this.raiseEvent("click",{originalEvent:event.originalEvent});_this.raiseEvent("release",{originalEvent:event.originalEvent});event.preventDefault=true;}else{event.preventDefault=false;}}});outTo(this,$.ButtonState.REST);};$.extend($.Button.prototype,$.EventSource.prototype,{notifyGroupEnter:function(){inTo(this,$.ButtonState.GROUP);},notifyGroupExit:function(){outTo(this,$.ButtonState.REST);},disable:function(){this.notifyGroupExit();this.element.disabled=true;this.tracker.setTracking(false);$.setElementOpacity(this.element,0.2,true);},enable:function(){this.element.disabled=false;this.tracker.setTracking(true);$.setElementOpacity(this.element,1.0,true);this.notifyGroupEnter();},destroy:function(){if(this.imgRest){this.element.removeChild(this.imgRest);this.imgRest=null;}
+if(this.imgGroup){this.element.removeChild(this.imgGroup);this.imgGroup=null;}
+if(this.imgHover){this.element.removeChild(this.imgHover);this.imgHover=null;}
+if(this.imgDown){this.element.removeChild(this.imgDown);this.imgDown=null;}
+this.removeAllHandlers();this.tracker.destroy();this.element=null;}});function scheduleFade(button){$.requestAnimationFrame(function(){updateFade(button);});}
+function updateFade(button){let currentTime,deltaTime,opacity;if(button.shouldFade){currentTime=$.now();deltaTime=currentTime-button.fadeBeginTime;opacity=1.0-deltaTime/button.fadeLength;opacity=Math.min(1.0,opacity);opacity=Math.max(0.0,opacity);if(button.imgGroup){$.setElementOpacity(button.imgGroup,opacity,true);}
+if(opacity>0){scheduleFade(button);}}}
+function beginFading(button){button.shouldFade=true;button.fadeBeginTime=$.now()+button.fadeDelay;window.setTimeout(function(){scheduleFade(button);},button.fadeDelay);}
+function stopFading(button){button.shouldFade=false;if(button.imgGroup){$.setElementOpacity(button.imgGroup,1.0,true);}}
+function inTo(button,newState){if(button.element.disabled){return;}
+if(newState>=$.ButtonState.GROUP&&button.currentState===$.ButtonState.REST){stopFading(button);button.currentState=$.ButtonState.GROUP;}
+if(newState>=$.ButtonState.HOVER&&button.currentState===$.ButtonState.GROUP){if(button.imgHover){button.imgHover.style.visibility="";}
+button.currentState=$.ButtonState.HOVER;}
+if(newState>=$.ButtonState.DOWN&&button.currentState===$.ButtonState.HOVER){if(button.imgDown){button.imgDown.style.visibility="";}
+button.currentState=$.ButtonState.DOWN;}}
+function outTo(button,newState){if(button.element.disabled){return;}
+if(newState<=$.ButtonState.HOVER&&button.currentState===$.ButtonState.DOWN){if(button.imgDown){button.imgDown.style.visibility="hidden";}
+button.currentState=$.ButtonState.HOVER;}
+if(newState<=$.ButtonState.GROUP&&button.currentState===$.ButtonState.HOVER){if(button.imgHover){button.imgHover.style.visibility="hidden";}
+button.currentState=$.ButtonState.GROUP;}
+if(newState<=$.ButtonState.REST&&button.currentState===$.ButtonState.GROUP){beginFading(button);button.currentState=$.ButtonState.REST;}}}(OpenSeadragon));(function($){$.ButtonGroup=function(options){$.extend(true,this,{buttons:[],clickTimeThreshold:$.DEFAULT_SETTINGS.clickTimeThreshold,clickDistThreshold:$.DEFAULT_SETTINGS.clickDistThreshold,labelText:""},options);let buttons=this.buttons.concat([]),_this=this,i;this.element=options.element||$.makeNeutralElement("div");if(!options.group){this.element.style.display="inline-block";for(i=0;i<buttons.length;i++){this.element.appendChild(buttons[i].element);}}
+$.setElementTouchActionNone(this.element);this.tracker=new $.MouseTracker({userData:'ButtonGroup.tracker',element:this.element,clickTimeThreshold:this.clickTimeThreshold,clickDistThreshold:this.clickDistThreshold,enterHandler:function(event){let i;for(i=0;i<_this.buttons.length;i++){_this.buttons[i].notifyGroupEnter();}},leaveHandler:function(event){let i;if(!event.insideElementPressed){for(i=0;i<_this.buttons.length;i++){_this.buttons[i].notifyGroupExit();}}},});};$.ButtonGroup.prototype={addButton:function(button){this.buttons.push(button);this.element.appendChild(button.element);},emulateEnter:function(){this.tracker.enterHandler({eventSource:this.tracker});},emulateLeave:function(){this.tracker.leaveHandler({eventSource:this.tracker});},destroy:function(){while(this.buttons.length){const button=this.buttons.pop();this.element.removeChild(button.element);button.destroy();}
+this.tracker.destroy();this.element=null;}};}(OpenSeadragon));(function($){$.Rect=function(x,y,width,height,degrees){this.x=typeof(x)==="number"?x:0;this.y=typeof(y)==="number"?y:0;this.width=typeof(width)==="number"?width:0;this.height=typeof(height)==="number"?height:0;this.degrees=typeof(degrees)==="number"?degrees:0;this.degrees=$.positiveModulo(this.degrees,360);let newTopLeft,newWidth;if(this.degrees>=270){newTopLeft=this.getTopRight();this.x=newTopLeft.x;this.y=newTopLeft.y;newWidth=this.height;this.height=this.width;this.width=newWidth;this.degrees-=270;}else if(this.degrees>=180){newTopLeft=this.getBottomRight();this.x=newTopLeft.x;this.y=newTopLeft.y;this.degrees-=180;}else if(this.degrees>=90){newTopLeft=this.getBottomLeft();this.x=newTopLeft.x;this.y=newTopLeft.y;newWidth=this.height;this.height=this.width;this.width=newWidth;this.degrees-=90;}};$.Rect.fromSummits=function(topLeft,topRight,bottomLeft){const width=topLeft.distanceTo(topRight);const height=topLeft.distanceTo(bottomLeft);const diff=topRight.minus(topLeft);let radians=Math.atan(diff.y/diff.x);if(diff.x<0){radians+=Math.PI;}else if(diff.y<0){radians+=2*Math.PI;}
+return new $.Rect(topLeft.x,topLeft.y,width,height,radians/Math.PI*180);};$.Rect.prototype={clone:function(){return new $.Rect(this.x,this.y,this.width,this.height,this.degrees);},getAspectRatio:function(){return this.width/this.height;},getTopLeft:function(){return new $.Point(this.x,this.y);},getBottomRight:function(){return new $.Point(this.x+this.width,this.y+this.height).rotate(this.degrees,this.getTopLeft());},getTopRight:function(){return new $.Point(this.x+this.width,this.y).rotate(this.degrees,this.getTopLeft());},getBottomLeft:function(){return new $.Point(this.x,this.y+this.height).rotate(this.degrees,this.getTopLeft());},getCenter:function(){return new $.Point(this.x+this.width/2.0,this.y+this.height/2.0).rotate(this.degrees,this.getTopLeft());},getSize:function(){return new $.Point(this.width,this.height);},equals:function(other){return(other instanceof $.Rect)&&this.x===other.x&&this.y===other.y&&this.width===other.width&&this.height===other.height&&this.degrees===other.degrees;},times:function(factor){return new $.Rect(this.x*factor,this.y*factor,this.width*factor,this.height*factor,this.degrees);},translate:function(delta){return new $.Rect(this.x+delta.x,this.y+delta.y,this.width,this.height,this.degrees);},union:function(rect){const thisBoundingBox=this.getBoundingBox();const otherBoundingBox=rect.getBoundingBox();const left=Math.min(thisBoundingBox.x,otherBoundingBox.x);const top=Math.min(thisBoundingBox.y,otherBoundingBox.y);const right=Math.max(thisBoundingBox.x+thisBoundingBox.width,otherBoundingBox.x+otherBoundingBox.width);const bottom=Math.max(thisBoundingBox.y+thisBoundingBox.height,otherBoundingBox.y+otherBoundingBox.height);return new $.Rect(left,top,right-left,bottom-top);},intersection:function(rect){const EPSILON=0.0000000001;const intersectionPoints=[];const thisTopLeft=this.getTopLeft();if(rect.containsPoint(thisTopLeft,EPSILON)){intersectionPoints.push(thisTopLeft);}
+const thisTopRight=this.getTopRight();if(rect.containsPoint(thisTopRight,EPSILON)){intersectionPoints.push(thisTopRight);}
+const thisBottomLeft=this.getBottomLeft();if(rect.containsPoint(thisBottomLeft,EPSILON)){intersectionPoints.push(thisBottomLeft);}
+const thisBottomRight=this.getBottomRight();if(rect.containsPoint(thisBottomRight,EPSILON)){intersectionPoints.push(thisBottomRight);}
+const rectTopLeft=rect.getTopLeft();if(this.containsPoint(rectTopLeft,EPSILON)){intersectionPoints.push(rectTopLeft);}
+const rectTopRight=rect.getTopRight();if(this.containsPoint(rectTopRight,EPSILON)){intersectionPoints.push(rectTopRight);}
+const rectBottomLeft=rect.getBottomLeft();if(this.containsPoint(rectBottomLeft,EPSILON)){intersectionPoints.push(rectBottomLeft);}
+const rectBottomRight=rect.getBottomRight();if(this.containsPoint(rectBottomRight,EPSILON)){intersectionPoints.push(rectBottomRight);}
+const thisSegments=this._getSegments();const rectSegments=rect._getSegments();for(let i=0;i<thisSegments.length;i++){const thisSegment=thisSegments[i];for(let j=0;j<rectSegments.length;j++){const rectSegment=rectSegments[j];const intersect=getIntersection(thisSegment[0],thisSegment[1],rectSegment[0],rectSegment[1]);if(intersect){intersectionPoints.push(intersect);}}}
+function getIntersection(a,b,c,d){const abVector=b.minus(a);const cdVector=d.minus(c);const denom=-cdVector.x*abVector.y+abVector.x*cdVector.y;if(denom===0){return null;}
+const s=(abVector.x*(a.y-c.y)-abVector.y*(a.x-c.x))/denom;const t=(cdVector.x*(a.y-c.y)-cdVector.y*(a.x-c.x))/denom;if(-EPSILON<=s&&s<=1-EPSILON&&-EPSILON<=t&&t<=1-EPSILON){return new $.Point(a.x+t*abVector.x,a.y+t*abVector.y);}
+return null;}
+if(intersectionPoints.length===0){return null;}
+let minX=intersectionPoints[0].x;let maxX=intersectionPoints[0].x;let minY=intersectionPoints[0].y;let maxY=intersectionPoints[0].y;for(let k=1;k<intersectionPoints.length;k++){const point=intersectionPoints[k];if(point.x<minX){minX=point.x;}
+if(point.x>maxX){maxX=point.x;}
+if(point.y<minY){minY=point.y;}
+if(point.y>maxY){maxY=point.y;}}
+return new $.Rect(minX,minY,maxX-minX,maxY-minY);},_getSegments:function(){const topLeft=this.getTopLeft();const topRight=this.getTopRight();const bottomLeft=this.getBottomLeft();const bottomRight=this.getBottomRight();return[[topLeft,topRight],[topRight,bottomRight],[bottomRight,bottomLeft],[bottomLeft,topLeft]];},rotate:function(degrees,pivot){degrees=$.positiveModulo(degrees,360);if(degrees===0){return this.clone();}
+pivot=pivot||this.getCenter();const newTopLeft=this.getTopLeft().rotate(degrees,pivot);const newTopRight=this.getTopRight().rotate(degrees,pivot);let diff=newTopRight.minus(newTopLeft);diff=diff.apply(function(x){const EPSILON=1e-15;return Math.abs(x)<EPSILON?0:x;});let radians=Math.atan(diff.y/diff.x);if(diff.x<0){radians+=Math.PI;}else if(diff.y<0){radians+=2*Math.PI;}
+return new $.Rect(newTopLeft.x,newTopLeft.y,this.width,this.height,radians/Math.PI*180);},getBoundingBox:function(){if(this.degrees===0){return this.clone();}
+const topLeft=this.getTopLeft();const topRight=this.getTopRight();const bottomLeft=this.getBottomLeft();const bottomRight=this.getBottomRight();const minX=Math.min(topLeft.x,topRight.x,bottomLeft.x,bottomRight.x);const maxX=Math.max(topLeft.x,topRight.x,bottomLeft.x,bottomRight.x);const minY=Math.min(topLeft.y,topRight.y,bottomLeft.y,bottomRight.y);const maxY=Math.max(topLeft.y,topRight.y,bottomLeft.y,bottomRight.y);return new $.Rect(minX,minY,maxX-minX,maxY-minY);},getIntegerBoundingBox:function(){const boundingBox=this.getBoundingBox();const x=Math.floor(boundingBox.x);const y=Math.floor(boundingBox.y);const width=Math.ceil(boundingBox.width+boundingBox.x-x);const height=Math.ceil(boundingBox.height+boundingBox.y-y);return new $.Rect(x,y,width,height);},containsPoint:function(point,epsilon){epsilon=epsilon||0;const topLeft=this.getTopLeft();const topRight=this.getTopRight();const bottomLeft=this.getBottomLeft();const topDiff=topRight.minus(topLeft);const leftDiff=bottomLeft.minus(topLeft);return((point.x-topLeft.x)*topDiff.x+
+(point.y-topLeft.y)*topDiff.y>=-epsilon)&&((point.x-topRight.x)*topDiff.x+
+(point.y-topRight.y)*topDiff.y<=epsilon)&&((point.x-topLeft.x)*leftDiff.x+
+(point.y-topLeft.y)*leftDiff.y>=-epsilon)&&((point.x-bottomLeft.x)*leftDiff.x+
+(point.y-bottomLeft.y)*leftDiff.y<=epsilon);},toString:function(){return"["+
+(Math.round(this.x*100)/100)+", "+
+(Math.round(this.y*100)/100)+", "+
+(Math.round(this.width*100)/100)+"x"+
+(Math.round(this.height*100)/100)+", "+
+(Math.round(this.degrees*100)/100)+"deg"+"]";}};}(OpenSeadragon));(function($){const THIS={};$.ReferenceStrip=function(options){const _this=this;const viewer=options.viewer;const viewerSize=$.getElementSize(viewer.element);let element;let i;if(!options.id){options.id='referencestrip-'+$.now();this.element=$.makeNeutralElement("div");this.element.id=options.id;this.element.className='referencestrip';}
+options=$.extend(true,{sizeRatio:$.DEFAULT_SETTINGS.referenceStripSizeRatio,position:$.DEFAULT_SETTINGS.referenceStripPosition,scroll:$.DEFAULT_SETTINGS.referenceStripScroll,clickTimeThreshold:$.DEFAULT_SETTINGS.clickTimeThreshold},options,{element:this.element});$.extend(this,options);THIS[this.id]={animating:false};this.minPixelRatio=this.viewer.minPixelRatio;this.element.tabIndex=0;const style=this.element.style;style.marginTop='0px';style.marginRight='0px';style.marginBottom='0px';style.marginLeft='0px';style.left='0px';style.bottom='0px';style.border='0px';style.background='#000';style.position='relative';$.setElementTouchActionNone(this.element);$.setElementOpacity(this.element,0.8);this.viewer=viewer;this.tracker=new $.MouseTracker({userData:'ReferenceStrip.tracker',element:this.element,clickHandler:$.delegate(this,onStripClick),dragHandler:$.delegate(this,onStripDrag),scrollHandler:$.delegate(this,onStripScroll),enterHandler:$.delegate(this,onStripEnter),leaveHandler:$.delegate(this,onStripLeave),keyDownHandler:$.delegate(this,onKeyDown),keyHandler:$.delegate(this,onKeyPress),preProcessEventHandler:function(eventInfo){if(eventInfo.eventType==='wheel'){eventInfo.preventDefault=true;}}});if(options.width&&options.height){this.element.style.width=options.width+'px';this.element.style.height=options.height+'px';viewer.addControl(this.element,{anchor:$.ControlAnchor.BOTTOM_LEFT});}else{if("horizontal"===options.scroll){this.element.style.width=(viewerSize.x*options.sizeRatio*viewer.tileSources.length)+(12*viewer.tileSources.length)+'px';this.element.style.height=(viewerSize.y*options.sizeRatio)+'px';viewer.addControl(this.element,{anchor:$.ControlAnchor.BOTTOM_LEFT});}else{this.element.style.height=(viewerSize.y*options.sizeRatio*viewer.tileSources.length)+(12*viewer.tileSources.length)+'px';this.element.style.width=(viewerSize.x*options.sizeRatio)+'px';viewer.addControl(this.element,{anchor:$.ControlAnchor.TOP_LEFT});}}
+this.panelWidth=(viewerSize.x*this.sizeRatio)+8;this.panelHeight=(viewerSize.y*this.sizeRatio)+8;this.panels=[];this.miniViewers={};for(i=0;i<viewer.tileSources.length;i++){element=$.makeNeutralElement('div');element.id=this.element.id+"-"+i;element.style.width=_this.panelWidth+'px';element.style.height=_this.panelHeight+'px';element.style.display='inline';element.style['float']='left';element.style.cssFloat='left';element.style.padding='2px';$.setElementTouchActionNone(element);$.setElementPointerEventsNone(element);this.element.appendChild(element);element.activePanel=false;this.panels.push(element);}
+loadPanels(this,this.scroll==='vertical'?viewerSize.y:viewerSize.x,0);this.setFocus(0);};$.ReferenceStrip.prototype={setFocus:function(page){const element=this.element.querySelector('#'+this.element.id+'-'+page);const viewerSize=$.getElementSize(this.viewer.canvas);const scrollWidth=Number(this.element.style.width.replace('px',''));const scrollHeight=Number(this.element.style.height.replace('px',''));const offsetLeft=-Number(this.element.style.marginLeft.replace('px',''));const offsetTop=-Number(this.element.style.marginTop.replace('px',''));let offset;if(this.currentSelected!==element){if(this.currentSelected){this.currentSelected.style.background='#000';}
+this.currentSelected=element;this.currentSelected.style.background='#999';if('horizontal'===this.scroll){offset=(Number(page))*(this.panelWidth+3);if(offset>offsetLeft+viewerSize.x-this.panelWidth){offset=Math.min(offset,(scrollWidth-viewerSize.x));this.element.style.marginLeft=-offset+'px';loadPanels(this,viewerSize.x,-offset);}else if(offset<offsetLeft){offset=Math.max(0,offset-viewerSize.x/2);this.element.style.marginLeft=-offset+'px';loadPanels(this,viewerSize.x,-offset);}}else{offset=(Number(page))*(this.panelHeight+3);if(offset>offsetTop+viewerSize.y-this.panelHeight){offset=Math.min(offset,(scrollHeight-viewerSize.y));this.element.style.marginTop=-offset+'px';loadPanels(this,viewerSize.y,-offset);}else if(offset<offsetTop){offset=Math.max(0,offset-viewerSize.y/2);this.element.style.marginTop=-offset+'px';loadPanels(this,viewerSize.y,-offset);}}
+this.currentPage=page;onStripEnter.call(this,{eventSource:this.tracker});}},update:function(){if(THIS[this.id].animating){return true;}
+return false;},destroy:function(){if(this.miniViewers){for(const key in this.miniViewers){this.miniViewers[key].destroy();}}
+this.tracker.destroy();if(this.element){this.viewer.removeControl(this.element);}}};function onStripClick(event){if(event.quick){let page;if('horizontal'===this.scroll){page=Math.floor(event.position.x/(this.panelWidth+4));}else{page=Math.floor(event.position.y/this.panelHeight);}
+this.viewer.goToPage(page);}
+this.element.focus();}
+function onStripDrag(event){this.dragging=true;if(this.element){const offsetLeft=Number(this.element.style.marginLeft.replace('px',''));const offsetTop=Number(this.element.style.marginTop.replace('px',''));const scrollWidth=Number(this.element.style.width.replace('px',''));const scrollHeight=Number(this.element.style.height.replace('px',''));const viewerSize=$.getElementSize(this.viewer.canvas);if('horizontal'===this.scroll){if(-event.delta.x>0){if(offsetLeft>-(scrollWidth-viewerSize.x)){this.element.style.marginLeft=(offsetLeft+(event.delta.x*2))+'px';loadPanels(this,viewerSize.x,offsetLeft+(event.delta.x*2));}}else if(-event.delta.x<0){if(offsetLeft<0){this.element.style.marginLeft=(offsetLeft+(event.delta.x*2))+'px';loadPanels(this,viewerSize.x,offsetLeft+(event.delta.x*2));}}}else{if(-event.delta.y>0){if(offsetTop>-(scrollHeight-viewerSize.y)){this.element.style.marginTop=(offsetTop+(event.delta.y*2))+'px';loadPanels(this,viewerSize.y,offsetTop+(event.delta.y*2));}}else if(-event.delta.y<0){if(offsetTop<0){this.element.style.marginTop=(offsetTop+(event.delta.y*2))+'px';loadPanels(this,viewerSize.y,offsetTop+(event.delta.y*2));}}}}}
+function onStripScroll(event){if(this.element){const offsetLeft=Number(this.element.style.marginLeft.replace('px',''));const offsetTop=Number(this.element.style.marginTop.replace('px',''));const scrollWidth=Number(this.element.style.width.replace('px',''));const scrollHeight=Number(this.element.style.height.replace('px',''));const viewerSize=$.getElementSize(this.viewer.canvas);if('horizontal'===this.scroll){if(event.scroll>0){if(offsetLeft>-(scrollWidth-viewerSize.x)){this.element.style.marginLeft=(offsetLeft-(event.scroll*60))+'px';loadPanels(this,viewerSize.x,offsetLeft-(event.scroll*60));}}else if(event.scroll<0){if(offsetLeft<0){this.element.style.marginLeft=(offsetLeft-(event.scroll*60))+'px';loadPanels(this,viewerSize.x,offsetLeft-(event.scroll*60));}}}else{if(event.scroll<0){if(offsetTop>viewerSize.y-scrollHeight){this.element.style.marginTop=(offsetTop+(event.scroll*60))+'px';loadPanels(this,viewerSize.y,offsetTop+(event.scroll*60));}}else if(event.scroll>0){if(offsetTop<0){this.element.style.marginTop=(offsetTop+(event.scroll*60))+'px';loadPanels(this,viewerSize.y,offsetTop+(event.scroll*60));}}}
+event.preventDefault=true;}}
+function loadPanels(strip,viewerSize,scroll){let panelSize;let activePanelsStart;let activePanelsEnd;let miniViewer;let i;let element;if('horizontal'===strip.scroll){panelSize=strip.panelWidth;}else{panelSize=strip.panelHeight;}
+activePanelsStart=Math.ceil(viewerSize/panelSize)+5;activePanelsEnd=Math.ceil((Math.abs(scroll)+viewerSize)/panelSize)+1;activePanelsStart=activePanelsEnd-activePanelsStart;activePanelsStart=activePanelsStart<0?0:activePanelsStart;for(i=activePanelsStart;i<activePanelsEnd&&i<strip.panels.length;i++){element=strip.panels[i];if(!element.activePanel){let miniTileSource;const originalTileSource=strip.viewer.tileSources[i];if(originalTileSource.referenceStripThumbnailUrl){miniTileSource={type:'image',url:originalTileSource.referenceStripThumbnailUrl};}else{miniTileSource=originalTileSource;}
+miniViewer=new $.Viewer({id:element.id,tileSources:[miniTileSource],element:element,navigatorSizeRatio:strip.sizeRatio,showNavigator:false,mouseNavEnabled:false,showNavigationControl:false,showSequenceControl:false,immediateRender:true,blendTime:0,animationTime:0,loadTilesWithAjax:strip.viewer.loadTilesWithAjax,ajaxHeaders:strip.viewer.ajaxHeaders,viewer:strip.viewer,drawer:'canvas',});$.setElementPointerEventsNone(miniViewer.canvas);$.setElementPointerEventsNone(miniViewer.container);miniViewer.innerTracker.setTracking(false);miniViewer.outerTracker.setTracking(false);strip.miniViewers[element.id]=miniViewer;element.activePanel=true;}}}
+function onStripEnter(event){const element=event.eventSource.element;if('horizontal'===this.scroll){element.style.marginBottom="0px";}else{element.style.marginLeft="0px";}}
+function onStripLeave(event){const element=event.eventSource.element;if('horizontal'===this.scroll){element.style.marginBottom="-"+($.getElementSize(element).y/2)+"px";}else{element.style.marginLeft="-"+($.getElementSize(element).x/2)+"px";}}
+function onKeyDown(event){if(!event.ctrl&&!event.alt&&!event.meta){switch(event.keyCode){case 38:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:1,shift:null});event.preventDefault=true;break;case 40:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:-1,shift:null});event.preventDefault=true;break;case 37:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:-1,shift:null});event.preventDefault=true;break;case 39:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:1,shift:null});event.preventDefault=true;break;default:event.preventDefault=false;break;}}else{event.preventDefault=false;}}
+function onKeyPress(event){if(!event.ctrl&&!event.alt&&!event.meta){switch(event.keyCode){case 61:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:1,shift:null});event.preventDefault=true;break;case 45:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:-1,shift:null});event.preventDefault=true;break;case 48:case 119:case 87:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:1,shift:null});event.preventDefault=true;break;case 115:case 83:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:-1,shift:null});event.preventDefault=true;break;case 97:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:-1,shift:null});event.preventDefault=true;break;case 100:onStripScroll.call(this,{eventSource:this.tracker,position:null,scroll:1,shift:null});event.preventDefault=true;break;default:event.preventDefault=false;break;}}else{event.preventDefault=false;}}}(OpenSeadragon));(function($){$.DisplayRect=function(x,y,width,height,minLevel,maxLevel){$.Rect.apply(this,[x,y,width,height]);this.minLevel=minLevel;this.maxLevel=maxLevel;};$.extend($.DisplayRect.prototype,$.Rect.prototype);}(OpenSeadragon));(function($){$.Spring=function(options){const args=arguments;if(typeof(options)!=='object'){options={initial:args.length&&typeof(args[0])==="number"?args[0]:undefined,springStiffness:args.length>1?args[1].springStiffness:5.0,animationTime:args.length>1?args[1].animationTime:1.5};}
+$.console.assert(typeof options.springStiffness==="number"&&options.springStiffness!==0,"[OpenSeadragon.Spring] options.springStiffness must be a non-zero number");$.console.assert(typeof options.animationTime==="number"&&options.animationTime>=0,"[OpenSeadragon.Spring] options.animationTime must be a number greater than or equal to 0");if(options.exponential){this._exponential=true;delete options.exponential;}
+$.extend(true,this,options);this.current={value:typeof(this.initial)==="number"?this.initial:(this._exponential?0:1),time:$.now()};$.console.assert(!this._exponential||this.current.value!==0,"[OpenSeadragon.Spring] value must be non-zero for exponential springs");this.start={value:this.current.value,time:this.current.time};this.target={value:this.current.value,time:this.current.time};if(this._exponential){this.start._logValue=Math.log(this.start.value);this.target._logValue=Math.log(this.target.value);this.current._logValue=Math.log(this.current.value);}};$.Spring.prototype={resetTo:function(target){$.console.assert(!this._exponential||target!==0,"[OpenSeadragon.Spring.resetTo] target must be non-zero for exponential springs");this.start.value=this.target.value=this.current.value=target;this.start.time=this.target.time=this.current.time=$.now();if(this._exponential){this.start._logValue=Math.log(this.start.value);this.target._logValue=Math.log(this.target.value);this.current._logValue=Math.log(this.current.value);}},springTo:function(target){$.console.assert(!this._exponential||target!==0,"[OpenSeadragon.Spring.springTo] target must be non-zero for exponential springs");this.start.value=this.current.value;this.start.time=this.current.time;this.target.value=target;this.target.time=this.start.time+1000*this.animationTime;if(this._exponential){this.start._logValue=Math.log(this.start.value);this.target._logValue=Math.log(this.target.value);}},shiftBy:function(delta){this.start.value+=delta;this.target.value+=delta;if(this._exponential){$.console.assert(this.target.value!==0&&this.start.value!==0,"[OpenSeadragon.Spring.shiftBy] spring value must be non-zero for exponential springs");this.start._logValue=Math.log(this.start.value);this.target._logValue=Math.log(this.target.value);}},setExponential:function(value){this._exponential=value;if(this._exponential){$.console.assert(this.current.value!==0&&this.target.value!==0&&this.start.value!==0,"[OpenSeadragon.Spring.setExponential] spring value must be non-zero for exponential springs");this.start._logValue=Math.log(this.start.value);this.target._logValue=Math.log(this.target.value);this.current._logValue=Math.log(this.current.value);}},update:function(){this.current.time=$.now();let startValue,targetValue;if(this._exponential){startValue=this.start._logValue;targetValue=this.target._logValue;}else{startValue=this.start.value;targetValue=this.target.value;}
+if(this.current.time>=this.target.time){this.current.value=this.target.value;}else{let currentValue=startValue+
+(targetValue-startValue)*transform(this.springStiffness,(this.current.time-this.start.time)/(this.target.time-this.start.time));if(this._exponential){this.current.value=Math.exp(currentValue);}else{this.current.value=currentValue;}}
+return this.current.value!==this.target.value;},isAtTargetValue:function(){return this.current.value===this.target.value;}};function transform(stiffness,x){return(1.0-Math.exp(stiffness*-x))/(1.0-Math.exp(-stiffness));}}(OpenSeadragon));(function($){$.ImageJob=function(options){this.data=null;this.userData={};this.errorMsg=null;this.timeout=$.DEFAULT_SETTINGS.timeout;this.isBatched=false;$.extend(true,this,{jobId:null,tries:0,},options);};$.ImageJob.prototype={start:function(){this.tries++;const self=this;const selfAbort=this.abort;this.jobId=window.setTimeout(function(){self.fail("Image load exceeded timeout ("+self.timeout+" ms)",null);},this.timeout);this.abort=function(){self.source.downloadTileAbort(self);if(typeof selfAbort==="function"){selfAbort();}
+self.fail("Image load aborted.",null);};this.source.downloadTileStart(this);},prepareForBatch:function(){this.tries++;this.jobId=-1;},finish:function(data,request,dataType){if(!this.jobId){return;}
+if(isInvalidData(data)){this.fail(dataType||"[downloadTileStart->finish()] Retrieved data is invalid!",request);return;}
+this.data=data;this.request=request;this.errorMsg=null;this.dataType=dataType;window.clearTimeout(this.jobId);this.jobId=null;this.callback(this);},fail:function(errorMessage,request){this.data=null;this.request=request;this.errorMsg=errorMessage;this.dataType=null;if(this.jobId){window.clearTimeout(this.jobId);this.jobId=null;}
+this.callback(this);}};$.BatchImageJob=function(options){$.extend(true,this,{timeout:$.DEFAULT_SETTINGS.timeout,jobId:null,data:null,dataType:null,errorMsg:null},options);this.jobs=options.jobs||[];this.source=options.source;};$.BatchImageJob.prototype={start:function(){this._finishedJobs=0;const self=this;this.jobId=window.setTimeout(function(){self.fail("Batch image load exceeded timeout ("+self.timeout+" ms)",null);},this.timeout);this.abort=function(){self.source.downloadTileBatchAbort(self);for(let j of this.jobs){if(j.jobId&&j.abort){j.abort();}}};const wrap=(fn,job)=>{return(...args)=>{if(!this.jobId){return;}
+this._finishedJobs++;fn.call(job,...args);if(this._finishedJobs===this.jobs.length){window.clearTimeout(this.jobId);this.jobId=null;if(this.callback){this.callback(this);}}};};for(let j of this.jobs){j.finish=wrap(j.finish,j);j.fail=wrap(j.fail,j);j.prepareForBatch();}
+this.source.downloadTileBatchStart(this);},finish:function(data,request,dataType){$.console.error('Finish call on batch job is not desirable: call finish on individual child jobs!',data,request);},fail:function(errorMessage,request){this.data=null;this.request=request;this.errorMsg=errorMessage;this.dataType=null;for(let i=0;i<this.jobs.length;i++){if(this.jobs[i].jobId){this.jobs[i].fail(errorMessage||"Batch failed",request);}}
+if(this.jobId){window.clearTimeout(this.jobId);this.jobId=null;}
+if(this.callback){this.callback(this);}}};$.ImageLoader=function(options){$.extend(true,this,{jobLimit:$.DEFAULT_SETTINGS.imageLoaderLimit,timeout:$.DEFAULT_SETTINGS.timeout,jobQueue:[],failedTiles:[],jobsInProgress:0},options);this._batchBuckets=[];};$.ImageLoader.prototype={addJob:function(options){if(!options.source){$.console.error('ImageLoader.prototype.addJob() requires [options.source]...');options.source=$.TileSource.prototype;}
+const _this=this,jobOptions={src:options.src,tile:options.tile||{},source:options.source,loadWithAjax:options.loadWithAjax,ajaxHeaders:options.loadWithAjax?options.ajaxHeaders:null,crossOriginPolicy:options.crossOriginPolicy,ajaxWithCredentials:options.ajaxWithCredentials,postData:options.postData,callback:(job)=>completeJob(_this,job,options.callback),abort:options.abort,timeout:this.timeout},newJob=new $.ImageJob(jobOptions);const sourceWantsBatching=options.source&&options.source.batchEnabled();if(sourceWantsBatching){newJob.isBatched=true;this._stageJobForBatching(newJob,options.source);return false;}
+if(!this.jobLimit||this.jobsInProgress<this.jobLimit){newJob.start();this.jobsInProgress++;return true;}
+this.jobQueue.push(newJob);return false;},_stageJobForBatching:function(newJob,source){let bucket=null;for(let i=0;i<this._batchBuckets.length;i++){if(this._batchBuckets[i].source.batchCompatible(source)){bucket=this._batchBuckets[i];break;}}
+if(bucket&&!bucket.timer){$.console.error('Attempted to add a new job to a batch bucket that has already been flushed. '+'Creating a new batch bucket for this source. '+'Check batch logic and timing if this happens frequently. '+'Bucket source:',source,'Job ID:',newJob&&newJob.jobId);bucket=null;}
+if(!bucket){bucket={source:source,jobs:[],timer:null,waitTimeout:source.batchTimeout(),maxJobs:source.batchMaxJobs()};bucket.timer=setTimeout(()=>this._flushBatchBucket(bucket),bucket.waitTimeout);this._batchBuckets.push(bucket);}
+bucket.jobs.push(newJob);if(bucket.maxJobs>=1&&bucket.jobs.length>=bucket.maxJobs){clearTimeout(bucket.timer);this._flushBatchBucket(bucket);}},_flushBatchBucket:function(bucket){bucket.timer=null;const index=this._batchBuckets.indexOf(bucket);if(index>-1){this._batchBuckets.splice(index,1);}
+if(bucket.jobs.length===0){return;}
+const _this=this;const batchJob=new $.BatchImageJob({source:bucket.source,jobs:bucket.jobs,timeout:this.timeout,callback:(job)=>completeBatchJob(_this,job),});if(!this.jobLimit||this.jobsInProgress<this.jobLimit){batchJob.start();this.jobsInProgress++;}else{this.jobQueue.push(batchJob);}},canAcceptNewJob(){return!this.jobLimit||this.jobsInProgress<this.jobLimit;},clear:function(){for(let i=0;i<this.jobQueue.length;i++){const job=this.jobQueue[i];if(typeof job.abort==="function"){job.abort();}}
+this.jobQueue=[];if(this._batchBuckets){for(let i=0;i<this._batchBuckets.length;i++){const bucket=this._batchBuckets[i];clearTimeout(bucket.timer);bucket.timer=null;}
+this._batchBuckets=[];}}};function completeJob(loader,job,callback){if(job.errorMsg&&job.data===null&&job.tries<1+loader.tileRetryMax){job.isBatched=false;loader.failedTiles.push(job);}
+if(!job.isBatched){loader.jobsInProgress--;}
+if(loader.canAcceptNewJob()&&loader.jobQueue.length>0){let nextJob=loader.jobQueue.shift();nextJob.start();loader.jobsInProgress++;}
+if(loader.tileRetryMax>0&&loader.jobQueue.length===0){if(loader.canAcceptNewJob()&&loader.failedTiles.length>0){let nextJob=loader.failedTiles.shift();setTimeout(function(){nextJob.start();},loader.tileRetryDelay);loader.jobsInProgress++;}}
+if(callback){callback(job.data,job.errorMsg,job.request,job.dataType,job.tries);}}
+function completeBatchJob(loader,job){loader.jobsInProgress--;job.jobs.length=0;}
+function isInvalidData(dataItem){return dataItem===null||dataItem===undefined||dataItem===false;}}(OpenSeadragon));(function($){$.Tile=function(level,x,y,bounds,exists,url,context2D,loadWithAjax,ajaxHeaders,sourceBounds,postData,cacheKey){this.level=level;this.x=x;this.y=y;this.bounds=bounds;this.positionedBounds=new OpenSeadragon.Rect(bounds.x,bounds.y,bounds.width,bounds.height);this.sourceBounds=sourceBounds;this.exists=exists;this._url=url;this.postData=postData;if(context2D){this.context2D=context2D;}
+this.loadWithAjax=loadWithAjax;this.ajaxHeaders=ajaxHeaders;if(cacheKey===undefined){$.console.warn("Tile constructor needs 'cacheKey' variable: creation tile cache"+" in Tile class is deprecated. TileSource.prototype.getTileHashKey will be used.");cacheKey=$.TileSource.prototype.getTileHashKey(level,x,y,url,ajaxHeaders,postData);}
+this._cKey=cacheKey||"";this._ocKey=cacheKey||"";this.loaded=false;this.loading=false;this.position=null;this.size=null;this.flipped=false;this.blendStart=null;this.opacity=null;this.squaredDistance=null;this.visibility=null;this.hasTransparency=false;this.beingDrawn=false;this.lastTouchTime=0;this.isRightMost=false;this.isBottomMost=false;this.tiledImage=null;this._caches={};this.processing=false;this.processingPromise=$.Promise.resolve(this);};$.Tile.prototype={toString:function(){return this.level+"/"+this.x+"_"+this.y;},get cacheKey(){return this._cKey;},set cacheKey(value){if(value===this.cacheKey){return;}
+const cache=this.getCache(value);if(!cache){$.console.warn("[Tile.cacheKey] should not be set manually. Use addCache() with setAsMain=true.");}
+this._updateMainCacheKey(value);},set originalCacheKey(value){throw"Original Cache Key cannot be managed manually!";},get originalCacheKey(){return this._ocKey;},get image(){$.console.error("[Tile.image] property has been deprecated. Use [Tile.getData] instead.");return this.getImage();},get url(){$.console.error("[Tile.url] property has been deprecated. Use [Tile.getUrl] instead.");return this.getUrl();},get element(){$.console.error("Tile::element property is deprecated. Use cache API instead. Moreover, this property might be unstable.");const cache=this.getCache();if(!cache||!cache.loaded){return null;}
+if(cache.type!==OpenSeadragon.HTMLDrawer.canvasCacheType||cache.type!==OpenSeadragon.HTMLDrawer.imageCacheType){$.console.error("Access to HtmlDrawer property via Tile instance: HTMLDrawer must be used!");return null;}
+return cache.data.element;},get imgElement(){$.console.error("Tile::imgElement property is deprecated. Use cache API instead. Moreover, this property might be unstable.");const cache=this.getCache();if(!cache||!cache.loaded){return null;}
+if(cache.type!==OpenSeadragon.HTMLDrawer.canvasCacheType||cache.type!==OpenSeadragon.HTMLDrawer.imageCacheType){$.console.error("Access to HtmlDrawer property via Tile instance: HTMLDrawer must be used!");return null;}
+return cache.data.imgElement;},get style(){$.console.error("Tile::style property is deprecated. Use cache API instead. Moreover, this property might be unstable.");const cache=this.getCache();if(!cache||!cache.loaded){return null;}
+if(cache.type!==OpenSeadragon.HTMLDrawer.canvasCacheType||cache.type!==OpenSeadragon.HTMLDrawer.imageCacheType){$.console.error("Access to HtmlDrawer property via Tile instance: HTMLDrawer must be used!");return null;}
+return cache.data.style;},getImage:function(){$.console.error("[Tile.getImage] property has been deprecated. Use 'tile-invalidated' routine event instead.");const cache=this.getCache(this.cacheKey);if(!cache){return undefined;}
+cache.transformTo("image");return cache.data;},getUrl:function(){if(typeof this._url==='function'){return this._url();}
+return this._url;},getCanvasContext:function(){$.console.error("[Tile.getCanvasContext] property has been deprecated. Use 'tile-invalidated' routine event instead.");const cache=this.getCache(this.cacheKey);if(!cache){return undefined;}
+cache.transformTo("context2d");return cache.data;},get context2D(){$.console.error("[Tile.context2D] property has been deprecated. Use 'tile-invalidated' routine event instead.");return this.getCanvasContext();},set context2D(value){$.console.error("[Tile.context2D] property has been deprecated. Use 'tile-invalidated' routine event instead.");const cache=this._caches[this.cacheKey];if(cache){this.removeCache(this.cacheKey);}
+this.addCache(this.cacheKey,value,'context2d',true,false);},get cacheImageRecord(){$.console.error("[Tile.cacheImageRecord] property has been deprecated. Use Tile::getCache.");return this.getCache(this.cacheKey);},set cacheImageRecord(value){$.console.error("[Tile.cacheImageRecord] property has been deprecated. Use Tile::addCache.");const cache=this._caches[this.cacheKey];if(cache){this.removeCache(this.cacheKey);}
+if(value){if(value.loaded){this.addCache(this.cacheKey,value.data,value.type,true,false);}else{value.await().then(x=>this.addCache(this.cacheKey,x,value.type,true,false));}}},buildDistinctMainCacheKey:function(){return this.cacheKey===this.originalCacheKey?"mod://"+this.originalCacheKey:this.cacheKey;},getCache:function(key=this._cKey){const cache=this._caches[key];if(cache){cache.withTileReference(this);}
+return cache;},addCache:function(key,data,type=undefined,setAsMain=false,_safely=true){const tiledImage=this.tiledImage;if(!tiledImage){return null;}
+if(!type){if(!this.__typeWarningReported){$.console.warn(this,"[Tile.addCache] called without type specification. "+"Automated deduction is potentially unsafe: prefer specification of data type explicitly.");this.__typeWarningReported=true;}
+if(typeof data==='function'){$.console.error("[TileCache.cacheTile] options.data as a callback requires type argument! Current is "+type);}
+type=$.converter.guessType(data);}
+const overwritesMainCache=key===this.cacheKey;if(_safely&&(overwritesMainCache||setAsMain)){const supportedTypes=tiledImage.getDrawer().getSupportedDataFormats();const conversion=$.converter.getConversionPath(type,supportedTypes);$.console.assert(conversion,"[Tile.addCache] data was set for the default tile cache we are unable"+`to render. Make sure OpenSeadragon.converter was taught to convert ${type} to (one of): ${conversion.toString()}`);}
+const cachedItem=tiledImage._tileCache.cacheTile({data:data,dataType:type,tile:this,cacheKey:key,cutoff:tiledImage.source.getClosestLevel(),});const havingRecord=this._caches[key];if(havingRecord!==cachedItem){this._caches[key]=cachedItem;if(havingRecord){havingRecord.removeTile(this);tiledImage._tileCache.safeUnloadCache(havingRecord);}}
+if(!overwritesMainCache&&setAsMain){this._updateMainCacheKey(key);}
+return cachedItem;},setCache(key,cache,setAsMain=false,_safely=true){const tiledImage=this.tiledImage;if(!tiledImage){return null;}
+const overwritesMainCache=key===this.cacheKey;if(_safely){$.console.assert(cache instanceof $.CacheRecord,"[Tile.setCache] cache must be a CacheRecord object!");if(overwritesMainCache||setAsMain){const supportedTypes=tiledImage.getDrawer().getSupportedDataFormats();const conversion=$.converter.getConversionPath(cache.type,supportedTypes);$.console.assert(conversion,"[Tile.setCache] data was set for the default tile cache we are unable"+`to render. Make sure OpenSeadragon.converter was taught to convert ${cache.type} to (one of): ${conversion.toString()}`);}}
+const havingRecord=this._caches[key];if(havingRecord!==cache){this._caches[key]=cache;cache.addTile(this);if(havingRecord){havingRecord.removeTile(this);tiledImage._tileCache.safeUnloadCache(havingRecord);}}
+if(!overwritesMainCache&&setAsMain){this._updateMainCacheKey(key);}
+return cache;},_updateMainCacheKey:function(value){let ref=this._caches[this._cKey];if(ref){ref.destroyInternalCache();}
+this._cKey=value;},getCacheSize:function(){return Object.keys(this._caches).length;},removeCache:function(key,freeIfUnused=true){const deleteTarget=this._caches[key];if(!deleteTarget){this.tiledImage._tileCache.unloadCacheForTile(this,key,freeIfUnused,true);return undefined;}
+const currentMainKey=this.cacheKey,originalDataKey=this.originalCacheKey,sameBuiltinKeys=currentMainKey===originalDataKey;if(!sameBuiltinKeys&&originalDataKey===key){$.console.warn("[Tile.removeCache] original data must not be manually deleted: other parts of the code might rely on it!","If you want the tile not to preserve the original data, toggle of data perseverance in tile.setData().");return undefined;}
+if(currentMainKey===key){if(!sameBuiltinKeys&&this._caches[originalDataKey]){this._updateMainCacheKey(originalDataKey);}else{$.console.warn("[Tile.removeCache] trying to remove the only cache that can be used to draw the tile!","If you want to remove the main cache, first set different cache as main with tile.addCache()");return undefined;}}
+if(this.tiledImage._tileCache.unloadCacheForTile(this,key,freeIfUnused,false)){delete this._caches[key];}
+return deleteTarget;},getScaleForEdgeSmoothing:function(){$.console.warn("[Tile.getScaleForEdgeSmoothing] is deprecated, the following error is the consequence:");const context=this.getCanvasContext();if(!context){$.console.warn('[Tile.drawCanvas] attempting to get tile scale %s when tile\'s not cached',this.toString());return 1;}
+return context.canvas.width/(this.size.x*$.pixelDensityRatio);},getTranslationForEdgeSmoothing:function(scale,canvasSize,sketchCanvasSize){const x=Math.max(1,Math.ceil((sketchCanvasSize.x-canvasSize.x)/2));const y=Math.max(1,Math.ceil((sketchCanvasSize.y-canvasSize.y)/2));return new $.Point(x,y).minus(this.position.times($.pixelDensityRatio).times(scale||1).apply(function(x){return x%1;}));},reflectCacheRenamed:function(oldKey,newKey){let cache=this._caches[oldKey];if(!cache){return;}
+if(oldKey===this._ocKey){this._ocKey=newKey;}
+if(oldKey===this._cKey){this._cKey=newKey;}
+this._caches[newKey]=cache;delete this._caches[oldKey];},equals(tile){return this._ocKey===tile._ocKey;},unload:function(erase=false){if(!this.loaded){return;}
+this.tiledImage._tileCache.unloadTile(this,erase);},_unload:function(){this.tiledImage=null;this._caches={};this.loaded=false;this.loading=false;this._cKey=this._ocKey;}};}(OpenSeadragon));(function($){$.OverlayPlacement=$.Placement;$.OverlayRotationMode=$.freezeObject({NO_ROTATION:1,EXACT:2,BOUNDING_BOX:3});$.Overlay=function(element,location,placement){let options;if($.isPlainObject(element)){options=element;}else{options={element:element,location:location,placement:placement};}
+this.elementWrapper=document.createElement('div');this.element=options.element;this.elementWrapper.appendChild(this.element);if(this.element.id){this.elementWrapper.id="overlay-wrapper-"+this.element.id;}
+this.elementWrapper.classList.add("openseadragon-overlay-wrapper");this.style=this.elementWrapper.style;this._init(options);};$.Overlay.prototype={_init:function(options){this.location=options.location;this.placement=options.placement===undefined?$.Placement.TOP_LEFT:options.placement;this.onDraw=options.onDraw;this.checkResize=options.checkResize===undefined?true:options.checkResize;this.width=options.width===undefined?null:options.width;this.height=options.height===undefined?null:options.height;this.rotationMode=options.rotationMode||$.OverlayRotationMode.EXACT;if(this.location instanceof $.Rect){this.width=this.location.width;this.height=this.location.height;this.location=this.location.getTopLeft();this.placement=$.Placement.TOP_LEFT;}
+this.scales=this.width!==null&&this.height!==null;this.bounds=new $.Rect(this.location.x,this.location.y,this.width,this.height);this.position=this.location;},adjust:function(position,size){const properties=$.Placement.properties[this.placement];if(!properties){return;}
+if(properties.isHorizontallyCentered){position.x-=size.x/2;}else if(properties.isRight){position.x-=size.x;}
+if(properties.isVerticallyCentered){position.y-=size.y/2;}else if(properties.isBottom){position.y-=size.y;}},destroy:function(){const element=this.elementWrapper;const style=this.style;if(element.parentNode){element.parentNode.removeChild(element);if(element.prevElementParent){style.display='none';document.body.appendChild(element);}}
+this.onDraw=null;style.top="";style.left="";style.position="";if(this.width!==null){style.width="";}
+if(this.height!==null){style.height="";}
+const transformOriginProp=$.getCssPropertyWithVendorPrefix('transformOrigin');const transformProp=$.getCssPropertyWithVendorPrefix('transform');if(transformOriginProp&&transformProp){style[transformOriginProp]="";style[transformProp]="";}},drawHTML:function(container,viewport){const element=this.elementWrapper;if(element.parentNode!==container){element.prevElementParent=element.parentNode;element.prevNextSibling=element.nextSibling;container.appendChild(element);this.style.position="absolute";this.size=$.getElementSize(this.elementWrapper);}
+const positionAndSize=this._getOverlayPositionAndSize(viewport);const position=positionAndSize.position;const size=this.size=positionAndSize.size;let outerScale="";if(viewport.overlayPreserveContentDirection){outerScale=viewport.flipped?" scaleX(-1)":" scaleX(1)";}
+const rotate=viewport.flipped?-positionAndSize.rotate:positionAndSize.rotate;const scale=viewport.flipped?" scaleX(-1)":"";if(this.onDraw){this.onDraw(position,size,this.element);}else{const style=this.style;const innerStyle=this.element.style;innerStyle.display="block";style.left=position.x+"px";style.top=position.y+"px";if(this.width!==null){innerStyle.width=size.x+"px";}
+if(this.height!==null){innerStyle.height=size.y+"px";}
+const transformOriginProp=$.getCssPropertyWithVendorPrefix('transformOrigin');const transformProp=$.getCssPropertyWithVendorPrefix('transform');if(transformOriginProp&&transformProp){if(rotate&&!viewport.flipped){innerStyle[transformProp]="";style[transformOriginProp]=this._getTransformOrigin();style[transformProp]="rotate("+rotate+"deg)";}else if(!rotate&&viewport.flipped){innerStyle[transformProp]=outerScale;style[transformOriginProp]=this._getTransformOrigin();style[transformProp]=scale;}else if(rotate&&viewport.flipped){innerStyle[transformProp]=outerScale;style[transformOriginProp]=this._getTransformOrigin();style[transformProp]="rotate("+rotate+"deg)"+scale;}else{innerStyle[transformProp]="";style[transformOriginProp]="";style[transformProp]="";}}
+style.display='flex';}},_getOverlayPositionAndSize:function(viewport){let position=viewport.pixelFromPoint(this.location,true);let size=this._getSizeInPixels(viewport);this.adjust(position,size);let rotate=0;if(viewport.getRotation(true)&&this.rotationMode!==$.OverlayRotationMode.NO_ROTATION){if(this.rotationMode===$.OverlayRotationMode.BOUNDING_BOX&&this.width!==null&&this.height!==null){const rect=new $.Rect(position.x,position.y,size.x,size.y);const boundingBox=this._getBoundingBox(rect,viewport.getRotation(true));position=boundingBox.getTopLeft();size=boundingBox.getSize();}else{rotate=viewport.getRotation(true);}}
+if(viewport.flipped){position.x=(viewport.getContainerSize().x-position.x);}
+return{position:position,size:size,rotate:rotate};},_getSizeInPixels:function(viewport){let width=this.size.x;let height=this.size.y;if(this.width!==null||this.height!==null){const scaledSize=viewport.deltaPixelsFromPointsNoRotate(new $.Point(this.width||0,this.height||0),true);if(this.width!==null){width=scaledSize.x;}
+if(this.height!==null){height=scaledSize.y;}}
+if(this.checkResize&&(this.width===null||this.height===null)){const eltSize=this.size=$.getElementSize(this.elementWrapper);if(this.width===null){width=eltSize.x;}
+if(this.height===null){height=eltSize.y;}}
+return new $.Point(width,height);},_getBoundingBox:function(rect,degrees){const refPoint=this._getPlacementPoint(rect);return rect.rotate(degrees,refPoint).getBoundingBox();},_getPlacementPoint:function(rect){const result=new $.Point(rect.x,rect.y);const properties=$.Placement.properties[this.placement];if(properties){if(properties.isHorizontallyCentered){result.x+=rect.width/2;}else if(properties.isRight){result.x+=rect.width;}
+if(properties.isVerticallyCentered){result.y+=rect.height/2;}else if(properties.isBottom){result.y+=rect.height;}}
+return result;},_getTransformOrigin:function(){let result="";const properties=$.Placement.properties[this.placement];if(!properties){return result;}
+if(properties.isLeft){result="left";}else if(properties.isRight){result="right";}
+if(properties.isTop){result+=" top";}else if(properties.isBottom){result+=" bottom";}
+return result;},update:function(location,placement){const options=$.isPlainObject(location)?location:{location:location,placement:placement};this._init({location:options.location||this.location,placement:options.placement!==undefined?options.placement:this.placement,onDraw:options.onDraw||this.onDraw,checkResize:options.checkResize||this.checkResize,width:options.width!==undefined?options.width:this.width,height:options.height!==undefined?options.height:this.height,rotationMode:options.rotationMode||this.rotationMode});},getBounds:function(viewport){$.console.assert(viewport,'A viewport must now be passed to Overlay.getBounds.');let width=this.width;let height=this.height;if(width===null||height===null){const size=viewport.deltaPointsFromPixelsNoRotate(this.size,true);if(width===null){width=size.x;}
+if(height===null){height=size.y;}}
+const location=this.location.clone();this.adjust(location,new $.Point(width,height));return this._adjustBoundsForRotation(viewport,new $.Rect(location.x,location.y,width,height));},_adjustBoundsForRotation:function(viewport,bounds){if(!viewport||viewport.getRotation(true)===0||this.rotationMode===$.OverlayRotationMode.EXACT){return bounds;}
+if(this.rotationMode===$.OverlayRotationMode.BOUNDING_BOX){if(this.width===null||this.height===null){return bounds;}
+const positionAndSize=this._getOverlayPositionAndSize(viewport);return viewport.viewerElementToViewportRectangle(new $.Rect(positionAndSize.position.x,positionAndSize.position.y,positionAndSize.size.x,positionAndSize.size.y));}
+return bounds.rotate(-viewport.getRotation(true),this._getPlacementPoint(bounds));}};}(OpenSeadragon));(function($){const OpenSeadragon=$;OpenSeadragon.DrawerBase=class DrawerBase{constructor(options){$.console.assert(options.viewer,"[Drawer] options.viewer is required");$.console.assert(options.viewport,"[Drawer] options.viewport is required");$.console.assert(options.element,"[Drawer] options.element is required");this._id=this.getType()+$.now();this.viewer=options.viewer;this.viewport=options.viewport;this.debugGridColor=typeof options.debugGridColor==='string'?[options.debugGridColor]:options.debugGridColor||$.DEFAULT_SETTINGS.debugGridColor;this.options=$.extend({usePrivateCache:false,preloadCache:true,offScreen:false,broadCastTileInvalidation:true,},this.defaultOptions,options.options);this.container=$.getElement(options.element);this._renderingTarget=this._createDrawingElement();if(!this.options.offScreen){this.canvas.style.width="100%";this.canvas.style.height="100%";this.canvas.style.position="absolute";this.canvas.style.left="0";$.setElementOpacity(this.canvas,this.viewer.opacity,true);$.setElementPointerEventsNone(this.canvas);$.setElementTouchActionNone(this.canvas);this.container.style.textAlign="left";this.container.appendChild(this.canvas);if(this.options.broadCastTileInvalidation){let parentViewer=this.viewer;while(parentViewer.viewer){parentViewer=parentViewer.viewer;}
+this._parentViewer=parentViewer;parentViewer._registerDrawer(this);}else{this.viewer._registerDrawer(this);this._parentViewer=this.viewer;}}
+this._checkInterfaceImplementation();this.setInternalCacheNeedsRefresh();}
+get defaultOptions(){return{};}
+get canvas(){return this._renderingTarget;}
+get element(){$.console.error('Drawer.element is deprecated. Use Drawer.container instead.');return this.container;}
+getId(){return this._id;}
+getType(){$.console.error('Drawer.getType must be implemented by child class');return undefined;}
+getRequiredDataFormats(){return this.getSupportedDataFormats();}
+getSupportedDataFormats(){throw"Drawer.getSupportedDataFormats must define its supported rendering data types!";}
+getDataToDraw(tile){const cache=tile.getCache(tile.cacheKey);if(!cache){$.console.warn("Attempt to draw tile %s when not cached!",tile);return undefined;}
+const dataCache=cache.getDataForRendering(this,tile);return dataCache&&dataCache.data;}
+static isSupported(){$.console.error('Drawer.isSupported must be implemented by child class');}
+_createDrawingElement(){$.console.error('Drawer._createDrawingElement must be implemented by child class');return null;}
+draw(tiledImages){$.console.error('Drawer.draw must be implemented by child class');}
+canRotate(){$.console.error('Drawer.canRotate must be implemented by child class');}
+destroy(){this._parentViewer._unregisterDrawer(this);}
+destroyInternalCache(){this.viewer.tileCache.clearDrawerInternalCache(this);}
+minimumOverlapRequired(tiledImage){return false;}
+setImageSmoothingEnabled(imageSmoothingEnabled){$.console.error('Drawer.setImageSmoothingEnabled must be implemented by child class');}
+drawDebuggingRect(rect){$.console.warn('[drawer].drawDebuggingRect is not implemented by this drawer');}
+clear(){$.console.warn('[drawer].clear() is deprecated. The drawer is responsible for clearing itself as needed before drawing tiles.');}
+internalCacheCreate(cache,tile){}
+internalCacheFree(data){}
+setInternalCacheNeedsRefresh(){this._dataNeedsRefresh=$.now();}
+tiledImageCreated(tiledImage){}
+_checkInterfaceImplementation(){if(this._createDrawingElement===$.DrawerBase.prototype._createDrawingElement){throw(new Error("[drawer]._createDrawingElement must be implemented by child class"));}
+if(this.draw===$.DrawerBase.prototype.draw){throw(new Error("[drawer].draw must be implemented by child class"));}
+if(this.canRotate===$.DrawerBase.prototype.canRotate){throw(new Error("[drawer].canRotate must be implemented by child class"));}
+if(this.destroy===$.DrawerBase.prototype.destroy){throw(new Error("[drawer].destroy must be implemented by child class"));}
+if(this.setImageSmoothingEnabled===$.DrawerBase.prototype.setImageSmoothingEnabled){throw(new Error("[drawer].setImageSmoothingEnabled must be implemented by child class"));}}
+viewportToDrawerRectangle(rectangle){const topLeft=this.viewport.pixelFromPointNoRotate(rectangle.getTopLeft(),true);const size=this.viewport.deltaPixelsFromPointsNoRotate(rectangle.getSize(),true);return new $.Rect(topLeft.x*$.pixelDensityRatio,topLeft.y*$.pixelDensityRatio,size.x*$.pixelDensityRatio,size.y*$.pixelDensityRatio);}
+viewportCoordToDrawerCoord(point){const vpPoint=this.viewport.pixelFromPointNoRotate(point,true);return new $.Point(vpPoint.x*$.pixelDensityRatio,vpPoint.y*$.pixelDensityRatio);}
+_calculateCanvasSize(){const pixelDensityRatio=$.pixelDensityRatio;const viewportSize=this.viewport.getContainerSize();return new OpenSeadragon.Point(Math.round(viewportSize.x*pixelDensityRatio),Math.round(viewportSize.y*pixelDensityRatio));}
+_raiseTiledImageDrawnEvent(tiledImage,tiles){if(!this.viewer){return;}
+this.viewer.raiseEvent('tiled-image-drawn',{tiledImage:tiledImage,tiles:tiles,});}
+_raiseDrawerErrorEvent(tiledImage,errorMessage){if(!this.viewer){return;}
+this.viewer.raiseEvent('drawer-error',{tiledImage:tiledImage,drawer:this,error:errorMessage,});}};}(OpenSeadragon));(function($){const OpenSeadragon=$;class HTMLDrawer extends OpenSeadragon.DrawerBase{constructor(options){super(options);this.viewer.rejectEventHandler("tile-drawing","The HTMLDrawer does not raise the tile-drawing event");this.viewer.allowEventHandler("tile-drawn");function _prepareTile(tile,data){const element=$.makeNeutralElement("div");const imgElement=data.cloneNode();imgElement.style.msInterpolationMode="nearest-neighbor";imgElement.style.width="100%";imgElement.style.height="100%";const style=element.style;style.position="absolute";return{element,imgElement,style,data};}
+$.converter.learn("image",HTMLDrawer.imageCacheType,_prepareTile,1,1);$.converter.learn(HTMLDrawer.imageCacheType,"image",(t,d)=>d.data,1,3);function _freeTile(data){if(data.imgElement&&data.imgElement.parentNode){data.imgElement.parentNode.removeChild(data.imgElement);}
+if(data.element&&data.element.parentNode){data.element.parentNode.removeChild(data.element);}}
+$.converter.learnDestroy(HTMLDrawer.imageCacheType,_freeTile);}
+static get imageCacheType(){return'htmlDrawer[image]';}
+static get canvasCacheType(){return'htmlDrawer[canvas]';}
+static isSupported(){return true;}
+getType(){return'html';}
+getSupportedDataFormats(){return[HTMLDrawer.imageCacheType,HTMLDrawer.canvasCacheType];}
+minimumOverlapRequired(tiledImage){return true;}
+_createDrawingElement(){return $.makeNeutralElement("div");}
+draw(tiledImages){const _this=this;this._prepareNewFrame();tiledImages.forEach(function(tiledImage){if(tiledImage.opacity!==0){_this._drawTiles(tiledImage);}});}
+canRotate(){return false;}
+destroy(){super.destroy();this.container.removeChild(this.canvas);}
+setImageSmoothingEnabled(){}
+_prepareNewFrame(){this.canvas.innerHTML="";}
+_drawTiles(tiledImage){const lastDrawn=tiledImage.getTilesToDraw().map(info=>info.tile);if(tiledImage.opacity===0||(lastDrawn.length===0&&!tiledImage.placeholderFillStyle)){return;}
+for(let i=lastDrawn.length-1;i>=0;i--){const tile=lastDrawn[i];this._drawTile(tile);if(this.viewer){this.viewer.raiseEvent('tile-drawn',{tiledImage:tiledImage,tile:tile});}}}
+_drawTile(tile){$.console.assert(tile,'[Drawer._drawTile] tile is required');let container=this.canvas;if(!tile.loaded){$.console.warn("Attempting to draw tile %s when it's not yet loaded.",tile.toString());return;}
+const dataObject=this.getDataToDraw(tile);if(!dataObject){return;}
+if(dataObject.element.parentNode!==container){container.appendChild(dataObject.element);}
+if(dataObject.imgElement.parentNode!==dataObject.element){dataObject.element.appendChild(dataObject.imgElement);}
+dataObject.style.top=tile.position.y+"px";dataObject.style.left=tile.position.x+"px";dataObject.style.height=tile.size.y+"px";dataObject.style.width=tile.size.x+"px";if(tile.flipped){dataObject.style.transform="scaleX(-1)";}
+$.setElementOpacity(dataObject.element,tile.opacity);}}
+$.HTMLDrawer=HTMLDrawer;}(OpenSeadragon));(function($){const OpenSeadragon=$;class CanvasDrawer extends OpenSeadragon.DrawerBase{constructor(options){super(options);this.context=this.canvas.getContext('2d');this.sketchCanvas=null;this.sketchContext=null;this._imageSmoothingEnabled=true;this.viewer.allowEventHandler("tile-drawn");this.viewer.allowEventHandler("tile-drawing");}
+static isSupported(){return $.supportsCanvas;}
+getType(){return'canvas';}
+getSupportedDataFormats(){return["context2d"];}
+_createDrawingElement(){const canvas=$.makeNeutralElement("canvas");const viewportSize=this._calculateCanvasSize();canvas.width=viewportSize.x;canvas.height=viewportSize.y;return canvas;}
+draw(tiledImages){this._prepareNewFrame();if(this.viewer.viewport.getFlip()!==this._viewportFlipped){this._flip();}
+for(const tiledImage of tiledImages){if(tiledImage.opacity!==0){this._drawTiles(tiledImage);}}}
+canRotate(){return true;}
+destroy(){super.destroy();this.canvas.width=1;this.canvas.height=1;this.sketchCanvas=null;this.sketchContext=null;this.container.removeChild(this.canvas);}
+minimumOverlapRequired(tiledImage){return true;}
+setImageSmoothingEnabled(imageSmoothingEnabled){this._imageSmoothingEnabled=!!imageSmoothingEnabled;this._updateImageSmoothingEnabled(this.context);this.viewer.forceRedraw();}
+drawDebuggingRect(rect){const context=this.context;context.save();context.lineWidth=2*$.pixelDensityRatio;context.strokeStyle=this.debugGridColor[0];context.fillStyle=this.debugGridColor[0];context.strokeRect(rect.x*$.pixelDensityRatio,rect.y*$.pixelDensityRatio,rect.width*$.pixelDensityRatio,rect.height*$.pixelDensityRatio);context.restore();}
+get _viewportFlipped(){return this.context.getTransform().a<0;}
+_raiseTileDrawingEvent(tiledImage,context,tile,rendered){this.viewer.raiseEvent('tile-drawing',{tiledImage:tiledImage,context:context,tile:tile,rendered:rendered});}
+_prepareNewFrame(){const viewportSize=this._calculateCanvasSize();if(this.canvas.width!==viewportSize.x||this.canvas.height!==viewportSize.y){this.canvas.width=viewportSize.x;this.canvas.height=viewportSize.y;this._updateImageSmoothingEnabled(this.context);if(this.sketchCanvas!==null){const sketchCanvasSize=this._calculateSketchCanvasSize();this.sketchCanvas.width=sketchCanvasSize.x;this.sketchCanvas.height=sketchCanvasSize.y;this._updateImageSmoothingEnabled(this.sketchContext);}}
+this._clear();}
+_clear(useSketch,bounds){const context=this._getContext(useSketch);if(bounds){context.clearRect(bounds.x,bounds.y,bounds.width,bounds.height);}else{const canvas=context.canvas;context.clearRect(0,0,canvas.width,canvas.height);}}
+_drawTiles(tiledImage){const lastDrawn=tiledImage.getTilesToDraw().map(info=>info.tile);if(tiledImage.opacity===0||(lastDrawn.length===0&&!tiledImage.placeholderFillStyle)){return;}
+let tile=lastDrawn[0];let useSketch;if(tile){useSketch=tiledImage.opacity<1||(tiledImage.compositeOperation&&tiledImage.compositeOperation!=='source-over')||(!tiledImage._isBottomItem()&&tiledImage.source.hasTransparency(null,tile.getUrl(),tile.ajaxHeaders,tile.postData));}
+let sketchScale;let sketchTranslate;const zoom=this.viewport.getZoom(true);const imageZoom=tiledImage.viewportToImageZoom(zoom);if(lastDrawn.length>1&&imageZoom>tiledImage.smoothTileEdgesMinZoom&&!tiledImage.iOSDevice&&tiledImage.getRotation(true)%360===0){useSketch=true;const context=tile.length&&this.getDataToDraw(tile);if(context){sketchScale=context.canvas.width/(tile.size.x*$.pixelDensityRatio);}else{sketchScale=1;}
+sketchTranslate=tile.getTranslationForEdgeSmoothing(sketchScale,this._getCanvasSize(false),this._getCanvasSize(true));}
+let bounds;if(useSketch){if(!sketchScale){bounds=this.viewport.viewportToViewerElementRectangle(tiledImage.getClippedBounds(true)).getIntegerBoundingBox();bounds=bounds.times($.pixelDensityRatio);}
+this._clear(true,bounds);}
+if(!sketchScale){this._setRotations(tiledImage,useSketch);}
+let usedClip=false;if(tiledImage._clip){this._saveContext(useSketch);let box=tiledImage.imageToViewportRectangle(tiledImage._clip,true);box=box.rotate(-tiledImage.getRotation(true),tiledImage._getRotationPoint(true));let clipRect=this.viewportToDrawerRectangle(box);if(sketchScale){clipRect=clipRect.times(sketchScale);}
+if(sketchTranslate){clipRect=clipRect.translate(sketchTranslate);}
+this._setClip(clipRect,useSketch);usedClip=true;}
+if(tiledImage._croppingPolygons){const self=this;if(!usedClip){this._saveContext(useSketch);}
+try{const polygons=tiledImage._croppingPolygons.map(function(polygon){return polygon.map(function(coord){const point=tiledImage.imageToViewportCoordinates(coord.x,coord.y,true).rotate(-tiledImage.getRotation(true),tiledImage._getRotationPoint(true));let clipPoint=self.viewportCoordToDrawerCoord(point);if(sketchScale){clipPoint=clipPoint.times(sketchScale);}
+if(sketchTranslate){clipPoint=clipPoint.plus(sketchTranslate);}
+return clipPoint;});});this._clipWithPolygons(polygons,useSketch);}catch(e){$.console.error(e);}
+usedClip=true;}
+tiledImage._hasOpaqueTile=false;if(tiledImage.placeholderFillStyle&&tiledImage._hasOpaqueTile===false){let placeholderRect=this.viewportToDrawerRectangle(tiledImage.getBoundsNoRotate(true));if(sketchScale){placeholderRect=placeholderRect.times(sketchScale);}
+if(sketchTranslate){placeholderRect=placeholderRect.translate(sketchTranslate);}
+let fillStyle=null;if(typeof tiledImage.placeholderFillStyle==="function"){fillStyle=tiledImage.placeholderFillStyle(tiledImage,this.context);}
+else{fillStyle=tiledImage.placeholderFillStyle;}
+this._drawRectangle(placeholderRect,fillStyle,useSketch);}
+const subPixelRoundingRule=determineSubPixelRoundingRule(tiledImage.subPixelRoundingForTransparency);let shouldRoundPositionAndSize=false;if(subPixelRoundingRule===$.SUBPIXEL_ROUNDING_OCCURRENCES.ALWAYS){shouldRoundPositionAndSize=true;}else if(subPixelRoundingRule===$.SUBPIXEL_ROUNDING_OCCURRENCES.ONLY_AT_REST){shouldRoundPositionAndSize=!(this.viewer&&this.viewer.isAnimating());}
+for(let i=0;i<lastDrawn.length;i++){tile=lastDrawn[i];this._drawTile(tile,tiledImage,useSketch,sketchScale,sketchTranslate,shouldRoundPositionAndSize,tiledImage.source);if(this.viewer){this.viewer.raiseEvent('tile-drawn',{tiledImage:tiledImage,tile:tile});}}
+if(usedClip){this._restoreContext(useSketch);}
+if(!sketchScale){if(tiledImage.getRotation(true)%360!==0){this._restoreRotationChanges(useSketch);}
+if(this.viewport.getRotation(true)%360!==0){this._restoreRotationChanges(useSketch);}}
+if(useSketch){if(sketchScale){this._setRotations(tiledImage);}
+this.blendSketch({opacity:tiledImage.opacity,scale:sketchScale,translate:sketchTranslate,compositeOperation:tiledImage.compositeOperation,bounds:bounds});if(sketchScale){if(tiledImage.getRotation(true)%360!==0){this._restoreRotationChanges(false);}
+if(this.viewport.getRotation(true)%360!==0){this._restoreRotationChanges(false);}}}
+this._drawDebugInfo(tiledImage,lastDrawn);this._raiseTiledImageDrawnEvent(tiledImage,lastDrawn);}
+_drawDebugInfo(tiledImage,lastDrawn){if(tiledImage.debugMode){for(let i=lastDrawn.length-1;i>=0;i--){const tile=lastDrawn[i];try{this._drawDebugInfoOnTile(tile,lastDrawn.length,i,tiledImage);}catch(e){$.console.error(e);}}}}
+_clipWithPolygons(polygons,useSketch){const context=this._getContext(useSketch);context.beginPath();for(const polygon of polygons){for(const[i,coord]of polygon.entries()){context[i===0?'moveTo':'lineTo'](coord.x,coord.y);}}
+context.clip();}
+_drawTile(tile,tiledImage,useSketch,scale,translate,shouldRoundPositionAndSize,source){$.console.assert(tile,'[Drawer._drawTile] tile is required');$.console.assert(tiledImage,'[Drawer._drawTile] drawingHandler is required');if(!tile.loaded){$.console.warn("Attempting to draw tile %s when it's not yet loaded.",tile.toString());return;}
+const rendered=this.getDataToDraw(tile);if(!rendered){return;}
+const context=this._getContext(useSketch);scale=scale||1;let position=tile.position.times($.pixelDensityRatio),size=tile.size.times($.pixelDensityRatio);context.save();if(typeof scale==='number'&&scale!==1){position=position.times(scale);size=size.times(scale);}
+if(translate instanceof $.Point){position=position.plus(translate);}
+if(context.globalAlpha===1&&tile.hasTransparency){if(shouldRoundPositionAndSize){position.x=Math.round(position.x);position.y=Math.round(position.y);size.x=Math.round(size.x);size.y=Math.round(size.y);}
+context.clearRect(position.x,position.y,size.x,size.y);}
+this._raiseTileDrawingEvent(tiledImage,context,tile,rendered);let sourceWidth,sourceHeight;if(tile.sourceBounds){sourceWidth=Math.min(tile.sourceBounds.width,rendered.canvas.width);sourceHeight=Math.min(tile.sourceBounds.height,rendered.canvas.height);}else{sourceWidth=rendered.canvas.width;sourceHeight=rendered.canvas.height;}
+context.translate(position.x+size.x/2,0);if(tile.flipped){context.scale(-1,1);}
+context.drawImage(rendered.canvas,0,0,sourceWidth,sourceHeight,-size.x/2,position.y,size.x,size.y);context.restore();}
+_getContext(useSketch){let context=this.context;if(useSketch){if(this.sketchCanvas===null){this.sketchCanvas=document.createElement("canvas");const sketchCanvasSize=this._calculateSketchCanvasSize();this.sketchCanvas.width=sketchCanvasSize.x;this.sketchCanvas.height=sketchCanvasSize.y;this.sketchContext=this.sketchCanvas.getContext("2d");if(this.viewport.getRotation()===0){const self=this;this.viewer.addHandler('rotate',function resizeSketchCanvas(){if(self.viewport.getRotation()===0){return;}
+self.viewer.removeHandler('rotate',resizeSketchCanvas);const sketchCanvasSize=self._calculateSketchCanvasSize();self.sketchCanvas.width=sketchCanvasSize.x;self.sketchCanvas.height=sketchCanvasSize.y;});}
+this._updateImageSmoothingEnabled(this.sketchContext);}
+context=this.sketchContext;}
+return context;}
+_saveContext(useSketch){this._getContext(useSketch).save();}
+_restoreContext(useSketch){this._getContext(useSketch).restore();}
+_setClip(rect,useSketch){const context=this._getContext(useSketch);context.beginPath();context.rect(rect.x,rect.y,rect.width,rect.height);context.clip();}
+_drawRectangle(rect,fillStyle,useSketch){const context=this._getContext(useSketch);context.save();context.fillStyle=fillStyle;context.fillRect(rect.x,rect.y,rect.width,rect.height);context.restore();}
+blendSketch(opacity,scale,translate,compositeOperation){let options=opacity;if(!$.isPlainObject(options)){options={opacity:opacity,scale:scale,translate:translate,compositeOperation:compositeOperation};}
+opacity=options.opacity;compositeOperation=options.compositeOperation;const bounds=options.bounds;this.context.save();this.context.globalAlpha=opacity;if(compositeOperation){this.context.globalCompositeOperation=compositeOperation;}
+if(bounds){if(bounds.x<0){bounds.width+=bounds.x;bounds.x=0;}
+if(bounds.x+bounds.width>this.canvas.width){bounds.width=this.canvas.width-bounds.x;}
+if(bounds.y<0){bounds.height+=bounds.y;bounds.y=0;}
+if(bounds.y+bounds.height>this.canvas.height){bounds.height=this.canvas.height-bounds.y;}
+this.context.drawImage(this.sketchCanvas,bounds.x,bounds.y,bounds.width,bounds.height,bounds.x,bounds.y,bounds.width,bounds.height);}else{scale=options.scale||1;translate=options.translate;const position=translate instanceof $.Point?translate:new $.Point(0,0);let widthExt=0;let heightExt=0;if(translate){const widthDiff=this.sketchCanvas.width-this.canvas.width;const heightDiff=this.sketchCanvas.height-this.canvas.height;widthExt=Math.round(widthDiff/2);heightExt=Math.round(heightDiff/2);}
+this.context.drawImage(this.sketchCanvas,position.x-widthExt*scale,position.y-heightExt*scale,(this.canvas.width+2*widthExt)*scale,(this.canvas.height+2*heightExt)*scale,-widthExt,-heightExt,this.canvas.width+2*widthExt,this.canvas.height+2*heightExt);}
+this.context.restore();}
+_drawDebugInfoOnTile(tile,count,i,tiledImage){const colorIndex=this.viewer.world.getIndexOfItem(tiledImage)%this.debugGridColor.length;const context=this.context;context.save();context.lineWidth=2*$.pixelDensityRatio;context.font='small-caps bold '+(13*$.pixelDensityRatio)+'px arial';context.strokeStyle=this.debugGridColor[colorIndex];context.fillStyle=this.debugGridColor[colorIndex];this._setRotations(tiledImage);if(this._viewportFlipped){this._flip({point:tile.position.plus(tile.size.divide(2))});}
+context.strokeRect(tile.position.x*$.pixelDensityRatio,tile.position.y*$.pixelDensityRatio,tile.size.x*$.pixelDensityRatio,tile.size.y*$.pixelDensityRatio);const tileCenterX=(tile.position.x+(tile.size.x/2))*$.pixelDensityRatio;const tileCenterY=(tile.position.y+(tile.size.y/2))*$.pixelDensityRatio;context.translate(tileCenterX,tileCenterY);const angleInDegrees=this.viewport.getRotation(true);context.rotate(Math.PI/180*-angleInDegrees);context.translate(-tileCenterX,-tileCenterY);if(tile.x===0&&tile.y===0){context.fillText("Zoom: "+this.viewport.getZoom(),tile.position.x*$.pixelDensityRatio,(tile.position.y-30)*$.pixelDensityRatio);context.fillText("Pan: "+this.viewport.getBounds().toString(),tile.position.x*$.pixelDensityRatio,(tile.position.y-20)*$.pixelDensityRatio);}
+context.fillText("Level: "+tile.level,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+20)*$.pixelDensityRatio);context.fillText("Column: "+tile.x,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+30)*$.pixelDensityRatio);context.fillText("Row: "+tile.y,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+40)*$.pixelDensityRatio);context.fillText("Order: "+i+" of "+count,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+50)*$.pixelDensityRatio);context.fillText("Size: "+tile.size.toString(),(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+60)*$.pixelDensityRatio);context.fillText("Position: "+tile.position.toString(),(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+70)*$.pixelDensityRatio);if(this.viewport.getRotation(true)%360!==0){this._restoreRotationChanges();}
+if(tiledImage.getRotation(true)%360!==0){this._restoreRotationChanges();}
+context.restore();}
+_updateImageSmoothingEnabled(context){context.msImageSmoothingEnabled=this._imageSmoothingEnabled;context.imageSmoothingEnabled=this._imageSmoothingEnabled;}
+_getCanvasSize(sketch){const canvas=this._getContext(sketch).canvas;return new $.Point(canvas.width,canvas.height);}
+_getCanvasCenter(){return new $.Point(this.canvas.width/2,this.canvas.height/2);}
+_setRotations(tiledImage,useSketch=false){let saveContext=false;if(this.viewport.getRotation(true)%360!==0){this._offsetForRotation({degrees:this.viewport.getRotation(true),useSketch:useSketch,saveContext:saveContext});saveContext=false;}
+if(tiledImage.getRotation(true)%360!==0){this._offsetForRotation({degrees:tiledImage.getRotation(true),point:this.viewport.pixelFromPointNoRotate(tiledImage._getRotationPoint(true),true),useSketch:useSketch,saveContext:saveContext});}}
+_offsetForRotation(options){const point=options.point?options.point.times($.pixelDensityRatio):this._getCanvasCenter();const context=this._getContext(options.useSketch);context.save();context.translate(point.x,point.y);context.rotate(Math.PI/180*options.degrees);context.translate(-point.x,-point.y);}
+_flip(options){options=options||{};const point=options.point?options.point.times($.pixelDensityRatio):this._getCanvasCenter();const context=this._getContext(options.useSketch);context.translate(point.x,0);context.scale(-1,1);context.translate(-point.x,0);}
+_restoreRotationChanges(useSketch){const context=this._getContext(useSketch);context.restore();}
+_calculateCanvasSize(){const pixelDensityRatio=$.pixelDensityRatio;const viewportSize=this.viewport.getContainerSize();return{x:Math.round(viewportSize.x*pixelDensityRatio),y:Math.round(viewportSize.y*pixelDensityRatio)};}
+_calculateSketchCanvasSize(){const canvasSize=this._calculateCanvasSize();if(this.viewport.getRotation()===0){return canvasSize;}
+const sketchCanvasSize=Math.ceil(Math.sqrt(canvasSize.x*canvasSize.x+
+canvasSize.y*canvasSize.y));return{x:sketchCanvasSize,y:sketchCanvasSize};}}
+$.CanvasDrawer=CanvasDrawer;const DEFAULT_SUBPIXEL_ROUNDING_RULE=$.SUBPIXEL_ROUNDING_OCCURRENCES.NEVER;function isSubPixelRoundingRuleUnknown(value){return value!==$.SUBPIXEL_ROUNDING_OCCURRENCES.ALWAYS&&value!==$.SUBPIXEL_ROUNDING_OCCURRENCES.ONLY_AT_REST&&value!==$.SUBPIXEL_ROUNDING_OCCURRENCES.NEVER;}
+function normalizeSubPixelRoundingRule(value){if(isSubPixelRoundingRuleUnknown(value)){return DEFAULT_SUBPIXEL_ROUNDING_RULE;}
+return value;}
+function determineSubPixelRoundingRule(subPixelRoundingRules){if(typeof subPixelRoundingRules==='number'){return normalizeSubPixelRoundingRule(subPixelRoundingRules);}
+if(!subPixelRoundingRules||!$.Browser){return DEFAULT_SUBPIXEL_ROUNDING_RULE;}
+let subPixelRoundingRule=subPixelRoundingRules[$.Browser.vendor];if(isSubPixelRoundingRuleUnknown(subPixelRoundingRule)){subPixelRoundingRule=subPixelRoundingRules['*'];}
+return normalizeSubPixelRoundingRule(subPixelRoundingRule);}}(OpenSeadragon));(function($){const OpenSeadragon=$;class WebglContextManager{constructor(options){this._renderingCanvas=options.renderingCanvas;this._unpackWithPremultipliedAlpha=!!options.unpackWithPremultipliedAlpha;this._imageSmoothingEnabled=options.imageSmoothingEnabled!==undefined?options.imageSmoothingEnabled:true;this._initShaderProgram=options.initShaderProgram;this._gl=null;this._isWebGL2=false;this._extTextureFilterAnisotropic=null;this._maxAnisotropy=0;this._firstPass=null;this._secondPass=null;this._glFrameBuffer=null;this._renderToTexture=null;this._glNumTextures=0;this._unitQuad=null;this._destroyed=false;this._gl=this._renderingCanvas.getContext('webgl2');if(this._gl){this._isWebGL2=true;this._setupWebGLExtensions();}else{this._gl=this._renderingCanvas.getContext('webgl');this._isWebGL2=false;if(this._gl){this._setupWebGLExtensions();}}
+if(this._gl){this._gl.pixelStorei(this._gl.UNPACK_PREMULTIPLY_ALPHA_WEBGL,this._unpackWithPremultipliedAlpha);}}
+getContext(){return this._gl;}
+isWebGL2(){return this._isWebGL2;}
+getMaxTextures(){if(!this._gl){return 0;}
+return this._gl.getParameter(this._gl.MAX_TEXTURE_IMAGE_UNITS);}
+getRenderingCanvas(){return this._renderingCanvas;}
+getFirstPass(){return this._firstPass;}
+getSecondPass(){return this._secondPass;}
+getFrameBuffer(){return this._glFrameBuffer;}
+getRenderToTexture(){return this._renderToTexture;}
+getUnitQuad(){return this._unitQuad;}
+_setupWebGLExtensions(){const gl=this._gl;this._extTextureFilterAnisotropic=gl.getExtension('EXT_texture_filter_anisotropic')||gl.getExtension('WEBKIT_EXT_texture_filter_anisotropic')||gl.getExtension('MOZ_EXT_texture_filter_anisotropic');if(this._extTextureFilterAnisotropic){this._maxAnisotropy=gl.getParameter(this._extTextureFilterAnisotropic.MAX_TEXTURE_MAX_ANISOTROPY_EXT);}}
+getTextureFilter(){const gl=this._gl;return this._imageSmoothingEnabled?gl.LINEAR:gl.NEAREST;}
+_applyAnisotropy(){if(!this._imageSmoothingEnabled||!this._extTextureFilterAnisotropic||this._maxAnisotropy<=0){return;}
+const gl=this._gl;gl.texParameterf(gl.TEXTURE_2D,this._extTextureFilterAnisotropic.TEXTURE_MAX_ANISOTROPY_EXT,Math.min(4,this._maxAnisotropy));}
+setupRenderer(width,height){const gl=this._gl;if(!gl){$.console.error('WebGL context not available for setupRenderer');return;}
+this._unitQuad=this.makeQuadVertexBuffer(0,1,0,1);this._makeFirstPassShaderProgram();this._makeSecondPassShaderProgram();this._renderToTexture=gl.createTexture();gl.activeTexture(gl.TEXTURE0);gl.bindTexture(gl.TEXTURE_2D,this._renderToTexture);gl.texImage2D(gl.TEXTURE_2D,0,gl.RGBA,width,height,0,gl.RGBA,gl.UNSIGNED_BYTE,null);gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_MIN_FILTER,this.getTextureFilter());this._applyAnisotropy();gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_WRAP_S,gl.CLAMP_TO_EDGE);gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_WRAP_T,gl.CLAMP_TO_EDGE);this._glFrameBuffer=gl.createFramebuffer();gl.bindFramebuffer(gl.FRAMEBUFFER,this._glFrameBuffer);gl.framebufferTexture2D(gl.FRAMEBUFFER,gl.COLOR_ATTACHMENT0,gl.TEXTURE_2D,this._renderToTexture,0);gl.enable(gl.BLEND);gl.blendFunc(gl.ONE,gl.ONE_MINUS_SRC_ALPHA);}
+resizeRenderer(width,height){const gl=this._gl;if(!gl){return;}
+gl.viewport(0,0,width,height);gl.deleteTexture(this._renderToTexture);this._renderToTexture=gl.createTexture();gl.activeTexture(gl.TEXTURE0);gl.bindTexture(gl.TEXTURE_2D,this._renderToTexture);gl.texImage2D(gl.TEXTURE_2D,0,gl.RGBA,width,height,0,gl.RGBA,gl.UNSIGNED_BYTE,null);gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_MIN_FILTER,this.getTextureFilter());this._applyAnisotropy();gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_WRAP_S,gl.CLAMP_TO_EDGE);gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_WRAP_T,gl.CLAMP_TO_EDGE);gl.bindFramebuffer(gl.FRAMEBUFFER,this._glFrameBuffer);gl.framebufferTexture2D(gl.FRAMEBUFFER,gl.COLOR_ATTACHMENT0,gl.TEXTURE_2D,this._renderToTexture,0);}
+createTexture(data,options={}){const gl=this._gl;if(!gl){return null;}
+const texture=gl.createTexture();gl.activeTexture(gl.TEXTURE0);gl.bindTexture(gl.TEXTURE_2D,texture);gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_WRAP_S,gl.CLAMP_TO_EDGE);gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_WRAP_T,gl.CLAMP_TO_EDGE);gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_MIN_FILTER,this.getTextureFilter());gl.texParameteri(gl.TEXTURE_2D,gl.TEXTURE_MAG_FILTER,this.getTextureFilter());this._applyAnisotropy();try{const unpackPremultipliedAlpha=options.unpackWithPremultipliedAlpha!==undefined?options.unpackWithPremultipliedAlpha:this._unpackWithPremultipliedAlpha;gl.pixelStorei(gl.UNPACK_PREMULTIPLY_ALPHA_WEBGL,unpackPremultipliedAlpha);gl.texImage2D(gl.TEXTURE_2D,0,gl.RGBA,gl.RGBA,gl.UNSIGNED_BYTE,data);return texture;}catch(e){gl.deleteTexture(texture);return null;}}
+deleteTexture(texture){if(this._gl&&texture){this._gl.deleteTexture(texture);}}
+setImageSmoothingEnabled(enabled){this._imageSmoothingEnabled=!!enabled;}
+setUnpackWithPremultipliedAlpha(enabled){this._unpackWithPremultipliedAlpha=!!enabled;if(this._gl){this._gl.pixelStorei(this._gl.UNPACK_PREMULTIPLY_ALPHA_WEBGL,this._unpackWithPremultipliedAlpha);}}
+makeQuadVertexBuffer(left,right,top,bottom){return new Float32Array([left,bottom,right,bottom,left,top,left,top,right,bottom,right,top]);}
+_makeFirstPassShaderProgram(){const numTextures=this._glNumTextures=this._gl.getParameter(this._gl.MAX_TEXTURE_IMAGE_UNITS);const makeMatrixUniforms=()=>{return[...Array(numTextures).keys()].map(index=>`uniform mat3 u_matrix_${index};`).join('\n');};const makeConditionals=()=>{return[...Array(numTextures).keys()].map(index=>`${index > 0 ? 'else ' : ''}if(int(a_index) == ${index}) { transform_matrix = u_matrix_${index}; }`).join('\n');};const vertexShaderProgram=`
+            attribute vec2 a_output_position;
+            attribute vec2 a_texture_position;
+            attribute float a_index;
+
+            ${makeMatrixUniforms()} // create a uniform mat3 for each potential tile to draw
+
+            varying vec2 v_texture_position;
+            varying float v_image_index;
+
+            void main() {
+
+                mat3 transform_matrix; // value will be set by the if/elses in makeConditional()
+
+                ${makeConditionals()}
+
+                gl_Position = vec4(transform_matrix * vec3(a_output_position, 1), 1);
+
+                v_texture_position = a_texture_position;
+                v_image_index = a_index;
+            }
+            `;const fragmentShaderProgram=`
+            precision mediump float;
+
+            // our textures
+            uniform sampler2D u_images[${numTextures}];
+            // our opacities
+            uniform float u_opacities[${numTextures}];
+
+            // the varyings passed in from the vertex shader.
+            varying vec2 v_texture_position;
+            varying float v_image_index;
+
+            void main() {
+                // can't index directly with a variable, need to use a loop iterator hack
+                for(int i = 0; i < ${numTextures}; ++i){
+                    if(i == int(v_image_index)){
+                        gl_FragColor = texture2D(u_images[i], v_texture_position) * u_opacities[i];
+                    }
+                }
+            }
+            `;const gl=this._gl;const program=this._initShaderProgram(gl,vertexShaderProgram,fragmentShaderProgram);gl.useProgram(program);this._firstPass={shaderProgram:program,aOutputPosition:gl.getAttribLocation(program,'a_output_position'),aTexturePosition:gl.getAttribLocation(program,'a_texture_position'),aIndex:gl.getAttribLocation(program,'a_index'),uTransformMatrices:[...Array(this._glNumTextures).keys()].map(i=>gl.getUniformLocation(program,`u_matrix_${i}`)),uImages:gl.getUniformLocation(program,'u_images'),uOpacities:gl.getUniformLocation(program,'u_opacities'),bufferOutputPosition:gl.createBuffer(),bufferTexturePosition:gl.createBuffer(),bufferIndex:gl.createBuffer(),};gl.uniform1iv(this._firstPass.uImages,[...Array(numTextures).keys()]);const outputQuads=new Float32Array(numTextures*12);for(let i=0;i<numTextures;++i){outputQuads.set(Float32Array.from(this._unitQuad),i*12);}
+gl.bindBuffer(gl.ARRAY_BUFFER,this._firstPass.bufferOutputPosition);gl.bufferData(gl.ARRAY_BUFFER,outputQuads,gl.STATIC_DRAW);gl.enableVertexAttribArray(this._firstPass.aOutputPosition);gl.bindBuffer(gl.ARRAY_BUFFER,this._firstPass.bufferTexturePosition);gl.enableVertexAttribArray(this._firstPass.aTexturePosition);gl.bindBuffer(gl.ARRAY_BUFFER,this._firstPass.bufferIndex);const indices=[...Array(this._glNumTextures).keys()].map(i=>Array(6).fill(i)).flat();gl.bufferData(gl.ARRAY_BUFFER,new Float32Array(indices),gl.STATIC_DRAW);gl.enableVertexAttribArray(this._firstPass.aIndex);}
+_makeSecondPassShaderProgram(){const vertexShaderProgram=`
+            attribute vec2 a_output_position;
+            attribute vec2 a_texture_position;
+
+            varying vec2 v_texture_position;
+
+            void main() {
+                // Transform to clip space (0:1 --> -1:1)
+                gl_Position = vec4(vec3(a_output_position * 2.0 - 1.0, 1), 1);
+
+                v_texture_position = a_texture_position;
+            }
+            `;const fragmentShaderProgram=`
+            precision mediump float;
+
+            // our texture
+            uniform sampler2D u_image;
+
+            // the texCoords passed in from the vertex shader.
+            varying vec2 v_texture_position;
+
+            // the opacity multiplier for the image
+            uniform float u_opacity_multiplier;
+
+            void main() {
+                gl_FragColor = texture2D(u_image, v_texture_position);
+                gl_FragColor *= u_opacity_multiplier;
+            }
+            `;const gl=this._gl;const program=this._initShaderProgram(gl,vertexShaderProgram,fragmentShaderProgram);gl.useProgram(program);this._secondPass={shaderProgram:program,aOutputPosition:gl.getAttribLocation(program,'a_output_position'),aTexturePosition:gl.getAttribLocation(program,'a_texture_position'),uImage:gl.getUniformLocation(program,'u_image'),uOpacityMultiplier:gl.getUniformLocation(program,'u_opacity_multiplier'),bufferOutputPosition:gl.createBuffer(),bufferTexturePosition:gl.createBuffer(),};gl.bindBuffer(gl.ARRAY_BUFFER,this._secondPass.bufferOutputPosition);gl.bufferData(gl.ARRAY_BUFFER,this._unitQuad,gl.STATIC_DRAW);gl.enableVertexAttribArray(this._secondPass.aOutputPosition);gl.bindBuffer(gl.ARRAY_BUFFER,this._secondPass.bufferTexturePosition);gl.bufferData(gl.ARRAY_BUFFER,this._unitQuad,gl.DYNAMIC_DRAW);gl.enableVertexAttribArray(this._secondPass.aTexturePosition);}
+destroy(){if(this._destroyed){return;}
+this._destroyed=true;const gl=this._gl;if(gl){try{const numTextureUnits=gl.getParameter(gl.MAX_TEXTURE_IMAGE_UNITS);if(numTextureUnits&&numTextureUnits>0){for(let unit=0;unit<numTextureUnits;++unit){gl.activeTexture(gl.TEXTURE0+unit);gl.bindTexture(gl.TEXTURE_2D,null);gl.bindTexture(gl.TEXTURE_CUBE_MAP,null);}}
+gl.bindBuffer(gl.ARRAY_BUFFER,null);gl.bindBuffer(gl.ELEMENT_ARRAY_BUFFER,null);gl.bindRenderbuffer(gl.RENDERBUFFER,null);gl.bindFramebuffer(gl.FRAMEBUFFER,null);if(this._secondPass&&this._secondPass.bufferOutputPosition){gl.deleteBuffer(this._secondPass.bufferOutputPosition);}
+if(this._glFrameBuffer){gl.deleteFramebuffer(this._glFrameBuffer);}}catch(e){$.console.warn('Error during WebGL cleanup in WebglContextManager.destroy():',e);}
+const ext=gl.getExtension('WEBGL_lose_context');if(ext){ext.loseContext();}}
+this._gl=null;this._firstPass=null;this._secondPass=null;this._glFrameBuffer=null;this._renderToTexture=null;this._unitQuad=null;}
+isDestroyed(){return this._destroyed;}}
+OpenSeadragon.WebGLDrawer=class WebGLDrawer extends OpenSeadragon.DrawerBase{constructor(options){super(options);this._destroyed=false;this._glContext=null;this._enableContextRecovery=true;this._outputCanvas=null;this._outputContext=null;this._clippingCanvas=null;this._clippingContext=null;this._renderingCanvas=null;this._backupCanvasDrawer=null;this._canvasFallbackAllowed=this.viewer.drawerCandidates&&this.viewer.drawerCandidates.includes('canvas');this._imageSmoothingEnabled=true;this._unpackWithPremultipliedAlpha=!!this.options.unpackWithPremultipliedAlpha;this.viewer.rejectEventHandler("tile-drawn","The WebGLDrawer does not raise the tile-drawn event");this.viewer.rejectEventHandler("tile-drawing","The WebGLDrawer does not raise the tile-drawing event");this._setupCanvases();this._setupRenderer();this._supportedFormats=["context2d","image"];this.context=this._outputContext;}
+get defaultOptions(){return{usePrivateCache:true,preloadCache:false,unpackWithPremultipliedAlpha:false,};}
+getSupportedDataFormats(){return this._supportedFormats;}
+destroy(){if(this._destroyed){return;}
+super.destroy();if(this._resizeHandler){this.viewer.removeHandler("resize",this._resizeHandler);this._resizeHandler=null;}
+if(this._glContext){this._glContext.destroy();this._glContext=null;}
+if(this._renderingCanvas){this._renderingCanvas.width=this._renderingCanvas.height=1;}
+if(this._clippingCanvas){this._clippingCanvas.width=this._clippingCanvas.height=1;}
+if(this._outputCanvas){this._outputCanvas.width=this._outputCanvas.height=1;}
+this._renderingCanvas=null;this._clippingCanvas=this._clippingContext=null;this._outputCanvas=this._outputContext=null;if(this._backupCanvasDrawer){this._backupCanvasDrawer.destroy();this._backupCanvasDrawer=null;}
+this.container.removeChild(this.canvas);if(this.viewer.drawer===this){this.viewer.drawer=null;}
+this.destroyInternalCache();this._destroyed=true;}
+canRotate(){return true;}
+static isSupported(){let contextManager=null;let testTexture=null;let gl=null;try{const size=4;const canvas=document.createElement('canvas');canvas.width=size;canvas.height=size;if(!$.isFunction(canvas.getContext)){return false;}
+gl=canvas.getContext('webgl2')||canvas.getContext('webgl');if(!gl){return false;}
+contextManager=new WebglContextManager({renderingCanvas:canvas,unpackWithPremultipliedAlpha:false,imageSmoothingEnabled:true,initShaderProgram:WebGLDrawer.initShaderProgram});if(!contextManager.getContext()){return false;}
+contextManager.setupRenderer(size,size);const firstPass=contextManager.getFirstPass();const glFrameBuffer=contextManager.getFrameBuffer();if(!firstPass||!glFrameBuffer){return false;}
+const maxTextures=contextManager.getMaxTextures();if(!maxTextures||maxTextures<=0){return false;}
+const imageData=new ImageData(size,size);imageData.data[0]=255;imageData.data[1]=0;imageData.data[2]=0;imageData.data[3]=255;testTexture=contextManager.createTexture(imageData);if(!testTexture){return false;}
+const unitQuad=contextManager.makeQuadVertexBuffer(0,1,0,1);gl.viewport(0,0,size,size);gl.bindFramebuffer(gl.FRAMEBUFFER,glFrameBuffer);gl.clearColor(0,0,0,0);gl.clear(gl.COLOR_BUFFER_BIT);gl.useProgram(firstPass.shaderProgram);gl.activeTexture(gl.TEXTURE0);gl.bindTexture(gl.TEXTURE_2D,testTexture);gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferTexturePosition);gl.bufferData(gl.ARRAY_BUFFER,unitQuad,gl.DYNAMIC_DRAW);const ndcMatrix=new Float32Array([2,0,0,0,2,0,-1,-1,1]);gl.uniformMatrix3fv(firstPass.uTransformMatrices[0],false,ndcMatrix);gl.uniform1fv(firstPass.uOpacities,new Float32Array([1]));gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferOutputPosition);gl.vertexAttribPointer(firstPass.aOutputPosition,2,gl.FLOAT,false,0,0);gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferTexturePosition);gl.vertexAttribPointer(firstPass.aTexturePosition,2,gl.FLOAT,false,0,0);gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferIndex);gl.vertexAttribPointer(firstPass.aIndex,1,gl.FLOAT,false,0,0);gl.drawArrays(gl.TRIANGLES,0,6);const pixels=new Uint8Array(size*size*4);gl.readPixels(0,0,size,size,gl.RGBA,gl.UNSIGNED_BYTE,pixels);const hasNonZero=pixels.some(v=>v!==0);if(!hasNonZero){$.console.warn('[WebGLDrawer.isSupported] Functional test failed: no non-zero pixels read back.');return false;}
+return true;}catch(e){$.console.warn('[WebGLDrawer.isSupported] Functional test failed:',e&&e.message?e.message:e);return false;}finally{try{if(testTexture&&contextManager){contextManager.deleteTexture(testTexture);}
+if(contextManager){contextManager.destroy();}else if(gl){const ext=gl.getExtension('WEBGL_lose_context');if(ext){ext.loseContext();}}}catch(cleanupErr){}}}
+getType(){return'webgl';}
+isWebGL2(){return this._glContext?this._glContext.isWebGL2():false;}
+setContextRecoveryEnabled(enabled){this._enableContextRecovery=!!enabled;}
+isContextRecoveryEnabled(){return this._enableContextRecovery;}
+minimumOverlapRequired(tiledImage){return tiledImage.hasIssue('webgl');}
+_createDrawingElement(){const canvas=$.makeNeutralElement("canvas");const viewportSize=this._calculateCanvasSize();canvas.width=viewportSize.x;canvas.height=viewportSize.y;return canvas;}
+_getBackupCanvasDrawer(){if(!this._backupCanvasDrawer){this._backupCanvasDrawer=this.viewer.requestDrawer('canvas',{mainDrawer:false});this._backupCanvasDrawer.canvas.style.setProperty('visibility','hidden');this._backupCanvasDrawer.getSupportedDataFormats=()=>this._supportedFormats;this._backupCanvasDrawer.getDataToDraw=this.getDataToDraw.bind(this);}
+return this._backupCanvasDrawer;}
+_draw(tiledImages,isRetry=false){const gl=this._glContext?this._glContext.getContext():null;if(!gl){return;}
+const firstPass=this._glContext.getFirstPass();const secondPass=this._glContext.getSecondPass();const glFrameBuffer=this._glContext.getFrameBuffer();const renderToTexture=this._glContext.getRenderToTexture();const bounds=this.viewport.getBoundsNoRotateWithMargins(true);const view={bounds:bounds,center:new OpenSeadragon.Point(bounds.x+bounds.width/2,bounds.y+bounds.height/2),rotation:this.viewport.getRotation(true)*Math.PI/180};const flipMultiplier=this.viewport.flipped?-1:1;const posMatrix=$.Mat3.makeTranslation(-view.center.x,-view.center.y);const scaleMatrix=$.Mat3.makeScaling(2/view.bounds.width*flipMultiplier,-2/view.bounds.height);const rotMatrix=$.Mat3.makeRotation(-view.rotation);const viewMatrix=scaleMatrix.multiply(rotMatrix).multiply(posMatrix);gl.bindFramebuffer(gl.FRAMEBUFFER,null);gl.clear(gl.COLOR_BUFFER_BIT);this._outputContext.clearRect(0,0,this._outputCanvas.width,this._outputCanvas.height);let renderingBufferHasImageData=false;tiledImages.forEach((tiledImage,tiledImageIndex)=>{if(tiledImage.getIssue('webgl')){if(renderingBufferHasImageData){this._outputContext.drawImage(this._renderingCanvas,0,0);gl.bindFramebuffer(gl.FRAMEBUFFER,null);gl.clear(gl.COLOR_BUFFER_BIT);renderingBufferHasImageData=false;}
+if(this._canvasFallbackAllowed){const canvasDrawer=this._getBackupCanvasDrawer();canvasDrawer.draw([tiledImage]);this._outputContext.drawImage(canvasDrawer.canvas,0,0);}}else{const tilesToDraw=tiledImage.getTilesToDraw();if(tiledImage.placeholderFillStyle&&tiledImage._hasOpaqueTile===false){this._drawPlaceholder(tiledImage);}
+if(tilesToDraw.length===0||tiledImage.getOpacity()===0){return;}
+const firstTile=tilesToDraw[0];const useContext2dPipeline=(tiledImage.compositeOperation||this.viewer.compositeOperation||tiledImage._clip||tiledImage._croppingPolygons||tiledImage.debugMode);const useTwoPassRendering=useContext2dPipeline||(tiledImage.opacity<1)||firstTile.tile.hasTransparency;if(useContext2dPipeline){if(renderingBufferHasImageData){this._outputContext.drawImage(this._renderingCanvas,0,0);}
+gl.bindFramebuffer(gl.FRAMEBUFFER,null);gl.clear(gl.COLOR_BUFFER_BIT);}
+gl.useProgram(firstPass.shaderProgram);if(useTwoPassRendering){gl.bindFramebuffer(gl.FRAMEBUFFER,glFrameBuffer);gl.clear(gl.COLOR_BUFFER_BIT);}else{gl.bindFramebuffer(gl.FRAMEBUFFER,null);}
+let overallMatrix=viewMatrix;const imageRotation=tiledImage.getRotation(true);if(imageRotation%360!==0){const imageRotationMatrix=$.Mat3.makeRotation(-imageRotation*Math.PI/180);const imageCenter=tiledImage.getBoundsNoRotate(true).getCenter();const t1=$.Mat3.makeTranslation(imageCenter.x,imageCenter.y);const t2=$.Mat3.makeTranslation(-imageCenter.x,-imageCenter.y);const localMatrix=t1.multiply(imageRotationMatrix).multiply(t2);overallMatrix=viewMatrix.multiply(localMatrix);}
+const maxTextures=this._glContext.getMaxTextures();if(maxTextures<=0||maxTextures===null||maxTextures===undefined){throw new Error(`WebGL error: bad value for gl parameter MAX_TEXTURE_IMAGE_UNITS (${maxTextures}). This could happen
+                    if too many contexts have been created and not released, or there is another problem with the graphics card.`);}
+const texturePositionArray=new Float32Array(maxTextures*12);const textureDataArray=new Array(maxTextures);const matrixArray=new Array(maxTextures);const opacityArray=new Array(maxTextures);for(let tileIndex=0;tileIndex<tilesToDraw.length;tileIndex++){const tile=tilesToDraw[tileIndex].tile;const indexInDrawArray=tileIndex%maxTextures;const numTilesToDraw=indexInDrawArray+1;const textureInfo=this.getDataToDraw(tile);if(textureInfo&&textureInfo.texture){this._getTileData(tile,tiledImage,textureInfo,overallMatrix,indexInDrawArray,texturePositionArray,textureDataArray,matrixArray,opacityArray);}
+if((numTilesToDraw===maxTextures)||(tileIndex===tilesToDraw.length-1)){for(let i=0;i<numTilesToDraw;i++){gl.activeTexture(gl.TEXTURE0+i);gl.bindTexture(gl.TEXTURE_2D,textureDataArray[i]);}
+gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferTexturePosition);gl.bufferData(gl.ARRAY_BUFFER,texturePositionArray,gl.DYNAMIC_DRAW);matrixArray.forEach((matrix,index)=>{gl.uniformMatrix3fv(firstPass.uTransformMatrices[index],false,matrix);});gl.uniform1fv(firstPass.uOpacities,new Float32Array(opacityArray));gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferOutputPosition);gl.vertexAttribPointer(firstPass.aOutputPosition,2,gl.FLOAT,false,0,0);gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferTexturePosition);gl.vertexAttribPointer(firstPass.aTexturePosition,2,gl.FLOAT,false,0,0);gl.bindBuffer(gl.ARRAY_BUFFER,firstPass.bufferIndex);gl.vertexAttribPointer(firstPass.aIndex,1,gl.FLOAT,false,0,0);gl.drawArrays(gl.TRIANGLES,0,6*numTilesToDraw);}}
+if(useTwoPassRendering){gl.useProgram(secondPass.shaderProgram);gl.bindFramebuffer(gl.FRAMEBUFFER,null);gl.activeTexture(gl.TEXTURE0);gl.bindTexture(gl.TEXTURE_2D,renderToTexture);gl.uniform1f(secondPass.uOpacityMultiplier,tiledImage.opacity);gl.bindBuffer(gl.ARRAY_BUFFER,secondPass.bufferTexturePosition);gl.vertexAttribPointer(secondPass.aTexturePosition,2,gl.FLOAT,false,0,0);gl.bindBuffer(gl.ARRAY_BUFFER,secondPass.bufferOutputPosition);gl.vertexAttribPointer(secondPass.aOutputPosition,2,gl.FLOAT,false,0,0);gl.drawArrays(gl.TRIANGLES,0,6);}
+renderingBufferHasImageData=true;if(useContext2dPipeline){this._applyContext2dPipeline(tiledImage,tilesToDraw,tiledImageIndex);renderingBufferHasImageData=false;gl.bindFramebuffer(gl.FRAMEBUFFER,null);gl.clear(gl.COLOR_BUFFER_BIT);}
+if(tiledImageIndex===0){this._raiseTiledImageDrawnEvent(tiledImage,tilesToDraw.map(info=>info.tile));}}});if(renderingBufferHasImageData){this._outputContext.drawImage(this._renderingCanvas,0,0);}}
+draw(tiledImages,isRetry=false){try{this._draw(tiledImages,isRetry);}catch(error){if(this._isWebGLContextError(error)){if(this._enableContextRecovery&&!isRetry){$.console.warn('WebGL context error detected during draw operation, attempting to recreate context...',error);const recreatedDrawer=this._recreateContext();if(recreatedDrawer){$.console.info('WebGL context recreated successfully, retrying draw operation');if(this.viewer){this.viewer.raiseEvent('webgl-context-recovered',{drawer:this,error:error});}
+this.draw(tiledImages,true);}else{this._fallbackToCanvasDrawer(error,tiledImages);}}else{if(this._enableContextRecovery){this._fallbackToCanvasDrawer(error,tiledImages);}else{throw error;}}}else{throw error;}}}
+setImageSmoothingEnabled(enabled){if(this._imageSmoothingEnabled!==enabled){this._imageSmoothingEnabled=enabled;if(this._glContext){this._glContext.setImageSmoothingEnabled(enabled);}
+this.setInternalCacheNeedsRefresh();this.viewer.forceRedraw();}}
+setUnpackWithPremultipliedAlpha(enabled){if(this._unpackWithPremultipliedAlpha!==enabled){this._unpackWithPremultipliedAlpha=enabled;if(this._glContext){this._glContext.setUnpackWithPremultipliedAlpha(enabled);}
+this.setInternalCacheNeedsRefresh();this.viewer.forceRedraw();}}
+drawDebuggingRect(rect){const context=this._outputContext;context.save();context.lineWidth=2*$.pixelDensityRatio;context.strokeStyle=this.debugGridColor[0];context.fillStyle=this.debugGridColor[0];context.strokeRect(rect.x*$.pixelDensityRatio,rect.y*$.pixelDensityRatio,rect.width*$.pixelDensityRatio,rect.height*$.pixelDensityRatio);context.restore();}
+_applyContext2dPipeline(tiledImage,tilesToDraw,tiledImageIndex){this._outputContext.save();this._outputContext.globalCompositeOperation=tiledImageIndex===0?null:tiledImage.compositeOperation||this.viewer.compositeOperation;if(tiledImage._croppingPolygons||tiledImage._clip){this._renderToClippingCanvas(tiledImage);this._outputContext.drawImage(this._clippingCanvas,0,0);}else{this._outputContext.drawImage(this._renderingCanvas,0,0);}
+this._outputContext.restore();if(tiledImage.debugMode){const flipped=this.viewer.viewport.getFlip();if(flipped){this._flip();}
+this._drawDebugInfo(tilesToDraw,tiledImage,flipped);if(flipped){this._flip();}}}
+_getTileData(tile,tiledImage,textureInfo,viewMatrix,index,texturePositionArray,textureDataArray,matrixArray,opacityArray){const texture=textureInfo.texture;const textureQuad=textureInfo.position;const overlapFraction=textureInfo.overlapFraction;texturePositionArray.set(textureQuad,index*12);const xOffset=tile.positionedBounds.width*overlapFraction.x;const yOffset=tile.positionedBounds.height*overlapFraction.y;const x=tile.positionedBounds.x+(tile.x===0?0:xOffset);const y=tile.positionedBounds.y+(tile.y===0?0:yOffset);const right=tile.positionedBounds.x+tile.positionedBounds.width-(tile.isRightMost?0:xOffset);const bottom=tile.positionedBounds.y+tile.positionedBounds.height-(tile.isBottomMost?0:yOffset);const model=new $.Mat3([right-x,0,0,0,bottom-y,0,x,y,1]);if(tile.flipped){model.scaleAndTranslateSelf(-1,1,1,0);}
+model.scaleAndTranslateOtherSetSelf(viewMatrix);opacityArray[index]=tile.opacity;textureDataArray[index]=texture;matrixArray[index]=model.values;}
+_setupRenderer(){if(!this._glContext||!this._glContext.getContext()){$.console.error('_setupCanvases must be called before _setupRenderer');return;}
+this._glContext.setupRenderer(this._renderingCanvas.width,this._renderingCanvas.height);}
+_resizeRenderer(){if(!this._glContext){return;}
+this._glContext.resizeRenderer(this._renderingCanvas.width,this._renderingCanvas.height);}
+_setupCanvases(){const _this=this;this._outputCanvas=this.canvas;this._outputContext=this._outputCanvas.getContext('2d');this._renderingCanvas=document.createElement('canvas');this._clippingCanvas=document.createElement('canvas');this._clippingContext=this._clippingCanvas.getContext('2d');this._renderingCanvas.width=this._clippingCanvas.width=this._outputCanvas.width;this._renderingCanvas.height=this._clippingCanvas.height=this._outputCanvas.height;this._glContext=new WebglContextManager({renderingCanvas:this._renderingCanvas,unpackWithPremultipliedAlpha:this._unpackWithPremultipliedAlpha,imageSmoothingEnabled:this._imageSmoothingEnabled,initShaderProgram:this.constructor.initShaderProgram});this._resizeHandler=function(){if(_this._outputCanvas!==_this.viewer.drawer.canvas){_this._outputCanvas.style.width=_this.viewer.drawer.canvas.clientWidth+'px';_this._outputCanvas.style.height=_this.viewer.drawer.canvas.clientHeight+'px';}
+const viewportSize=_this._calculateCanvasSize();if(_this._outputCanvas.width!==viewportSize.x||_this._outputCanvas.height!==viewportSize.y){_this._outputCanvas.width=viewportSize.x;_this._outputCanvas.height=viewportSize.y;}
+_this._renderingCanvas.style.width=_this._outputCanvas.clientWidth+'px';_this._renderingCanvas.style.height=_this._outputCanvas.clientHeight+'px';_this._renderingCanvas.width=_this._clippingCanvas.width=_this._outputCanvas.width;_this._renderingCanvas.height=_this._clippingCanvas.height=_this._outputCanvas.height;_this._resizeRenderer();};this.viewer.addHandler("resize",this._resizeHandler);}
+_isWebGLContextError(error){if(!error||!error.message){return false;}
+const message=error.message.toLowerCase();return message.includes('max_texture_image_units')||(message.includes('webgl')&&((message.includes('context')||message.includes('lost')||message.includes('invalid'))));}
+_recreateContext(){if(this._destroyed){return null;}
+try{const oldCanvas=this._renderingCanvas;const oldWidth=oldCanvas.width;const oldHeight=oldCanvas.height;const oldStyleWidth=oldCanvas.style.width;const oldStyleHeight=oldCanvas.style.height;this.destroyInternalCache();if(this._glContext){this._glContext.destroy();this._glContext=null;}
+this._renderingCanvas=document.createElement('canvas');this._renderingCanvas.width=oldWidth;this._renderingCanvas.height=oldHeight;if(oldStyleWidth){this._renderingCanvas.style.width=oldStyleWidth;}
+if(oldStyleHeight){this._renderingCanvas.style.height=oldStyleHeight;}
+this._glContext=new WebglContextManager({renderingCanvas:this._renderingCanvas,unpackWithPremultipliedAlpha:this._unpackWithPremultipliedAlpha,imageSmoothingEnabled:this._imageSmoothingEnabled,initShaderProgram:this.constructor.initShaderProgram});if(!this._glContext.getContext()){$.console.error('Failed to recreate WebGL context: no GL context');return null;}
+try{const maxTextures=this._glContext.getMaxTextures();if(!maxTextures||maxTextures<=0){$.console.error('Failed to recreate WebGL context: invalid MAX_TEXTURE_IMAGE_UNITS');return null;}}catch(e){$.console.error('Failed to verify new WebGL context:',e);return null;}
+this._setupRenderer();this.setInternalCacheNeedsRefresh();return this;}catch(e){$.console.error('Failed to recreate WebGL context:',e);return null;}}
+_fallbackToCanvasDrawer(error,tiledImages){const oldWebGLDrawer=this;if(!this._canvasFallbackAllowed){oldWebGLDrawer._raiseContextRecoveryFailedEvent(error,null);throw error;}
+const canvasDrawer=this.viewer.requestDrawer('canvas',{mainDrawer:true,redrawImmediately:false});if(canvasDrawer){$.console.error('Failed to recreate WebGL context, switching to canvas drawer');oldWebGLDrawer._raiseContextRecoveryFailedEvent(error,canvasDrawer);this.viewer.world.requestInvalidate(true);}else{$.console.error('Failed to create canvas drawer as fallback');oldWebGLDrawer._raiseContextRecoveryFailedEvent(error,null);throw error;}}
+_raiseContextRecoveryFailedEvent(error,canvasDrawer=null){if(!this.viewer){return;}
+this.viewer.raiseEvent('webgl-context-recovery-failed',{drawer:this,canvasDrawer:canvasDrawer,error:error});}
+internalCacheCreate(cache,tile){const tiledImage=tile.tiledImage;const gl=this._glContext?this._glContext.getContext():null;if(!gl){$.console.error('WebGL context not available in internalCacheCreate');return{};}
+let texture;let position;let data=cache.data;let isCanvas=false;if(data instanceof CanvasRenderingContext2D){data=data.canvas;isCanvas=true;}
+if(!tiledImage.getIssue('webgl')){if(isCanvas&&$.isCanvasTainted(data)){tiledImage.setIssue('webgl','WebGL cannot be used to draw this TiledImage because it has tainted data. Does crossOriginPolicy need to be set?');this._raiseDrawerErrorEvent(tiledImage,this._canvasFallbackAllowed?'Tainted data cannot be used by the WebGLDrawer. Falling back to CanvasDrawer for this TiledImage.':'Tainted data cannot be used by the WebGLDrawer, and canvas fallback is not enabled.');this.setInternalCacheNeedsRefresh();}else{let sourceWidthFraction,sourceHeightFraction;if(tile.sourceBounds){sourceWidthFraction=Math.min(tile.sourceBounds.width,data.width)/data.width;sourceHeightFraction=Math.min(tile.sourceBounds.height,data.height)/data.height;}else{sourceWidthFraction=1;sourceHeightFraction=1;}
+const overlap=tiledImage.source.tileOverlap;const overlapFraction=this._calculateOverlapFraction(tile,tiledImage);if(overlap>0){const left=(tile.x===0?0:overlapFraction.x)*sourceWidthFraction;const top=(tile.y===0?0:overlapFraction.y)*sourceHeightFraction;const right=(tile.isRightMost?1:1-overlapFraction.x)*sourceWidthFraction;const bottom=(tile.isBottomMost?1:1-overlapFraction.y)*sourceHeightFraction;position=this._glContext.makeQuadVertexBuffer(left,right,top,bottom);}else if(sourceWidthFraction===1&&sourceHeightFraction===1){position=this._glContext.getUnitQuad();}else{position=this._glContext.makeQuadVertexBuffer(0,sourceWidthFraction,0,sourceHeightFraction);}
+texture=this._glContext.createTexture(data,{unpackWithPremultipliedAlpha:this._unpackWithPremultipliedAlpha});if(!texture){tiledImage.setIssue('webgl','Error creating texture in WebGL.');const canvasAllowed=this._canvasFallbackAllowed;this._raiseDrawerErrorEvent(tiledImage,canvasAllowed?'Unknown error when creating texture. Falling back to CanvasDrawer for this TiledImage.':'Cannot use WebGL for this TiledImage; canvas fallback is not enabled.');this.setInternalCacheNeedsRefresh();}else{return{texture:texture,position:position,overlapFraction:overlapFraction,glContext:this._glContext};}}}
+if(data instanceof Image){const canvas=document.createElement('canvas');canvas.width=data.width;canvas.height=data.height;const context=canvas.getContext('2d',{willReadFrequently:true});context.drawImage(data,0,0);data=context;}
+if(data instanceof CanvasRenderingContext2D){return data;}
+$.console.error("Unsupported data used for WebGL Drawer - probably a bug!");return{};}
+internalCacheFree(data){if(data&&data.texture){const glContext=data.glContext||this._glContext;if(glContext&&!glContext.isDestroyed()){try{glContext.deleteTexture(data.texture);}catch(e){}}
+data.texture=null;data.glContext=null;}}
+_calculateOverlapFraction(tile,tiledImage){const overlap=tiledImage.source.tileOverlap;const nativeWidth=tile.sourceBounds.width;const nativeHeight=tile.sourceBounds.height;const overlapWidth=(tile.x===0?0:overlap)+(tile.isRightMost?0:overlap);const overlapHeight=(tile.y===0?0:overlap)+(tile.isBottomMost?0:overlap);const widthOverlapFraction=overlap/(nativeWidth+overlapWidth);const heightOverlapFraction=overlap/(nativeHeight+overlapHeight);return{x:widthOverlapFraction,y:heightOverlapFraction};}
+_setClip(){}
+_renderToClippingCanvas(item){this._clippingContext.clearRect(0,0,this._clippingCanvas.width,this._clippingCanvas.height);this._clippingContext.save();if(this.viewer.viewport.getFlip()){const point=new $.Point(this.canvas.width/2,this.canvas.height/2);this._clippingContext.translate(point.x,0);this._clippingContext.scale(-1,1);this._clippingContext.translate(-point.x,0);}
+if(item._clip){const polygon=[{x:item._clip.x,y:item._clip.y},{x:item._clip.x+item._clip.width,y:item._clip.y},{x:item._clip.x+item._clip.width,y:item._clip.y+item._clip.height},{x:item._clip.x,y:item._clip.y+item._clip.height},];const clipPoints=polygon.map(coord=>{const point=item.imageToViewportCoordinates(coord.x,coord.y,true).rotate(this.viewer.viewport.getRotation(true),this.viewer.viewport.getCenter(true));const clipPoint=this.viewportCoordToDrawerCoord(point);return clipPoint;});this._clippingContext.beginPath();clipPoints.forEach((coord,i)=>{this._clippingContext[i===0?'moveTo':'lineTo'](coord.x,coord.y);});this._clippingContext.clip();this._setClip();}
+if(item._croppingPolygons){const polygons=item._croppingPolygons.map(polygon=>{return polygon.map(coord=>{const point=item.imageToViewportCoordinates(coord.x,coord.y,true).rotate(this.viewer.viewport.getRotation(true),this.viewer.viewport.getCenter(true));const clipPoint=this.viewportCoordToDrawerCoord(point);return clipPoint;});});this._clippingContext.beginPath();polygons.forEach((polygon)=>{polygon.forEach((coord,i)=>{this._clippingContext[i===0?'moveTo':'lineTo'](coord.x,coord.y);});});this._clippingContext.clip();}
+if(this.viewer.viewport.getFlip()){const point=new $.Point(this.canvas.width/2,this.canvas.height/2);this._clippingContext.translate(point.x,0);this._clippingContext.scale(-1,1);this._clippingContext.translate(-point.x,0);}
+this._clippingContext.drawImage(this._renderingCanvas,0,0);this._clippingContext.restore();}
+_setRotations(tiledImage){let saveContext=false;if(this.viewport.getRotation(true)%360!==0){this._offsetForRotation({degrees:this.viewport.getRotation(true),saveContext:saveContext});saveContext=false;}
+if(tiledImage.getRotation(true)%360!==0){this._offsetForRotation({degrees:tiledImage.getRotation(true),point:this.viewport.pixelFromPointNoRotate(tiledImage._getRotationPoint(true),true),saveContext:saveContext});}}
+_offsetForRotation(options){const point=options.point?options.point.times($.pixelDensityRatio):this._getCanvasCenter();const context=this._outputContext;context.save();context.translate(point.x,point.y);context.rotate(Math.PI/180*options.degrees);context.translate(-point.x,-point.y);}
+_flip(options){options=options||{};const point=options.point?options.point.times($.pixelDensityRatio):this._getCanvasCenter();const context=this._outputContext;context.translate(point.x,0);context.scale(-1,1);context.translate(-point.x,0);}
+_drawDebugInfo(tilesToDraw,tiledImage,flipped){for(let i=tilesToDraw.length-1;i>=0;i--){const tile=tilesToDraw[i].tile;try{this._drawDebugInfoOnTile(tile,tilesToDraw.length,i,tiledImage,flipped);}catch(e){$.console.error(e);}}}
+_drawDebugInfoOnTile(tile,count,i,tiledImage,flipped){const colorIndex=this.viewer.world.getIndexOfItem(tiledImage)%this.debugGridColor.length;const context=this.context;context.save();context.lineWidth=2*$.pixelDensityRatio;context.font='small-caps bold '+(13*$.pixelDensityRatio)+'px arial';context.strokeStyle=this.debugGridColor[colorIndex];context.fillStyle=this.debugGridColor[colorIndex];this._setRotations(tiledImage);if(flipped){this._flip({point:tile.position.plus(tile.size.divide(2))});}
+context.strokeRect(tile.position.x*$.pixelDensityRatio,tile.position.y*$.pixelDensityRatio,tile.size.x*$.pixelDensityRatio,tile.size.y*$.pixelDensityRatio);const tileCenterX=(tile.position.x+(tile.size.x/2))*$.pixelDensityRatio;const tileCenterY=(tile.position.y+(tile.size.y/2))*$.pixelDensityRatio;context.translate(tileCenterX,tileCenterY);const angleInDegrees=this.viewport.getRotation(true);context.rotate(Math.PI/180*-angleInDegrees);context.translate(-tileCenterX,-tileCenterY);if(tile.x===0&&tile.y===0){context.fillText("Zoom: "+this.viewport.getZoom(),tile.position.x*$.pixelDensityRatio,(tile.position.y-30)*$.pixelDensityRatio);context.fillText("Pan: "+this.viewport.getBounds().toString(),tile.position.x*$.pixelDensityRatio,(tile.position.y-20)*$.pixelDensityRatio);}
+context.fillText("Level: "+tile.level,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+20)*$.pixelDensityRatio);context.fillText("Column: "+tile.x,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+30)*$.pixelDensityRatio);context.fillText("Row: "+tile.y,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+40)*$.pixelDensityRatio);context.fillText("Order: "+i+" of "+count,(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+50)*$.pixelDensityRatio);context.fillText("Size: "+tile.size.toString(),(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+60)*$.pixelDensityRatio);context.fillText("Position: "+tile.position.toString(),(tile.position.x+10)*$.pixelDensityRatio,(tile.position.y+70)*$.pixelDensityRatio);if(this.viewport.getRotation(true)%360!==0){this._restoreRotationChanges();}
+if(tiledImage.getRotation(true)%360!==0){this._restoreRotationChanges();}
+context.restore();}
+_drawPlaceholder(tiledImage){const bounds=tiledImage.getBounds(true);const rect=this.viewportToDrawerRectangle(tiledImage.getBounds(true));const context=this._outputContext;let fillStyle;if(typeof tiledImage.placeholderFillStyle==="function"){fillStyle=tiledImage.placeholderFillStyle(tiledImage,context);}
+else{fillStyle=tiledImage.placeholderFillStyle;}
+this._offsetForRotation({degrees:this.viewer.viewport.getRotation(true)});context.fillStyle=fillStyle;context.translate(rect.x,rect.y);context.rotate(Math.PI/180*bounds.degrees);context.translate(-rect.x,-rect.y);context.fillRect(rect.x,rect.y,rect.width,rect.height);this._restoreRotationChanges();}
+_getCanvasCenter(){return new $.Point(this.canvas.width/2,this.canvas.height/2);}
+_restoreRotationChanges(){const context=this._outputContext;context.restore();}
+static initShaderProgram(gl,vsSource,fsSource){function loadShader(gl,type,source){const shader=gl.createShader(type);gl.shaderSource(shader,source);gl.compileShader(shader);if(!gl.getShaderParameter(shader,gl.COMPILE_STATUS)){$.console.error(`An error occurred compiling the shaders: ${gl.getShaderInfoLog(shader)}`);gl.deleteShader(shader);return null;}
+return shader;}
+const vertexShader=loadShader(gl,gl.VERTEX_SHADER,vsSource);const fragmentShader=loadShader(gl,gl.FRAGMENT_SHADER,fsSource);const shaderProgram=gl.createProgram();gl.attachShader(shaderProgram,vertexShader);gl.attachShader(shaderProgram,fragmentShader);gl.linkProgram(shaderProgram);if(!gl.getProgramParameter(shaderProgram,gl.LINK_STATUS)){$.console.error(`Unable to initialize the shader program: ${gl.getProgramInfoLog(
+                shaderProgram
+                )}`);return null;}
+return shaderProgram;}};}(OpenSeadragon));(function($){$.Viewport=function(options){const args=arguments;if(args.length&&args[0]instanceof $.Point){options={containerSize:args[0],contentSize:args[1],config:args[2]};}
+if(options.config){$.extend(true,options,options.config);delete options.config;}
+this._margins=$.extend({left:0,top:0,right:0,bottom:0},options.margins||{});delete options.margins;options.initialDegrees=options.degrees;delete options.degrees;$.extend(true,this,{containerSize:null,contentSize:null,zoomPoint:null,rotationPivot:null,viewer:null,springStiffness:$.DEFAULT_SETTINGS.springStiffness,animationTime:$.DEFAULT_SETTINGS.animationTime,minZoomImageRatio:$.DEFAULT_SETTINGS.minZoomImageRatio,maxZoomPixelRatio:$.DEFAULT_SETTINGS.maxZoomPixelRatio,visibilityRatio:$.DEFAULT_SETTINGS.visibilityRatio,wrapHorizontal:$.DEFAULT_SETTINGS.wrapHorizontal,wrapVertical:$.DEFAULT_SETTINGS.wrapVertical,defaultZoomLevel:$.DEFAULT_SETTINGS.defaultZoomLevel,minZoomLevel:$.DEFAULT_SETTINGS.minZoomLevel,maxZoomLevel:$.DEFAULT_SETTINGS.maxZoomLevel,initialDegrees:$.DEFAULT_SETTINGS.degrees,flipped:$.DEFAULT_SETTINGS.flipped,homeFillsViewer:$.DEFAULT_SETTINGS.homeFillsViewer,silenceMultiImageWarnings:$.DEFAULT_SETTINGS.silenceMultiImageWarnings},options);this._updateContainerInnerSize();this.centerSpringX=new $.Spring({initial:0,springStiffness:this.springStiffness,animationTime:this.animationTime});this.centerSpringY=new $.Spring({initial:0,springStiffness:this.springStiffness,animationTime:this.animationTime});this.zoomSpring=new $.Spring({exponential:true,initial:1,springStiffness:this.springStiffness,animationTime:this.animationTime});this.degreesSpring=new $.Spring({initial:options.initialDegrees,springStiffness:this.springStiffness,animationTime:this.animationTime});this._oldCenterX=this.centerSpringX.current.value;this._oldCenterY=this.centerSpringY.current.value;this._oldZoom=this.zoomSpring.current.value;this._oldDegrees=this.degreesSpring.current.value;this._sizeChanged=false;this._setContentBounds(new $.Rect(0,0,1,1),1);this.goHome(true);this.update();};$.Viewport.prototype={get degrees(){$.console.warn('Accessing [Viewport.degrees] is deprecated. Use viewport.getRotation instead.');return this.getRotation();},set degrees(degrees){$.console.warn('Setting [Viewport.degrees] is deprecated. Use viewport.rotateTo, viewport.rotateBy, or viewport.setRotation instead.');this.rotateTo(degrees);},resetContentSize:function(contentSize){$.console.assert(contentSize,"[Viewport.resetContentSize] contentSize is required");$.console.assert(contentSize instanceof $.Point,"[Viewport.resetContentSize] contentSize must be an OpenSeadragon.Point");$.console.assert(contentSize.x>0,"[Viewport.resetContentSize] contentSize.x must be greater than 0");$.console.assert(contentSize.y>0,"[Viewport.resetContentSize] contentSize.y must be greater than 0");this._setContentBounds(new $.Rect(0,0,1,contentSize.y/contentSize.x),contentSize.x);return this;},setHomeBounds:function(bounds,contentFactor){$.console.error("[Viewport.setHomeBounds] this function is deprecated; The content bounds should not be set manually.");this._setContentBounds(bounds,contentFactor);},_setContentBounds:function(bounds,contentFactor){$.console.assert(bounds,"[Viewport._setContentBounds] bounds is required");$.console.assert(bounds instanceof $.Rect,"[Viewport._setContentBounds] bounds must be an OpenSeadragon.Rect");$.console.assert(bounds.width>0,"[Viewport._setContentBounds] bounds.width must be greater than 0");$.console.assert(bounds.height>0,"[Viewport._setContentBounds] bounds.height must be greater than 0");this._contentBoundsNoRotate=bounds.clone();this._contentSizeNoRotate=this._contentBoundsNoRotate.getSize().times(contentFactor);this._contentBounds=bounds.rotate(this.getRotation()).getBoundingBox();this._contentSize=this._contentBounds.getSize().times(contentFactor);this._contentAspectRatio=this._contentSize.x/this._contentSize.y;if(this.viewer){this.viewer.raiseEvent('reset-size',{contentSize:this._contentSizeNoRotate.clone(),contentFactor:contentFactor,homeBounds:this._contentBoundsNoRotate.clone(),contentBounds:this._contentBounds.clone()});}},getHomeZoom:function(){if(this.defaultZoomLevel){return this.defaultZoomLevel;}
+const aspectFactor=this._contentAspectRatio/this.getAspectRatio();let output;if(this.homeFillsViewer){output=aspectFactor>=1?aspectFactor:1;}else{output=aspectFactor>=1?1:aspectFactor;}
+return output/this._contentBounds.width;},getHomeBounds:function(){return this.getHomeBoundsNoRotate().rotate(-this.getRotation());},getHomeBoundsNoRotate:function(){const center=this._contentBounds.getCenter();const width=1.0/this.getHomeZoom();const height=width/this.getAspectRatio();return new $.Rect(center.x-(width/2.0),center.y-(height/2.0),width,height);},goHome:function(immediately){if(this.viewer){this.viewer.raiseEvent('home',{immediately:immediately});}
+return this.fitBounds(this.getHomeBounds(),immediately);},getMinZoom:function(){const homeZoom=this.getHomeZoom();const zoom=this.minZoomLevel?this.minZoomLevel:this.minZoomImageRatio*homeZoom;return zoom;},getMaxZoom:function(){let zoom=this.maxZoomLevel;if(!zoom){zoom=this._contentSize.x*this.maxZoomPixelRatio/this._containerInnerSize.x;zoom/=this._contentBounds.width;}
+return Math.max(zoom,this.getHomeZoom());},getAspectRatio:function(){return this._containerInnerSize.x/this._containerInnerSize.y;},getContainerSize:function(){return new $.Point(this.containerSize.x,this.containerSize.y);},getMargins:function(){return $.extend({},this._margins);},setMargins:function(margins){$.console.assert($.type(margins)==='object','[Viewport.setMargins] margins must be an object');this._margins=$.extend({left:0,top:0,right:0,bottom:0},margins);this._updateContainerInnerSize();if(this.viewer){this.viewer.forceRedraw();}},getBounds:function(current){return this.getBoundsNoRotate(current).rotate(-this.getRotation(current));},getBoundsNoRotate:function(current){const center=this.getCenter(current);const width=1.0/this.getZoom(current);const height=width/this.getAspectRatio();return new $.Rect(center.x-(width/2.0),center.y-(height/2.0),width,height);},getBoundsWithMargins:function(current){return this.getBoundsNoRotateWithMargins(current).rotate(-this.getRotation(current),this.getCenter(current));},getBoundsNoRotateWithMargins:function(current){const bounds=this.getBoundsNoRotate(current);const factor=this._containerInnerSize.x*this.getZoom(current);bounds.x-=this._margins.left/factor;bounds.y-=this._margins.top/factor;bounds.width+=(this._margins.left+this._margins.right)/factor;bounds.height+=(this._margins.top+this._margins.bottom)/factor;return bounds;},getCenter:function(current){const centerCurrent=new $.Point(this.centerSpringX.current.value,this.centerSpringY.current.value);const centerTarget=new $.Point(this.centerSpringX.target.value,this.centerSpringY.target.value);if(current){return centerCurrent;}else if(!this.zoomPoint){return centerTarget;}
+const oldZoomPixel=this.pixelFromPoint(this.zoomPoint,true);const zoom=this.getZoom();const width=1.0/zoom;const height=width/this.getAspectRatio();const bounds=new $.Rect(centerCurrent.x-width/2.0,centerCurrent.y-height/2.0,width,height);const newZoomPixel=this._pixelFromPoint(this.zoomPoint,bounds);const deltaZoomPixels=newZoomPixel.minus(oldZoomPixel).rotate(-this.getRotation(true));const deltaZoomPoints=deltaZoomPixels.divide(this._containerInnerSize.x*zoom);return centerTarget.plus(deltaZoomPoints);},getZoom:function(current){if(current){return this.zoomSpring.current.value;}else{return this.zoomSpring.target.value;}},_applyZoomConstraints:function(zoom){return Math.max(Math.min(zoom,this.getMaxZoom()),this.getMinZoom());},_applyBoundaryConstraints:function(bounds){const newBounds=this.viewportToViewerElementRectangle(bounds).getBoundingBox();const cb=this.viewportToViewerElementRectangle(this._contentBoundsNoRotate).getBoundingBox();let xConstrained=false;let yConstrained=false;if(this.wrapHorizontal){}else{const boundsRight=newBounds.x+newBounds.width;const contentRight=cb.x+cb.width;let horizontalThreshold,leftDx,rightDx;if(newBounds.width>cb.width){horizontalThreshold=this.visibilityRatio*cb.width;}else{horizontalThreshold=this.visibilityRatio*newBounds.width;}
+leftDx=cb.x-boundsRight+horizontalThreshold;rightDx=contentRight-newBounds.x-horizontalThreshold;if(horizontalThreshold>cb.width){newBounds.x+=(leftDx+rightDx)/2;xConstrained=true;}else if(rightDx<0){newBounds.x+=rightDx;xConstrained=true;}else if(leftDx>0){newBounds.x+=leftDx;xConstrained=true;}}
+if(this.wrapVertical){}else{const boundsBottom=newBounds.y+newBounds.height;const contentBottom=cb.y+cb.height;let verticalThreshold,topDy,bottomDy;if(newBounds.height>cb.height){verticalThreshold=this.visibilityRatio*cb.height;}else{verticalThreshold=this.visibilityRatio*newBounds.height;}
+topDy=cb.y-boundsBottom+verticalThreshold;bottomDy=contentBottom-newBounds.y-verticalThreshold;if(verticalThreshold>cb.height){newBounds.y+=(topDy+bottomDy)/2;yConstrained=true;}else if(bottomDy<0){newBounds.y+=bottomDy;yConstrained=true;}else if(topDy>0){newBounds.y+=topDy;yConstrained=true;}}
+const constraintApplied=xConstrained||yConstrained;const newViewportBounds=constraintApplied?this.viewerElementToViewportRectangle(newBounds):bounds.clone();newViewportBounds.xConstrained=xConstrained;newViewportBounds.yConstrained=yConstrained;newViewportBounds.constraintApplied=constraintApplied;return newViewportBounds;},_raiseConstraintsEvent:function(immediately){if(this.viewer){this.viewer.raiseEvent('constrain',{immediately:immediately});}},applyConstraints:function(immediately){const actualZoom=this.getZoom();const constrainedZoom=this._applyZoomConstraints(actualZoom);if(actualZoom!==constrainedZoom){this.zoomTo(constrainedZoom,this.zoomPoint,immediately);}
+const constrainedBounds=this.getConstrainedBounds(false);if(constrainedBounds.constraintApplied){this.fitBounds(constrainedBounds,immediately);this._raiseConstraintsEvent(immediately);}
+return this;},ensureVisible:function(immediately){return this.applyConstraints(immediately);},_fitBounds:function(bounds,options){options=options||{};const immediately=options.immediately||false;const constraints=options.constraints||false;const aspect=this.getAspectRatio();const center=bounds.getCenter();const newBounds=new $.Rect(bounds.x,bounds.y,bounds.width,bounds.height,bounds.degrees+this.getRotation()).getBoundingBox();if(newBounds.getAspectRatio()>=aspect){newBounds.height=newBounds.width/aspect;}else{newBounds.width=newBounds.height*aspect;}
+newBounds.x=center.x-newBounds.width/2;newBounds.y=center.y-newBounds.height/2;let newZoom=1.0/newBounds.width;if(immediately){this.panTo(center,true);this.zoomTo(newZoom,null,true);if(constraints){this.applyConstraints(true);}
+return this;}
+const currentCenter=this.getCenter(true);const currentZoom=this.getZoom(true);this.panTo(currentCenter,true);this.zoomTo(currentZoom,null,true);const oldBounds=this.getBounds();const oldZoom=this.getZoom();if(oldZoom===0||Math.abs(newZoom/oldZoom-1)<0.00000001){this.zoomTo(newZoom,null,true);this.panTo(center,immediately);if(constraints){this.applyConstraints(false);}
+return this;}
+if(constraints){this.panTo(center,false);newZoom=this._applyZoomConstraints(newZoom);this.zoomTo(newZoom,null,false);const constrainedBounds=this.getConstrainedBounds();this.panTo(currentCenter,true);this.zoomTo(currentZoom,null,true);this.fitBounds(constrainedBounds);}else{const rotatedNewBounds=newBounds.rotate(-this.getRotation());const referencePoint=rotatedNewBounds.getTopLeft().times(newZoom).minus(oldBounds.getTopLeft().times(oldZoom)).divide(newZoom-oldZoom);this.zoomTo(newZoom,referencePoint,immediately);}
+return this;},fitBounds:function(bounds,immediately){return this._fitBounds(bounds,{immediately:immediately,constraints:false});},fitBoundsWithConstraints:function(bounds,immediately){return this._fitBounds(bounds,{immediately:immediately,constraints:true});},fitVertically:function(immediately){const box=new $.Rect(this._contentBounds.x+(this._contentBounds.width/2),this._contentBounds.y,0,this._contentBounds.height);return this.fitBounds(box,immediately);},fitHorizontally:function(immediately){const box=new $.Rect(this._contentBounds.x,this._contentBounds.y+(this._contentBounds.height/2),this._contentBounds.width,0);return this.fitBounds(box,immediately);},getConstrainedBounds:function(current){const bounds=this.getBounds(current);const constrainedBounds=this._applyBoundaryConstraints(bounds);return constrainedBounds;},panBy:function(delta,immediately){const center=new $.Point();if(immediately){center.x=this.centerSpringX.current.value;center.y=this.centerSpringY.current.value;}else{center.x=this.centerSpringX.target.value;center.y=this.centerSpringY.target.value;}
+return this.panTo(center.plus(delta),immediately);},panTo:function(center,immediately){if(immediately){this.centerSpringX.resetTo(center.x);this.centerSpringY.resetTo(center.y);}else{this.centerSpringX.springTo(center.x);this.centerSpringY.springTo(center.y);}
+if(this.viewer){this.viewer.raiseEvent('pan',{center:center,immediately:immediately});}
+return this;},zoomBy:function(factor,refPoint,immediately){return this.zoomTo(this.zoomSpring.target.value*factor,refPoint,immediately);},zoomTo:function(zoom,refPoint,immediately){const _this=this;this.zoomPoint=refPoint instanceof $.Point&&!isNaN(refPoint.x)&&!isNaN(refPoint.y)?refPoint:null;if(immediately){this._adjustCenterSpringsForZoomPoint(function(){_this.zoomSpring.resetTo(zoom);});}else{this.zoomSpring.springTo(zoom);}
+if(this.viewer){this.viewer.raiseEvent('zoom',{zoom:zoom,refPoint:refPoint,immediately:immediately});}
+return this;},setRotation:function(degrees,immediately){return this.rotateTo(degrees,null,immediately);},getRotation:function(current){return current?this.degreesSpring.current.value:this.degreesSpring.target.value;},setRotationWithPivot:function(degrees,pivot,immediately){return this.rotateTo(degrees,pivot,immediately);},rotateTo:function(degrees,pivot,immediately){if(!this.viewer||!this.viewer.drawer.canRotate()){return this;}
+if(this.degreesSpring.target.value===degrees&&this.degreesSpring.isAtTargetValue()){return this;}
+this.rotationPivot=pivot instanceof $.Point&&!isNaN(pivot.x)&&!isNaN(pivot.y)?pivot:null;if(immediately){if(this.rotationPivot){const changeInDegrees=degrees-this._oldDegrees;if(!changeInDegrees){this.rotationPivot=null;return this;}
+this._rotateAboutPivot(degrees);}else{this.degreesSpring.resetTo(degrees);}}else{const normalizedFrom=$.positiveModulo(this.degreesSpring.current.value,360);let normalizedTo=$.positiveModulo(degrees,360);const diff=normalizedTo-normalizedFrom;if(diff>180){normalizedTo-=360;}else if(diff<-180){normalizedTo+=360;}
+const reverseDiff=normalizedFrom-normalizedTo;this.degreesSpring.resetTo(degrees+reverseDiff);this.degreesSpring.springTo(degrees);}
+this._setContentBounds(this.viewer.world.getHomeBounds(),this.viewer.world.getContentFactor());this.viewer.forceRedraw();this.viewer.raiseEvent('rotate',{degrees:degrees,immediately:!!immediately,pivot:this.rotationPivot||this.getCenter()});return this;},rotateBy:function(degrees,pivot,immediately){return this.rotateTo(this.degreesSpring.target.value+degrees,pivot,immediately);},resize:function(newContainerSize,maintain){const oldBounds=this.getBoundsNoRotate();const newBounds=oldBounds;let widthDeltaFactor;this._sizeChanged=!this.containerSize.equals(newContainerSize);this.containerSize.x=newContainerSize.x;this.containerSize.y=newContainerSize.y;this._updateContainerInnerSize();if(maintain){widthDeltaFactor=newContainerSize.x/this.containerSize.x;newBounds.width=oldBounds.width*widthDeltaFactor;newBounds.height=newBounds.width/this.getAspectRatio();}
+if(this.viewer){this.viewer.raiseEvent('resize',{newContainerSize:newContainerSize,maintain:maintain});}
+const output=this.fitBounds(newBounds,true);if(this.viewer){this.viewer.raiseEvent('after-resize',{newContainerSize:newContainerSize,maintain:maintain});}
+return output;},_updateContainerInnerSize:function(){this._containerInnerSize=new $.Point(Math.max(1,this.containerSize.x-(this._margins.left+this._margins.right)),Math.max(1,this.containerSize.y-(this._margins.top+this._margins.bottom)));},update:function(){const _this=this;this._adjustCenterSpringsForZoomPoint(function(){_this.zoomSpring.update();});if(this.degreesSpring.isAtTargetValue()){this.rotationPivot=null;}
+this.centerSpringX.update();this.centerSpringY.update();if(this.rotationPivot){this._rotateAboutPivot(true);}
+else{this.degreesSpring.update();}
+const changed=this.centerSpringX.current.value!==this._oldCenterX||this.centerSpringY.current.value!==this._oldCenterY||this.zoomSpring.current.value!==this._oldZoom||this.degreesSpring.current.value!==this._oldDegrees||this._sizeChanged;this._sizeChanged=false;this._oldCenterX=this.centerSpringX.current.value;this._oldCenterY=this.centerSpringY.current.value;this._oldZoom=this.zoomSpring.current.value;this._oldDegrees=this.degreesSpring.current.value;const isAnimating=changed||!this.zoomSpring.isAtTargetValue()||!this.centerSpringX.isAtTargetValue()||!this.centerSpringY.isAtTargetValue()||!this.degreesSpring.isAtTargetValue();return isAnimating;},_rotateAboutPivot:function(degreesOrUseSpring){const useSpring=degreesOrUseSpring===true;const delta=this.rotationPivot.minus(this.getCenter());this.centerSpringX.shiftBy(delta.x);this.centerSpringY.shiftBy(delta.y);if(useSpring){this.degreesSpring.update();}else{this.degreesSpring.resetTo(degreesOrUseSpring);}
+const changeInDegrees=this.degreesSpring.current.value-this._oldDegrees;const rdelta=delta.rotate(changeInDegrees*-1).times(-1);this.centerSpringX.shiftBy(rdelta.x);this.centerSpringY.shiftBy(rdelta.y);},_adjustCenterSpringsForZoomPoint:function(zoomSpringHandler){if(this.zoomPoint){const oldZoomPixel=this.pixelFromPoint(this.zoomPoint,true);zoomSpringHandler();const newZoomPixel=this.pixelFromPoint(this.zoomPoint,true);const deltaZoomPixels=newZoomPixel.minus(oldZoomPixel);const deltaZoomPoints=this.deltaPointsFromPixels(deltaZoomPixels,true);this.centerSpringX.shiftBy(deltaZoomPoints.x);this.centerSpringY.shiftBy(deltaZoomPoints.y);if(this.zoomSpring.isAtTargetValue()){this.zoomPoint=null;}}else{zoomSpringHandler();}},deltaPixelsFromPointsNoRotate:function(deltaPoints,current){return deltaPoints.times(this._containerInnerSize.x*this.getZoom(current));},deltaPixelsFromPoints:function(deltaPoints,current){return this.deltaPixelsFromPointsNoRotate(deltaPoints.rotate(this.getRotation(current)),current);},deltaPointsFromPixelsNoRotate:function(deltaPixels,current){return deltaPixels.divide(this._containerInnerSize.x*this.getZoom(current));},deltaPointsFromPixels:function(deltaPixels,current){return this.deltaPointsFromPixelsNoRotate(deltaPixels,current).rotate(-this.getRotation(current));},pixelFromPointNoRotate:function(point,current){return this._pixelFromPointNoRotate(point,this.getBoundsNoRotate(current));},pixelFromPoint:function(point,current){return this._pixelFromPoint(point,this.getBoundsNoRotate(current));},_pixelFromPointNoRotate:function(point,bounds){return point.minus(bounds.getTopLeft()).times(this._containerInnerSize.x/bounds.width).plus(new $.Point(this._margins.left,this._margins.top));},_pixelFromPoint:function(point,bounds){return this._pixelFromPointNoRotate(point.rotate(this.getRotation(true),this.getCenter(true)),bounds);},pointFromPixelNoRotate:function(pixel,current){const bounds=this.getBoundsNoRotate(current);return pixel.minus(new $.Point(this._margins.left,this._margins.top)).divide(this._containerInnerSize.x/bounds.width).plus(bounds.getTopLeft());},pointFromPixel:function(pixel,current){return this.pointFromPixelNoRotate(pixel,current).rotate(-this.getRotation(current),this.getCenter(current));},_viewportToImageDelta:function(viewerX,viewerY){const scale=this._contentBoundsNoRotate.width;return new $.Point(viewerX*this._contentSizeNoRotate.x/scale,viewerY*this._contentSizeNoRotate.x/scale);},viewportToImageCoordinates:function(viewerX,viewerY){if(viewerX instanceof $.Point){return this.viewportToImageCoordinates(viewerX.x,viewerX.y);}
+if(this.viewer){const count=this.viewer.world.getItemCount();if(count>1){if(!this.silenceMultiImageWarnings){$.console.error('[Viewport.viewportToImageCoordinates] is not accurate '+'with multi-image; use TiledImage.viewportToImageCoordinates instead.');}}else if(count===1){const item=this.viewer.world.getItemAt(0);return item.viewportToImageCoordinates(viewerX,viewerY,true);}}
+return this._viewportToImageDelta(viewerX-this._contentBoundsNoRotate.x,viewerY-this._contentBoundsNoRotate.y);},_imageToViewportDelta:function(imageX,imageY){const scale=this._contentBoundsNoRotate.width;return new $.Point(imageX/this._contentSizeNoRotate.x*scale,imageY/this._contentSizeNoRotate.x*scale);},imageToViewportCoordinates:function(imageX,imageY){if(imageX instanceof $.Point){return this.imageToViewportCoordinates(imageX.x,imageX.y);}
+if(this.viewer){const count=this.viewer.world.getItemCount();if(count>1){if(!this.silenceMultiImageWarnings){$.console.error('[Viewport.imageToViewportCoordinates] is not accurate '+'with multi-image; use TiledImage.imageToViewportCoordinates instead.');}}else if(count===1){const item=this.viewer.world.getItemAt(0);return item.imageToViewportCoordinates(imageX,imageY,true);}}
+const point=this._imageToViewportDelta(imageX,imageY);point.x+=this._contentBoundsNoRotate.x;point.y+=this._contentBoundsNoRotate.y;return point;},imageToViewportRectangle:function(imageX,imageY,pixelWidth,pixelHeight){let rect=imageX;if(!(rect instanceof $.Rect)){rect=new $.Rect(imageX,imageY,pixelWidth,pixelHeight);}
+if(this.viewer){const count=this.viewer.world.getItemCount();if(count>1){if(!this.silenceMultiImageWarnings){$.console.error('[Viewport.imageToViewportRectangle] is not accurate '+'with multi-image; use TiledImage.imageToViewportRectangle instead.');}}else if(count===1){const item=this.viewer.world.getItemAt(0);return item.imageToViewportRectangle(imageX,imageY,pixelWidth,pixelHeight,true);}}
+const coordA=this.imageToViewportCoordinates(rect.x,rect.y);const coordB=this._imageToViewportDelta(rect.width,rect.height);return new $.Rect(coordA.x,coordA.y,coordB.x,coordB.y,rect.degrees);},viewportToImageRectangle:function(viewerX,viewerY,pointWidth,pointHeight){let rect=viewerX;if(!(rect instanceof $.Rect)){rect=new $.Rect(viewerX,viewerY,pointWidth,pointHeight);}
+if(this.viewer){const count=this.viewer.world.getItemCount();if(count>1){if(!this.silenceMultiImageWarnings){$.console.error('[Viewport.viewportToImageRectangle] is not accurate '+'with multi-image; use TiledImage.viewportToImageRectangle instead.');}}else if(count===1){const item=this.viewer.world.getItemAt(0);return item.viewportToImageRectangle(viewerX,viewerY,pointWidth,pointHeight,true);}}
+const coordA=this.viewportToImageCoordinates(rect.x,rect.y);const coordB=this._viewportToImageDelta(rect.width,rect.height);return new $.Rect(coordA.x,coordA.y,coordB.x,coordB.y,rect.degrees);},viewerElementToImageCoordinates:function(pixel){const point=this.pointFromPixel(pixel,true);return this.viewportToImageCoordinates(point);},imageToViewerElementCoordinates:function(pixel){const point=this.imageToViewportCoordinates(pixel);return this.pixelFromPoint(point,true);},windowToImageCoordinates:function(pixel){$.console.assert(this.viewer,"[Viewport.windowToImageCoordinates] the viewport must have a viewer.");const viewerCoordinates=pixel.minus($.getElementPosition(this.viewer.container));return this.viewerElementToImageCoordinates(viewerCoordinates);},imageToWindowCoordinates:function(pixel){$.console.assert(this.viewer,"[Viewport.imageToWindowCoordinates] the viewport must have a viewer.");const viewerCoordinates=this.imageToViewerElementCoordinates(pixel);return viewerCoordinates.plus($.getElementPosition(this.viewer.container));},viewerElementToViewportCoordinates:function(pixel){return this.pointFromPixel(pixel,true);},viewportToViewerElementCoordinates:function(point){return this.pixelFromPoint(point,true);},viewerElementToViewportRectangle:function(rectangle){return $.Rect.fromSummits(this.pointFromPixel(rectangle.getTopLeft(),true),this.pointFromPixel(rectangle.getTopRight(),true),this.pointFromPixel(rectangle.getBottomLeft(),true));},viewportToViewerElementRectangle:function(rectangle){return $.Rect.fromSummits(this.pixelFromPoint(rectangle.getTopLeft(),true),this.pixelFromPoint(rectangle.getTopRight(),true),this.pixelFromPoint(rectangle.getBottomLeft(),true));},windowToViewportCoordinates:function(pixel){$.console.assert(this.viewer,"[Viewport.windowToViewportCoordinates] the viewport must have a viewer.");const viewerCoordinates=pixel.minus($.getElementPosition(this.viewer.container));return this.viewerElementToViewportCoordinates(viewerCoordinates);},viewportToWindowCoordinates:function(point){$.console.assert(this.viewer,"[Viewport.viewportToWindowCoordinates] the viewport must have a viewer.");const viewerCoordinates=this.viewportToViewerElementCoordinates(point);return viewerCoordinates.plus($.getElementPosition(this.viewer.container));},viewportToImageZoom:function(viewportZoom){if(this.viewer){const count=this.viewer.world.getItemCount();if(count>1){if(!this.silenceMultiImageWarnings){$.console.error('[Viewport.viewportToImageZoom] is not '+'accurate with multi-image.');}}else if(count===1){const item=this.viewer.world.getItemAt(0);return item.viewportToImageZoom(viewportZoom);}}
+const imageWidth=this._contentSizeNoRotate.x;const containerWidth=this._containerInnerSize.x;const scale=this._contentBoundsNoRotate.width;const viewportToImageZoomRatio=(containerWidth/imageWidth)*scale;return viewportZoom*viewportToImageZoomRatio;},imageToViewportZoom:function(imageZoom){if(this.viewer){const count=this.viewer.world.getItemCount();if(count>1){if(!this.silenceMultiImageWarnings){$.console.error('[Viewport.imageToViewportZoom] is not accurate '+'with multi-image. Instead, use [TiledImage.imageToViewportZoom] for the specific image of interest');}}else if(count===1){const item=this.viewer.world.getItemAt(0);return item.imageToViewportZoom(imageZoom);}}
+const imageWidth=this._contentSizeNoRotate.x;const containerWidth=this._containerInnerSize.x;const scale=this._contentBoundsNoRotate.width;const viewportToImageZoomRatio=(imageWidth/containerWidth)/scale;return imageZoom*viewportToImageZoomRatio;},toggleFlip:function(){this.setFlip(!this.getFlip());return this;},getFlip:function(){return this.flipped;},setFlip:function(state){if(this.flipped===state){return this;}
+this.flipped=state;if(this.viewer.navigator){this.viewer.navigator.setFlip(this.getFlip());}
+this.viewer.forceRedraw();this.viewer.raiseEvent('flip',{flipped:state});return this;},getMaxZoomPixelRatio:function(){return this.maxZoomPixelRatio;},setMaxZoomPixelRatio:function(ratio,applyConstraints=true,immediately=false){$.console.assert(!isNaN(ratio),"[Viewport.setMaxZoomPixelRatio] ratio must be a number");if(isNaN(ratio)){return;}
+this.maxZoomPixelRatio=ratio;if(applyConstraints){if(this.getZoom()>this.getMaxZoom()){this.applyConstraints(immediately);}}},};}(OpenSeadragon));(function($){$.TiledImage=function(options){this._initialized=false;$.console.assert(options.tileCache,"[TiledImage] options.tileCache is required");$.console.assert(options.drawer,"[TiledImage] options.drawer is required");$.console.assert(options.viewer,"[TiledImage] options.viewer is required");$.console.assert(options.imageLoader,"[TiledImage] options.imageLoader is required");$.console.assert(options.source,"[TiledImage] options.source is required");$.console.assert(!options.clip||options.clip instanceof $.Rect,"[TiledImage] options.clip must be an OpenSeadragon.Rect if present");$.EventSource.call(this);this._optimalWorldIndex=undefined;this._tileCache=options.tileCache;delete options.tileCache;this._drawer=options.drawer;delete options.drawer;this._imageLoader=options.imageLoader;delete options.imageLoader;if(options.clip instanceof $.Rect){this._clip=options.clip.clone();}
+delete options.clip;const x=options.x||0;delete options.x;const y=options.y||0;delete options.y;this.normHeight=options.source.dimensions.y/options.source.dimensions.x;this.contentAspectX=options.source.dimensions.x/options.source.dimensions.y;let scale=1;if(options.width){scale=options.width;delete options.width;if(options.height){$.console.error("specifying both width and height to a tiledImage is not supported");delete options.height;}}else if(options.height){scale=options.height/this.normHeight;delete options.height;}
+const fitBounds=options.fitBounds;delete options.fitBounds;const fitBoundsPlacement=options.fitBoundsPlacement||OpenSeadragon.Placement.CENTER;delete options.fitBoundsPlacement;const degrees=options.degrees||0;delete options.degrees;const ajaxHeaders=options.ajaxHeaders;delete options.ajaxHeaders;this.crossOriginPolicy=options.crossOriginPolicy;delete options.crossOriginPolicy;$.extend(true,this,{viewer:null,tilesMatrix:{},coverage:{},loadingCoverage:{},lastResetTime:0,_needsDraw:true,_needsUpdate:true,_hasOpaqueTile:false,_tilesLoading:0,_zombieCache:false,_tilesToDraw:[],_lastDrawn:[],_arrayCacheMap:[],_isBlending:false,_wasBlending:false,_issues:{},springStiffness:$.DEFAULT_SETTINGS.springStiffness,animationTime:$.DEFAULT_SETTINGS.animationTime,minZoomImageRatio:$.DEFAULT_SETTINGS.minZoomImageRatio,wrapHorizontal:$.DEFAULT_SETTINGS.wrapHorizontal,wrapVertical:$.DEFAULT_SETTINGS.wrapVertical,immediateRender:$.DEFAULT_SETTINGS.immediateRender,loadDestinationTilesOnAnimation:$.DEFAULT_SETTINGS.loadDestinationTilesOnAnimation,blendTime:$.DEFAULT_SETTINGS.blendTime,alwaysBlend:$.DEFAULT_SETTINGS.alwaysBlend,minPixelRatio:$.DEFAULT_SETTINGS.minPixelRatio,smoothTileEdgesMinZoom:$.DEFAULT_SETTINGS.smoothTileEdgesMinZoom,iOSDevice:$.DEFAULT_SETTINGS.iOSDevice,debugMode:$.DEFAULT_SETTINGS.debugMode,ajaxWithCredentials:$.DEFAULT_SETTINGS.ajaxWithCredentials,placeholderFillStyle:$.DEFAULT_SETTINGS.placeholderFillStyle,opacity:$.DEFAULT_SETTINGS.opacity,preload:$.DEFAULT_SETTINGS.preload,compositeOperation:$.DEFAULT_SETTINGS.compositeOperation,subPixelRoundingForTransparency:$.DEFAULT_SETTINGS.subPixelRoundingForTransparency,maxTilesPerFrame:$.DEFAULT_SETTINGS.maxTilesPerFrame,originalDataType:undefined,_currentMaxTilesPerFrame:(options.maxTilesPerFrame||$.DEFAULT_SETTINGS.maxTilesPerFrame)*10},options);this._preload=this.preload;delete this.preload;this._fullyLoaded=false;this._xSpring=new $.Spring({initial:x,springStiffness:this.springStiffness,animationTime:this.animationTime});this._ySpring=new $.Spring({initial:y,springStiffness:this.springStiffness,animationTime:this.animationTime});this._scaleSpring=new $.Spring({initial:scale,springStiffness:this.springStiffness,animationTime:this.animationTime});this._degreesSpring=new $.Spring({initial:degrees,springStiffness:this.springStiffness,animationTime:this.animationTime});this._updateForScale();if(fitBounds){this.fitBounds(fitBounds,fitBoundsPlacement,true);}
+this._ownAjaxHeaders={};this.setAjaxHeaders(ajaxHeaders,false);this._initialized=true;};$.extend($.TiledImage.prototype,$.EventSource.prototype,{needsDraw:function(){return this._needsDraw;},redraw:function(){this._needsDraw=true;},getFullyLoaded:function(){return this._fullyLoaded;},whenFullyLoaded:function(callback){if(this.getFullyLoaded()){setTimeout(callback,1);}else{this.addOnceHandler('fully-loaded-change',function(){callback();});}},_setFullyLoaded:function(flag){if(flag===this._fullyLoaded){return;}
+this._fullyLoaded=flag;this.raiseEvent('fully-loaded-change',{fullyLoaded:this._fullyLoaded});},requestInvalidate:function(restoreTiles=true,viewportOnly=false,tStamp=$.now()){const tiles=viewportOnly?this._lastDrawn.map(x=>x.tile):this._tileCache.getLoadedTilesFor(this);return this.viewer.world.requestTileInvalidateEvent(tiles,tStamp,restoreTiles);},reset:function(){this._tileCache.clearTilesFor(this);this._currentMaxTilesPerFrame=this.maxTilesPerFrame*10;this.lastResetTime=$.now();this._needsDraw=true;this._fullyLoaded=false;},update:function(viewportChanged){const xUpdated=this._xSpring.update();const yUpdated=this._ySpring.update();const scaleUpdated=this._scaleSpring.update();const degreesUpdated=this._degreesSpring.update();const updated=(xUpdated||yUpdated||scaleUpdated||degreesUpdated||this._needsUpdate);if(updated||viewportChanged||!this._fullyLoaded){const fullyLoadedFlag=this._updateLevelsForViewport();this._setFullyLoaded(fullyLoadedFlag);}
+this._needsUpdate=false;if(updated){this._updateForScale();this._raiseBoundsChange();this._needsDraw=true;return true;}
+return false;},setDrawn:function(){this._needsDraw=this._isBlending||this._wasBlending||(this.opacity>0&&this._lastDrawn.length<1);return this._needsDraw;},get crossOriginPolicy(){return this._crossOriginPolicy;},set crossOriginPolicy(crossOriginPolicy){if(typeof crossOriginPolicy==='string'){this._crossOriginPolicy=crossOriginPolicy.toLowerCase();}else{this._crossOriginPolicy=$.DEFAULT_SETTINGS.crossOriginPolicy;}},setIssue(issueType,description=undefined,error=undefined){const errorText=error?(error.message||error):'';this._issues[issueType]=(description||`TiledImage is ${issueType}}`)+errorText;$.console.warn(this._issues[issueType],error);},getIssue(issueType){return this._issues[issueType];},hasIssue(issueType){return!!this.getIssue(issueType);},destroy:function(){this.reset();this.source.destroy(this.viewer);},getBounds:function(current){return this.getBoundsNoRotate(current).rotate(this.getRotation(current),this._getRotationPoint(current));},getBoundsNoRotate:function(current){return current?new $.Rect(this._xSpring.current.value,this._ySpring.current.value,this._worldWidthCurrent,this._worldHeightCurrent):new $.Rect(this._xSpring.target.value,this._ySpring.target.value,this._worldWidthTarget,this._worldHeightTarget);},getWorldBounds:function(){$.console.error('[TiledImage.getWorldBounds] is deprecated; use TiledImage.getBounds instead');return this.getBounds();},getClippedBounds:function(current){let bounds=this.getBoundsNoRotate(current);if(this._clip){const worldWidth=current?this._worldWidthCurrent:this._worldWidthTarget;const ratio=worldWidth/this.source.dimensions.x;const clip=this._clip.times(ratio);bounds=new $.Rect(bounds.x+clip.x,bounds.y+clip.y,clip.width,clip.height);}
+return bounds.rotate(this.getRotation(current),this._getRotationPoint(current));},getTileBounds:function(level,x,y){const numTiles=this.source.getNumTiles(level);const xMod=(numTiles.x+(x%numTiles.x))%numTiles.x;const yMod=(numTiles.y+(y%numTiles.y))%numTiles.y;const bounds=this.source.getTileBounds(level,xMod,yMod);if(this.getFlip()){bounds.x=Math.max(0,1-bounds.x-bounds.width);}
+bounds.x+=(x-xMod)/numTiles.x;bounds.y+=(this._worldHeightCurrent/this._worldWidthCurrent)*((y-yMod)/numTiles.y);return bounds;},getContentSize:function(){return new $.Point(this.source.dimensions.x,this.source.dimensions.y);},getSizeInWindowCoordinates:function(){const topLeft=this.imageToWindowCoordinates(new $.Point(0,0));const bottomRight=this.imageToWindowCoordinates(this.getContentSize());return new $.Point(bottomRight.x-topLeft.x,bottomRight.y-topLeft.y);},get lastDrawn(){return this._lastDrawn;},getDrawer:function(){return this.viewer.drawer;},_viewportToImageDelta:function(viewerX,viewerY,current){const scale=(current?this._scaleSpring.current.value:this._scaleSpring.target.value);return new $.Point(viewerX*(this.source.dimensions.x/scale),viewerY*((this.source.dimensions.y*this.contentAspectX)/scale));},viewportToImageCoordinates:function(viewerX,viewerY,current){let point;if(viewerX instanceof $.Point){current=viewerY;point=viewerX;}else{point=new $.Point(viewerX,viewerY);}
+point=point.rotate(-this.getRotation(current),this._getRotationPoint(current));return current?this._viewportToImageDelta(point.x-this._xSpring.current.value,point.y-this._ySpring.current.value):this._viewportToImageDelta(point.x-this._xSpring.target.value,point.y-this._ySpring.target.value);},_imageToViewportDelta:function(imageX,imageY,current){const scale=(current?this._scaleSpring.current.value:this._scaleSpring.target.value);return new $.Point((imageX/this.source.dimensions.x)*scale,(imageY/this.source.dimensions.y/this.contentAspectX)*scale);},imageToViewportCoordinates:function(imageX,imageY,current){if(imageX instanceof $.Point){current=imageY;imageY=imageX.y;imageX=imageX.x;}
+const point=this._imageToViewportDelta(imageX,imageY,current);if(current){point.x+=this._xSpring.current.value;point.y+=this._ySpring.current.value;}else{point.x+=this._xSpring.target.value;point.y+=this._ySpring.target.value;}
+return point.rotate(this.getRotation(current),this._getRotationPoint(current));},imageToViewportRectangle:function(imageX,imageY,pixelWidth,pixelHeight,current){let rect=imageX;if(rect instanceof $.Rect){current=imageY;}else{rect=new $.Rect(imageX,imageY,pixelWidth,pixelHeight);}
+const coordA=this.imageToViewportCoordinates(rect.getTopLeft(),current);const coordB=this._imageToViewportDelta(rect.width,rect.height,current);return new $.Rect(coordA.x,coordA.y,coordB.x,coordB.y,rect.degrees+this.getRotation(current));},viewportToImageRectangle:function(viewerX,viewerY,pointWidth,pointHeight,current){let rect=viewerX;if(viewerX instanceof $.Rect){current=viewerY;}else{rect=new $.Rect(viewerX,viewerY,pointWidth,pointHeight);}
+const coordA=this.viewportToImageCoordinates(rect.getTopLeft(),current);const coordB=this._viewportToImageDelta(rect.width,rect.height,current);return new $.Rect(coordA.x,coordA.y,coordB.x,coordB.y,rect.degrees-this.getRotation(current));},viewerElementToImageCoordinates:function(pixel){const point=this.viewport.pointFromPixel(pixel,true);return this.viewportToImageCoordinates(point);},imageToViewerElementCoordinates:function(pixel){const point=this.imageToViewportCoordinates(pixel);return this.viewport.pixelFromPoint(point,true);},windowToImageCoordinates:function(pixel){const viewerCoordinates=pixel.minus(OpenSeadragon.getElementPosition(this.viewer.element));return this.viewerElementToImageCoordinates(viewerCoordinates);},imageToWindowCoordinates:function(pixel){const viewerCoordinates=this.imageToViewerElementCoordinates(pixel);return viewerCoordinates.plus(OpenSeadragon.getElementPosition(this.viewer.element));},_viewportToTiledImageRectangle:function(rect){const scale=this._scaleSpring.current.value;rect=rect.rotate(-this.getRotation(true),this._getRotationPoint(true));return new $.Rect((rect.x-this._xSpring.current.value)/scale,(rect.y-this._ySpring.current.value)/scale,rect.width/scale,rect.height/scale,rect.degrees);},viewportToImageZoom:function(viewportZoom){const ratio=this._scaleSpring.current.value*this.viewport._containerInnerSize.x/this.source.dimensions.x;return ratio*viewportZoom;},imageToViewportZoom:function(imageZoom){const ratio=this._scaleSpring.current.value*this.viewport._containerInnerSize.x/this.source.dimensions.x;return imageZoom/ratio;},setPosition:function(position,immediately){const sameTarget=(this._xSpring.target.value===position.x&&this._ySpring.target.value===position.y);if(immediately){if(sameTarget&&this._xSpring.current.value===position.x&&this._ySpring.current.value===position.y){return;}
+this._xSpring.resetTo(position.x);this._ySpring.resetTo(position.y);this._needsDraw=true;this._needsUpdate=true;}else{if(sameTarget){return;}
+this._xSpring.springTo(position.x);this._ySpring.springTo(position.y);this._needsDraw=true;this._needsUpdate=true;}
+if(!sameTarget){this._raiseBoundsChange();}},setWidth:function(width,immediately){this._setScale(width,immediately);},setHeight:function(height,immediately){this._setScale(height/this.normHeight,immediately);},setCroppingPolygons:function(polygons){const isXYObject=function(obj){return obj instanceof $.Point||(typeof obj.x==='number'&&typeof obj.y==='number');};const objectToSimpleXYObject=function(objs){return objs.map(function(obj){try{if(isXYObject(obj)){return{x:obj.x,y:obj.y};}else{throw new Error();}}catch(e){throw new Error('A Provided cropping polygon point is not supported');}});};try{if(!$.isArray(polygons)){throw new Error('Provided cropping polygon is not an array');}
+this._croppingPolygons=polygons.map(function(polygon){return objectToSimpleXYObject(polygon);});this._needsDraw=true;}catch(e){$.console.error('[TiledImage.setCroppingPolygons] Cropping polygon format not supported');$.console.error(e);this.resetCroppingPolygons();}},resetCroppingPolygons:function(){this._croppingPolygons=null;this._needsDraw=true;},fitBounds:function(bounds,anchor,immediately){anchor=anchor||$.Placement.CENTER;const anchorProperties=$.Placement.properties[anchor];let aspectRatio=this.contentAspectX;let xOffset=0;let yOffset=0;let displayedWidthRatio=1;let displayedHeightRatio=1;if(this._clip){aspectRatio=this._clip.getAspectRatio();displayedWidthRatio=this._clip.width/this.source.dimensions.x;displayedHeightRatio=this._clip.height/this.source.dimensions.y;if(bounds.getAspectRatio()>aspectRatio){xOffset=this._clip.x/this._clip.height*bounds.height;yOffset=this._clip.y/this._clip.height*bounds.height;}else{xOffset=this._clip.x/this._clip.width*bounds.width;yOffset=this._clip.y/this._clip.width*bounds.width;}}
+if(bounds.getAspectRatio()>aspectRatio){const height=bounds.height/displayedHeightRatio;let marginLeft=0;if(anchorProperties.isHorizontallyCentered){marginLeft=(bounds.width-bounds.height*aspectRatio)/2;}else if(anchorProperties.isRight){marginLeft=bounds.width-bounds.height*aspectRatio;}
+this.setPosition(new $.Point(bounds.x-xOffset+marginLeft,bounds.y-yOffset),immediately);this.setHeight(height,immediately);}else{const width=bounds.width/displayedWidthRatio;let marginTop=0;if(anchorProperties.isVerticallyCentered){marginTop=(bounds.height-bounds.width/aspectRatio)/2;}else if(anchorProperties.isBottom){marginTop=bounds.height-bounds.width/aspectRatio;}
+this.setPosition(new $.Point(bounds.x-xOffset,bounds.y-yOffset+marginTop),immediately);this.setWidth(width,immediately);}},getClip:function(){if(this._clip){return this._clip.clone();}
+return null;},setClip:function(newClip){$.console.assert(!newClip||newClip instanceof $.Rect,"[TiledImage.setClip] newClip must be an OpenSeadragon.Rect or null");if(newClip instanceof $.Rect){this._clip=newClip.clone();}else{this._clip=null;}
+this._needsUpdate=true;this._needsDraw=true;this.raiseEvent('clip-change');},getFlip:function(){return this.flipped;},setFlip:function(flip){this.flipped=flip;},get flipped(){return this._flipped;},set flipped(flipped){const changed=this._flipped!==!!flipped;this._flipped=!!flipped;if(changed&&this._initialized){this.update(true);this._needsDraw=true;this._raiseBoundsChange();}},get wrapHorizontal(){return this._wrapHorizontal;},set wrapHorizontal(wrap){const changed=this._wrapHorizontal!==!!wrap;this._wrapHorizontal=!!wrap;if(this._initialized&&changed){this.update(true);this._needsDraw=true;}},get wrapVertical(){return this._wrapVertical;},set wrapVertical(wrap){const changed=this._wrapVertical!==!!wrap;this._wrapVertical=!!wrap;if(this._initialized&&changed){this.update(true);this._needsDraw=true;}},get debugMode(){return this._debugMode;},set debugMode(debug){this._debugMode=!!debug;this._needsDraw=true;},getOpacity:function(){return this.opacity;},setOpacity:function(opacity){this.opacity=opacity;},get opacity(){return this._opacity;},set opacity(opacity){if(opacity===this.opacity){return;}
+this._opacity=opacity;this._needsDraw=true;this._needsUpdate=true;this.raiseEvent('opacity-change',{opacity:this.opacity});},getPreload:function(){return this._preload;},setPreload:function(preload){this._preload=!!preload;this._needsDraw=true;},getRotation:function(current){return current?this._degreesSpring.current.value:this._degreesSpring.target.value;},setRotation:function(degrees,immediately){if(this._degreesSpring.target.value===degrees&&this._degreesSpring.isAtTargetValue()){return;}
+if(immediately){this._degreesSpring.resetTo(degrees);}else{this._degreesSpring.springTo(degrees);}
+this._needsDraw=true;this._needsUpdate=true;this._raiseBoundsChange();},getDrawArea:function(){if(this._opacity===0&&!this._preload){return false;}
+let drawArea=this._viewportToTiledImageRectangle(this.viewport.getBoundsWithMargins(true));if(!this.wrapHorizontal&&!this.wrapVertical){const tiledImageBounds=this._viewportToTiledImageRectangle(this.getClippedBounds(true));drawArea=drawArea.intersection(tiledImageBounds);}
+return drawArea;},getLoadArea:function(){let loadArea=this._viewportToTiledImageRectangle(this.viewport.getBoundsWithMargins(false));if(!this.wrapHorizontal&&!this.wrapVertical){const tiledImageBounds=this._viewportToTiledImageRectangle(this.getClippedBounds(false));loadArea=loadArea.intersection(tiledImageBounds);}
+return loadArea;},getTilesToDraw:function(){const lastDrawn=this._lastDrawn;let insertionIndex=0;for(const maybeNested of this._tilesToDraw){if(Array.isArray(maybeNested)){for(const item of maybeNested){lastDrawn[insertionIndex++]=item;}}else if(maybeNested){lastDrawn[insertionIndex++]=maybeNested;}}
+lastDrawn.length=insertionIndex;this._updateTilesInViewport(lastDrawn);insertionIndex=0;for(const maybeNested of this._tilesToDraw){if(Array.isArray(maybeNested)){for(const item of maybeNested){if(item.tile.loaded){item.tile.beingDrawn=true;lastDrawn[insertionIndex++]=item;}}}else if(maybeNested){if(maybeNested.tile.loaded){maybeNested.tile.beingDrawn=true;lastDrawn[insertionIndex++]=maybeNested;}}}
+lastDrawn.length=insertionIndex;return lastDrawn;},_getRotationPoint:function(current){return this.getBoundsNoRotate(current).getCenter();},get compositeOperation(){return this._compositeOperation;},set compositeOperation(compositeOperation){if(compositeOperation===this._compositeOperation){return;}
+this._compositeOperation=compositeOperation;this._needsDraw=true;this.raiseEvent('composite-operation-change',{compositeOperation:this._compositeOperation});},getCompositeOperation:function(){return this._compositeOperation;},setCompositeOperation:function(compositeOperation){this.compositeOperation=compositeOperation;},setAjaxHeaders:function(ajaxHeaders,propagate){if(ajaxHeaders===null){ajaxHeaders={};}
+if(!$.isPlainObject(ajaxHeaders)){$.console.error('[TiledImage.setAjaxHeaders] Ignoring invalid headers, must be a plain object');return;}
+this._ownAjaxHeaders=ajaxHeaders;this._updateAjaxHeaders(propagate);},_updateAjaxHeaders:function(propagate){if(propagate===undefined){propagate=true;}
+if($.isPlainObject(this.viewer.ajaxHeaders)){this.ajaxHeaders=$.extend({},this.viewer.ajaxHeaders,this._ownAjaxHeaders);}else{this.ajaxHeaders=this._ownAjaxHeaders;}
+if(propagate){let numTiles,xMod,yMod,tile;for(const level in this.tilesMatrix){numTiles=this.source.getNumTiles(level);const matrixLevel=this.tilesMatrix[level];for(const x in matrixLevel){xMod=(numTiles.x+(x%numTiles.x))%numTiles.x;for(const y in matrixLevel[x]){yMod=(numTiles.y+(y%numTiles.y))%numTiles.y;tile=matrixLevel[x][y];tile.loadWithAjax=this.loadTilesWithAjax;if(tile.loadWithAjax){const tileAjaxHeaders=this.source.getTileAjaxHeaders(level,xMod,yMod);tile.ajaxHeaders=$.extend({},this.ajaxHeaders,tileAjaxHeaders);}else{tile.ajaxHeaders=null;}}}}
+for(let i=0;i<this._imageLoader.jobQueue.length;i++){const job=this._imageLoader.jobQueue[i];job.loadWithAjax=job.tile.loadWithAjax;job.ajaxHeaders=job.tile.loadWithAjax?job.tile.ajaxHeaders:null;}}},allowZombieCache:function(allow){this._zombieCache=allow;},_setScale:function(scale,immediately){const sameTarget=(this._scaleSpring.target.value===scale);if(immediately){if(sameTarget&&this._scaleSpring.current.value===scale){return;}
+this._scaleSpring.resetTo(scale);this._updateForScale();this._needsDraw=true;this._needsUpdate=true;}else{if(sameTarget){return;}
+this._scaleSpring.springTo(scale);this._updateForScale();this._needsDraw=true;this._needsUpdate=true;}
+if(!sameTarget){this._raiseBoundsChange();}},_updateForScale:function(){this._worldWidthTarget=this._scaleSpring.target.value;this._worldHeightTarget=this.normHeight*this._scaleSpring.target.value;this._worldWidthCurrent=this._scaleSpring.current.value;this._worldHeightCurrent=this.normHeight*this._scaleSpring.current.value;},_raiseBoundsChange:function(){this.raiseEvent('bounds-change');},_isBottomItem:function(){return this.viewer.world.getItemAt(0)===this;},_getLevelsInterval:function(){let lowestLevel=Math.max(this.source.minLevel,Math.floor(Math.log(this.minZoomImageRatio)/Math.log(2)));const currentZeroRatio=this.viewport.deltaPixelsFromPointsNoRotate(this.source.getPixelRatio(0),true).x*this._scaleSpring.current.value;let highestLevel=Math.min(Math.abs(this.source.maxLevel),Math.abs(Math.floor(Math.log(currentZeroRatio/this.minPixelRatio)/Math.log(2))));highestLevel=Math.max(highestLevel,this.source.minLevel||0);lowestLevel=Math.min(lowestLevel,highestLevel);return{lowestLevel:lowestLevel,highestLevel:highestLevel};},_updateLevelsForViewport:function(){const levelsInterval=this._getLevelsInterval();const lowestLevel=levelsInterval.lowestLevel;const highestLevel=levelsInterval.highestLevel;const drawArea=this.getDrawArea();let loadArea=drawArea;let bestLoadTileCandidates=this._getCachedArray('bestLoadTileCandidates',0);if(this.loadDestinationTilesOnAnimation){loadArea=this.getLoadArea();}
+const currentTime=$.now();for(const tileInfo of this._lastDrawn){tileInfo.tile.beingDrawn=false;}
+this._tilesToDraw.length=0;this._tilesLoading=0;this.loadingCoverage={};if(!drawArea){this._needsDraw=false;return this._fullyLoaded;}
+const levelList=this._getCachedArray('levelList',highestLevel-lowestLevel+1);for(let i=0,level=highestLevel;level>=lowestLevel;level--,i++){levelList[i]=level;}
+for(let level=highestLevel+1;level<=this.source.maxLevel;level++){const tile=(this.tilesMatrix[level]&&this.tilesMatrix[level][0]&&this.tilesMatrix[level][0][0]);if(tile&&tile.isBottomMost&&tile.isRightMost&&tile.loaded){levelList.push(level);break;}}
+let useLevel=false;for(let i=0;i<levelList.length;i++){const level=levelList[i];const currentRenderPixelRatio=this.viewport.deltaPixelsFromPointsNoRotate(this.source.getPixelRatio(level),true).x*this._scaleSpring.current.value;if(i===levelList.length-1||currentRenderPixelRatio>=this.minPixelRatio){useLevel=true;}else if(!useLevel){continue;}
+const targetRenderPixelRatio=this.viewport.deltaPixelsFromPointsNoRotate(this.source.getPixelRatio(level),false).x*this._scaleSpring.current.value;const targetZeroRatio=this.viewport.deltaPixelsFromPointsNoRotate(this.source.getPixelRatio(Math.max(this.source.getClosestLevel(),0)),false).x*this._scaleSpring.current.value;const optimalRatio=this.immediateRender?1:targetZeroRatio;const levelOpacity=Math.min(1,(currentRenderPixelRatio-0.5)/0.5);const levelVisibility=optimalRatio/Math.abs(optimalRatio-targetRenderPixelRatio);const result=this._updateLevel(level,levelOpacity,levelVisibility,drawArea,loadArea,currentTime,bestLoadTileCandidates);this.viewer.world.ensureTilesUpToDate(result.tilesToDraw);bestLoadTileCandidates=result.bestLoadTileCandidates;this._tilesToDraw[level]=result.tilesToDraw;if(this._providesCoverage(this.coverage,level)){break;}}
+if(bestLoadTileCandidates&&bestLoadTileCandidates.length>0){for(const tile of bestLoadTileCandidates){if(tile){this._loadTile(tile,currentTime);}}
+this._needsDraw=true;return false;}else{return this._tilesLoading===0;}},_updateTilesInViewport:function(tiles){const currentTime=$.now();const _this=this;this._tilesLoading=0;this._wasBlending=this._isBlending;this._isBlending=false;this.loadingCoverage={};const lowestLevel=tiles.length?tiles[0].level:0;const drawArea=this.getDrawArea();if(!drawArea){return;}
+let level=0;for(const info of tiles){const tile=info.tile;if(tile&&tile.loaded){const tileIsBlending=_this._blendTile(tile,tile.x,tile.y,info.level,info.levelOpacity,currentTime,lowestLevel);_this._isBlending=_this._isBlending||tileIsBlending;_this._needsDraw=_this._needsDraw||tileIsBlending||_this._wasBlending;}
+if(this._providesCoverage(this.coverage,info.level)){level=Math.max(level,info.level);}}
+if(level>0){for(const levelKey in this._tilesToDraw){if(levelKey<level){this._tilesToDraw[levelKey]=undefined;}}}},_blendTile:function(tile,x,y,level,levelOpacity,currentTime,lowestLevel){let blendTimeMillis=1000*this.blendTime,deltaTime,opacity;if(!tile.blendStart){tile.blendStart=currentTime;}
+deltaTime=currentTime-tile.blendStart;opacity=blendTimeMillis?Math.min(1,deltaTime/(blendTimeMillis)):1;if(level===lowestLevel){opacity=1;deltaTime=blendTimeMillis;}
+if(this.alwaysBlend){opacity*=levelOpacity;}
+tile.opacity=opacity;if(opacity===1){this._setCoverage(this.coverage,level,x,y,true);this._hasOpaqueTile=true;}
+return deltaTime<blendTimeMillis;},_updateLevel:function(level,levelOpacity,levelVisibility,drawArea,loadArea,currentTime,bestLoadTileCandidates){const drawTopLeftBound=drawArea.getBoundingBox().getTopLeft();const drawBottomRightBound=drawArea.getBoundingBox().getBottomRight();if(this.viewer){this.viewer.raiseEvent('update-level',{tiledImage:this,havedrawn:true,level:level,opacity:levelOpacity,visibility:levelVisibility,drawArea:drawArea,topleft:drawTopLeftBound,bottomright:drawBottomRightBound,currenttime:currentTime,best:bestLoadTileCandidates});}
+const numberOfTiles=this.source.getNumTiles(level);const viewportCenter=this.viewport.pixelFromPoint(this.viewport.getCenter());this._resetCoverage(this.coverage,level);if(loadArea){this._resetCoverage(this.loadingCoverage,level);}
+let tilesToDraw=null;let tileIndex=0;this._visitTiles(level,drawArea,(x,y,total)=>{const tile=this._getTile(x,y,level,currentTime,numberOfTiles);if(!tilesToDraw){tilesToDraw=this._getCachedArray(level,total);}
+if(this.viewer){this.viewer.raiseEvent('update-tile',{tiledImage:this,tile:tile});}
+this._setCoverage(this.coverage,level,x,y,false);if(tile.exists){if(tile.loaded){if(tile.opacity===1){this._setCoverage(this.coverage,level,x,y,true);}
+tilesToDraw[tileIndex++]={tile:tile,level:level,levelOpacity:levelOpacity,currentTime:currentTime};this._setCoverage(this.loadingCoverage,level,x,y,true);}
+this._positionTile(tile,this.source.tileOverlap,this.viewport,viewportCenter,levelVisibility);}
+if(loadArea&&!tile.loaded){let loadingCoverage=tile.loading||this._isCovered(this.loadingCoverage,level,x,y);this._setCoverage(this.loadingCoverage,level,x,y,loadingCoverage);if(!tile.exists){return;}
+if(!tile.loading&&this._tryFindTileCacheRecord(tile)){loadingCoverage=true;}
+if(tile.loading){this._tilesLoading++;}else if(!loadingCoverage){bestLoadTileCandidates=this._compareTiles(bestLoadTileCandidates,tile,this._currentMaxTilesPerFrame);}}});if(this._currentMaxTilesPerFrame>this.maxTilesPerFrame){this._currentMaxTilesPerFrame=Math.max(Math.ceil(this._currentMaxTilesPerFrame/2),this.maxTilesPerFrame);}
+if(tilesToDraw){tilesToDraw.length=tileIndex;}
+return{bestLoadTileCandidates:bestLoadTileCandidates,tilesToDraw:tilesToDraw||[]};},_visitTiles:function(level,area,callback){const bbox=area.getBoundingBox();const drawCornerTiles=this._getCornerTiles(level,bbox.getTopLeft(),bbox.getBottomRight());const drawTopLeftTile=drawCornerTiles.topLeft;const drawBottomRightTile=drawCornerTiles.bottomRight;const numberOfTiles=this.source.getNumTiles(level);if(this.getFlip()){drawBottomRightTile.x+=1;if(!this.wrapHorizontal){drawBottomRightTile.x=Math.min(drawBottomRightTile.x,numberOfTiles.x-1);}}
+const numTiles=Math.max(0,(drawBottomRightTile.x-drawTopLeftTile.x)*(drawBottomRightTile.y-drawTopLeftTile.y));for(let x=drawTopLeftTile.x;x<=drawBottomRightTile.x;x++){for(let y=drawTopLeftTile.y;y<=drawBottomRightTile.y;y++){let flippedX;if(this.getFlip()){const xMod=(numberOfTiles.x+(x%numberOfTiles.x))%numberOfTiles.x;flippedX=x+numberOfTiles.x-xMod-xMod-1;}else{flippedX=x;}
+if(area.intersection(this.getTileBounds(level,flippedX,y))===null){continue;}
+callback(flippedX,y,numTiles);}}},_positionTile:function(tile,overlap,viewport,viewportCenter,levelVisibility){const boundsTL=tile.bounds.getTopLeft();boundsTL.x*=this._scaleSpring.current.value;boundsTL.y*=this._scaleSpring.current.value;boundsTL.x+=this._xSpring.current.value;boundsTL.y+=this._ySpring.current.value;const boundsSize=tile.bounds.getSize();boundsSize.x*=this._scaleSpring.current.value;boundsSize.y*=this._scaleSpring.current.value;tile.positionedBounds.x=boundsTL.x;tile.positionedBounds.y=boundsTL.y;tile.positionedBounds.width=boundsSize.x;tile.positionedBounds.height=boundsSize.y;const positionC=viewport.pixelFromPointNoRotate(boundsTL,true);const positionT=viewport.pixelFromPointNoRotate(boundsTL,false);let sizeC=viewport.deltaPixelsFromPointsNoRotate(boundsSize,true);const sizeT=viewport.deltaPixelsFromPointsNoRotate(boundsSize,false);const tileCenter=positionT.plus(sizeT.divide(2));const tileSquaredDistance=viewportCenter.squaredDistanceTo(tileCenter);if(this.getDrawer().minimumOverlapRequired(this)){if(!overlap){sizeC=sizeC.plus(new $.Point(1,1));}
+if(tile.isRightMost&&this.wrapHorizontal){sizeC.x+=0.75;}
+if(tile.isBottomMost&&this.wrapVertical){sizeC.y+=0.75;}}
+tile.position=positionC;tile.size=sizeC;tile.squaredDistance=tileSquaredDistance;tile.visibility=levelVisibility;},_getCornerTiles:function(level,topLeftBound,bottomRightBound){let leftX;let rightX;if(this.wrapHorizontal){leftX=$.positiveModulo(topLeftBound.x,1);rightX=$.positiveModulo(bottomRightBound.x,1);}else{leftX=Math.max(0,topLeftBound.x);rightX=Math.min(1,bottomRightBound.x);}
+let topY;let bottomY;const aspectRatio=1/this.source.aspectRatio;if(this.wrapVertical){topY=$.positiveModulo(topLeftBound.y,aspectRatio);bottomY=$.positiveModulo(bottomRightBound.y,aspectRatio);}else{topY=Math.max(0,topLeftBound.y);bottomY=Math.min(aspectRatio,bottomRightBound.y);}
+const topLeftTile=this.source.getTileAtPoint(level,new $.Point(leftX,topY));const bottomRightTile=this.source.getTileAtPoint(level,new $.Point(rightX,bottomY));const numTiles=this.source.getNumTiles(level);if(this.wrapHorizontal){topLeftTile.x+=numTiles.x*Math.floor(topLeftBound.x);bottomRightTile.x+=numTiles.x*Math.floor(bottomRightBound.x);}
+if(this.wrapVertical){topLeftTile.y+=numTiles.y*Math.floor(topLeftBound.y/aspectRatio);bottomRightTile.y+=numTiles.y*Math.floor(bottomRightBound.y/aspectRatio);}
+return{topLeft:topLeftTile,bottomRight:bottomRightTile,};},_tryFindTileCacheRecord:function(tile){const record=this._tileCache.getCacheRecord(tile.originalCacheKey);if(!record){return false;}
+tile.loading=true;this._setTileLoaded(tile,record.data,null,null,record.type);return true;},_getTile:function(x,y,level,time,numTiles){let xMod,yMod,bounds,sourceBounds,exists,urlOrGetter,post,ajaxHeaders,tile,tilesMatrix=this.tilesMatrix,tileSource=this.source;let matrixLevel=tilesMatrix[level];if(!matrixLevel){tilesMatrix[level]=matrixLevel={};}
+if(!matrixLevel[x]){matrixLevel[x]={};}
+if(!matrixLevel[x][y]||!matrixLevel[x][y].flipped!==!this.flipped){xMod=(numTiles.x+(x%numTiles.x))%numTiles.x;yMod=(numTiles.y+(y%numTiles.y))%numTiles.y;bounds=this.getTileBounds(level,x,y);sourceBounds=tileSource.getTileBounds(level,xMod,yMod,true);exists=tileSource.tileExists(level,xMod,yMod);urlOrGetter=tileSource.getTileUrl(level,xMod,yMod);post=tileSource.getTilePostData(level,xMod,yMod);if(this.loadTilesWithAjax){ajaxHeaders=tileSource.getTileAjaxHeaders(level,xMod,yMod);if($.isPlainObject(this.ajaxHeaders)){ajaxHeaders=$.extend({},this.ajaxHeaders,ajaxHeaders);}}else{ajaxHeaders=null;}
+tile=new $.Tile(level,x,y,bounds,exists,urlOrGetter,undefined,this.loadTilesWithAjax,ajaxHeaders,sourceBounds,post,tileSource.getTileHashKey(level,xMod,yMod,urlOrGetter,ajaxHeaders,post));if(this.getFlip()){if(xMod===0){tile.isRightMost=true;}}else{if(xMod===numTiles.x-1){tile.isRightMost=true;}}
+if(yMod===numTiles.y-1){tile.isBottomMost=true;}
+tile.flipped=this.flipped;matrixLevel[x][y]=tile;}else{tile=matrixLevel[x][y];}
+tile.lastTouchTime=time;return tile;},_loadTile:function(tile,time){const _this=this;tile.loading=true;tile.tiledImage=this;if(!this._imageLoader.addJob({src:tile.getUrl(),tile:tile,source:this.source,postData:tile.postData,loadWithAjax:tile.loadWithAjax,ajaxHeaders:tile.ajaxHeaders,crossOriginPolicy:this.crossOriginPolicy,ajaxWithCredentials:this.ajaxWithCredentials,callback:function(data,errorMsg,tileRequest,dataType,tries){_this._onTileLoad(tile,time,data,errorMsg,tileRequest,dataType,tries);},abort:function(){tile.loading=false;}})){this.viewer.raiseEvent("job-queue-full",{tile:tile,tiledImage:this,time:time,});}},_onTileLoad:function(tile,time,data,errorMsg,tileRequest,dataType,tries){if(data===null||data===undefined){$.console.error("Tile %s failed to load: %s - error: %s",tile,tile.getUrl(),errorMsg);this.viewer.raiseEvent("tile-load-failed",{tile:tile,tiledImage:this,time:time,message:errorMsg,tileRequest:tileRequest,tries:tries,maxReached:this.viewer.tileRetryMax===0?true:tries>=this.viewer.tileRetryMax});tile.loading=false;tile.exists=false;return;}else{tile.exists=true;}
+if(time<this.lastResetTime){$.console.warn("Ignoring tile %s loaded before reset: %s",tile,tile.getUrl());tile.loading=false;return;}
+if(this.originalDataType){const conversion=$.converter.getConversionPath(dataType,this.originalDataType);if(conversion){const desiredType=$.converter.getConversionPathFinalType(conversion);$.converter.convert(tile,data,dataType,desiredType).then(newData=>{this._setTileLoaded(tile,newData,null,tileRequest,desiredType);}).catch(e=>{$.console.warn("Failed to satisfy original type [%s] %s from %s: %s",desiredType,tile,dataType,e);this._setTileLoaded(tile,data,null,tileRequest,dataType);});}else{$.console.warn("Ignoring default base tile data type %s: no conversion possible from %s",this.originalDataType,dataType);this._setTileLoaded(tile,data,null,tileRequest,dataType);}}else{this._setTileLoaded(tile,data,null,tileRequest,dataType);}},_setTileLoaded:function(tile,data,cutoff,tileRequest,dataType){tile.tiledImage=this;$.console.assert(dataType!==undefined,"TileSource::downloadTileStart must return a dataType.");let tileCacheCreated=false;tile.addCache(tile.cacheKey,()=>{tileCacheCreated=true;return data;},dataType,false,false);let resolver=null,increment=0,eventFinished=false;const _this=this;function completionCallback(){increment--;if(increment>0){return;}
+eventFinished=true;tile.hasTransparency=tile.hasTransparency||_this.source.hasTransparency(undefined,tile.getUrl(),tile.ajaxHeaders,tile.postData);tile.loading=false;tile.loaded=true;_this.redraw();resolver(tile);}
+function getCompletionCallback(){if(eventFinished){$.console.error("Event 'tile-loaded' argument getCompletionCallback must be called synchronously. "+"Its return value should be called asynchronously.");}
+increment++;return completionCallback;}
+function markTileAsReady(){const fallbackCompletion=getCompletionCallback();_this.viewer.raiseEventAwaiting("tile-loaded",{tile:tile,tiledImage:_this,tileRequest:tileRequest,promise:new $.Promise(resolve=>{resolver=resolve;}),get image(){$.console.error("[tile-loaded] event 'image' has been deprecated. Use 'tile-invalidated' event to modify data instead.");return data;},get data(){$.console.error("[tile-loaded] event 'data' has been deprecated. Use 'tile-invalidated' event to modify data instead.");return data;},getCompletionCallback:function(){$.console.error("[tile-loaded] getCompletionCallback is deprecated: it introduces race conditions: "+"use async event handlers instead, execution order is deducted by addHandler(...) priority argument.");return getCompletionCallback();},}).catch(()=>{$.console.error("[tile-loaded] event finished with failure: there might be a problem with a plugin you are using.");}).then(fallbackCompletion);}
+if(tileCacheCreated){this.viewer.world.requestTileInvalidateEvent([tile],undefined,false,true,true).then(markTileAsReady).catch(markTileAsReady);}else{const origCache=tile.getCache(tile.originalCacheKey);const ensureValidDrawerType=(cache)=>{if(this.viewer.isDestroyed()){return $.Promise.resolve();}
+const drawer=this.getDrawer();if(!cache.isUsableForDrawer(drawer)){return cache.prepareForRendering(drawer);}
+return $.Promise.resolve();};for(const t of origCache._tiles){if(t.cacheKey!==tile.cacheKey){const targetMainCache=t.getCache();ensureValidDrawerType(targetMainCache).then(()=>tile.setCache(t.cacheKey,targetMainCache,true,false)).then(markTileAsReady);return;}
+if(t.processing){t.processingPromise.then(t=>{const targetMainCache=t.getCache();ensureValidDrawerType(targetMainCache).then(()=>{tile.setCache(t.cacheKey,targetMainCache,true,false);if(!targetMainCache.loaded){return targetMainCache.await();}
+return null;}).then(markTileAsReady);});return;}}
+ensureValidDrawerType(origCache).then(markTileAsReady);}},_compareTiles:function(previousBest,tile,maxNTiles){if(!previousBest){return[tile];}
+let inserted=false;for(let tileIndex=0;tileIndex<previousBest.length;tileIndex++){const nextTile=previousBest[tileIndex];if(this._sortTilesComparator(nextTile,tile)>0){previousBest.splice(tileIndex,0,tile);inserted=true;break;}}
+if(!inserted){previousBest.push(tile);}
+if(previousBest.length>maxNTiles){previousBest.pop();}
+return previousBest;},_sortTilesComparator:function(a,b){if(a===null){return 1;}
+if(b===null){return-1;}
+if(a.visibility===b.visibility){return a.squaredDistance-b.squaredDistance;}
+return b.visibility-a.visibility;},_getCachedArray:function(key,length=undefined){let arr=this._arrayCacheMap[key];if(!arr){if(length!==undefined){arr=this._arrayCacheMap[key]=new Array(length);}else{arr=this._arrayCacheMap[key]=[];}}else if(length!==undefined){arr.length=length;}
+return arr;},_providesCoverage:function(coverage,level,x,y){let rows;let cols;let i,j;if(!coverage[level]){return false;}
+if(x===undefined||y===undefined){rows=coverage[level];for(i in rows){if(Object.prototype.hasOwnProperty.call(rows,i)){cols=rows[i];for(j in cols){if(Object.prototype.hasOwnProperty.call(cols,j)&&!cols[j]){return false;}}}}
+return true;}
+return(coverage[level][x]===undefined||coverage[level][x][y]===undefined||coverage[level][x][y]===true);},_isCovered:function(coverage,level,x,y){if(x===undefined||y===undefined){return this._providesCoverage(coverage,level+1);}else{return(this._providesCoverage(coverage,level+1,2*x,2*y)&&this._providesCoverage(coverage,level+1,2*x,2*y+1)&&this._providesCoverage(coverage,level+1,2*x+1,2*y)&&this._providesCoverage(coverage,level+1,2*x+1,2*y+1));}},_setCoverage:function(coverage,level,x,y,covers){if(!coverage[level]){$.console.warn("Setting coverage for a tile before its level's coverage has been reset: %s",level);return;}
+if(!coverage[level][x]){coverage[level][x]={};}
+coverage[level][x][y]=covers;},_resetCoverage:function(coverage,level){coverage[level]={};}});}(OpenSeadragon));(function($){const OpenSeadragon=$;const DRAWER_INTERNAL_CACHE=Symbol("DRAWER_INTERNAL_CACHE");OpenSeadragon.CacheRecord=class CacheRecord{constructor(){this.revive();}
+get data(){return this._data;}
+get type(){return this._type;}
+await(){if(!this._promise){return $.Promise.resolve(this._data);}
+return this._promise;}
+getImage(){$.console.error("[CacheRecord.getImage] options.image is deprecated. Moreover, it might not work"+" correctly as the cache system performs conversion asynchronously in case the type needs to be converted.");this.transformTo("image");return this.data;}
+getRenderedContext(){$.console.error("[CacheRecord.getRenderedContext] options.getRenderedContext  is deprecated. Moreover, it might not work"+" correctly as the cache system performs conversion asynchronously in case the type needs to be converted.");this.transformTo("context2d");return this.data;}
+setDataAs(data,type){$.console.assert(data!==undefined&&data!==null,"[CacheRecord.setDataAs] needs valid data to set!");if(this._conversionJobQueue){let resolver=null;const promise=new $.Promise((resolve,reject)=>{resolver=resolve;});this._conversionJobQueue.push(()=>resolver(this._overwriteData(data,type)));return promise;}
+return this._overwriteData(data,type);}
+getDataAs(type=undefined,copy=true){if(this.loaded){if(type===this._type){return copy?$.converter.copy(this._tRef,this._data,type||this._type):this._promise;}
+return this._transformDataIfNeeded(this._tRef,this._data,type||this._type,copy)||this._promise;}
+return this._promise.then(data=>this._transformDataIfNeeded(this._tRef,data,type||this._type,copy)||data);}
+_transformDataIfNeeded(referenceTile,data,type,copy){if(this._destroyed){return $.Promise.resolve();}
+let result;if(type!==this._type){result=$.converter.convert(referenceTile,data,this._type,type);}else if(copy){result=$.converter.copy(referenceTile,data,type);}
+if(result){return result.then(finalData=>{if(this._destroyed){$.converter.destroy(finalData,type);return undefined;}
+return finalData;}).catch(e=>{this._handleConversionError(e);return undefined;});}
+return false;}
+getDataForRendering(drawer,tileToDraw){if(this._destroyed){$.console.error(`Attempt to draw tile with destroyed main cache ${this}!`);tileToDraw._unload();return undefined;}
+if(!this.loaded){if(this._promise){return undefined;}
+$.console.error(`Attempt to draw cache ${this} when not loaded!`);return undefined;}
+if(this._destroyed){$.console.error(`Attempt to draw tile with destroyed main cache ${this}!`);tileToDraw._unload();return undefined;}
+const supportedTypes=drawer.getSupportedDataFormats();if(!supportedTypes.includes(this.type)){$.console.error(`Attempt to draw tile cache ${this} with unsupported type '${this.type}' for the target drawer!`);this.prepareForRendering(drawer);return undefined;}
+if(drawer.options.usePrivateCache){if(!drawer.options.preloadCache){return this.prepareInternalCacheSync(drawer);}
+const internalCache=this._getInternalCacheRef(drawer);if(!internalCache||!internalCache.loaded){$.console.error(`Attempt to draw tile cache ${this} with internal cache non-ready state!`);return undefined;}
+return internalCache;}
+return this;}
+isUsableForDrawer(drawer){const supportedTypes=drawer.getSupportedDataFormats();if(!supportedTypes.includes(this.type)){return false;}
+if(drawer.options.usePrivateCache){const internalCache=this._getInternalCacheRef(drawer);if(!internalCache){return false;}}
+return true;}
+prepareForRendering(drawer){const supportedTypes=drawer.getRequiredDataFormats();if(!this.loaded){return this.await().then(_=>this.prepareForRendering(drawer));}
+let selfPromise;if(!supportedTypes.includes(this.type)){selfPromise=this.transformTo(supportedTypes);}else{selfPromise=this.await();}
+const swallow=(p)=>p.catch(e=>{this._handleConversionError(e);return null;});if(drawer.options.usePrivateCache&&drawer.options.preloadCache){return swallow(selfPromise.then(_=>this.prepareInternalCacheAsync(drawer)));}
+return swallow(selfPromise);}
+prepareInternalCacheAsync(drawer){let internalCache=this._getInternalCacheRef(drawer);if(this._checkInternalCacheUpToDate(internalCache,drawer)){return internalCache.await();}
+if(internalCache&&!internalCache.loaded){internalCache.await().then(()=>internalCache.destroy());}
+$.console.assert(this._tRef,"Data Create called from invalidation routine needs tile reference!");const transformedData=drawer.internalCacheCreate(this,this._tRef);$.console.assert(transformedData!==undefined,"[DrawerBase.internalCacheCreate] must return a value if usePrivateCache is enabled!");const drawerID=drawer.getId();internalCache=this[DRAWER_INTERNAL_CACHE][drawerID]=new $.InternalCacheRecord(transformedData,drawerID,(data)=>drawer.internalCacheFree(data));return internalCache.await();}
+prepareInternalCacheSync(drawer){let internalCache=this._getInternalCacheRef(drawer);if(this._checkInternalCacheUpToDate(internalCache,drawer)){return internalCache;}
+if(internalCache){internalCache.destroy();}
+$.console.assert(this._tRef,"Data Create called from drawing loop needs tile reference!");const transformedData=drawer.internalCacheCreate(this,this._tRef);$.console.assert(transformedData!==undefined,"[DrawerBase.internalCacheCreate] must return a value if usePrivateCache is enabled!");const drawerID=drawer.getId();internalCache=this[DRAWER_INTERNAL_CACHE][drawerID]=new $.InternalCacheRecord(transformedData,drawerID,(data)=>drawer.internalCacheFree(data));return internalCache;}
+_getInternalCacheRef(drawer){const options=drawer.options;if(!options.usePrivateCache){$.console.error("[CacheRecord.prepareInternalCacheSync] must not be called when usePrivateCache is false.");return undefined;}
+let internalCache=this[DRAWER_INTERNAL_CACHE];if(!internalCache){internalCache=this[DRAWER_INTERNAL_CACHE]={};}
+return internalCache[drawer.getId()];}
+_checkInternalCacheUpToDate(internalCache,drawer){return internalCache&&internalCache.tstamp>=drawer._dataNeedsRefresh;}
+transformTo(type=this._type){if(!this.loaded){this._conversionJobQueue=this._conversionJobQueue||[];let resolver=null;const promise=new $.Promise((resolve,reject)=>{resolver=resolve;});this._conversionJobQueue.push(()=>{if(this._destroyed){return;}
+if((typeof type==="string"&&type!==this._type)||(Array.isArray(type)&&!type.includes(this._type))){this._convert(this._type,type);this._promise.then(data=>resolver(data));}else{this._promise.then(data=>{this._checkAwaitsConvert();return resolver(data);});}});return promise;}
+if((typeof type==="string"&&type!==this._type)||(Array.isArray(type)&&!type.includes(this._type))){this._convert(this._type,type);}
+return this._promise;}
+destroyInternalCache(drawerId=undefined){const internal=this[DRAWER_INTERNAL_CACHE];if(internal){if(drawerId){const cache=internal[drawerId];if(cache){cache.destroy();delete internal[drawerId];}}else{for(const iCache in internal){internal[iCache].destroy();}
+delete this[DRAWER_INTERNAL_CACHE];}}}
+withTileReference(ref){this._tRef=ref;return this;}
+toString(){const tile=this._tRef||(this._tiles.length&&this._tiles[0]);return tile?`Cache ${this.type} [used e.g. by ${tile.toString()}]`:`Orphan cache!`;}
+revive(){$.console.assert(!this.loaded&&!this._type,"[CacheRecord::revive] must not be called when loaded!");this._tiles=[];this._data=null;this._type=null;this.loaded=false;this._promise=null;this._destroyed=false;this._ownerTileCache=null;this.cacheKey=null;}
+destroy(){if(!this._destroyed){delete this._conversionJobQueue;this._destroyed=true;if(this.loaded){this._destroySelfUnsafe(this._data,this._type);}else if(this._promise){const oldType=this._type;this._promise.then(x=>this._destroySelfUnsafe(x,oldType)).catch($.console.error);}}}
+_destroySelfUnsafe(data,type){$.converter.destroy(data,type);this.destroyInternalCache();if(!this._destroyed){return;}
+this.loaded=false;this._tiles=null;this._data=null;this._type=null;this._tRef=null;this._promise=null;}
+addTile(tile,data,type){if(this._destroyed){return;}
+$.console.assert(tile,'[CacheRecord.addTile] tile is required');if(data!==undefined&&data!==null&&this._tiles.length<1){if(typeof data==='function'){data=data();}
+if(this.type&&this._promise){if(data instanceof $.Promise){this._promise=data.then(d=>{this._overwriteData(d,type);});}else{this._overwriteData(data,type);}}else{if(data instanceof $.Promise){this._promise=data.then(data=>{if(this._destroyed){try{$.converter.destroy(data,this._type);}catch(e){}
+return undefined;}
+this.loaded=true;this._data=data;return data;}).catch(e=>{this._handleConversionError(e);return undefined;});this._data=null;}else{this._promise=$.Promise.resolve(data);this._data=data;this.loaded=true;}
+this._type=type;}
+this._tiles.push(tile);}else{const tileExists=this._tiles.includes(tile);if(!tileExists&&this.type&&this._promise){this._tiles.push(tile);}else if(!tileExists){$.console.warn("Tile %s caching attempt without data argument on uninitialized cache entry!",tile);}}}
+removeTile(tile){if(this._destroyed){return false;}
+for(let i=0;i<this._tiles.length;i++){if(this._tiles[i]===tile){this._tiles.splice(i,1);if(this._tRef===tile){this._tRef=this._tiles[i-1];}
+return true;}}
+$.console.warn('[CacheRecord.removeTile] trying to remove unknown tile',tile);return false;}
+getTileCount(){return this._tiles?this._tiles.length:0;}
+_checkAwaitsConvert(){if(!this._conversionJobQueue||this._destroyed){return;}
+setTimeout(()=>{if(!this._conversionJobQueue||this._destroyed){return;}
+const job=this._conversionJobQueue[0];this._conversionJobQueue.splice(0,1);if(this._conversionJobQueue.length===0){delete this._conversionJobQueue;}
+job();});}
+_triggerNeedsDraw(){if(this._tiles.length>0){this._tiles[0].tiledImage.viewer.forceRedraw();}}
+_overwriteData(data,type){if(this._destroyed){$.converter.destroy(data,type);return $.Promise.resolve();}
+if(this.loaded){if(this._data===data&&this._type===type){return this._promise;}
+$.converter.destroy(this._data,this._type);this._type=type;this._data=data;this._promise=$.Promise.resolve(data);const internal=this[DRAWER_INTERNAL_CACHE];if(internal){for(const iCache in internal){internal[iCache].setDataAs(data,type);}}
+this._triggerNeedsDraw();return this._promise;}
+return this._promise.then(()=>{if(this._data===data&&this._type===type){return this._data;}
+$.converter.destroy(this._data,this._type);this._type=type;this._data=data;this._promise=$.Promise.resolve(data);const internal=this[DRAWER_INTERNAL_CACHE];if(internal){for(const iCache in internal){internal[iCache].setDataAs(data,type);}}
+this._triggerNeedsDraw();return this._data;});}
+_convert(from,to){const converter=$.converter,conversionPath=converter.getConversionPath(from,to);if(!conversionPath){$.console.error(`[CacheRecord._convert] Conversion ${from} ---> ${to} cannot be done!`);return;}
+const originalData=this._data;const stepCount=conversionPath.length;const _this=this;const convert=(x,i)=>{if(i>=stepCount){_this._data=x;_this.loaded=true;_this._checkAwaitsConvert();return $.Promise.resolve(x);}
+const edge=conversionPath[i];let y;try{y=edge.transform(_this._tRef,x);}catch(err){converter.destroy(x,edge.origin.value);return $.Promise.reject(`[CacheRecord._convert] sync failure (while converting using ${edge.target.value}, ${edge.origin.value})`);}
+if(y===undefined){_this.loaded=false;converter.destroy(x,edge.origin.value);return $.Promise.reject(`[CacheRecord._convert] data mid result undefined value (while converting using ${edge.target.value}, ${edge.origin.value})`);}
+converter.destroy(x,edge.origin.value);const result=$.type(y)==="promise"?y:$.Promise.resolve(y);return result.then(res=>convert(res,i+1));};this.loaded=false;this._data=undefined;this._type=conversionPath[stepCount-1].target.value;this._promise=convert(originalData,0).catch(e=>{this._handleConversionError(e);return undefined;});}
+_handleConversionError(e){$.console.error("[CacheRecord] Conversion/preparation error:",e);this._destroyed=true;this.loaded=false;this._data=null;if(!this.cacheKey||!this._ownerTileCache){this._promise=$.Promise.resolve(undefined);this._tiles=[];this._tRef=null;return;}
+this._ownerTileCache._handleBrokenCacheRecord(this);}};OpenSeadragon.InternalCacheRecord=class InternalCacheRecord{constructor(data,type,onDestroy){this.tstamp=$.now();this._ondestroy=onDestroy;this._type=type;if(data instanceof $.Promise){this._promise=data;data.then(data=>{this.loaded=true;this._data=data;});}else{this._promise=null;this.loaded=true;this._data=data;}}
+get data(){return this._data;}
+get type(){return this._type;}
+await(){if(!this._promise){return $.Promise.resolve(this._data);}
+return this._promise;}
+withTileReference(referenceTile){this._temporaryTileRef=referenceTile;return this;}
+destroy(){if(this.loaded){if(this._ondestroy){this._ondestroy(this._data);}
+this._data=null;this.loaded=false;}}};OpenSeadragon.TileCache=class TileCache{constructor(options){options=options||{};this._maxCacheItemCount=options.maxImageCacheCount||$.DEFAULT_SETTINGS.maxImageCacheCount;this._tilesLoaded=[];this._zombiesLoaded=[];this._zombiesLoadedCount=0;this._cachesLoaded=[];this._cachesLoadedCount=0;}
+numTilesLoaded(){return this._tilesLoaded.length;}
+numCachesLoaded(){return this._zombiesLoadedCount+this._cachesLoadedCount;}
+cacheTile(options){$.console.assert(options,"[TileCache.cacheTile] options is required");const theTile=options.tile;$.console.assert(theTile,"[TileCache.cacheTile] options.tile is required");$.console.assert(theTile.cacheKey,"[TileCache.cacheTile] options.tile.cacheKey is required");if(options.image instanceof Image){$.console.warn("[TileCache.cacheTile] options.image is deprecated!");options.data=options.image;options.dataType="image";}
+const cacheKey=options.cacheKey||theTile.cacheKey;let cacheRecord=this._cachesLoaded[cacheKey];if(!cacheRecord){if(options.data===undefined){$.console.error("[TileCache.cacheTile] options.image was renamed to options.data. '.image' attribute "+"has been deprecated and will be removed in the future.");options.data=options.image;}
+cacheRecord=this._zombiesLoaded[cacheKey];if(cacheRecord){if(cacheRecord._destroyed){cacheRecord.revive();}else{if(typeof options.data==='function'){options.data();}
+delete options.data;}
+delete this._zombiesLoaded[cacheKey];this._zombiesLoadedCount--;this._cachesLoaded[cacheKey]=cacheRecord;this._cachesLoadedCount++;}else{const validData=options.data!==undefined&&options.data!==null&&options.data!==false;$.console.assert(validData,"[TileCache.cacheTile] options.data is required to create an CacheRecord");cacheRecord=this._cachesLoaded[cacheKey]=new $.CacheRecord();this._cachesLoadedCount++;}}
+if(!options.dataType){$.console.error("[TileCache.cacheTile] options.dataType is newly required. "+"For easier use of the cache system, use the tile instance API.");if(typeof options.data==='function'){$.console.error("[TileCache.cacheTile] options.dataType is mandatory "+" when data item is a callback!");}
+options.dataType=$.converter.guessType(options.data);}
+cacheRecord._ownerTileCache=this;cacheRecord.cacheKey=cacheKey;cacheRecord.addTile(theTile,options.data,options.dataType);this._freeOldRecordRoutine(theTile,options.cutoff||0);return cacheRecord;}
+renameCache(options){const newKey=options.newCacheKey,oldKey=options.oldCacheKey;let originalCache=this._cachesLoaded[oldKey];if(!originalCache){originalCache=this._zombiesLoaded[oldKey];$.console.assert(originalCache,"[TileCache.renameCache] oldCacheKey must reference existing cache!");if(this._zombiesLoaded[newKey]){$.console.error("Cannot rename zombie cache %s to %s: the target cache is occupied!",oldKey,newKey);return null;}
+this._zombiesLoaded[newKey]=originalCache;delete this._zombiesLoaded[oldKey];}else if(this._cachesLoaded[newKey]){$.console.error("Cannot rename cache %s to %s: the target cache is occupied!",oldKey,newKey);return null;}else{this._cachesLoaded[newKey]=originalCache;delete this._cachesLoaded[oldKey];}
+originalCache._ownerTileCache=this;originalCache.cacheKey=newKey;for(const tile of originalCache._tiles){tile.reflectCacheRenamed(oldKey,newKey);}
+return originalCache;}
+cloneCache(options){const theTile=options.tile;const cacheKey=options.copyTargetKey;const cacheRecord=this._cachesLoaded[cacheKey]||this._zombiesLoaded[cacheKey];$.console.assert(cacheRecord,"[TileCache.cloneCache] attempt to clone non-existent cache %s!",cacheKey);$.console.assert(!this._cachesLoaded[options.newCacheKey],"[TileCache.cloneCache] attempt to copy clone to existing cache %s!",options.newCacheKey);const desiredType=options.desiredType||undefined;return cacheRecord.getDataAs(desiredType,true).then(data=>{const newRecord=this._cachesLoaded[options.newCacheKey]=new $.CacheRecord();newRecord.addTile(theTile,data,cacheRecord.type);this._cachesLoadedCount++;this._freeOldRecordRoutine(theTile,options.cutoff||0);return newRecord;});}
+injectCache(options){const targetKey=options.targetKey,tile=options.tile;if(!options.tileAllowNotLoaded&&!tile.loaded&&!tile.loading){$.console.warn("Attempt to inject cache on tile in invalid state: this is probably a bug!");return;}
+const consumer=this._cachesLoaded[targetKey];if(consumer){const iterateTiles=[...consumer._tiles];for(const tile of iterateTiles){this.unloadCacheForTile(tile,targetKey,true,false);}}
+if(this._cachesLoaded[targetKey]){$.console.error("The inject routine should've freed cache!");}
+const cache=options.cache;this._cachesLoaded[targetKey]=cache;cache._ownerTileCache=this;cache.cacheKey=targetKey;for(const t of tile.getCache(tile.originalCacheKey)._tiles){t.setCache(targetKey,cache,options.setAsMainCache,false);}}
+replaceCache(options){const victimKey=options.victimKey,consumerKey=options.consumerKey,victim=this._cachesLoaded[victimKey],tile=options.tile;if(!victim||(!options.tileAllowNotLoaded&&!tile.loaded&&!tile.loading)){$.console.warn("Attempt to consume cache on tile in invalid state: this is probably a bug!");return;}
+const consumer=this._cachesLoaded[consumerKey];if(consumer){const iterateTiles=[...consumer._tiles];for(const tile of iterateTiles){this.unloadCacheForTile(tile,consumerKey,true,false);}}
+if(this._cachesLoaded[consumerKey]){$.console.error("The consume routine should've freed cache!");}
+const resultCache=this.renameCache({oldCacheKey:victimKey,newCacheKey:consumerKey});if(resultCache){for(const t of tile.getCache(tile.originalCacheKey)._tiles){t.setCache(consumerKey,resultCache,options.setAsMainCache,false);}}}
+restoreTilesThatShareOriginalCache(tile,originalCache,freeIfUnused){for(const t of originalCache._tiles){if(t.cacheKey!==t.originalCacheKey){this.unloadCacheForTile(t,t.cacheKey,freeIfUnused,true);delete t._caches[t.cacheKey];t.cacheKey=t.originalCacheKey;}}}
+_freeOldRecordRoutine(theTile,cutoff){let insertionIndex=this._tilesLoaded.length,worstTileIndex=-1;if(this._cachesLoadedCount+this._zombiesLoadedCount>this._maxCacheItemCount){if(this._zombiesLoadedCount>0){for(const zombie in this._zombiesLoaded){this._zombiesLoaded[zombie].destroy();delete this._zombiesLoaded[zombie];this._zombiesLoadedCount--;break;}}else{let worstTile=null;let prevTile,worstTime,worstLevel,prevTime,prevLevel;for(let i=this._tilesLoaded.length-1;i>=0;i--){prevTile=this._tilesLoaded[i];if(prevTile.level<=cutoff||prevTile.beingDrawn||prevTile.loading||prevTile.processing){continue;}
+if(!worstTile){worstTile=prevTile;worstTileIndex=i;continue;}
+prevTime=prevTile.lastTouchTime;worstTime=worstTile.lastTouchTime;prevLevel=prevTile.level;worstLevel=worstTile.level;if(prevTime<worstTime||(prevTime===worstTime&&prevLevel>worstLevel)){worstTile=prevTile;worstTileIndex=i;}}
+if(worstTile&&worstTileIndex>=0){this._unloadTile(worstTile,true);insertionIndex=worstTileIndex;}}}
+if(theTile.getCacheSize()===0){this._tilesLoaded[insertionIndex]=theTile;}else if(worstTileIndex>=0){this._tilesLoaded.splice(insertionIndex,1);}}
+_handleBrokenCacheRecord(cache){if(!cache){return;}
+const key=cache.cacheKey;if(key&&this._cachesLoaded[key]===cache){delete this._cachesLoaded[key];this._cachesLoadedCount--;}
+if(key&&this._zombiesLoaded[key]===cache){delete this._zombiesLoaded[key];this._zombiesLoadedCount--;}
+const tiles=cache._tiles?[...cache._tiles]:[];for(const tile of tiles){const isMainCache=tile.getCache&&tile.getCache()===cache;const isOriginalCache=key&&tile.originalCacheKey===key;if(isMainCache||isOriginalCache){tile.exists=false;tile.unload(true);}else{if(tile.removeCache&&key){tile.removeCache(key);}
+cache.removeTile(tile);}}
+cache._promise=$.Promise.resolve(undefined);cache._tiles=[];cache._tRef=null;cache._ownerTileCache=null;}
+clearTilesFor(tiledImage){$.console.assert(tiledImage,'[TileCache.clearTilesFor] tiledImage is required');let tile;let cacheOverflows=this._cachesLoadedCount+this._zombiesLoadedCount>this._maxCacheItemCount;if(tiledImage._zombieCache&&cacheOverflows&&this._zombiesLoadedCount>0){for(const zombie in this._zombiesLoaded){this._zombiesLoaded[zombie].destroy();delete this._zombiesLoaded[zombie];}
+this._zombiesLoadedCount=0;cacheOverflows=this._cachesLoadedCount>this._maxCacheItemCount;}
+for(let i=this._tilesLoaded.length-1;i>=0;i--){tile=this._tilesLoaded[i];if(tile.tiledImage===tiledImage){if(!tile.loaded){this._tilesLoaded.splice(i,1);}else if(tile.tiledImage===tiledImage){this._unloadTile(tile,!tiledImage._zombieCache||cacheOverflows,i);}}}}
+clear(withZombies=true){for(const zombie in this._zombiesLoaded){this._zombiesLoaded[zombie].destroy();}
+for(const tile in this._tilesLoaded){this._unloadTile(tile,true);}
+this._tilesLoaded=[];this._zombiesLoaded=[];this._zombiesLoadedCount=0;this._cachesLoaded=[];this._cachesLoadedCount=0;}
+clearDrawerInternalCache(drawer){const drawerId=drawer.getId();for(const zombie of this._zombiesLoaded){if(zombie){zombie.destroyInternalCache(drawerId);}}
+for(const cache of this._cachesLoaded){if(cache){cache.destroyInternalCache(drawerId);}}}
+getLoadedTilesFor(tiledImage){if(!tiledImage){return[...this._tilesLoaded];}
+return this._tilesLoaded.filter(tile=>tile.tiledImage===tiledImage);}
+getCacheRecord(cacheKey){$.console.assert(cacheKey,'[TileCache.getCacheRecord] cacheKey is required');return this._cachesLoaded[cacheKey]||this._zombiesLoaded[cacheKey];}
+safeUnloadCache(cache){if(cache&&!cache._destroyed&&cache.getTileCount()<1){for(const i in this._zombiesLoaded){const c=this._zombiesLoaded[i];if(c===cache){delete this._zombiesLoaded[i];c.destroy();return;}}
+$.console.error("Attempt to delete an orphan cache that is not in zombie list: this could be a bug!",cache);cache.destroy();}}
+unloadCacheForTile(tile,key,destroy,okIfNotExists){const cacheRecord=this._cachesLoaded[key];if(cacheRecord){if(cacheRecord.removeTile(tile)){if(!cacheRecord.getTileCount()){if(destroy){cacheRecord.destroy();}else{this._zombiesLoaded[key]=cacheRecord;this._zombiesLoadedCount++;}
+delete this._cachesLoaded[key];this._cachesLoadedCount--;}
+return true;}
+$.console.error("[TileCache.unloadCacheForTile] System tried to delete tile from cache it "+"does not belong to! This could mean a bug in the cache system.");return false;}
+if(!okIfNotExists){$.console.warn("[TileCache.unloadCacheForTile] Attempting to delete missing cache!");}
+return false;}
+unloadTile(tile,destroy=false){if(!tile.loaded){$.console.warn("Attempt to unload already unloaded tile.");return;}
+const index=this._tilesLoaded.findIndex(x=>x===tile);this._unloadTile(tile,destroy,index);}
+_unloadTile(tile,destroy,deleteAtIndex=undefined){$.console.assert(tile,'[TileCache._unloadTile] tile is required');for(const key in tile._caches){this.unloadCacheForTile(tile,key,destroy,false);}
+if(deleteAtIndex!==undefined){this._tilesLoaded.splice(deleteAtIndex,1);}
+if(!tile.loaded){return;}
+const tiledImage=tile.tiledImage;tile._unload();tiledImage.viewer.raiseEvent("tile-unloaded",{tile:tile,tiledImage:tiledImage,destroyed:destroy});}};}(OpenSeadragon));(function($){$.World=function(options){const _this=this;$.console.assert(options.viewer,"[World] options.viewer is required");$.EventSource.call(this);this.viewer=options.viewer;this._items=[];this._needsDraw=false;this.__invalidatedAt=1;this._autoRefigureSizes=true;this._needsSizesFigured=false;this._delegatedFigureSizes=function(event){if(_this._autoRefigureSizes){_this._figureSizes();}else{_this._needsSizesFigured=true;}};this._figureSizes();};$.extend($.World.prototype,$.EventSource.prototype,{addItem:function(item,options){$.console.assert(item,"[World.addItem] item is required");$.console.assert(item instanceof $.TiledImage,"[World.addItem] only TiledImages supported at this time");options=options||{};if(options.index!==undefined){const index=Math.max(0,Math.min(this._items.length,options.index));this._items.splice(index,0,item);}else{this._items.push(item);}
+if(this._autoRefigureSizes){this._figureSizes();}else{this._needsSizesFigured=true;}
+this._needsDraw=true;item.addHandler('bounds-change',this._delegatedFigureSizes);item.addHandler('clip-change',this._delegatedFigureSizes);this.raiseEvent('add-item',{item:item});},getItemAt:function(index){$.console.assert(index!==undefined,"[World.getItemAt] index is required");return this._items[index];},getIndexOfItem:function(item){$.console.assert(item,"[World.getIndexOfItem] item is required");return $.indexOf(this._items,item);},getItemCount:function(){return this._items.length;},setItemIndex:function(item,index){$.console.assert(item,"[World.setItemIndex] item is required");$.console.assert(index!==undefined,"[World.setItemIndex] index is required");const oldIndex=this.getIndexOfItem(item);if(index>=this._items.length){throw new Error("Index bigger than number of layers.");}
+this._items.splice(oldIndex,1);this._items.splice(index,0,item);this._needsDraw=true;this.raiseEvent('item-index-change',{item:item,previousIndex:oldIndex,newIndex:index});},removeItem:function(item){$.console.assert(item,"[World.removeItem] item is required");const index=$.indexOf(this._items,item);if(index===-1){return;}
+item.removeHandler('bounds-change',this._delegatedFigureSizes);item.removeHandler('clip-change',this._delegatedFigureSizes);item.destroy();this._items.splice(index,1);this._figureSizes();this._needsDraw=true;this._raiseRemoveItem(item);},removeAll:function(){this.viewer._cancelPendingImages();let item;for(let i=0;i<this._items.length;i++){item=this._items[i];item.removeHandler('bounds-change',this._delegatedFigureSizes);item.removeHandler('clip-change',this._delegatedFigureSizes);item.destroy();}
+const removedItems=this._items;this._items=[];this._figureSizes();this._needsDraw=true;for(let i=0;i<removedItems.length;i++){item=removedItems[i];this._raiseRemoveItem(item);}},requestInvalidate:function(restoreTiles=true,tStamp=$.now()){this.__invalidatedAt=tStamp;let drawnTstamp=Infinity;for(const item of this._items){if(item._lastDrawn.length){drawnTstamp=Math.min(drawnTstamp,item._lastDrawn[0].tile.lastTouchTime);}
+for(const tileSet of item._tilesToDraw){if(Array.isArray(tileSet)){if(tileSet.length){drawnTstamp=Math.min(drawnTstamp,tileSet[0].tile.lastTouchTime);}}else if(tileSet){drawnTstamp=Math.min(drawnTstamp,tileSet.tile.lastTouchTime);}}}
+const allTiles=this.viewer.tileCache.getLoadedTilesFor(null);const tilesToRestore=new Array(allTiles.length);let restoreIndex=0;let deletedTiles=0;const cache=this.viewer.tileCache;for(let i=0;i<allTiles.length;i++){const tile=allTiles[i];const isRecentlyTouched=tile.lastTouchTime>=drawnTstamp;const isAboveCutoff=tile.level<=(tile.tiledImage.source.getClosestLevel()||0);if(isRecentlyTouched||isAboveCutoff){tilesToRestore[restoreIndex++]=tile;}else{cache._unloadTile(tile,false,i-deletedTiles);deletedTiles++;}}
+tilesToRestore.length=restoreIndex;return this.requestTileInvalidateEvent(tilesToRestore,tStamp,restoreTiles);},requestTileInvalidateEvent:function(tilesToProcess,tStamp,restoreTiles=true,_allowTileUnloaded=false,_isFromTileLoad=false){if(!this.viewer.isOpen()){return $.Promise.resolve();}
+if(tStamp===undefined){tStamp=this.__invalidatedAt;}
+const tilesThatNeedReprocessing=[];const jobList=tilesToProcess.map(tile=>{if(!tile||(!_allowTileUnloaded&&!tile.loaded&&!tile.processing)){return Promise.resolve();}
+const tiledImage=tile.tiledImage;const drawer=tiledImage.getDrawer();const eventTarget=drawer._parentViewer||this.viewer;const originalCache=tile.getCache(tile.originalCacheKey);const tileCache=tile.getCache(tile.originalCacheKey);if(tileCache.__invStamp&&tileCache.__invStamp>=tStamp){return Promise.resolve();}
+let wasOutdatedRun=false;if(originalCache.__finishProcessing){originalCache.__finishProcessing(true);}
+let promise;if(!originalCache.__resolve){promise=new $.Promise((resolve)=>{originalCache.__resolve=resolve;});}
+originalCache.__finishProcessing=(asInvalidRun)=>{wasOutdatedRun=wasOutdatedRun||asInvalidRun;tile.processing=false;originalCache.__finishProcessing=null;if(!asInvalidRun){originalCache.__resolve(tile);originalCache.__resolve=null;}};for(const t of originalCache._tiles){t.processing=tStamp;if(promise){t.processingPromise=promise;}}
+originalCache.__invStamp=tStamp;originalCache.__wasRestored=restoreTiles;let workingCache=null;const getWorkingCacheData=(type)=>{if(workingCache){return workingCache.getDataAs(type,false);}
+const targetCopyKey=restoreTiles?tile.originalCacheKey:tile.cacheKey;const origCache=tile.getCache(targetCopyKey);if(!origCache){$.console.error("[Tile::getData] There is no cache available for tile with key %s",targetCopyKey);return $.Promise.reject();}
+type=type||origCache.type;workingCache=new $.CacheRecord().withTileReference(tile);return origCache.getDataAs(type,true).then(data=>{if(data===undefined||data===null){return $.Promise.reject(new Error('[World.getData] Working cache source data unavailable'));}
+workingCache.addTile(tile,data,type);return workingCache.data;});};const setWorkingCacheData=(value,type)=>{if(!workingCache){workingCache=new $.CacheRecord().withTileReference(tile);workingCache.addTile(tile,value,type);return $.Promise.resolve();}
+return workingCache.setDataAs(value,type);};const atomicCacheSwap=()=>{if(workingCache){const newCacheKey=tile.buildDistinctMainCacheKey();tiledImage._tileCache.injectCache({tile:tile,cache:workingCache,targetKey:newCacheKey,setAsMainCache:true,tileAllowNotLoaded:tile.loading});}else if(restoreTiles){tiledImage._tileCache.restoreTilesThatShareOriginalCache(tile,tile.getCache(tile.originalCacheKey),true);}};const outdatedTest=()=>wasOutdatedRun||(typeof originalCache.__invStamp==="number"&&originalCache.__invStamp<this.__invalidatedAt)||(!tile.loaded&&!tile.loading);return eventTarget.raiseEventAwaiting('tile-invalidated',{tile:tile,tiledImage:tiledImage,outdated:outdatedTest,getData:getWorkingCacheData,setData:setWorkingCacheData,resetData:()=>{if(workingCache){workingCache.destroy();workingCache=null;}},stopPropagation:()=>{const result=outdatedTest();return result;},}).catch(err=>{$.console.error('Update routine error:',err);if(workingCache){try{workingCache.destroy();}catch(e){}
+workingCache=null;}
+wasOutdatedRun=true;if(originalCache.__finishProcessing){originalCache.__finishProcessing(true);}
+return null;}).then(_=>{if(this.viewer.isDestroyed()){if(originalCache.__finishProcessing){originalCache.__finishProcessing(true);}
+return null;}
+if(wasOutdatedRun){return null;}
+if(originalCache.__finishProcessing){if(!wasOutdatedRun&&(tile.loaded||tile.loading)){if(originalCache.__invStamp<this.__invalidatedAt){tilesThatNeedReprocessing.push(tile);}else if(originalCache.__invStamp===tStamp){if(workingCache){return workingCache.prepareForRendering(drawer).then(c=>{if(!wasOutdatedRun){if(!outdatedTest()&&c){atomicCacheSwap();}else{workingCache.destroy();workingCache=null;}
+originalCache.__finishProcessing();}else{workingCache.destroy();workingCache=null;}});}
+if(restoreTiles){const mainCacheRef=tile.getCache();const freshOriginalCacheRef=tile.getCache(tile.originalCacheKey);if(mainCacheRef!==freshOriginalCacheRef){return freshOriginalCacheRef.prepareForRendering(drawer).then((c)=>{if(!wasOutdatedRun){if(!outdatedTest()&&c){atomicCacheSwap();}
+originalCache.__finishProcessing();}});}else{return null;}}}else{$.console.error(`Invalidation flow error: tile processing state is invalid. `+`Tile: ${tile ? tile.toString() : 'null'}, `+`loaded: ${tile ? tile.loaded : 'n/a'}, loading: ${tile ? tile.loading : 'n/a'}, `+`originalCache.__invStamp: ${originalCache.__invStamp}, `+`this.__invalidatedAt: ${this.__invalidatedAt}, `+`tStamp: ${tStamp}, wasOutdatedRun: ${wasOutdatedRun}`);}
+if(_isFromTileLoad){const freshMainCacheRef=tile.getCache();return freshMainCacheRef.prepareForRendering(drawer).then(()=>{if(!wasOutdatedRun&&originalCache.__finishProcessing){originalCache.__finishProcessing();}});}
+originalCache.__finishProcessing();return null;}
+if(!wasOutdatedRun){originalCache.__finishProcessing(true);}}
+if(_isFromTileLoad){const freshMainCacheRef=tile.getCache();return freshMainCacheRef.prepareForRendering(drawer).then(()=>{if(!wasOutdatedRun&&originalCache.__finishProcessing){originalCache.__finishProcessing();}});}
+if(workingCache){workingCache.destroy();workingCache=null;}
+return null;}).catch(e=>{$.console.error("Update routine error:",e);if(workingCache){workingCache.destroy();workingCache=null;}
+originalCache.__finishProcessing();});});return $.Promise.all(jobList).then(()=>{if(tilesThatNeedReprocessing.length){this.requestTileInvalidateEvent(tilesThatNeedReprocessing,undefined,restoreTiles,true);}
+if(!_allowTileUnloaded&&!this.viewer.isDestroyed()){this.draw();}});},ensureTilesUpToDate:function(tileList){let updateList;let wasRestored;for(let tile of tileList){tile=tile.tile||tile;if(!tile.loaded||tile.processing){continue;}
+const originalCache=tile.getCache(tile.originalCacheKey);wasRestored=originalCache.__wasRestored;if(originalCache.__invStamp<this.__invalidatedAt){if(!updateList){updateList=[tile];}else{updateList.push(tile);}}}
+if(updateList&&updateList.length){this.requestTileInvalidateEvent(updateList,$.now(),wasRestored,false);}},resetItems:function(){for(let i=0;i<this._items.length;i++){this._items[i].reset();}},update:function(viewportChanged){let animated=false;for(let i=0;i<this._items.length;i++){animated=this._items[i].update(viewportChanged)||animated;}
+return animated;},draw:function(){this.viewer.drawer.draw(this._items);this._needsDraw=false;for(const item of this._items){this._needsDraw=item.setDrawn()||this._needsDraw;}},needsDraw:function(){for(let i=0;i<this._items.length;i++){if(this._items[i].needsDraw()){return true;}}
+return this._needsDraw;},getHomeBounds:function(){return this._homeBounds.clone();},getContentFactor:function(){return this._contentFactor;},setAutoRefigureSizes:function(value){this._autoRefigureSizes=value;if(value&this._needsSizesFigured){this._figureSizes();this._needsSizesFigured=false;}},arrange:function(options){options=options||{};const immediately=options.immediately||false;const layout=options.layout||$.DEFAULT_SETTINGS.collectionLayout;const rows=options.rows||$.DEFAULT_SETTINGS.collectionRows;const columns=options.columns||$.DEFAULT_SETTINGS.collectionColumns;const tileSize=options.tileSize||$.DEFAULT_SETTINGS.collectionTileSize;const tileMargin=options.tileMargin||$.DEFAULT_SETTINGS.collectionTileMargin;const increment=tileSize+tileMargin;let wrap;if(!options.rows&&columns){wrap=columns;}else{wrap=Math.ceil(this._items.length/rows);}
+let x=0;let y=0;let item,box,width,height,position;this.setAutoRefigureSizes(false);for(let i=0;i<this._items.length;i++){if(i&&(i%wrap)===0){if(layout==='horizontal'){y+=increment;x=0;}else{x+=increment;y=0;}}
+item=this._items[i];box=item.getBoundsNoRotate();if(box.width>box.height){width=tileSize;}else{width=tileSize*(box.width/box.height);}
+height=width*(box.height/box.width);position=new $.Point(x+((tileSize-width)/2),y+((tileSize-height)/2));item.setPosition(position,immediately);item.setWidth(width,immediately);if(layout==='horizontal'){x+=increment;}else{y+=increment;}}
+this.setAutoRefigureSizes(true);},_figureSizes:function(){const oldHomeBounds=this._homeBounds?this._homeBounds.clone():null;const oldContentSize=this._contentSize?this._contentSize.clone():null;const oldContentFactor=this._contentFactor||0;if(!this._items.length){this._homeBounds=new $.Rect(0,0,1,1);this._contentSize=new $.Point(1,1);this._contentFactor=1;}else{let item=this._items[0];let bounds=item.getBounds();this._contentFactor=item.getContentSize().x/bounds.width;let clippedBounds=item.getClippedBounds().getBoundingBox();let left=clippedBounds.x;let top=clippedBounds.y;let right=clippedBounds.x+clippedBounds.width;let bottom=clippedBounds.y+clippedBounds.height;for(let i=1;i<this._items.length;i++){item=this._items[i];bounds=item.getBounds();this._contentFactor=Math.max(this._contentFactor,item.getContentSize().x/bounds.width);clippedBounds=item.getClippedBounds().getBoundingBox();left=Math.min(left,clippedBounds.x);top=Math.min(top,clippedBounds.y);right=Math.max(right,clippedBounds.x+clippedBounds.width);bottom=Math.max(bottom,clippedBounds.y+clippedBounds.height);}
+this._homeBounds=new $.Rect(left,top,right-left,bottom-top);this._contentSize=new $.Point(this._homeBounds.width*this._contentFactor,this._homeBounds.height*this._contentFactor);}
+if(this._contentFactor!==oldContentFactor||!this._homeBounds.equals(oldHomeBounds)||!this._contentSize.equals(oldContentSize)){this.raiseEvent('metrics-change',{});}},_raiseRemoveItem:function(item){this.raiseEvent('remove-item',{item:item});}});}(OpenSeadragon));
\ No newline at end of file